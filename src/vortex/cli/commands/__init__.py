@@ -5,6 +5,7 @@ from .download import download
 from .metrics import metrics
 from .providers import providers
 from .resilience import resilience
+from .storage import storage
 from .validate import validate
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "validate",
     "resilience",
     "metrics",
+    "storage",
 ]
@@ -4,7 +4,7 @@ Refactored to use focused modules following single responsibility principle."""
 
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -47,9 +47,23 @@ class DownloadConfig:
     mode: str = "updating"
     backup_enabled: bool = True
     force_backup: bool = False
-    random_sleep: int = 0
     dry_run: bool = False
     download_config: Dict[str, Any] = None
+    workers: int = 1
+    # Processes parsing downloads; 0 runs each job in one thread
+    cpu_workers: int = 0
+    resume: bool = False
+    deadline: Optional[datetime] = None
+    plan_out: Optional[Path] = None
+    partitioning: str = "none"
+    max_pending_writes: int = 0
+    storage_format: str = "csv"
+    backup_format: str = "parquet"
+    backup_deferred: bool = False
+    arrow_compression: str = "uncompressed"
+    csv_engine: str = "pandas"
+    # ParquetEncoding settings from general.parquet
+    parquet: Dict[str, Any] = None
 
 
 # Note: load_config_instruments functionality moved to symbol_resolver.py
@@ -108,7 +122,23 @@ class DownloadConfig:
     type=click.Path(path_type=Path),
     help="Raw data directory for audit trail. Default: ./raw",
 )
-@click.option("--backup/--no-backup", default=False, help="Create Parquet backup files")
+@click.option(
+    "--backup/--no-backup",
+    default=False,
+    help="Create backup files (Parquet unless general.backup_format says otherwise)",
+)
+@click.option(
+    "--write-behind/--sync-writes",
+    default=None,
+    help="Write files in the background while downloading continues (default: from config)",
+)
+@click.option(
+    "--partition",
+    "partitioning",
+    type=click.Choice(["none", "year", "month"]),
+    default=None,
+    help="Store series as yearly or monthly files (default: from config)",
+)
 @click.option("--force", is_flag=True, help="Force re-download even if data exists")
 @click.option(
     "--chunk-size",
@@ -116,6 +146,35 @@ class DownloadConfig:
     default=30,
     help="Days per download chunk (1-365)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(1, 64),
+    default=1,
+    help="Number of concurrent download jobs (capped per provider)",
+)
+@click.option(
+    "--cpu-workers",
+    type=click.IntRange(0, 32),
+    default=0,
+    help="Parse downloads in this many processes while fetching continues (0: off)",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Resume an interrupted download, skipping jobs it already completed",
+)
+@click.option(
+    "--deadline-minutes",
+    type=click.IntRange(1, 24 * 60),
+    default=None,
+    help="Defer low-priority backfill jobs that have not started after this many minutes",
+)
+@click.option(
+    "--plan-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the planned download jobs to this JSON file",
+)
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 @click.pass_context
 def download(
@@ -129,8 +188,15 @@ def download(
     output_dir: Optional[Path],
     raw_dir: Optional[Path],
     backup: bool,
+    write_behind: Optional[bool],
+    partitioning: Optional[str],
     force: bool,
     chunk_size: int,
+    workers: int,
+    cpu_workers: int,
+    resume: bool,
+    deadline_minutes: Optional[int],
+    plan_out: Optional[Path],
     yes: bool,
 ) -> None:
     """Download financial data for specified instruments.
@@ -143,6 +209,12 @@ def download(
         vortex download -p barchart -s GCM25 --start-date 2024-01-01
         vortex download -p ibkr -s TSLA --start-date 2024-01-01
         vortex download -s AAPL --output-dir ./custom --raw-dir ./audit
+        vortex download -p yahoo --symbols-file symbols.txt --workers 8
+        vortex download -p yahoo --symbols-file symbols.txt --workers 8 --cpu-workers 2
+        vortex download -p yahoo --symbols-file symbols.txt --resume
+        vortex download -p barchart --deadline-minutes 45
+        vortex download -p barchart --plan-out plan.json
+        vortex download -p ibkr -s SPY --partition year
 
     \b
     Default Assets:
@@ -191,6 +263,12 @@ def download(
         output_dir = Path("./data")
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    general_config = config_manager.load_config().general
+    if partitioning is None:
+        partitioning = general_config.partitioning.value
+    if write_behind is None:
+        write_behind = general_config.write_behind
+
     # Resolve symbols and configurations using extracted module
     try:
         symbols_list, instrument_configs = resolve_symbols_and_configs(
@@ -224,9 +302,27 @@ def download(
         output_dir=output_dir,
         backup_enabled=backup,
         force_backup=force,
-        random_sleep=config_manager.load_config().general.random_sleep_max,
         dry_run=ctx.obj.get("dry_run", False),
         download_config=config_manager.get_provider_config(provider),
+        workers=workers,
+        cpu_workers=cpu_workers,
+        resume=resume,
+        deadline=(
+            datetime.now() + timedelta(minutes=deadline_minutes)
+            if deadline_minutes
+            else None
+        ),
+        plan_out=plan_out,
+        partitioning=partitioning,
+        max_pending_writes=(
+            general_config.write_behind_max_pending if write_behind else 0
+        ),
+        storage_format=general_config.storage_format.value,
+        backup_format=general_config.backup_format.value,
+        backup_deferred=general_config.backup_deferred,
+        arrow_compression=general_config.arrow_compression,
+        csv_engine=general_config.csv_engine,
+        parquet=general_config.parquet.model_dump(),
     )
 
     # Execute download using extracted module
@@ -239,16 +335,26 @@ def download(
         )
         end_time = time.time()
 
-        # Show results
-        failed_jobs = total_jobs - successful_jobs
+        # Show results; deferred jobs are left for a later run, not failed
+        deferred_jobs = executor.deferred_jobs
+        failed_jobs = total_jobs - successful_jobs - deferred_jobs
         show_download_summary(
-            start_time, end_time, total_jobs, successful_jobs, failed_jobs
+            start_time,
+            end_time,
+            total_jobs,
+            successful_jobs,
+            failed_jobs,
+            deferred_jobs,
         )
 
         if successful_jobs > 0:
             console.print(
                 f"[green]✅ Download completed: {successful_jobs}/{total_jobs} successful[/green]"
             )
+        elif deferred_jobs and not failed_jobs:
+            console.print(
+                f"[yellow]All {deferred_jobs} jobs deferred to a later run[/yellow]"
+            )
         else:
             console.print("[red]❌ Download failed: No data downloaded[/red]")
             raise click.Abort()
@@ -9,14 +9,19 @@ import logging
 import time
 from typing import Any, Dict, List
 
+from vortex.exceptions.providers import DataNotFoundError
 from vortex.infrastructure.providers.base import HistoricalDataResult
 from vortex.services.backfill_downloader import BackfillDownloader
+from vortex.services.job_journal import JobJournal
+from vortex.services.job_runner import JobRunner, job_lock_key
+from vortex.services.job_scheduler import PriorityScheduler
 
 # Note: Simple console output instead of complex UX functions
 from vortex.services.updating_downloader import UpdatingDownloader
 from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
 
 from .job_creator import create_jobs_using_downloader_logic, get_periods_for_symbol
+from .job_plan import JobPlan, PlannedJob
 
 
 class JobExecutionContext:
@@ -27,6 +32,8 @@ class JobExecutionContext:
         self.job_number = job_number
         self.total_jobs = total_jobs
         self.symbol = symbol
+        # Captured up front: jobs narrow their date range while running
+        self.journal_key = str(job)
 
 
 class DownloadExecutor:
@@ -36,6 +43,10 @@ class DownloadExecutor:
         self.config = config
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
+        self._job_journal = None
+        # Jobs of the last run left for a later one (deadline or allowance);
+        # neither successful nor failed
+        self.deferred_jobs = 0
 
     def execute_downloads(
         self, symbols: List[str], instrument_configs: Dict[str, Any]
@@ -46,26 +57,40 @@ class DownloadExecutor:
             instrument_configs, symbols
         )
 
-        # Count total jobs for progress tracking
-        total_jobs = self._count_total_jobs(symbols, instrument_configs)
-
-        if total_jobs == 0:
-            self.logger.warning("No download jobs to execute")
-            return 0, 0
-
-        self.logger.info(
-            f"Starting download execution: {len(symbols)} symbols, {total_jobs} total jobs"
-        )
-
-        # Process all downloads
-        success_count = self._process_all_downloads(
-            symbols, instrument_configs, total_jobs
-        )
+        self.deferred_jobs = 0
+        # Journal progress so an interrupted run can resume
+        self._job_journal = self._open_job_journal()
+        downloader = None
+        try:
+            # Plan every job once; the plan drives counting, progress and execution
+            downloader = self._create_downloader()
+            plan = self._build_job_plan(downloader, symbols, instrument_configs)
+            if self.config.plan_out:
+                plan.write_json(self.config.plan_out)
+                self.logger.info(f"Job plan written to {self.config.plan_out}")
+
+            if plan.total_jobs == 0:
+                self.logger.warning("No download jobs to execute")
+                return 0, 0
+
+            self.logger.info(
+                f"Starting download execution: {len(symbols)} symbols, {plan.total_jobs} total jobs"
+            )
+            success_count = self._process_all_downloads(
+                plan, instrument_configs, downloader
+            )
+        finally:
+            # Write-behind storage may still be writing the last series
+            if downloader is not None:
+                downloader.flush_storage()
+            if self._job_journal is not None:
+                self._job_journal.close()
+                self._job_journal = None
 
         self.logger.info(
-            f"Download execution completed: {success_count}/{total_jobs} jobs successful"
+            f"Download execution completed: {success_count}/{plan.total_jobs} jobs successful"
         )
-        return success_count, total_jobs
+        return success_count, plan.total_jobs
 
     def _ensure_instrument_configs(
         self, instrument_configs: dict, symbols: List[str]
@@ -84,18 +109,17 @@ class DownloadExecutor:
 
         return updated_configs
 
-    def _count_total_jobs(self, symbols: List[str], instrument_configs: dict) -> int:
-        """Count total number of download jobs using same logic as actual job creation."""
-        total_jobs = 0
-
-        # Create temporary downloader for job counting
-        downloader = self._create_downloader()
-
+    def _build_job_plan(
+        self, downloader, symbols: List[str], instrument_configs: dict
+    ) -> JobPlan:
+        """Create every download job once using the downloader's job creation logic."""
+        planned = []
+        failed_symbols = []
+        unplanned_jobs = 0
         for symbol in symbols:
             config = instrument_configs.get(symbol, {})
             periods = get_periods_for_symbol(config)
 
-            # Use the same job creation logic to get accurate count
             try:
                 jobs = create_jobs_using_downloader_logic(
                     downloader,
@@ -105,67 +129,169 @@ class DownloadExecutor:
                     self.config.start_date,
                     self.config.end_date,
                 )
-                total_jobs += len(jobs)
             except Exception as e:
-                self.logger.warning(f"Failed to count jobs for symbol {symbol}: {e}")
-                # Fallback to period count if job creation fails
-                total_jobs += len(periods)
+                self.logger.error(f"Failed to create jobs for symbol {symbol}: {e}")
+                # Count one job per period so the symbol is reported as failed
+                failed_symbols.append(symbol)
+                unplanned_jobs += len(periods)
+                continue
 
-        return total_jobs
+            planned.extend(PlannedJob.from_job(job, symbol) for job in jobs)
+
+        return JobPlan(
+            provider=self.config.provider,
+            jobs=tuple(planned),
+            failed_symbols=tuple(failed_symbols),
+            unplanned_jobs=unplanned_jobs,
+        )
 
     def _process_all_downloads(
-        self, symbols: List[str], instrument_configs: dict, total_jobs: int
+        self, plan: JobPlan, instrument_configs: dict, downloader
     ) -> int:
-        """Process all downloads with threading and progress tracking."""
+        """Process all planned downloads on the configured worker pool with progress tracking."""
         start_time = time.time()
         completed_jobs = 0
         successful_jobs = 0
+        total_jobs = plan.total_jobs
 
-        # Create downloader
-        downloader = self._create_downloader()
+        contexts = [
+            JobExecutionContext(planned.job, number, total_jobs, planned.symbol)
+            for number, planned in enumerate(plan.jobs, start=1)
+        ]
 
-        # Process downloads (could be threaded in the future)
-        for symbol in symbols:
-            config = instrument_configs.get(symbol, {})
-            periods = get_periods_for_symbol(config)
-
-            # Create jobs for this symbol
-            try:
-                jobs = create_jobs_using_downloader_logic(
-                    downloader,
-                    symbol,
-                    config,
-                    periods,
-                    self.config.start_date,
-                    self.config.end_date,
-                )
+        contexts, resumed_jobs = self._skip_completed_jobs(contexts, downloader)
+        completed_jobs += resumed_jobs
+        successful_jobs += resumed_jobs
 
-                # Execute jobs for this symbol
-                for job in jobs:
-                    completed_jobs += 1
-                    context = JobExecutionContext(
-                        job, completed_jobs, total_jobs, symbol
-                    )
+        contexts, satisfied_jobs = self._skip_satisfied_jobs(contexts, downloader)
+        completed_jobs += satisfied_jobs
+        successful_jobs += satisfied_jobs
 
-                    if self._process_single_job(context, downloader):
-                        successful_jobs += 1
+        if not contexts:
+            self.logger.info("Stored data is up to date; skipping provider login")
+            return successful_jobs
+        downloader.login()
 
-                    # Show progress
-                    progress = (completed_jobs / total_jobs) * 100
-                    elapsed = time.time() - start_time
-                    self.logger.info(
-                        f"Progress: {completed_jobs}/{total_jobs} ({progress:.1f}%) - "
-                        f"Elapsed: {elapsed:.1f}s"
-                    )
-
-            except Exception as e:
-                self.logger.error(f"Failed to create jobs for symbol {symbol}: {e}")
-                continue
+        contexts = self._schedule_contexts(
+            contexts, instrument_configs, downloader, first_number=completed_jobs + 1
+        )
+        scheduled = len(contexts)
+        contexts = self._fit_allowance(contexts, downloader)
+        self.deferred_jobs += scheduled - len(contexts)
+        downloader.expect_jobs([context.job for context in contexts])
+
+        for context, result, error in self._run_contexts(contexts, downloader):
+            completed_jobs += 1
+            downloader._journal_job_outcome(context.journal_key, result, error)
+            if error is not None:
+                self._log_job_error(context, error)
+            elif result == HistoricalDataResult.DEFERRED:
+                self.deferred_jobs += 1
+            elif self._is_successful(context, result):
+                successful_jobs += 1
+
+            # Show progress
+            progress = (completed_jobs / total_jobs) * 100
+            elapsed = time.time() - start_time
+            self.logger.info(
+                f"Progress: {completed_jobs}/{total_jobs} ({progress:.1f}%) - "
+                f"Elapsed: {elapsed:.1f}s"
+            )
 
+        if self.deferred_jobs:
+            self.logger.warning(f"Deferred {self.deferred_jobs} jobs to a later run")
         return successful_jobs
 
-    def _process_single_job(self, context: JobExecutionContext, downloader) -> bool:
-        """Process a single download job using the shared downloader instance."""
+    def _run_contexts(self, contexts: List[JobExecutionContext], downloader):
+        """Run jobs on the worker pool, or through the downloader's pipeline.
+
+        Yields ``(context, result, error)`` as each job completes.
+        """
+        if isinstance(downloader, UpdatingDownloader) and downloader.pipelined:
+            return downloader.run_pipeline(contexts, job_of=lambda context: context.job)
+        runner = JobRunner(
+            max_workers=self.config.workers,
+            provider_name=self.config.provider,
+            lock_key=lambda context: job_lock_key(context.job),
+        )
+        return runner.run(
+            contexts, lambda context: self._process_single_job(context, downloader)
+        )
+
+    def _open_job_journal(self):
+        """Open the job journal under the output directory (not for dry runs)."""
+        if self.config.dry_run:
+            return None
+        return JobJournal.open(self.config.output_dir, resume=self.config.resume)
+
+    def _skip_completed_jobs(self, contexts: List[JobExecutionContext], downloader):
+        """Record planned jobs and drop those completed by a previous run.
+
+        Returns the remaining contexts and the number of skipped jobs.
+        """
+        jobs, _ = downloader._plan_journaled_jobs([context.job for context in contexts])
+        remaining = self._contexts_of(contexts, jobs)
+        return remaining, len(contexts) - len(remaining)
+
+    def _skip_satisfied_jobs(self, contexts: List[JobExecutionContext], downloader):
+        """Drop jobs whose stored metadata shows there is nothing to fetch.
+
+        Returns the remaining contexts and the number of skipped jobs.
+        """
+        plan = downloader.preflight([context.job for context in contexts])
+        for context in self._contexts_of(contexts, plan.satisfied):
+            downloader._journal_job_outcome(
+                context.journal_key, HistoricalDataResult.EXISTS, None
+            )
+        remaining = self._contexts_of(contexts, plan.pending)
+        return remaining, len(contexts) - len(remaining)
+
+    def _schedule_contexts(
+        self,
+        contexts: List[JobExecutionContext],
+        instrument_configs: dict,
+        downloader,
+        first_number: int = 1,
+    ) -> List[JobExecutionContext]:
+        """Order jobs with the downloader's scheduler and renumber them."""
+        jobs_per_symbol: Dict[str, list] = {}
+        by_job = {}
+        for context in contexts:
+            jobs_per_symbol.setdefault(context.symbol, []).append(context.job)
+            by_job[id(context.job)] = context
+
+        scheduled = downloader.scheduler.schedule(instrument_configs, jobs_per_symbol)
+        ordered = [by_job[id(job)] for job in scheduled]
+        for number, context in enumerate(ordered, start=first_number):
+            context.job_number = number
+        return ordered
+
+    def _fit_allowance(
+        self, contexts: List[JobExecutionContext], downloader
+    ) -> List[JobExecutionContext]:
+        """Keep the scheduled jobs that fit in the provider's download allowance.
+
+        Deferred series are remembered in the job journal so that the next run
+        serves them first.
+        """
+        jobs = downloader._fit_allowance([context.job for context in contexts])
+        return self._contexts_of(contexts, jobs)
+
+    @staticmethod
+    def _contexts_of(
+        contexts: List[JobExecutionContext], jobs
+    ) -> List[JobExecutionContext]:
+        """The contexts of ``jobs``, in their current order."""
+        kept = {id(job) for job in jobs}
+        return [context for context in contexts if id(context.job) in kept]
+
+    def _process_single_job(
+        self, context: JobExecutionContext, downloader
+    ) -> HistoricalDataResult:
+        """Process a single download job using the shared downloader instance.
+
+        Errors are raised to the worker pool, which reports them with the job.
+        """
         config = LoggingConfiguration(
             entry_msg=f"Processing job {context.job_number}/{context.total_jobs}: {context.symbol}",
             entry_level=logging.INFO,
@@ -174,64 +300,144 @@ class DownloadExecutor:
         )
 
         with LoggingContext(config):
-            try:
-                result = downloader._process_job(context.job)
-
-                if result == HistoricalDataResult.OK:
-                    self.logger.debug(
-                        f"Job {context.job_number} completed successfully"
-                    )
-                    return True
-                elif result == HistoricalDataResult.EXISTS:
-                    self.logger.debug(f"Job {context.job_number} - data already exists")
-                    return True
-                else:
-                    self.logger.warning(f"Job {context.job_number} - no data available")
-                    return False
+            if not downloader.scheduler.start(context.job):
+                self.logger.warning(
+                    f"Job {context.job_number} deferred: run deadline passed"
+                )
+                return HistoricalDataResult.DEFERRED
 
+            try:
+                return downloader._process_job(context.job)
             except KeyboardInterrupt:
                 self.logger.info("Download interrupted by user")
                 raise
-            except Exception as e:
-                self.logger.error(f"Job {context.job_number} failed: {e}")
-                return False
+
+    def _log_job_error(self, context: JobExecutionContext, error: Exception) -> None:
+        if isinstance(error, DataNotFoundError):
+            self.logger.warning(f"Job {context.job_number} - no data found: {error}")
+        else:
+            self.logger.error(f"Job {context.job_number} failed: {error}")
+
+    def _is_successful(
+        self, context: JobExecutionContext, result: HistoricalDataResult
+    ) -> bool:
+        """Whether a processed job counts as successful, logging its outcome."""
+        if result == HistoricalDataResult.OK:
+            self.logger.debug(f"Job {context.job_number} completed successfully")
+            return True
+        elif result == HistoricalDataResult.EXISTS:
+            self.logger.debug(f"Job {context.job_number} - data already exists")
+            return True
+        elif result == HistoricalDataResult.UNCHANGED:
+            self.logger.debug(f"Job {context.job_number} - fetched data already stored")
+            return True
+        elif result == HistoricalDataResult.PENDING:
+            self.logger.debug(
+                f"Job {context.job_number} - fetched, journaled once written"
+            )
+            return True
+        elif result == HistoricalDataResult.DEFERRED:
+            self.logger.warning(f"Job {context.job_number} deferred")
+            return False
+        else:
+            self.logger.warning(f"Job {context.job_number} - no data available")
+            return False
+
+    def _deferred_backup(self, primary_storage, backup_storage):
+        """Backup storage copying changed series in one batch at the end of the run."""
+        from vortex.infrastructure.storage.deferred_backup import DeferredBackupStorage
+        from vortex.infrastructure.storage.file_storage import FileStorage
+
+        if not (
+            isinstance(primary_storage, FileStorage)
+            and isinstance(backup_storage, FileStorage)
+        ):
+            self.logger.warning(
+                "Deferred backup needs file storages; backing up each series "
+                "as it is stored"
+            )
+            return backup_storage
+        return DeferredBackupStorage(primary_storage, backup_storage)
 
     def _create_downloader(self):
         """Create appropriate downloader instance."""
         from vortex.infrastructure.providers.factory import ProviderFactory
-        from vortex.infrastructure.storage.csv_storage import CsvStorage
-        from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+        from vortex.infrastructure.storage.factory import create_storage
+        from vortex.infrastructure.storage.parquet_storage import ParquetEncoding
 
-        # Create provider with updated config_manager if available
+        # Create provider with updated config_manager if available. Login is
+        # deferred until preflight shows there is something to fetch.
         factory = ProviderFactory(config_manager=self.config_manager)
         provider = factory.create_provider(
-            self.config.provider, self.config.download_config
+            self.config.provider, self.config.download_config, login=False
         )
 
         # Create storage
-        csv_storage = CsvStorage(str(self.config.output_dir), self.config.dry_run)
-        parquet_storage = (
-            ParquetStorage(str(self.config.output_dir), self.config.dry_run)
-            if self.config.backup_enabled
-            else None
+        def storage(storage_format: str):
+            return create_storage(
+                storage_format,
+                str(self.config.output_dir),
+                self.config.dry_run,
+                partitioning=self.config.partitioning,
+                max_pending_writes=self.config.max_pending_writes,
+                arrow_compression=self.config.arrow_compression,
+                csv_engine=self.config.csv_engine,
+                parquet_encoding=(
+                    ParquetEncoding(**self.config.parquet)
+                    if self.config.parquet
+                    else None
+                ),
+            )
+
+        primary_storage = storage(self.config.storage_format)
+        backup_storage = None
+        if self.config.backup_enabled:
+            if self.config.backup_format == self.config.storage_format:
+                self.logger.warning(
+                    f"Backup format '{self.config.backup_format}' is the primary "
+                    "storage format; skipping backup"
+                )
+            else:
+                backup_storage = storage(self.config.backup_format)
+                if self.config.backup_deferred:
+                    backup_storage = self._deferred_backup(
+                        primary_storage, backup_storage
+                    )
+
+        scheduler = PriorityScheduler(
+            deadline=self.config.deadline,
+            carried_over=(
+                self._job_journal.deferred_keys() if self._job_journal is not None else None
+            ),
         )
 
         # Create downloader
         if self.config.mode == "updating":
             return UpdatingDownloader(
-                data_storage=csv_storage,
+                data_storage=primary_storage,
                 data_provider=provider,
-                backup_data_storage=parquet_storage,
+                backup_data_storage=backup_storage,
                 force_backup=self.config.force_backup,
-                random_sleep_in_sec=self.config.random_sleep,
                 dry_run=self.config.dry_run,
+                max_workers=self.config.workers,
+                job_journal=self._job_journal,
+                scheduler=scheduler,
+                cpu_workers=self.config.cpu_workers,
             )
         else:
+            if self.config.cpu_workers:
+                self.logger.warning(
+                    "Backfill downloads do not run through the pipeline; "
+                    "ignoring cpu_workers"
+                )
             return BackfillDownloader(
-                data_storage=csv_storage,
+                data_storage=primary_storage,
                 data_provider=provider,
-                backup_data_storage=parquet_storage,
+                backup_data_storage=backup_storage,
                 force_backup=self.config.force_backup,
+                max_workers=self.config.workers,
+                job_journal=self._job_journal,
+                scheduler=scheduler,
             )
 
 
@@ -241,6 +447,7 @@ def show_download_summary(
     total_jobs: int,
     successful_jobs: int,
     failed_jobs: int,
+    deferred_jobs: int = 0,
 ) -> None:
     """Display download execution summary."""
     duration = end_time - start_time
@@ -250,6 +457,8 @@ def show_download_summary(
     print(f"  Total Jobs: {total_jobs}")
     print(f"  Successful: {successful_jobs}")
     print(f"  Failed: {failed_jobs}")
+    if deferred_jobs:
+        print(f"  Deferred: {deferred_jobs}")
     print(f"  Success Rate: {success_rate:.1f}%")
     print(f"  Duration: {duration:.2f}s")
     print(
@@ -0,0 +1,86 @@
+"""
+Immutable download job plan for download commands.
+
+The plan is built once per run from the downloader's job creation logic and is
+then used for counting, progress reporting and execution, so jobs (and the
+provider behind them) are never constructed twice. It can be exported as JSON
+for inspection.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+
+@dataclass(frozen=True)
+class PlannedJob:
+    """A download job as planned, before execution narrows its date range."""
+
+    job: Any
+    symbol: str
+    key: str
+    start_date: datetime
+    end_date: datetime
+    requests: int
+
+    @classmethod
+    def from_job(cls, job: Any, symbol: str) -> "PlannedJob":
+        fetch_ranges = getattr(job, "fetch_ranges", None)
+        return cls(
+            job=job,
+            symbol=symbol,
+            key=str(job),
+            start_date=job.start_date,
+            end_date=job.end_date,
+            requests=len(fetch_ranges) if isinstance(fetch_ranges, list) else 1,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "symbol": self.symbol,
+            "instrument": str(self.job.instrument),
+            "period": str(self.job.period),
+            "start_date": _isoformat(self.start_date),
+            "end_date": _isoformat(self.end_date),
+            "requests": self.requests,
+        }
+
+
+@dataclass(frozen=True)
+class JobPlan:
+    """All download jobs of a run, in creation order.
+
+    Symbols whose jobs could not be created are listed in ``failed_symbols``
+    and still count towards ``total_jobs`` with one job per period, so that
+    the run reports them as failed.
+    """
+
+    provider: str
+    jobs: Tuple[PlannedJob, ...] = ()
+    failed_symbols: Tuple[str, ...] = ()
+    unplanned_jobs: int = 0
+
+    @property
+    def total_jobs(self) -> int:
+        return len(self.jobs) + self.unplanned_jobs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "total_jobs": self.total_jobs,
+            "failed_symbols": list(self.failed_symbols),
+            "jobs": [planned.to_dict() for planned in self.jobs],
+        }
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Export the plan as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
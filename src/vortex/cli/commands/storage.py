@@ -0,0 +1,339 @@
+"""CLI storage command for inspecting and tuning stored data."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from vortex.core.config import get_config_manager
+from vortex.infrastructure.storage.deferred_backup import sync_backup
+from vortex.infrastructure.storage.factory import create_storage
+from vortex.infrastructure.storage.file_storage import FileStorage
+from vortex.infrastructure.storage.migration import (
+    MIGRATION_FORMATS,
+    MigrationResult,
+    find_series,
+    migrate_store,
+)
+from vortex.infrastructure.storage.parquet_benchmark import (
+    benchmark_encoding,
+    candidate_encodings,
+    read_series_file,
+)
+from vortex.infrastructure.storage.parquet_storage import (
+    PARQUET_CODECS,
+    ROW_GROUP_SPANS,
+    ParquetEncoding,
+)
+
+console = Console()
+
+DEFAULT_BENCHMARK_CODECS = ("zstd", "lz4", "snappy")
+
+MIB = 1024 * 1024
+
+
+@click.group()
+def storage():
+    """Inspect and tune data storage."""
+
+
+@storage.command("benchmark")
+@click.argument(
+    "files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--codec",
+    "codecs",
+    multiple=True,
+    type=click.Choice(PARQUET_CODECS),
+    help="Codec to try (repeatable, default: zstd, lz4 and snappy)",
+)
+@click.option(
+    "--level",
+    "levels",
+    multiple=True,
+    type=click.IntRange(1, 22),
+    help="Compression level to try with zstd, lz4 and gzip (repeatable)",
+)
+@click.option(
+    "--row-group-rows",
+    multiple=True,
+    type=click.IntRange(min=1),
+    help="Maximum rows per row group to try (repeatable)",
+)
+@click.option(
+    "--row-group-span",
+    multiple=True,
+    type=click.Choice(["none", *ROW_GROUP_SPANS]),
+    help="Row group time span to try (repeatable)",
+)
+@click.option(
+    "--no-dictionary",
+    is_flag=True,
+    help="Also try every setting without dictionary encoding",
+)
+@click.option(
+    "--repeat",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Runs per measurement; the best time is reported",
+)
+def benchmark(
+    files: Tuple[Path, ...],
+    codecs: Tuple[str, ...],
+    levels: Tuple[int, ...],
+    row_group_rows: Tuple[int, ...],
+    row_group_span: Tuple[str, ...],
+    no_dictionary: bool,
+    repeat: int,
+):
+    """Compare Parquet encodings on stored series FILES (CSV, Parquet or Arrow).
+
+    Settings not given on the command line are taken from [general.parquet].
+    """
+    encodings = candidate_encodings(
+        ParquetEncoding(**_configured_parquet()),
+        codecs=codecs or DEFAULT_BENCHMARK_CODECS,
+        levels=levels,
+        row_group_rows=row_group_rows,
+        row_group_spans=[None if span == "none" else span for span in row_group_span],
+        dictionary=[True, False] if no_dictionary else [],
+    )
+
+    for file_path in files:
+        try:
+            df = read_series_file(str(file_path))
+        except (OSError, ValueError) as e:
+            console.print(f"[red]❌ Cannot read {file_path}: {e}[/red]")
+            continue
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = [
+                benchmark_encoding(df, encoding, directory, repeat)
+                for encoding in encodings
+            ]
+
+        table = Table(
+            title=f"{file_path.name}: {len(df):,} rows, "
+            f"{results[0].data_bytes / MIB:.1f} MiB in memory",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        table.add_column("Encoding", style="cyan", no_wrap=True)
+        table.add_column("Size (MiB)", justify="right")
+        table.add_column("Row groups", justify="right")
+        table.add_column("Write (MiB/s)", justify="right")
+        table.add_column("Read (MiB/s)", justify="right")
+        table.add_column("Range read (ms)", justify="right")
+        for result in sorted(results, key=lambda r: r.file_bytes):
+            table.add_row(
+                str(result.encoding),
+                f"{result.file_bytes / MIB:.2f}",
+                str(result.row_groups),
+                f"{result.write_throughput / MIB:.0f}",
+                f"{result.read_throughput / MIB:.0f}",
+                f"{result.range_read_seconds * 1000:.1f}",
+            )
+        console.print(table)
+
+
+@storage.command("migrate")
+@click.option(
+    "--from",
+    "source_format",
+    required=True,
+    type=click.Choice(MIGRATION_FORMATS),
+    help="Format of the stored series",
+)
+@click.option(
+    "--to",
+    "target_format",
+    required=True,
+    type=click.Choice(MIGRATION_FORMATS),
+    help="Format to convert them to (the same format rewrites them)",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Storage root. Default: general.output_directory",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(1, 64),
+    default=os.cpu_count() or 1,
+    show_default="CPU count",
+    help="Number of series converted in parallel",
+)
+@click.option(
+    "--partition",
+    "partitioning",
+    type=click.Choice(["none", "year", "month"]),
+    default=None,
+    help="Layout of the converted series (default: from config)",
+)
+@click.option(
+    "--keep-source",
+    is_flag=True,
+    help="Keep the source files after converting them",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="List the series that would be converted",
+)
+def migrate(
+    source_format: str,
+    target_format: str,
+    output_dir: Optional[Path],
+    workers: int,
+    partitioning: Optional[str],
+    keep_source: bool,
+    dry_run: bool,
+):
+    """Convert every stored series from one format to another.
+
+    Each series is written next to the source, read back and compared by row
+    count and checksum before it replaces it. Series that fail are left as
+    they were. Encoding settings are taken from [general].
+
+    \b
+    Examples:
+        vortex storage migrate --from csv --to parquet --workers 8
+        vortex storage migrate --from csv --to csv --partition year
+    """
+    general = get_config_manager().load_config().general
+    base_path = str(output_dir or general.output_directory)
+    if partitioning is None:
+        partitioning = general.partitioning.value
+
+    if dry_run:
+        series = find_series(base_path, source_format)
+        for series_path in series:
+            console.print(os.path.relpath(series_path, base_path))
+        console.print(
+            f"[yellow]Dry run: {len(series)} {source_format} series would be "
+            f"converted to {target_format}[/yellow]"
+        )
+        return
+
+    def report(result: MigrationResult) -> None:
+        name = os.path.relpath(result.series_path, base_path)
+        if result.succeeded:
+            console.print(f"[green]✓[/green] {name} ({result.row_count:,} rows)")
+        else:
+            console.print(f"[red]❌ {name}: {result.error}[/red]")
+
+    results = migrate_store(
+        base_path,
+        source_format,
+        target_format,
+        workers=workers,
+        keep_source=keep_source,
+        partitioning=partitioning,
+        arrow_compression=general.arrow_compression,
+        parquet=general.parquet.model_dump(),
+        on_result=report,
+    )
+    failed = [result for result in results if not result.succeeded]
+    console.print(
+        f"Converted {len(results) - len(failed)} of {len(results)} series "
+        f"from {source_format} to {target_format}"
+    )
+    if failed:
+        raise click.ClickException(f"{len(failed)} series could not be converted")
+    if results and target_format != source_format:
+        console.print(
+            f"[yellow]Set storage_format = \"{target_format}\" in [general] "
+            "to use the converted series[/yellow]"
+        )
+
+
+@storage.command("sync-backup")
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Storage root. Default: general.output_directory",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(1, 64),
+    default=os.cpu_count() or 1,
+    show_default="CPU count",
+    help="Number of series copied in parallel",
+)
+@click.option(
+    "--all",
+    "copy_all",
+    is_flag=True,
+    help="Copy every stored series, not only those changed since the last sync",
+)
+def sync_backup_command(output_dir: Optional[Path], workers: int, copy_all: bool):
+    """Copy series changed since the last backup to the backup storage.
+
+    With general.backup_deferred, downloads only mark changed series and copy
+    them when the run ends; this copies those left by an interrupted run.
+    Formats and encoding settings are taken from [general].
+
+    \b
+    Examples:
+        vortex storage sync-backup
+        vortex storage sync-backup --all --workers 8
+    """
+    general = get_config_manager().load_config().general
+    base_path = str(output_dir or general.output_directory)
+    if general.backup_format == general.storage_format:
+        raise click.ClickException(
+            "backup_format must differ from storage_format to sync a backup"
+        )
+
+    def file_storage(storage_format) -> FileStorage:
+        data_storage = create_storage(
+            storage_format.value,
+            base_path,
+            dry_run=False,
+            partitioning=general.partitioning.value,
+            arrow_compression=general.arrow_compression,
+            csv_engine=general.csv_engine,
+            parquet_encoding=ParquetEncoding(**general.parquet.model_dump()),
+        )
+        if not isinstance(data_storage, FileStorage):
+            raise click.ClickException(
+                f"Cannot sync a backup of or to '{storage_format.value}' storage"
+            )
+        return data_storage
+
+    primary = file_storage(general.storage_format)
+    backup = file_storage(general.backup_format)
+    result = sync_backup(
+        primary,
+        backup,
+        workers=workers,
+        file_paths=(
+            find_series(base_path, primary.storage_type) if copy_all else None
+        ),
+    )
+    for file_path, error in result.failed.items():
+        console.print(f"[red]❌ {os.path.relpath(file_path, base_path)}: {error}[/red]")
+    console.print(
+        f"Copied {len(result.synced)} series to the {backup.storage_type} backup"
+    )
+    if result.failed:
+        raise click.ClickException(
+            f"{len(result.failed)} series could not be backed up"
+        )
+
+
+def _configured_parquet() -> dict:
+    config = get_config_manager().load_config()
+    return config.general.parquet.model_dump()
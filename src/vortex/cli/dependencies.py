@@ -174,7 +174,7 @@ def _import_rich():
 
 def _import_commands():
     """Import command modules."""
-    from .commands import config, download, metrics, providers, validate
+    from .commands import config, download, metrics, providers, storage, validate
     from .completion import install_completion
     from .help import help as help_command
 
@@ -184,6 +184,7 @@ def _import_commands():
         "providers": providers,
         "validate": validate,
         "metrics": metrics,
+        "storage": storage,
         "help_command": help_command,
         "install_completion": install_completion,
     }
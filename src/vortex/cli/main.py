@@ -292,6 +292,8 @@ def register_commands():
             cli.add_command(commands["validate"])
         if commands.get("metrics"):
             cli.add_command(commands["metrics"])
+        if commands.get("storage"):
+            cli.add_command(commands["storage"])
         if commands.get("help_command"):
             cli.add_command(commands["help_command"])
         if commands.get("install_completion"):
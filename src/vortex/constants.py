@@ -210,6 +210,7 @@ class ProviderConstants:
         MAX_BARS_PER_DOWNLOAD = 20000
         MAX_RETRIES = 3
         REQUEST_TIMEOUT_SECONDS = 30
+        MAX_CONCURRENT_JOBS = 2  # Shared login session; stay polite
 
         # Data validation
         MIN_REQUIRED_DATA_POINTS = 4
@@ -237,6 +238,7 @@ class ProviderConstants:
         MAX_BARS_PER_DOWNLOAD = 50000
         MAX_RETRIES = 3
         REQUEST_TIMEOUT_SECONDS = 15
+        MAX_CONCURRENT_JOBS = 8
 
         # Data validation
         MIN_REQUIRED_DATA_POINTS = 2
@@ -260,6 +262,7 @@ class ProviderConstants:
         # Request limits
         MAX_BARS_PER_DOWNLOAD = 10000
         MAX_RETRIES = 5
+        MAX_CONCURRENT_JOBS = 1  # ib_insync connection is not thread-safe
 
         # Data validation
         MIN_REQUIRED_DATA_POINTS = 1
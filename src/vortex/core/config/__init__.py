@@ -41,8 +41,12 @@ from .models import (
     IBKRConfig,
     LoggingConfig,
     LogLevel,
+    ParquetConfig,
     Provider,
     ProvidersConfig,
+    RateLimitSettings,
+    StorageFormat,
+    StoragePartitioning,
     VortexConfig,
     YahooConfig,
 )
@@ -62,10 +66,14 @@ __all__ = [
     "BarchartConfig",
     "YahooConfig",
     "IBKRConfig",
+    "RateLimitSettings",
     "LoggingConfig",
     "DateRangeConfig",
     "LogLevel",
+    "ParquetConfig",
     "Provider",
+    "StorageFormat",
+    "StoragePartitioning",
     # Configuration management
     "ConfigManager",
     "VortexSettings",
@@ -233,6 +233,8 @@ class ConfigManager:
             raw_config["compress"] = settings.vortex_raw_compress
         if settings.vortex_raw_include_metadata is not None:
             raw_config["include_metadata"] = settings.vortex_raw_include_metadata
+        if settings.vortex_raw_archive is not None:
+            raw_config["archive"] = settings.vortex_raw_archive
 
     def _apply_provider_env_overrides(
         self, config_data: Dict[str, Any], settings: VortexSettings
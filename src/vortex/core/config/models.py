@@ -51,6 +51,49 @@ class Provider(str, Enum):
     IBKR = "ibkr"
 
 
+class StorageFormat(str, Enum):
+    """Storage formats for price series."""
+
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"  # Arrow IPC (Feather v2), memory-mapped on load
+    DUCKDB = "duckdb"  # One embedded database for all series (optional dependency)
+
+
+class StoragePartitioning(str, Enum):
+    """On-disk layout of stored price series."""
+
+    NONE = "none"  # One file per instrument and period
+    YEAR = "year"  # One file per calendar year, e.g. SPY/2024.csv
+    MONTH = "month"  # One file per calendar month, e.g. SPY/2024-01.csv
+
+
+class RateLimitSettings(BaseModel):
+    """Request pacing for a provider; unset fields use the provider's defaults."""
+
+    requests_per_second: Optional[float] = Field(
+        None, ge=0, description="Steady-state request rate (0 disables pacing)"
+    )
+    burst: Optional[int] = Field(
+        None, ge=1, description="Requests allowed back-to-back after idling"
+    )
+    jitter: Optional[float] = Field(
+        None, ge=0, le=300, description="Maximum random delay per paced request (seconds)"
+    )
+    min_requests_per_second: Optional[float] = Field(
+        None, gt=0, description="Lowest rate reached when backing off"
+    )
+    decrease_factor: Optional[float] = Field(
+        None, gt=0, lt=1, description="Rate multiplier applied when throttled"
+    )
+    additive_increase: Optional[float] = Field(
+        None, gt=0, le=1, description="Fraction of the rate regained per success"
+    )
+    max_retry_after: Optional[float] = Field(
+        None, ge=0, description="Longest Retry-After pause honoured (seconds)"
+    )
+
+
 class BarchartConfig(BaseModel):
     """Barchart provider configuration."""
 
@@ -59,6 +102,12 @@ class BarchartConfig(BaseModel):
     daily_limit: int = Field(
         DEFAULT_DAILY_LIMIT, ge=1, le=1000, description="Daily download limit"
     )
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    csv_engine: str = Field(
+        "python",
+        pattern="^(python|pyarrow)$",
+        description="Parser of downloaded CSV data",
+    )
 
     @field_validator("username", "password")
     @classmethod
@@ -79,6 +128,7 @@ class YahooConfig(BaseModel):
 
     # No configuration required for Yahoo Finance
     enabled: bool = Field(True, description="Enable Yahoo Finance provider")
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
 
 
 class IBKRConfig(BaseModel):
@@ -95,6 +145,7 @@ class IBKRConfig(BaseModel):
         le=300,
         description="Connection timeout in seconds",
     )
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
 
 
 class ProvidersConfig(BaseModel):
@@ -167,6 +218,55 @@ class RawConfig(BaseModel):
     include_metadata: bool = Field(
         True, description="Include request metadata with raw data files"
     )
+    archive: bool = Field(
+        False,
+        description="Append responses to rolling zstd archive segments "
+        "instead of one file per response",
+    )
+    archive_segment_mb: int = Field(
+        64, ge=1, le=4096, description="Size at which an archive segment is closed"
+    )
+    archive_segment_hours: int = Field(
+        24, ge=1, le=744, description="Age at which an archive segment is closed"
+    )
+
+
+class ParquetConfig(BaseModel):
+    """Encoding of Parquet files."""
+
+    codec: str = Field(
+        "snappy",
+        pattern="^(zstd|lz4|snappy|gzip|none)$",
+        description="Compression codec",
+    )
+    compression_level: Optional[int] = Field(
+        None, ge=1, le=22, description="Codec level (zstd, lz4 and gzip only)"
+    )
+    row_group_rows: int = Field(
+        64 * 1024, ge=1, description="Maximum rows per row group"
+    )
+    row_group_span: Optional[str] = Field(
+        None,
+        pattern="^(day|week|month|year)$",
+        description="Start a new row group at every day, week, month or year",
+    )
+    dictionary: bool = Field(True, description="Dictionary-encode columns")
+    statistics: bool = Field(
+        True, description="Write column statistics (always kept for the index)"
+    )
+    sorted_index: bool = Field(
+        True, description="Record that rows are sorted by the index"
+    )
+
+    @model_validator(mode="after")
+    def validate_compression_level(self) -> "ParquetConfig":
+        if self.compression_level is not None and self.codec not in (
+            "zstd",
+            "lz4",
+            "gzip",
+        ):
+            raise ValueError(f"codec '{self.codec}' has no compression levels")
+        return self
 
 
 class GeneralConfig(BaseModel):
@@ -187,17 +287,55 @@ class GeneralConfig(BaseModel):
     raw: RawConfig = Field(
         default_factory=RawConfig, description="Raw data storage configuration"
     )
-    backup_enabled: bool = Field(False, description="Enable Parquet backup files")
+    parquet: ParquetConfig = Field(
+        default_factory=ParquetConfig, description="Parquet encoding configuration"
+    )
+    backup_enabled: bool = Field(False, description="Enable backup files")
+    storage_format: StorageFormat = Field(
+        StorageFormat.CSV, description="Format of the primary storage"
+    )
+    backup_format: StorageFormat = Field(
+        StorageFormat.PARQUET, description="Format of the backup storage"
+    )
+    arrow_compression: str = Field(
+        "uncompressed",
+        pattern="^(uncompressed|lz4)$",
+        description="Compression of Arrow files (uncompressed files load zero-copy)",
+    )
+    csv_engine: str = Field(
+        "pandas",
+        pattern="^(pandas|pyarrow)$",
+        description="Parser of stored CSV files (pyarrow parses on several threads)",
+    )
     force_backup: bool = Field(False, description="Force backup even if files exist")
-    dry_run: bool = Field(False, description="Perform dry run without downloading")
-    random_sleep_max: int = Field(
-        10, ge=0, le=300, description="Maximum random sleep between requests (seconds)"
+    backup_deferred: bool = Field(
+        False,
+        description="Copy changed series to the backup in one batch at the end of a run",
+    )
+    partitioning: StoragePartitioning = Field(
+        StoragePartitioning.NONE,
+        description="Split stored series into yearly or monthly files",
+    )
+    write_behind: bool = Field(
+        False,
+        description="Write files on a background thread while downloading continues",
     )
+    write_behind_max_pending: int = Field(
+        32, ge=1, le=1024, description="Series writes queued before downloads wait"
+    )
+    dry_run: bool = Field(False, description="Perform dry run without downloading")
     default_provider: Provider = Field(
         Provider.YAHOO,
         description="Default data provider (yahoo is free and requires no setup)",
     )
 
+    @model_validator(mode="after")
+    def validate_storage_formats(self) -> "GeneralConfig":
+        """Ensure the backup does not write the same files as the primary storage."""
+        if self.backup_enabled and self.backup_format == self.storage_format:
+            raise ValueError("backup_format must differ from storage_format")
+        return self
+
     @field_validator("output_directory", "raw_directory")
     @classmethod
     def validate_directories(cls, v: Path) -> Path:
@@ -316,6 +454,7 @@ class VortexSettings(BaseSettings):
     vortex_raw_include_metadata: Optional[bool] = Field(
         None, alias="VORTEX_RAW_INCLUDE_METADATA"
     )
+    vortex_raw_archive: Optional[bool] = Field(None, alias="VORTEX_RAW_ARCHIVE")
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
@@ -29,6 +29,7 @@ class InstrumentConfig:
         periods: str = None,
         cycle: str | None = None,
         days_count: int | None = None,
+        priority: int | None = None,
     ):
         self.name = name
         self.code = code
@@ -51,6 +52,8 @@ class InstrumentConfig:
             else 0
         )
         self.days_count = days_count if days_count else default_duration_in_days
+        # Higher values are downloaded first within a scheduling tier
+        self.priority = priority if priority else 0
 
     def __str__(self):
         return f"{self.name}|{self.code}|{self.periods}"
@@ -59,6 +59,12 @@ class VortexError(Exception):
         self.timestamp = datetime.now()
         super().__init__(message)
 
+    def __reduce__(self):
+        # Subclasses take other constructor arguments than the message, so
+        # restore the instance state instead of calling __init__ again. Lets
+        # errors raised in worker processes reach the parent intact.
+        return _restore_error, (type(self), self.args, self.__dict__)
+
     def __str__(self) -> str:
         result = self.message
 
@@ -96,3 +102,10 @@ class VortexError(Exception):
         """Add additional context to the exception."""
         self.context.update(kwargs)
         return self
+
+
+def _restore_error(cls, args, state):
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.__dict__.update(state)
+    return error
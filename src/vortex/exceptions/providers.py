@@ -101,6 +101,7 @@ class RateLimitError(DataProviderError):
         help_text += f" or check your {provider} subscription limits"
 
         super().__init__(provider, message, help_text, "RATE_LIMIT")
+        self.wait_time = wait_time
 
 
 class VortexConnectionError(DataProviderError):
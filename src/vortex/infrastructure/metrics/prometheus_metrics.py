@@ -90,6 +90,32 @@ class VortexMetrics:
             buckets=[0.01, 0.1, 0.5, 1.0, 2.0, 5.0],
         )
 
+        self.write_behind_queue_depth = Gauge(
+            "vortex_write_behind_queue_depth",
+            "Series writes queued but not yet written",
+            ["storage_type"],
+        )
+
+        self.write_behind_flush_seconds = Histogram(
+            "vortex_write_behind_flush_seconds",
+            "Time between queueing a series write and it being written",
+            ["storage_type"],
+            buckets=[0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0],
+        )
+
+        # Scheduler metrics
+        self.scheduler_queue_depth = Gauge(
+            "vortex_scheduler_queue_depth",
+            "Scheduled download jobs that have not started yet",
+        )
+
+        self.scheduler_wait_seconds = Histogram(
+            "vortex_scheduler_wait_seconds",
+            "Time between scheduling a download job and starting it",
+            ["priority"],
+            buckets=[1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0],
+        )
+
         # Configuration metrics
         self.config_loads_total = Counter(
             "vortex_config_loads_total", "Total configuration loads", ["status"]
@@ -240,6 +266,22 @@ class VortexMetrics:
             operation=operation, storage_type=storage_type
         ).observe(duration)
 
+    def update_write_behind_queue_depth(self, storage_type: str, depth: int):
+        """Update the number of queued series writes"""
+        if not self._initialized:
+            return
+
+        self.write_behind_queue_depth.labels(storage_type=storage_type).set(depth)
+
+    def record_write_behind_flush(self, storage_type: str, latency: float):
+        """Record how long a queued series write waited until it was written"""
+        if not self._initialized:
+            return
+
+        self.write_behind_flush_seconds.labels(storage_type=storage_type).observe(
+            latency
+        )
+
     def record_config_load(self, success: bool):
         """Record configuration load"""
         if not self._initialized:
@@ -248,6 +290,20 @@ class VortexMetrics:
         status = "success" if success else "error"
         self.config_loads_total.labels(status=status).inc()
 
+    def update_scheduler_queue_depth(self, depth: int):
+        """Update the number of scheduled jobs waiting to start"""
+        if not self._initialized:
+            return
+
+        self.scheduler_queue_depth.set(depth)
+
+    def record_scheduler_wait(self, priority: str, wait_seconds: float):
+        """Record how long a job waited between scheduling and start"""
+        if not self._initialized:
+            return
+
+        self.scheduler_wait_seconds.labels(priority=priority).observe(wait_seconds)
+
     def update_active_correlations(self, count: int):
         """Update active correlation count"""
         if not self._initialized:
@@ -8,9 +8,11 @@ import io
 import logging
 
 import pandas as pd
+import pyarrow as pa
 
 from vortex.models.columns import DATETIME_INDEX_NAME, standardize_dataframe_columns
 from vortex.models.period import Period
+from vortex.utils.arrow_csv import read_csv_arrow
 
 
 class BarchartParser:
@@ -19,6 +21,11 @@ class BarchartParser:
     BARCHART_DATE_TIME_COLUMN = "Time"
     BARCHART_CLOSE_COLUMN = "Last"
 
+    def __init__(self, csv_engine: str = "python"):
+        # "pyarrow" parses with pyarrow's reader, falling back to pandas' python
+        # engine for responses it rejects
+        self.csv_engine = csv_engine
+
     def convert_downloaded_csv_to_df(
         self, period: Period, data: str, tz: str
     ) -> pd.DataFrame:
@@ -38,9 +45,25 @@ class BarchartParser:
         engine = getattr(self, "csv_engine", "python")
         quotechar = getattr(self, "csv_quotechar", '"')
 
-        df = pd.read_csv(
-            iostr, skipfooter=skipfooter, engine=engine, quotechar=quotechar
-        )
+        df = None
+        if engine == "pyarrow":
+            try:
+                df = read_csv_arrow(
+                    data.encode(),
+                    column_types={
+                        self.BARCHART_DATE_TIME_COLUMN: pa.timestamp("ns")
+                    },
+                    timestamp_formats=[date_format],
+                    skip_footer=skipfooter,
+                    quote_char=quotechar,
+                )
+            except pa.ArrowInvalid as e:
+                logging.debug(f"pyarrow could not parse Barchart CSV: {e}")
+                engine = "python"
+        if df is None:
+            df = pd.read_csv(
+                iostr, skipfooter=skipfooter, engine=engine, quotechar=quotechar
+            )
         logging.debug(f"Received data {df.shape} from Barchart")
         logging.debug(f"CSV columns: {list(df.columns)}")
 
@@ -5,14 +5,17 @@ Orchestrates authentication, data fetching, and parsing for Barchart.com financi
 Refactored to use composition and single responsibility principle.
 """
 
+import io
+import logging
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Union
 
+import pandas as pd
 from pandas import DataFrame
 
 from vortex.constants import ProviderConstants
 from vortex.core.error_handling.strategies import ErrorHandlingStrategy
-from vortex.exceptions.providers import DataNotFoundError
+from vortex.exceptions.providers import DataNotFoundError, DataProviderError
 from vortex.models.forex import Forex
 from vortex.models.future import Future
 from vortex.models.period import FrequencyAttributes, Period
@@ -20,7 +23,12 @@ from vortex.models.price_series import FUTURES_SOURCE_TIME_ZONE, STOCK_SOURCE_TI
 from vortex.models.stock import Stock
 
 from vortex.infrastructure.storage.raw_storage import RawDataStorage
-from ..base import DataProvider
+from ..base import (
+    DataProvider,
+    RawResponse,
+    data_not_found_error,
+    parsing_deferred,
+)
 from ..config import BarchartProviderConfig, CircuitBreakerConfig
 from ..interfaces import BarchartHTTPClient, HTTPClientProtocol
 from .auth import BarchartAuth
@@ -29,6 +37,8 @@ from .parser import BarchartParser
 from .url_generator import BarchartURLGenerator
 from .usage_checker import BarchartUsageChecker
 
+logger = logging.getLogger(__name__)
+
 
 class BarchartDataProvider(DataProvider):
     """Enhanced Barchart data provider with configuration-based architecture.
@@ -58,8 +68,8 @@ class BarchartDataProvider(DataProvider):
             circuit_breaker_config: Optional circuit breaker configuration
             raw_storage: Optional raw data storage for raw data trail
         """
-        # Initialize base with circuit breaker config and raw data storage
-        super().__init__(circuit_breaker_config, raw_storage)
+        # Initialize base with circuit breaker config, raw data storage and rate limits
+        super().__init__(circuit_breaker_config, raw_storage, config.rate_limit)
 
         # Store configuration
         self.config = config
@@ -173,6 +183,10 @@ class BarchartDataProvider(DataProvider):
                 default_value=100,
             )
 
+    def get_remaining_allowance(self) -> Optional[int]:
+        """Get today's remaining downloads from the server usage count."""
+        return self.usage_checker.get_remaining_allowance()
+
     def _check_server_usage(self) -> Optional[int]:
         """Check current download usage count (delegated to usage checker)."""
         return self.usage_checker.check_server_usage()
@@ -369,33 +383,18 @@ class BarchartDataProvider(DataProvider):
                 tz,
                 original_instrument,
             )
-            if df is not None:
-                # Barchart-specific: Check minimum data points requirement before validation
-                if len(df) < self.config.min_required_data_points:
-                    from vortex.exceptions.providers import DataProviderError
-
-                    symbol = (
-                        instrument.get_symbol()
-                        if hasattr(instrument, "get_symbol")
-                        else str(instrument)
-                    )
-                    raise DataProviderError(
-                        "barchart",
-                        f"Insufficient data for {symbol} - only {len(df)} records found",
-                        "This may indicate the symbol is delisted or has limited trading history",
-                    )
-
-                # Return data - standardized validation is handled by base class wrapper
-                return df
-
-            # No data found - use standardized error creation
-            raise self._create_data_not_found_error(
+            checks = (
                 instrument,
                 frequency_attributes.frequency,
                 start_date,
                 end_date,
-                "Barchart returned no data for the requested symbol and period",
+                self.config.min_required_data_points,
             )
+            if isinstance(df, RawResponse):
+                # Parsed and checked by the caller, e.g. in a worker process
+                return RawResponse(checked_download, (df, *checks))
+            # Standardized validation is handled by the base class wrapper
+            return checked_download(df, *checks)
 
         except Exception as e:
             logger.error(f"bc-utils download failed for {instrument}: {e}")
@@ -555,6 +554,17 @@ class BarchartDataProvider(DataProvider):
         logger.debug(f"Download response status: {response.status_code}")
         logger.debug(f"Download response headers: {dict(response.headers)}")
 
+        if response.status_code == 429:
+            from vortex.exceptions.providers import RateLimitError
+            from vortex.infrastructure.resilience.rate_limiter import (
+                parse_retry_after,
+            )
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            raise RateLimitError(
+                "barchart", wait_time=int(retry_after) if retry_after else None
+            )
+
         if response.status_code != 200:
             from vortex.exceptions.providers import (
                 VortexConnectionError as ConnectionError,
@@ -656,53 +666,14 @@ class BarchartDataProvider(DataProvider):
 
     def _process_bc_utils_csv_response(
         self, csv_data: str, frequency, tz: str
-    ) -> Optional[DataFrame]:
+    ) -> Union[DataFrame, RawResponse, None]:
         """Process CSV response from bc-utils /my/download endpoint."""
-        import io
-        import logging
-
-        import pandas as pd
-
-        logger = logging.getLogger(__name__)
-
+        if parsing_deferred():
+            return RawResponse(
+                parse_bc_utils_csv, (self.parser, csv_data, frequency, tz)
+            )
         try:
-            # bc-utils CSV format has different column names
-            iostr = io.StringIO(csv_data)
-
-            # Read CSV and check if it has data
-            # Handle quoted timestamps in CSV by specifying quote character
-            df = pd.read_csv(iostr, quotechar='"')
-
-            if df.empty:
-                raise DataNotFoundError("barchart", "unknown", frequency, None, None)
-
-            logger.debug(f"bc-utils CSV columns: {list(df.columns)}")
-            logger.debug(f"bc-utils CSV shape: {df.shape}")
-
-            # Map bc-utils columns to standard format
-            column_mapping = {
-                "tradeTime": "Time",
-                "openPrice": "Open",
-                "highPrice": "High",
-                "lowPrice": "Low",
-                "lastPrice": "Last",
-                "volume": "Volume",
-                "openInterest": "Open Interest",
-            }
-
-            # Rename columns
-            df.rename(columns=column_mapping, inplace=True)
-
-            # Process with our standard parser (which expects Time, Last, etc.)
-
-            # Convert back to CSV string for parser
-            csv_output = io.StringIO()
-            df.to_csv(csv_output, index=False)
-            csv_string = csv_output.getvalue()
-
-            # Use our standard parser instance
-            return self.parser.convert_downloaded_csv_to_df(frequency, csv_string, tz)
-
+            return convert_bc_utils_csv(self.parser, csv_data, frequency, tz)
         except Exception as e:
             if isinstance(e, DataNotFoundError):
                 raise  # Re-raise our standardized error
@@ -718,3 +689,95 @@ class BarchartDataProvider(DataProvider):
     def get_historical_quote_url(self, instrument) -> str:
         """Get historical quote URL (delegated to URL generator)."""
         return self.url_generator.get_historical_quote_url(instrument)
+
+
+def convert_bc_utils_csv(
+    parser: BarchartParser, csv_data: str, frequency, tz: str
+) -> DataFrame:
+    """Convert CSV from the bc-utils /my/download endpoint to a standard DataFrame."""
+    # bc-utils CSV format has different column names
+    iostr = io.StringIO(csv_data)
+
+    # Read CSV and check if it has data
+    # Handle quoted timestamps in CSV by specifying quote character
+    df = pd.read_csv(iostr, quotechar='"')
+
+    if df.empty:
+        raise DataNotFoundError("barchart", "unknown", frequency, None, None)
+
+    logger.debug(f"bc-utils CSV columns: {list(df.columns)}")
+    logger.debug(f"bc-utils CSV shape: {df.shape}")
+
+    # Map bc-utils columns to standard format
+    column_mapping = {
+        "tradeTime": "Time",
+        "openPrice": "Open",
+        "highPrice": "High",
+        "lowPrice": "Low",
+        "lastPrice": "Last",
+        "volume": "Volume",
+        "openInterest": "Open Interest",
+    }
+
+    # Rename columns
+    df.rename(columns=column_mapping, inplace=True)
+
+    # Process with our standard parser (which expects Time, Last, etc.)
+
+    # Convert back to CSV string for parser
+    csv_output = io.StringIO()
+    df.to_csv(csv_output, index=False)
+    csv_string = csv_output.getvalue()
+
+    # Use our standard parser instance
+    return parser.convert_downloaded_csv_to_df(frequency, csv_string, tz)
+
+
+def parse_bc_utils_csv(
+    parser: BarchartParser, csv_data: str, frequency, tz: str
+) -> Optional[DataFrame]:
+    """Deferred _process_bc_utils_csv_response: None when the CSV cannot be parsed."""
+    try:
+        return convert_bc_utils_csv(parser, csv_data, frequency, tz)
+    except DataNotFoundError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to parse bc-utils CSV response: {e}")
+        return None
+
+
+def checked_download(
+    df: Union[DataFrame, RawResponse, None],
+    instrument,
+    period: Period,
+    start_date,
+    end_date,
+    min_required_data_points: int,
+) -> DataFrame:
+    """A bc-utils download, or the error for a missing or too short one."""
+    if isinstance(df, RawResponse):
+        df = df.to_frame()
+    if df is None:
+        # No data found - use standardized error creation
+        raise data_not_found_error(
+            "barchart",
+            instrument,
+            period,
+            start_date,
+            end_date,
+            "Barchart returned no data for the requested symbol and period",
+        )
+
+    # Barchart-specific: Check minimum data points requirement before validation
+    if len(df) < min_required_data_points:
+        symbol = (
+            instrument.get_symbol()
+            if hasattr(instrument, "get_symbol")
+            else str(instrument)
+        )
+        raise DataProviderError(
+            "barchart",
+            f"Insufficient data for {symbol} - only {len(df)} records found",
+            "This may indicate the symbol is delisted or has limited trading history",
+        )
+    return df
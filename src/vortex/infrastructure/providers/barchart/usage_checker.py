@@ -116,7 +116,7 @@ class BarchartUsageChecker:
             if current_usage >= self.daily_limit:
                 raise AllowanceLimitExceededError(
                     provider="barchart",
-                    limit=self.daily_limit,
+                    daily_limit=self.daily_limit,
                     current_usage=current_usage,
                 )
 
@@ -129,6 +129,26 @@ class BarchartUsageChecker:
                 "Could not verify usage count - proceeding with download"
             )
 
+    def get_remaining_allowance(self) -> Optional[int]:
+        """Get the downloads left under the daily limit.
+
+        Returns:
+            Remaining downloads (never negative), or None if the server usage
+            count is unavailable
+        """
+        current_usage = self.check_server_usage()
+        if current_usage is None:
+            self.logger.warning(
+                "Could not verify usage count - download allowance not enforced"
+            )
+            return None
+
+        remaining = max(0, self.daily_limit - current_usage)
+        self.logger.info(
+            f"Usage check: {current_usage}/{self.daily_limit} downloads used, {remaining} remaining"
+        )
+        return remaining
+
     def fetch_usage_data(self, url: str, xsrf_token: str) -> Tuple[dict, str]:
         """Fetch usage data using the client."""
         return self.client.fetch_usage(url, xsrf_token)
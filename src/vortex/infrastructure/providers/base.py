@@ -1,8 +1,11 @@
+import asyncio
 import enum
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from pandas import DataFrame
 from retrying import retry
@@ -25,6 +28,10 @@ from vortex.infrastructure.resilience.circuit_breaker import (
     CircuitBreakerConfig,
     get_circuit_breaker,
 )
+from vortex.infrastructure.resilience.rate_limiter import (
+    RateLimitConfig,
+    get_rate_limiter,
+)
 from vortex.infrastructure.storage.raw_storage import RawDataStorage
 from vortex.models.instrument import Instrument
 from vortex.models.period import FrequencyAttributes, Period
@@ -32,12 +39,20 @@ from vortex.models.period import FrequencyAttributes, Period
 from .metrics import get_metrics_collector
 
 
+# Retry policy shared by the sync and async fetch paths
+FETCH_RETRY_MAX_ATTEMPTS = 5
+FETCH_RETRY_WAIT_MULTIPLIER_MS = 2000
+
+
 class HistoricalDataResult(enum.Enum):
     NONE = 1
     OK = 2
     EXISTS = 3
     EXCEED = 4
     LOW = 5
+    DEFERRED = 6
+    UNCHANGED = 7  # Fetched bars were all stored already; nothing was written
+    PENDING = 8  # Fetched; journaled once its series is written
 
 
 def should_retry(exception: Exception) -> bool:
@@ -69,6 +84,208 @@ def should_retry(exception: Exception) -> bool:
     return not isinstance(exception, permanent_failures)
 
 
+class RawResponse(NamedTuple):
+    """A fetched payload whose parsing the provider left to the caller.
+
+    Providers return these instead of a DataFrame inside deferred_parsing().
+    ``parse(*args)`` is module-level, so the payload can be parsed in a
+    worker process; it returns the DataFrame or raises DataNotFoundError.
+    """
+
+    parse: Callable[..., DataFrame]
+    args: Tuple[Any, ...]
+
+    def to_frame(self) -> DataFrame:
+        return self.parse(*self.args)
+
+
+# Set by deferred_parsing() for the current thread only
+_parsing_deferred: ContextVar[bool] = ContextVar("parsing_deferred", default=False)
+
+
+@contextmanager
+def deferred_parsing() -> Iterator[None]:
+    """Let providers that support it return RawResponse payloads unparsed.
+
+    Used by pipelines that parse in worker processes. Scoped to the calling
+    thread, so other fetches of the same provider are unaffected.
+    """
+    token = _parsing_deferred.set(True)
+    try:
+        yield
+    finally:
+        _parsing_deferred.reset(token)
+
+
+def parsing_deferred() -> bool:
+    """Whether the current fetch runs inside deferred_parsing()."""
+    return _parsing_deferred.get()
+
+
+def data_not_found_error(
+    provider: str,
+    instrument: Instrument,
+    period: Period,
+    start_date: datetime,
+    end_date: datetime,
+    details: Optional[str] = None,
+) -> DataNotFoundError:
+    """DataNotFoundError with consistent context; see DataProvider."""
+    symbol = (
+        instrument.get_symbol()
+        if hasattr(instrument, "get_symbol")
+        else str(instrument)
+    )
+    error = DataNotFoundError(
+        provider=provider,
+        symbol=symbol,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    if details:
+        error.technical_details = details
+    return error
+
+
+def validate_fetched_data(
+    df: "DataFrame",
+    provider_name: str,
+    instrument: "Instrument",
+    period: "Period",
+    start_date=None,
+    end_date=None,
+) -> "DataFrame":
+    """Standardized data validation for all providers.
+
+    Performs consistent validation across all providers:
+    1. Empty data validation
+    2. Required column validation
+    3. Data type validation
+    4. Data quality checks
+
+    Free of provider state so that it can also validate payloads parsed in
+    a worker process.
+
+    Args:
+        df: DataFrame to validate
+        provider_name: Name of the provider that returned the data
+        instrument: Instrument that was fetched
+        period: Time period that was fetched
+        start_date: Optional start date for context
+        end_date: Optional end date for context
+
+    Returns:
+        DataFrame: Validated DataFrame
+
+    Raises:
+        DataNotFoundError: If data is empty or insufficient
+        DataProviderError: If validation fails with unrecoverable errors
+    """
+    import logging
+
+    from vortex.models.columns import (
+        ValidationIssueType,
+        get_provider_expected_columns,
+        validate_column_data_types,
+        validate_required_columns,
+    )
+
+    logger = logging.getLogger(__name__)
+    provider = provider_name.lower()
+
+    # 1. Check for empty data (critical - always fail fast)
+    if df is None or df.empty:
+        raise data_not_found_error(
+            provider,
+            instrument,
+            period,
+            start_date,
+            end_date,
+            f"{provider_name} returned empty dataset",
+        )
+
+    # 2. Validate required columns (critical - always fail fast)
+    required_cols, optional_cols = get_provider_expected_columns(provider)
+    missing_cols, found_cols = validate_required_columns(
+        df.columns, required_cols, case_insensitive=True
+    )
+    if missing_cols:
+        from vortex.exceptions.providers import DataProviderError
+
+        symbol = (
+            instrument.get_symbol()
+            if hasattr(instrument, "get_symbol")
+            else str(instrument)
+        )
+        raise DataProviderError(
+            provider=provider,
+            message=f"Data validation failed: Missing required columns {missing_cols} "
+            f"for {symbol}. Found columns: {list(df.columns)}",
+        )
+
+    # 3. Log missing optional columns (informational only)
+    missing_optional = set(optional_cols) - set(df.columns)
+    if missing_optional:
+        logger.debug(
+            f"{provider_name}: Missing optional columns {missing_optional}"
+        )
+
+    # 4. Perform data type validation (quality - warn but continue)
+    try:
+        is_valid, issues = validate_column_data_types(df, strict=False)
+        if issues:
+            # Categorize issues by severity
+            critical_issues = [
+                issue
+                for issue in issues
+                if issue.type
+                in [
+                    ValidationIssueType.INDEX_TYPE_MISMATCH,
+                    ValidationIssueType.COLUMN_TYPE_MISMATCH,
+                ]
+            ]
+            quality_issues = [
+                issue for issue in issues if issue not in critical_issues
+            ]
+
+            # Critical data type issues - log as warnings but continue
+            for issue in critical_issues:
+                logger.warning(f"{provider_name} data type issue: {issue}")
+
+            # Quality issues - log as debug
+            for issue in quality_issues:
+                logger.debug(f"{provider_name} data quality issue: {issue}")
+
+    except Exception as validation_error:
+        # Don't fail the entire fetch due to validation infrastructure issues
+        logger.warning(
+            f"{provider_name} data type validation failed: {validation_error}"
+        )
+
+    logger.debug(
+        f"{provider_name} data validation passed: {df.shape} rows, columns: {list(df.columns)}"
+    )
+    return df
+
+
+def parse_validated(
+    raw: RawResponse,
+    provider_name: str,
+    instrument: Instrument,
+    period: Period,
+    start_date: datetime,
+    end_date: datetime,
+) -> Optional[DataFrame]:
+    """Parse a RawResponse and validate it as a fetched DataFrame would be."""
+    result = raw.to_frame()
+    if result is not None and not result.empty:
+        result = validate_fetched_data(
+            result, provider_name, instrument, period, start_date, end_date
+        )
+    return result
+
+
 class DataProvider(ABC):
     """Enhanced abstract base class for all data providers.
 
@@ -83,6 +300,7 @@ class DataProvider(ABC):
         self,
         circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
         raw_storage: Optional[RawDataStorage] = None,
+        rate_limit_config: Optional[RateLimitConfig] = None,
     ):
         """Initialize the data provider with enhanced capabilities."""
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -102,6 +320,13 @@ class DataProvider(ABC):
             f"provider_{self.get_name().lower()}", cb_config
         )
 
+        # Rate limiter shared by every worker talking to this provider; without
+        # a configuration requests are not paced
+        self._rate_limiter = get_rate_limiter(
+            f"provider_{self.get_name().lower()}",
+            rate_limit_config or RateLimitConfig(requests_per_second=0),
+        )
+
         # Initialize metrics collector for this provider
         self._metrics_collector = get_metrics_collector(self.get_name().lower())
 
@@ -172,6 +397,30 @@ class DataProvider(ABC):
         freq_attr = freq_dict.get(period)
         return freq_attr.max_window if freq_attr else None
 
+    def get_max_bars(self, period: Period) -> Optional[int]:
+        """Get the maximum number of bars a single request can return.
+
+        Args:
+            period: The time period to check
+
+        Returns:
+            Bar limit per request, or None if the provider does not declare one
+        """
+        freq_dict = self._get_frequency_attr_dict()
+        freq_attr = freq_dict.get(period)
+        if not freq_attr or not freq_attr.properties:
+            return None
+        return freq_attr.properties.get("max_bars")
+
+    def get_remaining_allowance(self) -> Optional[int]:
+        """Get the number of downloads still allowed today.
+
+        Returns:
+            Remaining downloads, or None if the provider has no daily limit or
+            its current usage cannot be determined
+        """
+        return None
+
     def get_min_start(self, period: Period) -> Optional[datetime]:
         """Get minimum start date for a given period.
 
@@ -260,8 +509,8 @@ class DataProvider(ABC):
             )
 
     @retry(
-        wait_exponential_multiplier=2000,
-        stop_max_attempt_number=5,
+        wait_exponential_multiplier=FETCH_RETRY_WAIT_MULTIPLIER_MS,
+        stop_max_attempt_number=FETCH_RETRY_MAX_ATTEMPTS,
         retry_on_exception=should_retry,
     )
     def _fetch_historical_data_with_retry(
@@ -293,7 +542,7 @@ class DataProvider(ABC):
                 "Data fetch completed successfully",
                 provider=self.get_name(),
                 correlation_id=correlation_id,
-                rows_fetched=len(result) if result is not None else 0,
+                rows_fetched=len(result) if isinstance(result, DataFrame) else 0,
             )
 
             return result
@@ -326,6 +575,172 @@ class DataProvider(ABC):
                 correlation_id=correlation_id,
             )
 
+    async def fetch_historical_data_async(
+        self,
+        instrument: Instrument,
+        period: Period,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[DataFrame]:
+        """Async counterpart of fetch_historical_data.
+
+        Applies the same period validation, retry policy, circuit breaker and
+        data validation, but awaits _fetch_historical_data_async so that many
+        requests can be in flight on one event loop.
+
+        Correlation context is thread-local, so a fresh correlation ID is
+        generated per call instead of relying on the ambient context.
+
+        Args:
+            instrument: The financial instrument to fetch data for
+            period: The time period/frequency for the data
+            start_date: Start date for the data range
+            end_date: End date for the data range
+
+        Returns:
+            DataFrame with OHLCV data, or None if no data available
+        """
+        correlation_id = CorrelationIdManager.generate_id()
+
+        freq_attr = self._get_frequency_attr_dict().get(period)
+        if freq_attr is None:
+            validation_error = ValueError(
+                f"Period {period} is not supported by provider {self.get_name()}"
+            )
+            return self._handle_provider_error(
+                validation_error,
+                "fetch_historical_data",
+                ErrorHandlingStrategy.FAIL_FAST,
+                instrument=instrument,
+                period=period,
+                correlation_id=correlation_id,
+            )
+
+        with self._metrics_collector.track_operation(
+            "fetch_historical_data",
+            correlation_id=correlation_id,
+            symbol=getattr(instrument, "symbol", str(instrument)),
+            period=str(period),
+        ):
+            attempt = 1
+            while True:
+                try:
+                    return await self._fetch_historical_data_once_async(
+                        instrument, freq_attr, start_date, end_date, correlation_id
+                    )
+                except Exception as e:
+                    if attempt >= FETCH_RETRY_MAX_ATTEMPTS or not should_retry(e):
+                        raise
+                    # Same exponential schedule as the retrying decorator
+                    wait_ms = FETCH_RETRY_WAIT_MULTIPLIER_MS * (2**attempt)
+                    await asyncio.sleep(wait_ms / 1000)
+                    attempt += 1
+
+    async def _fetch_historical_data_once_async(
+        self,
+        instrument: Instrument,
+        freq_attr: FrequencyAttributes,
+        start_date: datetime,
+        end_date: datetime,
+        correlation_id: str,
+    ) -> Optional[DataFrame]:
+        """Single async fetch attempt; mirrors _fetch_historical_data_with_retry."""
+        try:
+            result = await self._circuit_breaker.call_async(
+                self._fetch_historical_data_with_validation_async,
+                instrument,
+                freq_attr,
+                start_date,
+                end_date,
+            )
+
+            self._log_with_context(
+                "info",
+                "Data fetch completed successfully",
+                provider=self.get_name(),
+                correlation_id=correlation_id,
+                rows_fetched=len(result) if isinstance(result, DataFrame) else 0,
+            )
+
+            return result
+
+        except Exception as e:
+            self._log_with_context(
+                "error",
+                f"Data fetch failed: {str(e)}",
+                provider=self.get_name(),
+                correlation_id=correlation_id,
+                exception_type=type(e).__name__,
+            )
+
+            if hasattr(e, "add_context"):
+                e.add_context(
+                    provider=self.get_name(),
+                    symbol=getattr(instrument, "symbol", str(instrument)),
+                    operation="fetch_historical_data",
+                    correlation_id=correlation_id,
+                )
+
+            return self._handle_provider_error(
+                e,
+                "fetch_historical_data",
+                ErrorHandlingStrategy.FAIL_FAST,
+                instrument=instrument,
+                period=freq_attr.frequency,
+                correlation_id=correlation_id,
+            )
+
+    async def _fetch_historical_data_with_validation_async(
+        self,
+        instrument: Instrument,
+        frequency_attributes: FrequencyAttributes,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[DataFrame]:
+        """Async counterpart of _fetch_historical_data_with_validation."""
+        await self._rate_limiter.acquire_async()
+        try:
+            result = await self._fetch_historical_data_async(
+                instrument, frequency_attributes, start_date, end_date
+            )
+        except Exception as e:
+            self._rate_limiter.record_outcome(e)
+            raise
+        self._rate_limiter.record_outcome(None)
+
+        return self._validate_result(
+            result, instrument, frequency_attributes.frequency, start_date, end_date
+        )
+
+    async def _fetch_historical_data_async(
+        self,
+        instrument: Instrument,
+        frequency_attributes: FrequencyAttributes,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Optional[DataFrame]:
+        """Internal async method to fetch historical data.
+
+        Default implementation runs the blocking _fetch_historical_data in a
+        worker thread. Providers with a native async client should override it.
+
+        Args:
+            instrument: The financial instrument to fetch data for
+            frequency_attributes: Detailed frequency information including properties
+            start_date: Start date for the data range
+            end_date: End date for the data range
+
+        Returns:
+            DataFrame with OHLCV data, or None if no data available
+        """
+        return await asyncio.to_thread(
+            self._fetch_historical_data,
+            instrument,
+            frequency_attributes,
+            start_date,
+            end_date,
+        )
+
     def validate_configuration(self) -> bool:
         """Validate provider configuration.
 
@@ -348,6 +763,26 @@ class DataProvider(ABC):
         """
         return []
 
+    def _validate_result(
+        self,
+        result: Any,
+        instrument: Instrument,
+        period: Period,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Any:
+        """Validate a fetch result; a RawResponse is validated once parsed."""
+        if isinstance(result, RawResponse):
+            return RawResponse(
+                parse_validated,
+                (result, self.get_name(), instrument, period, start_date, end_date),
+            )
+        if result is not None and not result.empty:
+            result = self._validate_fetched_data(
+                result, instrument, period, start_date, end_date
+            )
+        return result
+
     def _validate_fetched_data(
         self,
         df: "DataFrame",
@@ -356,113 +791,11 @@ class DataProvider(ABC):
         start_date=None,
         end_date=None,
     ) -> "DataFrame":
-        """Standardized data validation for all providers.
-
-        Performs consistent validation across all providers:
-        1. Empty data validation
-        2. Required column validation
-        3. Data type validation
-        4. Data quality checks
-
-        Args:
-            df: DataFrame to validate
-            instrument: Instrument that was fetched
-            period: Time period that was fetched
-            start_date: Optional start date for context
-            end_date: Optional end date for context
-
-        Returns:
-            DataFrame: Validated DataFrame
-
-        Raises:
-            DataNotFoundError: If data is empty or insufficient
-            DataProviderError: If validation fails with unrecoverable errors
-        """
-        import logging
-
-        from vortex.models.columns import (
-            ValidationIssueType,
-            get_provider_expected_columns,
-            validate_column_data_types,
-            validate_required_columns,
+        """Standardized data validation for all providers; see validate_fetched_data."""
+        return validate_fetched_data(
+            df, self.get_name(), instrument, period, start_date, end_date
         )
 
-        logger = logging.getLogger(__name__)
-        provider_name = self.get_name().lower()
-
-        # 1. Check for empty data (critical - always fail fast)
-        if df is None or df.empty:
-            raise self._create_data_not_found_error(
-                instrument,
-                period,
-                start_date,
-                end_date,
-                f"{self.get_name()} returned empty dataset",
-            )
-
-        # 2. Validate required columns (critical - always fail fast)
-        required_cols, optional_cols = get_provider_expected_columns(provider_name)
-        missing_cols, found_cols = validate_required_columns(
-            df.columns, required_cols, case_insensitive=True
-        )
-        if missing_cols:
-            from vortex.exceptions.providers import DataProviderError
-
-            symbol = (
-                instrument.get_symbol()
-                if hasattr(instrument, "get_symbol")
-                else str(instrument)
-            )
-            raise DataProviderError(
-                provider=self.get_name().lower(),
-                message=f"Data validation failed: Missing required columns {missing_cols} "
-                f"for {symbol}. Found columns: {list(df.columns)}",
-            )
-
-        # 3. Log missing optional columns (informational only)
-        missing_optional = set(optional_cols) - set(df.columns)
-        if missing_optional:
-            logger.debug(
-                f"{self.get_name()}: Missing optional columns {missing_optional}"
-            )
-
-        # 4. Perform data type validation (quality - warn but continue)
-        try:
-            is_valid, issues = validate_column_data_types(df, strict=False)
-            if issues:
-                # Categorize issues by severity
-                critical_issues = [
-                    issue
-                    for issue in issues
-                    if issue.type
-                    in [
-                        ValidationIssueType.INDEX_TYPE_MISMATCH,
-                        ValidationIssueType.COLUMN_TYPE_MISMATCH,
-                    ]
-                ]
-                quality_issues = [
-                    issue for issue in issues if issue not in critical_issues
-                ]
-
-                # Critical data type issues - log as warnings but continue
-                for issue in critical_issues:
-                    logger.warning(f"{self.get_name()} data type issue: {issue}")
-
-                # Quality issues - log as debug
-                for issue in quality_issues:
-                    logger.debug(f"{self.get_name()} data quality issue: {issue}")
-
-        except Exception as validation_error:
-            # Don't fail the entire fetch due to validation infrastructure issues
-            logger.warning(
-                f"{self.get_name()} data type validation failed: {validation_error}"
-            )
-
-        logger.debug(
-            f"{self.get_name()} data validation passed: {df.shape} rows, columns: {list(df.columns)}"
-        )
-        return df
-
     def _handle_provider_error(
         self,
         error: Exception,
@@ -512,21 +845,9 @@ class DataProvider(ABC):
         Returns:
             DataNotFoundError with consistent formatting
         """
-        symbol = (
-            instrument.get_symbol()
-            if hasattr(instrument, "get_symbol")
-            else str(instrument)
+        return data_not_found_error(
+            self.get_name().lower(), instrument, period, start_date, end_date, details
         )
-        error = DataNotFoundError(
-            provider=self.get_name().lower(),
-            symbol=symbol,
-            period=period,
-            start_date=start_date,
-            end_date=end_date,
-        )
-        if details:
-            error.technical_details = details
-        return error
 
     def _create_connection_error(
         self, details: str, operation: Optional[str] = None
@@ -582,22 +903,20 @@ class DataProvider(ABC):
             DataFrame with validated OHLCV data, or None if no data available
         """
         try:
-            # Call the provider-specific implementation
-            result = self._fetch_historical_data(
-                instrument, frequency_attributes, start_date, end_date
-            )
-
-            # Apply standardized validation if data was returned
-            if result is not None and not result.empty:
-                result = self._validate_fetched_data(
-                    result,
-                    instrument,
-                    frequency_attributes.frequency,
-                    start_date,
-                    end_date,
+            # Call the provider-specific implementation, paced by the rate limiter
+            self._rate_limiter.acquire()
+            try:
+                result = self._fetch_historical_data(
+                    instrument, frequency_attributes, start_date, end_date
                 )
+            except Exception as e:
+                self._rate_limiter.record_outcome(e)
+                raise
+            self._rate_limiter.record_outcome(None)
 
-            return result
+            return self._validate_result(
+                result, instrument, frequency_attributes.frequency, start_date, end_date
+            )
 
         except Exception as e:
             # Log with correlation context
@@ -121,7 +121,7 @@ class BarchartProviderBuilder(ProviderBuilder):
             self._config.username, self._config.password
         )
         http_client = self._http_client or BarchartHTTPClient(auth.session)
-        parser = self._parser or BarchartParser()
+        parser = self._parser or BarchartParser(csv_engine=self._config.csv_engine)
 
         # Create circuit breaker configuration
         cb_config = self._circuit_breaker_config or CircuitBreakerConfig(
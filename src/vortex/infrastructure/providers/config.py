@@ -5,9 +5,17 @@ This module defines configuration dataclasses for all data providers,
 eliminating hardcoded values and providing type-safe configuration.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, Optional
 
+from vortex.infrastructure.resilience.rate_limiter import RateLimitConfig
+
+# Default request pacing per provider, overridable via [providers.*.rate_limit]
+BARCHART_RATE_LIMIT = RateLimitConfig(requests_per_second=0.2, burst=1, jitter=2.0)
+YAHOO_RATE_LIMIT = RateLimitConfig(requests_per_second=2.0, burst=5, jitter=0.25)
+# IBKR pacing rules allow 60 historical data requests per 10 minutes
+IBKR_RATE_LIMIT = RateLimitConfig(requests_per_second=0.1, burst=6, jitter=0.0)
+
 
 @dataclass
 class BarchartProviderConfig:
@@ -19,6 +27,9 @@ class BarchartProviderConfig:
 
     # Rate limiting
     daily_limit: int = 150
+    rate_limit: RateLimitConfig = field(
+        default_factory=lambda: replace(BARCHART_RATE_LIMIT)
+    )
 
     # Network timeouts
     request_timeout: int = 30
@@ -39,6 +50,9 @@ class BarchartProviderConfig:
     min_required_data_points: int = 1
     max_bars_per_download: int = 10000
 
+    # CSV parser for downloads: pandas' "python" engine or "pyarrow"
+    csv_engine: str = "python"
+
     # Circuit breaker settings
     circuit_breaker_failure_threshold: int = 3
     circuit_breaker_recovery_timeout: int = 60
@@ -54,6 +68,7 @@ class BarchartProviderConfig:
                 self.download_timeout > 0,
                 self.max_retries >= 0,
                 self.daily_limit > 0,
+                self.rate_limit.validate(),
                 # Fixed: Add validation for data validation parameters
                 self.min_required_data_points > 0,
                 self.max_bars_per_download > 0,
@@ -77,6 +92,10 @@ class BarchartProviderConfig:
             "request_timeout": config_data.get("request_timeout", 30),
             "download_timeout": config_data.get("download_timeout", 60),
             "max_retries": config_data.get("max_retries", 3),
+            "rate_limit": RateLimitConfig.from_dict(
+                config_data.get("rate_limit"), BARCHART_RATE_LIMIT
+            ),
+            "csv_engine": config_data.get("csv_engine"),
         }
 
         return cls(**{k: v for k, v in mapped_data.items() if v is not None})
@@ -109,6 +128,9 @@ class YahooProviderConfig:
 
     # Rate limiting (Yahoo has implicit limits)
     rate_limit_delay: float = 0.1
+    rate_limit: RateLimitConfig = field(
+        default_factory=lambda: replace(YAHOO_RATE_LIMIT)
+    )
 
     def validate(self) -> bool:
         """Validate configuration parameters."""
@@ -118,6 +140,7 @@ class YahooProviderConfig:
                 self.max_retries >= 0,
                 self.cache_ttl_hours > 0,
                 self.rate_limit_delay >= 0,
+                self.rate_limit.validate(),
             ]
         )
 
@@ -136,6 +159,9 @@ class YahooProviderConfig:
             request_timeout=config_data.get("request_timeout", 30),
             max_retries=config_data.get("max_retries", 3),
             validate_data_types=config_data.get("validate_data_types", True),
+            rate_limit=RateLimitConfig.from_dict(
+                config_data.get("rate_limit"), YAHOO_RATE_LIMIT
+            ),
         )
 
 
@@ -169,6 +195,9 @@ class IBKRProviderConfig:
     heartbeat_interval: int = 60
     max_idle_time: int = 300
 
+    # Rate limiting
+    rate_limit: RateLimitConfig = field(default_factory=lambda: replace(IBKR_RATE_LIMIT))
+
     def validate(self) -> bool:
         """Validate configuration parameters."""
         return all(
@@ -178,6 +207,7 @@ class IBKRProviderConfig:
                 self.connection_timeout > 0,
                 self.historical_data_timeout > 0,
                 self.max_retries >= 0,
+                self.rate_limit.validate(),
             ]
         )
 
@@ -196,6 +226,9 @@ class IBKRProviderConfig:
             client_id=config_data.get("client_id"),
             connection_timeout=config_data.get("connection_timeout", 30),
             max_retries=config_data.get("max_retries", 3),
+            rate_limit=RateLimitConfig.from_dict(
+                config_data.get("rate_limit"), IBKR_RATE_LIMIT
+            ),
         )
 
 
@@ -50,15 +50,23 @@ class ProviderFactory:
             "yahoo": YahooProviderBuilder,
             "ibkr": IBKRProviderBuilder,
         }
+        # Providers that open a session (Barchart login, IBKR connection) on creation
+        self._login_on_create = {"barchart", "ibkr"}
 
     def create_provider(
-        self, provider_name: str, config_override: Optional[Dict[str, Any]] = None
+        self,
+        provider_name: str,
+        config_override: Optional[Dict[str, Any]] = None,
+        login: bool = True,
     ) -> DataProviderProtocol:
         """Create a provider instance with proper dependency injection.
 
         Args:
             provider_name: Name of the provider to create
             config_override: Optional configuration to override defaults
+            login: Open the provider session right away. Pass False to defer it
+                until the caller knows there is data to fetch, then call
+                ``provider.login()`` itself.
 
         Returns:
             Configured provider instance
@@ -76,7 +84,12 @@ class ProviderFactory:
         builder = self._provider_builders[provider_name]
 
         # Build with configuration
-        return builder(config_override)
+        provider = builder(config_override)
+
+        if login and provider_name in self._login_on_create:
+            provider.login()
+
+        return provider
 
     def get_builder(self, provider_name: str):
         """Get a fresh builder instance for the specified provider.
@@ -160,12 +173,7 @@ class ProviderFactory:
             if "parser" in config_override:
                 builder.with_parser(config_override["parser"])
 
-        provider = builder.build()
-
-        # Perform explicit login now that provider is configured
-        provider.login()
-
-        return provider
+        return builder.build()
 
     def _build_yahoo_provider(
         self, config_override: Optional[Dict[str, Any]] = None
@@ -217,12 +225,7 @@ class ProviderFactory:
             if "connection_manager" in config_override:
                 builder.with_connection_manager(config_override["connection_manager"])
 
-        provider = builder.build()
-
-        # Perform explicit login now that provider is configured
-        provider.login()
-
-        return provider
+        return builder.build()
 
     def register_provider(
         self,
@@ -317,6 +320,9 @@ class ProviderFactory:
                 retention_days=raw_config.retention_days,
                 compress=raw_config.compress,
                 include_metadata=raw_config.include_metadata,
+                archive=raw_config.archive,
+                archive_segment_mb=raw_config.archive_segment_mb,
+                archive_segment_hours=raw_config.archive_segment_hours,
             )
         except Exception:
             # If configuration loading fails, return None to disable raw data storage
@@ -50,11 +50,13 @@ class IbkrDataProvider(DataProvider):
             circuit_breaker_config: Optional circuit breaker configuration
             raw_storage: Optional raw data storage for raw data trail
         """
-        # Initialize base with circuit breaker config and raw data storage
-        super().__init__(circuit_breaker_config, raw_storage)
+        config = config or IBKRProviderConfig()
+
+        # Initialize base with circuit breaker config, raw data storage and rate limits
+        super().__init__(circuit_breaker_config, raw_storage, config.rate_limit)
 
         # Store configuration
-        self.config = config or IBKRProviderConfig()
+        self.config = config
         if not self.config.validate():
             raise ValueError("Invalid IBKR provider configuration")
 
@@ -180,17 +182,40 @@ class IbkrDataProvider(DataProvider):
             ),
         ]
 
-    @singledispatchmethod
     def _fetch_historical_data(
-        self, stock: Stock, frequency_attributes: FrequencyAttributes, start, end
+        self, instrument, frequency_attributes: FrequencyAttributes, start, end
     ) -> DataFrame:
-        ib_contract = IB_Stock(stock.get_symbol(), "SMART", "USD")
-        return self.fetch_historical_data_for_symbol(ib_contract, frequency_attributes)
+        ib_contract, what_to_show = self._make_ib_contract(instrument)
+        return self.fetch_historical_data_for_symbol(
+            ib_contract, frequency_attributes, what_to_show
+        )
 
-    @_fetch_historical_data.register
-    def _(
-        self, future: Future, frequency_attributes: FrequencyAttributes, start, end
+    async def _fetch_historical_data_async(
+        self, instrument, frequency_attributes: FrequencyAttributes, start, end
     ) -> DataFrame:
+        """Fetch through ib_insync's native async API instead of a worker thread."""
+        ib_contract, what_to_show = self._make_ib_contract(instrument)
+        try:
+            self.ib.reqMarketDataType(self.config.market_data_type)
+
+            bars = await self.ib.reqHistoricalDataAsync(
+                ib_contract,
+                **self._historical_data_request_args(
+                    frequency_attributes, what_to_show
+                ),
+            )
+            return self._bars_to_dataframe(
+                bars, ib_contract, frequency_attributes, what_to_show
+            )
+        except Exception as e:
+            return self._handle_fetch_error(e, ib_contract, frequency_attributes)
+
+    @singledispatchmethod
+    def _make_ib_contract(self, stock: Stock):
+        return IB_Stock(stock.get_symbol(), "SMART", "USD"), "TRADES"
+
+    @_make_ib_contract.register
+    def _(self, future: Future):
         # Fixed: Validate futures_code format before splitting
         if "." not in future.futures_code:
             raise ValueError(
@@ -222,15 +247,23 @@ class IbkrDataProvider(DataProvider):
         # COTTON, TT, NYMEX, USD, 50000, 1, FALSE
         # COFFEE, KC, NYBOT, USD, 37500, 100, FALSE
 
-        return self.fetch_historical_data_for_symbol(ib_contract, frequency_attributes)
-
-    @_fetch_historical_data.register
-    def _(
-        self, forex: Forex, frequency_attributes: FrequencyAttributes, start, end
-    ) -> DataFrame:
-        ib_contract = IB_Forex(pair=forex.get_symbol())
-        return self.fetch_historical_data_for_symbol(
-            ib_contract, frequency_attributes, "MIDPOINT"
+        return ib_contract, "TRADES"
+
+    @_make_ib_contract.register
+    def _(self, forex: Forex):
+        return IB_Forex(pair=forex.get_symbol()), "MIDPOINT"
+
+    def _historical_data_request_args(
+        self, frequency_attributes: FrequencyAttributes, what_to_show: str
+    ) -> dict:
+        return dict(
+            endDateTime="",
+            durationStr=frequency_attributes.properties["duration"],
+            barSizeSetting=frequency_attributes.properties["bar_size"],
+            whatToShow=what_to_show,
+            useRTH=self.config.use_rth_only,
+            formatDate=2,
+            timeout=self.config.historical_data_timeout,
         )
 
     def fetch_historical_data_for_symbol(
@@ -243,96 +276,101 @@ class IbkrDataProvider(DataProvider):
 
             bars = self.ib.reqHistoricalData(
                 contract,
-                endDateTime="",
-                durationStr=frequency_attributes.properties["duration"],
-                barSizeSetting=frequency_attributes.properties["bar_size"],
-                whatToShow=what_to_show,
-                useRTH=self.config.use_rth_only,
-                formatDate=2,
-                timeout=self.config.historical_data_timeout,
+                **self._historical_data_request_args(
+                    frequency_attributes, what_to_show
+                ),
+            )
+            return self._bars_to_dataframe(
+                bars, contract, frequency_attributes, what_to_show
             )
 
-            df = util.df(bars)
-            logging.debug(f"Received data {df.shape} from {self.get_name()}")
-
-            # Save raw data for data trail before processing
-            if self._raw_storage and not df.empty:
-                try:
-                    # Convert raw DataFrame to CSV for raw data storage
-                    raw_csv = df.to_csv()
-
-                    # Use the original contract for raw data storage
-                    raw_instrument = contract
-
-                    request_metadata = {
-                        "data_source": "ibkr_tws",
-                        "contract_type": contract.__class__.__name__,
-                        "exchange": getattr(contract, "exchange", "SMART"),
-                        "currency": getattr(contract, "currency", "USD"),
-                        "duration": frequency_attributes.properties["duration"],
-                        "bar_size": frequency_attributes.properties["bar_size"],
-                        "what_to_show": what_to_show,
-                        "use_rth": self.config.use_rth_only,
-                        "original_columns": list(df.columns),
-                        "data_shape": list(df.shape),
-                    }
-
-                    self._save_raw_data(
-                        stock=raw_instrument,
-                        raw_response=raw_csv,
-                        request_metadata=request_metadata,
-                    )
-                except Exception as raw_error:
-                    logging.warning(f"Failed to save IBKR data trail: {raw_error}")
-
-            # Process data without validation - validation will be handled by _validate_fetched_data()
-            if df.empty:
-                return df  # Return empty DataFrame, let validation handle it properly
-
-            # Standardize columns using the centralized mapping system
-            df = standardize_dataframe_columns(df, "ibkr")
-
-            # Handle datetime column - should be mapped to DATETIME_INDEX_NAME by standardize_dataframe_columns
-            datetime_col = None
-            if DATETIME_INDEX_NAME in df.columns:
-                datetime_col = DATETIME_INDEX_NAME
-            else:
-                # Fallback: try to find the datetime column that was mapped
-                datetime_candidates = [
-                    col for col in df.columns if "date" in col.lower()
-                ]
-                if datetime_candidates:
-                    datetime_col = datetime_candidates[0]
-
-            if datetime_col and not frequency_attributes.frequency.is_intraday():
-                df[datetime_col] = (
-                    pd.to_datetime(df[datetime_col], format="%Y-%m-%d", errors="coerce")
-                    .dt.tz_localize(FUTURES_SOURCE_TIME_ZONE)
-                    .dt.tz_convert("UTC")
+        except Exception as e:
+            return self._handle_fetch_error(e, contract, frequency_attributes)
+
+    def _bars_to_dataframe(
+        self, bars, contract, frequency_attributes: FrequencyAttributes, what_to_show
+    ) -> DataFrame:
+        df = util.df(bars)
+        logging.debug(f"Received data {df.shape} from {self.get_name()}")
+
+        # Save raw data for data trail before processing
+        if self._raw_storage and not df.empty:
+            try:
+                # Convert raw DataFrame to CSV for raw data storage
+                raw_csv = df.to_csv()
+
+                # Use the original contract for raw data storage
+                raw_instrument = contract
+
+                request_metadata = {
+                    "data_source": "ibkr_tws",
+                    "contract_type": contract.__class__.__name__,
+                    "exchange": getattr(contract, "exchange", "SMART"),
+                    "currency": getattr(contract, "currency", "USD"),
+                    "duration": frequency_attributes.properties["duration"],
+                    "bar_size": frequency_attributes.properties["bar_size"],
+                    "what_to_show": what_to_show,
+                    "use_rth": self.config.use_rth_only,
+                    "original_columns": list(df.columns),
+                    "data_shape": list(df.shape),
+                }
+
+                self._save_raw_data(
+                    stock=raw_instrument,
+                    raw_response=raw_csv,
+                    request_metadata=request_metadata,
                 )
+            except Exception as raw_error:
+                logging.warning(f"Failed to save IBKR data trail: {raw_error}")
+
+        # Process data without validation - validation will be handled by _validate_fetched_data()
+        if df.empty:
+            return df  # Return empty DataFrame, let validation handle it properly
+
+        # Standardize columns using the centralized mapping system
+        df = standardize_dataframe_columns(df, "ibkr")
+
+        # Handle datetime column - should be mapped to DATETIME_INDEX_NAME by standardize_dataframe_columns
+        datetime_col = None
+        if DATETIME_INDEX_NAME in df.columns:
+            datetime_col = DATETIME_INDEX_NAME
+        else:
+            # Fallback: try to find the datetime column that was mapped
+            datetime_candidates = [col for col in df.columns if "date" in col.lower()]
+            if datetime_candidates:
+                datetime_col = datetime_candidates[0]
+
+        if datetime_col and not frequency_attributes.frequency.is_intraday():
+            df[datetime_col] = (
+                pd.to_datetime(df[datetime_col], format="%Y-%m-%d", errors="coerce")
+                .dt.tz_localize(FUTURES_SOURCE_TIME_ZONE)
+                .dt.tz_convert("UTC")
+            )
 
-            if datetime_col:
-                df.set_index(datetime_col, inplace=True)
-                df.index.name = DATETIME_INDEX_NAME
+        if datetime_col:
+            df.set_index(datetime_col, inplace=True)
+            df.index.name = DATETIME_INDEX_NAME
 
-            # Return processed data - validation is handled by base class wrapper
-            # Note: IBKR-specific processing is complete at this point
+        # Return processed data - validation is handled by base class wrapper
+        # Note: IBKR-specific processing is complete at this point
 
-            return df
+        return df
 
-        except Exception as e:
-            if isinstance(e, DataNotFoundError):
-                raise  # Re-raise our standardized error
-
-            # Handle IBKR-specific errors with standardized error handling
-            symbol = str(contract)
-            return self._handle_provider_error(
-                e,
-                "fetch_historical_data",
-                strategy=ErrorHandlingStrategy.FAIL_FAST,
-                symbol=symbol,
-                frequency=frequency_attributes.frequency,
-            )
+    def _handle_fetch_error(
+        self, e: Exception, contract, frequency_attributes: FrequencyAttributes
+    ):
+        if isinstance(e, DataNotFoundError):
+            raise e  # Re-raise our standardized error
+
+        # Handle IBKR-specific errors with standardized error handling
+        symbol = str(contract)
+        return self._handle_provider_error(
+            e,
+            "fetch_historical_data",
+            strategy=ErrorHandlingStrategy.FAIL_FAST,
+            symbol=symbol,
+            frequency=frequency_attributes.frequency,
+        )
 
     def to_ibkr_finance_bar_size(self, period: Period) -> str:
         """Convert period to IBKR bar size with configurable mappings."""
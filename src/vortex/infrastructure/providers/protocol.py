@@ -69,6 +69,26 @@ class DataProviderProtocol(Protocol):
         """
         ...
 
+    def get_max_bars(self, period: Period) -> Optional[int]:
+        """Get the maximum number of bars a single request can return.
+
+        Args:
+            period: The time period to check
+
+        Returns:
+            Bar limit per request, or None if the provider does not declare one
+        """
+        ...
+
+    def get_remaining_allowance(self) -> Optional[int]:
+        """Get the number of downloads still allowed today.
+
+        Returns:
+            Remaining downloads, or None if the provider has no daily limit or
+            its current usage cannot be determined
+        """
+        ...
+
     def get_min_start(self, period: Period) -> Optional[datetime]:
         """Get minimum start date for a given period.
 
@@ -49,14 +49,16 @@ class YahooDataProvider(DataProvider):
             circuit_breaker_config: Optional circuit breaker configuration
             raw_storage: Optional raw data storage for raw data trail
         """
-        # Initialize base with circuit breaker config and raw data storage
-        super().__init__(circuit_breaker_config, raw_storage)
+        config = config or YahooProviderConfig()
+
+        # Initialize base with circuit breaker config, raw data storage and rate limits
+        super().__init__(circuit_breaker_config, raw_storage, config.rate_limit)
 
         # Initialize logger
         self.logger = get_logger(__name__)
 
         # Store configuration
-        self.config = config or YahooProviderConfig()
+        self.config = config
         if not self.config.validate():
             raise ValueError("Invalid Yahoo provider configuration")
 
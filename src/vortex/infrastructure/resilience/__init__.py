@@ -9,12 +9,16 @@ and other transient problems.
 from vortex.core.correlation import CorrelationIdManager
 
 from .circuit_breaker import CircuitBreaker, CircuitState
+from .rate_limiter import RateLimitConfig, RateLimiter, get_rate_limiter
 from .recovery import ErrorRecoveryManager, RecoveryStrategy
 from .retry import ExponentialBackoffStrategy, RetryManager, RetryPolicy
 
 __all__ = [
     "CircuitBreaker",
     "CircuitState",
+    "RateLimiter",
+    "RateLimitConfig",
+    "get_rate_limiter",
     "RetryManager",
     "ExponentialBackoffStrategy",
     "RetryPolicy",
@@ -83,6 +83,8 @@ class CircuitBreaker:
         # Circuit state management
         self._state = CircuitState.CLOSED
         self._state_lock = threading.RLock()
+        # Only one call at a time probes a half-open circuit
+        self._probe_in_flight = False
 
         # Failure tracking with sliding window
         self._call_results: deque = deque(maxlen=self.config.sliding_window_size)
@@ -164,6 +166,54 @@ class CircuitBreaker:
             CircuitOpenException: When circuit is open
             Original exception: When function fails
         """
+        probe = self._before_call()
+
+        # Execute the call outside the state lock so concurrent callers
+        # sharing this breaker are not serialized behind each other
+        start_time = time.time()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._after_failure(e, start_time, probe)
+            raise
+        except BaseException:
+            self._end_probe(probe)
+            raise
+
+        self._after_success(start_time, probe)
+        return result
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function through the circuit breaker.
+
+        Async counterpart of call() sharing the same state and statistics.
+
+        Raises:
+            CircuitOpenException: When circuit is open
+            Original exception: When the coroutine fails
+        """
+        probe = self._before_call()
+
+        start_time = time.time()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self._after_failure(e, start_time, probe)
+            raise
+        except BaseException:
+            # e.g. a cancelled task: let another caller probe instead
+            self._end_probe(probe)
+            raise
+
+        self._after_success(start_time, probe)
+        return result
+
+    def _before_call(self) -> bool:
+        """Count the call and reject it if the circuit is open.
+
+        Returns True if the call is the probe of a half-open circuit.
+        """
         with self._state_lock:
             self._total_calls += 1
 
@@ -172,71 +222,74 @@ class CircuitBreaker:
                 logger.warning(f"Circuit breaker '{self.name}' is OPEN, blocking call")
                 raise CircuitOpenException(f"Circuit breaker '{self.name}' is open")
 
-            # Execute the call
-            start_time = time.time()
-            call_success = False
-            exception = None
+            if self._state == CircuitState.HALF_OPEN:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def _end_probe(self, probe: bool):
+        """Let the next caller probe once this call's probe has finished."""
+        if probe:
+            with self._state_lock:
+                self._probe_in_flight = False
 
-            try:
-                result = func(*args, **kwargs)
-                call_success = True
-                self._record_success()
+    def _after_success(self, start_time: float, probe: bool = False):
+        """Record a successful call."""
+        duration = time.time() - start_time
+        with self._state_lock:
+            self._end_probe(probe)
+            self._record_success()
+
+            # Record success metrics
+            if self._metrics:
+                self._metrics.record_provider_request(self.name, "call", duration, True)
+
+            logger.debug(
+                f"Circuit breaker '{self.name}' call succeeded", duration=duration
+            )
 
-                # Record success metrics
-                duration = time.time() - start_time
+            # Always record the call result
+            self._record_call_result(True, duration)
+
+    def _after_failure(self, e: Exception, start_time: float, probe: bool = False):
+        """Record a failed call."""
+        duration = time.time() - start_time
+        with self._state_lock:
+            self._end_probe(probe)
+            # Only record as failure if it's a monitored exception
+            if isinstance(e, self.config.monitored_exceptions):
+                self._record_failure(e)
+
+                # Record failure metrics
                 if self._metrics:
                     self._metrics.record_provider_request(
-                        self.name, "call", duration, True
+                        self.name, "call", duration, False
+                    )
+                    self._metrics.record_circuit_breaker_failure(self.name)
+                    self._metrics.record_error(
+                        type(e).__name__, self.name, "circuit_breaker_call"
                     )
 
-                logger.debug(
-                    f"Circuit breaker '{self.name}' call succeeded", duration=duration
+                logger.warning(
+                    f"Circuit breaker '{self.name}' recorded failure",
+                    exception_type=type(e).__name__,
+                    failure_count=self._failure_count,
                 )
-                return result
-
-            except Exception as e:
-                exception = e
-                call_success = False
-                duration = time.time() - start_time
-
-                # Only record as failure if it's a monitored exception
-                if isinstance(e, self.config.monitored_exceptions):
-                    self._record_failure(e)
-
-                    # Record failure metrics
-                    if self._metrics:
-                        self._metrics.record_provider_request(
-                            self.name, "call", duration, False
-                        )
-                        self._metrics.record_circuit_breaker_failure(self.name)
-                        self._metrics.record_error(
-                            type(e).__name__, self.name, "circuit_breaker_call"
-                        )
-
-                    logger.warning(
-                        f"Circuit breaker '{self.name}' recorded failure",
-                        exception_type=type(e).__name__,
-                        failure_count=self._failure_count,
-                    )
-                else:
-                    # Still record the call result but don't count as failure
-                    self._record_call_result(True, time.time() - start_time)
-                    if self._metrics:
-                        self._metrics.record_provider_request(
-                            self.name, "call", duration, True
-                        )
-
-                    logger.debug(
-                        f"Circuit breaker '{self.name}' non-monitored exception",
-                        exception_type=type(e).__name__,
+            else:
+                # Still record the call result but don't count as failure
+                self._record_call_result(True, time.time() - start_time)
+                if self._metrics:
+                    self._metrics.record_provider_request(
+                        self.name, "call", duration, True
                     )
 
-                raise
+                logger.debug(
+                    f"Circuit breaker '{self.name}' non-monitored exception",
+                    exception_type=type(e).__name__,
+                )
 
-            finally:
-                # Always record the call result
-                duration = time.time() - start_time
-                self._record_call_result(call_success, duration, exception)
+            # Always record the call result
+            self._record_call_result(False, time.time() - start_time, e)
 
     def _should_allow_call(self) -> bool:
         """Determine if the circuit should allow a call."""
@@ -255,8 +308,8 @@ class CircuitBreaker:
             return False
 
         elif self._state == CircuitState.HALF_OPEN:
-            # Allow limited calls to test recovery
-            return True
+            # Test recovery with one call at a time
+            return not self._probe_in_flight
 
         return False
 
@@ -332,6 +385,7 @@ class CircuitBreaker:
         """Reset circuit breaker to closed state."""
         with self._state_lock:
             self._state = CircuitState.CLOSED
+            self._probe_in_flight = False
             self._failure_count = 0
             self._success_count = 0
             self._call_results.clear()
@@ -0,0 +1,304 @@
+"""
+Adaptive Rate Limiter Implementation.
+
+Token bucket with jitter that spaces out provider requests, backs off
+multiplicatively when the provider throttles (HTTP 429/5xx), recovers
+additively on success (AIMD) and honours ``Retry-After`` hints.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from vortex.exceptions.providers import RateLimitError
+
+# Optional logging - graceful fallback if not available
+try:
+    from vortex.logging import get_logger
+
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+
+HTTP_TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for rate limiter behavior."""
+
+    requests_per_second: float = 1.0  # Steady-state ceiling; 0 disables limiting
+    burst: int = 1  # Requests allowed back-to-back after an idle period
+    jitter: float = 0.0  # Maximum random delay added to paced requests (seconds)
+
+    # AIMD back-off
+    min_requests_per_second: float = 0.01  # Floor when backing off
+    decrease_factor: float = 0.5  # Rate multiplier on throttling
+    additive_increase: float = 0.1  # Fraction of the ceiling regained per success
+    max_retry_after: float = 600.0  # Longest Retry-After honoured (seconds)
+
+    def validate(self) -> bool:
+        """Validate rate limit configuration."""
+        return all(
+            [
+                self.requests_per_second >= 0,
+                self.burst >= 1,
+                self.jitter >= 0,
+                self.min_requests_per_second > 0,
+                0 < self.decrease_factor < 1,
+                self.additive_increase > 0,
+                self.max_retry_after >= 0,
+            ]
+        )
+
+    @classmethod
+    def from_dict(
+        cls, data: Optional[Dict[str, Any]], defaults: Optional["RateLimitConfig"] = None
+    ) -> "RateLimitConfig":
+        """Create configuration from dictionary; unset keys keep ``defaults``."""
+        known = {f.name for f in fields(cls)}
+        overrides = {
+            k: v for k, v in (data or {}).items() if k in known and v is not None
+        }
+        return replace(defaults or cls(), **overrides)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every worker of a provider.
+
+    ``acquire`` reserves a token and sleeps until it is due, so concurrent
+    callers are spaced out rather than released together. Outcomes reported
+    through ``record_success``/``record_throttle`` adapt the refill rate.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[RateLimitConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.config = config or RateLimitConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._rate = self.config.requests_per_second
+        self._tokens = float(self.config.burst)
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+
+        # Statistics
+        self._total_requests = 0
+        self._total_throttles = 0
+        self._total_wait = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.requests_per_second > 0
+
+    @property
+    def current_rate(self) -> float:
+        """Current refill rate in requests per second."""
+        with self._lock:
+            return self._rate
+
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the time waited."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Async counterpart of acquire that does not block the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def record_success(self) -> None:
+        """Additively recover the rate towards the configured ceiling."""
+        if not self.enabled:
+            return
+        with self._lock:
+            ceiling = self.config.requests_per_second
+            self._rate = min(
+                ceiling, self._rate + ceiling * self.config.additive_increase
+            )
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicatively back off and pause until ``retry_after`` elapses."""
+        with self._lock:
+            self._total_throttles += 1
+            if self.enabled:
+                self._rate = max(
+                    self.config.min_requests_per_second,
+                    self._rate * self.config.decrease_factor,
+                )
+            if retry_after:
+                pause = min(retry_after, self.config.max_retry_after)
+                self._blocked_until = max(self._blocked_until, self._clock() + pause)
+            rate = self._rate
+
+        logger.warning(
+            f"Rate limiter '{self.name}' throttled by provider; "
+            f"rate now {rate:.3f} req/s"
+            + (f", pausing {retry_after:.0f}s (Retry-After)" if retry_after else "")
+        )
+
+    def record_outcome(self, error: Optional[BaseException]) -> None:
+        """Adapt to the outcome of a request: None for success, else the error."""
+        if error is None:
+            self.record_success()
+            return
+        throttled, retry_after = throttle_hint(error)
+        if throttled:
+            self.record_throttle(retry_after)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            delay = max(0.0, self._blocked_until - now)
+            if self.enabled:
+                self._refill(now)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._rate)
+            self._total_requests += 1
+
+        if delay > 0:
+            # Jitter only paced requests, so bursts after an idle period stay fast
+            delay += random.uniform(0, self.config.jitter)
+            with self._lock:
+                self._total_wait += delay
+            logger.debug(f"Rate limiter '{self.name}' waiting {delay:.2f}s")
+        return delay
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(float(self.config.burst), self._tokens + elapsed * self._rate)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "requests_per_second": self._rate,
+                "configured_requests_per_second": self.config.requests_per_second,
+                "total_requests": self._total_requests,
+                "total_throttles": self._total_throttles,
+                "total_wait_seconds": self._total_wait,
+            }
+
+    def reset(self) -> None:
+        """Reset the bucket to its configured state."""
+        with self._lock:
+            self._rate = self.config.requests_per_second
+            self._tokens = float(self.config.burst)
+            self._last_refill = self._clock()
+            self._blocked_until = 0.0
+
+
+def throttle_hint(error: BaseException) -> Tuple[bool, Optional[float]]:
+    """Tell whether ``error`` means the provider is throttling us.
+
+    Returns ``(throttled, retry_after_seconds)``. Recognises RateLimitError and
+    HTTP errors carrying a 429 or 5xx response.
+    """
+    if isinstance(error, RateLimitError):
+        return True, error.wait_time
+
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int) and (
+        status == HTTP_TOO_MANY_REQUESTS or status >= HTTP_SERVER_ERROR
+    ):
+        headers = getattr(response, "headers", None) or {}
+        return True, parse_retry_after(headers.get("Retry-After"))
+
+    return False, None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delay-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiterRegistry:
+    """
+    Registry for rate limiters shared across workers.
+
+    Every provider instance with the same name draws from the same bucket,
+    so concurrent workers stay within one provider-wide budget.
+    """
+
+    def __init__(self):
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.RLock()
+
+    def get_limiter(
+        self, name: str, config: Optional[RateLimitConfig] = None
+    ) -> RateLimiter:
+        """Get or create a rate limiter by name."""
+        with self._lock:
+            if name not in self._limiters:
+                self._limiters[name] = RateLimiter(name, config)
+                logger.info(f"Created new rate limiter: {name}")
+            return self._limiters[name]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for all rate limiters."""
+        with self._lock:
+            return {name: limiter.stats for name, limiter in self._limiters.items()}
+
+    def reset_all(self):
+        """Reset all rate limiters."""
+        with self._lock:
+            for limiter in self._limiters.values():
+                limiter.reset()
+
+
+# Global rate limiter registry
+_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter(
+    name: str, config: Optional[RateLimitConfig] = None
+) -> RateLimiter:
+    """Get a rate limiter from the global registry."""
+    return _registry.get_limiter(name, config)
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for all rate limiters."""
+    return _registry.get_stats()
+
+
+def reset_all_rate_limiters():
+    """Reset all rate limiters in the registry."""
+    _registry.reset_all()
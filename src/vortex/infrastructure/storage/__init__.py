@@ -5,8 +5,13 @@ Contains concrete implementations for persisting and retrieving
 financial data from various storage backends.
 """
 
+from .arrow_storage import ArrowStorage
+from .catalog import CatalogEntry, StorageCatalog
 from .csv_storage import CsvStorage
 from .data_storage import DataStorage
+from .deferred_backup import DeferredBackupStorage
+from .duckdb_storage import DuckDBStorage
+from .factory import create_storage
 from .file_storage import FileStorage
 from .metadata import MetadataHandler
 from .parquet_storage import ParquetStorage
@@ -15,6 +20,12 @@ __all__ = [
     "DataStorage",
     "CsvStorage",
     "ParquetStorage",
+    "ArrowStorage",
+    "DuckDBStorage",
+    "DeferredBackupStorage",
     "FileStorage",
     "MetadataHandler",
+    "StorageCatalog",
+    "CatalogEntry",
+    "create_storage",
 ]
@@ -0,0 +1,97 @@
+import os
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame
+
+from vortex.models.columns import DATETIME_INDEX_NAME
+from vortex.models.instrument import Instrument
+from vortex.models.period import Period
+
+from .file_storage import FileStorage, align_timestamp
+
+# Uncompressed files are memory-mapped without copying; LZ4 trades a fast
+# decompression on load for smaller files
+ARROW_COMPRESSIONS = ("uncompressed", "lz4")
+
+
+class ArrowStorage(FileStorage):
+    """Arrow IPC (Feather v2) files, memory-mapped on load.
+
+    Loads map the file instead of reading and parsing it, so repeated reads of
+    an uncompressed series cost almost no I/O or CPU. Files are replaced
+    atomically rather than rewritten in place, since truncating a file that
+    another process has mapped would crash that reader.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        dry_run: bool,
+        partitioning: Optional[str] = None,
+        max_pending_writes: int = 0,
+        compression: str = "uncompressed",
+    ):
+        super().__init__(base_path, dry_run, partitioning, max_pending_writes)
+        if compression not in ARROW_COMPRESSIONS:
+            raise ValueError(
+                f"Unknown Arrow compression '{compression}', expected one of "
+                f"{list(ARROW_COMPRESSIONS)}"
+            )
+        self.compression = compression
+
+    def _make_file_path_for_instrument(self, instrument: Instrument, period: Period):
+        base_file_path = super()._make_file_path_for_instrument(instrument, period)
+        return f"{base_file_path}.arrow"
+
+    def _load(self, file_path) -> DataFrame:
+        return _read_table(file_path).to_pandas().sort_index()
+
+    def _load_range(
+        self,
+        file_path: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[List[str]],
+    ) -> DataFrame:
+        table = _read_table(file_path)
+        if columns is not None:
+            table = table.select([DATETIME_INDEX_NAME, *columns])
+
+        # Rows are stored sorted: bisect the mapped index column and slice,
+        # which shares the mapped buffers instead of copying rows
+        index_type = table.schema.field(DATETIME_INDEX_NAME).type
+        tz = getattr(index_type, "tz", None)
+        stamps = table.column(DATETIME_INDEX_NAME).to_numpy()
+        first, stop = 0, len(stamps)
+        if start is not None:
+            first = np.searchsorted(stamps, _as_datetime64(start, tz))
+        if end is not None:
+            stop = np.searchsorted(stamps, _as_datetime64(end, tz), side="right")
+        return table.slice(first, max(0, stop - first)).to_pandas()
+
+    def _persist(self, df: DataFrame, file_path: str) -> None:
+        table = pa.Table.from_pandas(df.sort_index(), preserve_index=True)
+        options = pa.ipc.IpcWriteOptions(
+            compression=None if self.compression == "uncompressed" else self.compression
+        )
+        temp_path = f"{file_path}.tmp"
+        with pa.OSFile(temp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        os.replace(temp_path, file_path)
+
+
+def _read_table(file_path: str) -> pa.Table:
+    # The table's buffers keep the mapping alive for as long as they are used
+    return pa.ipc.open_file(pa.memory_map(file_path, "r")).read_all()
+
+
+def _as_datetime64(value: datetime, tz) -> np.datetime64:
+    """``value`` in the representation of a stored index: naive, UTC if tz-aware."""
+    timestamp = align_timestamp(value, tz)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.to_datetime64()
@@ -0,0 +1,261 @@
+"""
+Storage catalog index.
+
+A single SQLite database per storage root that records, for every stored price
+series, the metadata previously kept in per-file JSON sidecars together with
+the row count and a content checksum. Coverage decisions can then be made from
+the catalog without opening any data file.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+
+CATALOG_FILE_NAME = ".vortex-catalog.sqlite"
+
+# One catalog connection per storage root, shared by every storage using it
+_catalogs: Dict[str, "StorageCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+_COLUMNS = (
+    "key",
+    "symbol",
+    "period",
+    "start_date",
+    "end_date",
+    "first_row_date",
+    "last_row_date",
+    "data_provider",
+    "expiration_date",
+    "created_date",
+    "row_count",
+    "checksum",
+    "updated_at",
+)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Catalog record describing one stored price series."""
+
+    metadata: Metadata
+    row_count: int
+    checksum: Optional[str] = None
+
+
+def dataframe_checksum(df: DataFrame) -> str:
+    """Content checksum of a DataFrame, including its index.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest that changes whenever any value, index entry or column changes
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).values
+    digest = hashlib.sha256(row_hashes.tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+class StorageCatalog:
+    """SQLite-backed index of the series held by a storage root.
+
+    Entries are keyed by the data file path relative to the storage root, so
+    storages sharing a root (e.g. CSV primary and Parquet backup) share one
+    catalog without colliding.
+    """
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+        self.path = os.path.join(base_path, CATALOG_FILE_NAME)
+        Path(base_path).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS series ("
+                " key TEXT PRIMARY KEY,"
+                " symbol TEXT NOT NULL,"
+                " period TEXT NOT NULL,"
+                " start_date TEXT NOT NULL,"
+                " end_date TEXT NOT NULL,"
+                " first_row_date TEXT NOT NULL,"
+                " last_row_date TEXT NOT NULL,"
+                " data_provider TEXT,"
+                " expiration_date TEXT,"
+                " created_date TEXT,"
+                " row_count INTEGER NOT NULL,"
+                " checksum TEXT,"
+                " updated_at TEXT NOT NULL)"
+            )
+            # Checksum of each partition file of a partitioned series
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " key TEXT NOT NULL,"
+                " label TEXT NOT NULL,"
+                " checksum TEXT NOT NULL,"
+                " PRIMARY KEY (key, label))"
+            )
+            # Series written to the primary storage but not yet to a deferred backup
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS backup_pending ("
+                " key TEXT PRIMARY KEY,"
+                " marked_at TEXT NOT NULL)"
+            )
+
+    def key_for(self, file_path: str) -> str:
+        """Catalog key for a data file path."""
+        return os.path.relpath(file_path, self.base_path).replace(os.sep, "/")
+
+    def get(self, file_path: str) -> Optional[CatalogEntry]:
+        """Look up the entry for a data file, or None if it is not catalogued."""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM series WHERE key = ?",
+                (self.key_for(file_path),),
+            ).fetchone()
+        return _row_to_entry(row) if row else None
+
+    def put(self, file_path: str, entry: CatalogEntry) -> None:
+        """Insert or replace the entry for a data file in a single transaction."""
+        metadata = entry.metadata
+        row = (
+            self.key_for(file_path),
+            metadata.symbol,
+            _period_value(metadata.period),
+            _to_text(metadata.start_date),
+            _to_text(metadata.end_date),
+            _to_text(metadata.first_row_date),
+            _to_text(metadata.last_row_date),
+            metadata.data_provider,
+            _to_text(metadata.expiration_date),
+            _to_text(metadata.created_date),
+            int(entry.row_count),
+            entry.checksum,
+            _to_text(datetime.now(timezone.utc)),
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO series ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                row,
+            )
+
+    def remove(self, file_path: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM series WHERE key = ?", (self.key_for(file_path),)
+            )
+            self._connection.execute(
+                "DELETE FROM partitions WHERE key = ?", (self.key_for(file_path),)
+            )
+
+    def partition_checksums(self, file_path: str) -> Dict[str, str]:
+        """Checksum of each partition of the series at ``file_path``, by label."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT label, checksum FROM partitions WHERE key = ?",
+                (self.key_for(file_path),),
+            ).fetchall()
+        return dict(rows)
+
+    def put_partition_checksums(
+        self, file_path: str, checksums: Dict[str, str]
+    ) -> None:
+        """Replace the partition checksums of a series in a single transaction."""
+        key = self.key_for(file_path)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM partitions WHERE key = ?", (key,))
+            self._connection.executemany(
+                "INSERT INTO partitions (key, label, checksum) VALUES (?, ?, ?)",
+                [(key, label, checksum) for label, checksum in checksums.items()],
+            )
+
+    def entries(self) -> Iterator[Tuple[str, CatalogEntry]]:
+        """Iterate over ``(key, entry)`` for every catalogued series."""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM series ORDER BY key"
+            ).fetchall()
+        for row in rows:
+            yield row[0], _row_to_entry(row)
+
+    def mark_backup_pending(self, file_path: str) -> None:
+        """Record that the series at ``file_path`` changed since the last backup."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO backup_pending (key, marked_at) VALUES (?, ?)",
+                (self.key_for(file_path), _to_text(datetime.now(timezone.utc))),
+            )
+
+    def backup_pending(self) -> Dict[str, str]:
+        """Data file paths waiting for a backup, with the time each was marked."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, marked_at FROM backup_pending ORDER BY key"
+            ).fetchall()
+        return {os.path.join(self.base_path, key): marked_at for key, marked_at in rows}
+
+    def clear_backup_pending(self, file_path: str, marked_at: str) -> None:
+        """Drop the mark of a backed up series, unless it was marked again since."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM backup_pending WHERE key = ? AND marked_at = ?",
+                (self.key_for(file_path), marked_at),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def get_storage_catalog(base_path: str) -> StorageCatalog:
+    """Get the shared catalog for a storage root, opening it on first use."""
+    key = os.path.abspath(base_path)
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = StorageCatalog(base_path)
+        return _catalogs[key]
+
+
+def _row_to_entry(row) -> CatalogEntry:
+    values = dict(zip(_COLUMNS, row))
+    metadata = Metadata(
+        values["symbol"],
+        Period(values["period"]),
+        _from_text(values["start_date"]),
+        _from_text(values["end_date"]),
+        _from_text(values["first_row_date"]),
+        _from_text(values["last_row_date"]),
+        data_provider=values["data_provider"],
+        expiration_date=_from_text(values["expiration_date"]),
+    )
+    if values["created_date"]:
+        metadata.created_date = _from_text(values["created_date"])
+    return CatalogEntry(metadata, values["row_count"], values["checksum"])
+
+
+def _period_value(period) -> str:
+    return period.value if isinstance(period, Period) else str(period)
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
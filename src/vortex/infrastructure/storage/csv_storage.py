@@ -1,31 +1,233 @@
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Callable, List, Optional
+
 import pandas as pd
+import pyarrow as pa
 from pandas import DataFrame
 
-from vortex.models.columns import DATETIME_COLUMN_NAME, DATETIME_INDEX_NAME
+from vortex.models.columns import (
+    CLOSE_COLUMN,
+    DATETIME_COLUMN_NAME,
+    DATETIME_INDEX_NAME,
+    HIGH_COLUMN,
+    LOW_COLUMN,
+    OPEN_COLUMN,
+)
 from vortex.models.instrument import Instrument
 from vortex.models.period import Period
+from vortex.utils.arrow_csv import read_csv_arrow
+
+from .file_storage import DATE_TIME_FORMAT, FileStorage, align_timestamp
+
+# How far back from the end of a file to look for the last stored row
+APPEND_SCAN_LIMIT = 1 << 20
+_SCAN_BLOCK_SIZE = 64 * 1024
 
-from .file_storage import DATE_TIME_FORMAT, FileStorage
+# Prices must read back exactly as written, or stored series never match the
+# catalog checksum; pandas' default float parser can be one unit in the last
+# place off
+FLOAT_PRECISION = "round_trip"
+
+# Parsers for stored files: pandas, or pyarrow's multi-threaded reader
+CSV_ENGINES = ("pandas", "pyarrow")
+
+# Types declared to the pyarrow reader; other columns are inferred
+_ARROW_COLUMN_TYPES = {
+    DATETIME_COLUMN_NAME: pa.timestamp("ns", tz="UTC"),
+    OPEN_COLUMN: pa.float64(),
+    HIGH_COLUMN: pa.float64(),
+    LOW_COLUMN: pa.float64(),
+    CLOSE_COLUMN: pa.float64(),
+}
 
 
 class CsvStorage(FileStorage):
-    def __init__(self, base_path: str, dry_run: bool):
-        super().__init__(base_path, dry_run)
+    def __init__(
+        self,
+        base_path: str,
+        dry_run: bool,
+        partitioning: Optional[str] = None,
+        max_pending_writes: int = 0,
+        engine: str = "pandas",
+    ):
+        super().__init__(base_path, dry_run, partitioning, max_pending_writes)
+        if engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unknown CSV engine '{engine}', expected one of {list(CSV_ENGINES)}"
+            )
+        self.engine = engine
 
     def _make_file_path_for_instrument(self, instrument: Instrument, period: Period):
         base_file_path = super()._make_file_path_for_instrument(instrument, period)
         return f"{base_file_path}.csv"
 
     def _load(self, file_path) -> DataFrame:
-        df = pd.read_csv(file_path)
-        # Convert datetime column to proper datetime type
-        df[DATETIME_COLUMN_NAME] = pd.to_datetime(
-            df[DATETIME_COLUMN_NAME], format=DATE_TIME_FORMAT
+        if self.engine == "pyarrow":
+            with open(file_path, "rb") as f:
+                return self._parse(f.read())
+        return _index_by_datetime(pd.read_csv(file_path, float_precision=FLOAT_PRECISION))
+
+    def _load_range(
+        self,
+        file_path: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[List[str]],
+    ) -> DataFrame:
+        # Rows are stored sorted, so the range is found by binary search over
+        # byte offsets and only that slice of the file is parsed
+        with open(file_path, "rb") as f:
+            header = f.readline()
+            first_row = f.tell()
+            end_of_file = f.seek(0, os.SEEK_END)
+            tz = _stored_timezone(f, first_row)
+            begin = first_row
+            if start is not None:
+                bound = align_timestamp(start, tz)
+                begin = _bisect_rows(f, first_row, end_of_file, lambda ts: ts < bound)
+            stop = end_of_file
+            if end is not None:
+                bound = align_timestamp(end, tz)
+                stop = _bisect_rows(f, begin, end_of_file, lambda ts: ts <= bound)
+            f.seek(begin)
+            rows = f.read(max(0, stop - begin))
+
+        usecols = None if columns is None else [DATETIME_COLUMN_NAME, *columns]
+        df = self._parse(header + rows, usecols)
+        if df.empty and tz is not None:
+            # Nothing to infer the timezone from when no row is in range
+            index = df.index
+            df.index = index.tz_localize(tz) if index.tz is None else index.tz_convert(tz)
+        return df[columns] if columns is not None else df
+
+    def _parse(self, data: bytes, usecols: Optional[List[str]] = None) -> DataFrame:
+        if self.engine == "pyarrow":
+            try:
+                return _index_by_datetime_arrow(data, usecols)
+            except pa.ArrowInvalid as e:
+                logging.debug(f"pyarrow could not parse CSV, using pandas: {e}")
+        return _index_by_datetime(
+            pd.read_csv(io.BytesIO(data), usecols=usecols, float_precision=FLOAT_PRECISION)
         )
-        # Set as index and ensure it has the correct name
-        df = df.set_index(DATETIME_COLUMN_NAME).sort_index()
-        df.index.name = DATETIME_INDEX_NAME
-        return df
 
     def _persist(self, df: DataFrame, file_path: str) -> None:
         df.sort_index().to_csv(file_path, date_format=DATE_TIME_FORMAT)
+
+    def _append(self, new_rows: DataFrame, file_path: str, last_row_date) -> bool:
+        stamp = pd.Timestamp(last_row_date).strftime(DATE_TIME_FORMAT)
+        with open(file_path, "r+b") as f:
+            header = f.readline().decode().rstrip("\r\n").split(",")
+            if header[1:] != [str(column) for column in new_rows.columns]:
+                return False
+            # Cut right after the last stored row, dropping anything a crashed
+            # append may have left behind it
+            end_of_stored_rows = _find_end_of_row(f, stamp)
+            if end_of_stored_rows is None:
+                return False
+            f.seek(end_of_stored_rows)
+            f.truncate()
+            try:
+                f.write(
+                    new_rows.sort_index()
+                    .to_csv(header=False, date_format=DATE_TIME_FORMAT)
+                    .encode()
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.seek(end_of_stored_rows)
+                f.truncate()
+                raise
+        return True
+
+
+def _index_by_datetime(df: DataFrame) -> DataFrame:
+    # Convert datetime column to proper datetime type
+    df[DATETIME_COLUMN_NAME] = pd.to_datetime(
+        df[DATETIME_COLUMN_NAME], format=DATE_TIME_FORMAT
+    )
+    # Set as index and ensure it has the correct name
+    df = df.set_index(DATETIME_COLUMN_NAME).sort_index()
+    df.index.name = DATETIME_INDEX_NAME
+    return df
+
+
+def _index_by_datetime_arrow(
+    data: bytes, usecols: Optional[List[str]] = None
+) -> DataFrame:
+    """Same as _index_by_datetime(pd.read_csv(...)), parsed by pyarrow.
+
+    Timestamps are read as UTC, then shown in the offset of the first row as
+    pandas would.
+    """
+    df = read_csv_arrow(
+        data,
+        column_types=_ARROW_COLUMN_TYPES,
+        timestamp_formats=[DATE_TIME_FORMAT],
+        include_columns=usecols,
+    )
+    df = df.set_index(DATETIME_COLUMN_NAME).sort_index()
+    df.index.name = DATETIME_INDEX_NAME
+    if len(df):
+        header_end = data.index(b"\n") + 1
+        first_row = data[header_end:].split(b"\n", 1)[0]
+        df.index = df.index.tz_convert(_row_timestamp(first_row.strip()).tz)
+    return df
+
+
+def _row_timestamp(line: bytes) -> pd.Timestamp:
+    return pd.Timestamp(
+        datetime.strptime(line.split(b",", 1)[0].decode(), DATE_TIME_FORMAT)
+    )
+
+
+def _stored_timezone(f, first_row: int):
+    f.seek(first_row)
+    line = f.readline().strip()
+    return _row_timestamp(line).tz if line else None
+
+
+def _bisect_rows(
+    f, lo: int, hi: int, before: Callable[[pd.Timestamp], bool]
+) -> int:
+    """Offset of the first row in ``[lo, hi)`` for which ``before`` is False.
+
+    ``lo`` must be the start of a row and ``hi`` the start of a row or EOF;
+    returns ``hi`` when every row is before the bound.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        f.seek(mid - 1)
+        f.readline()  # Move to the first row starting at or after mid
+        row = f.tell()
+        if row >= hi:
+            # No row starts in (mid, hi): step over the row at lo instead
+            row = lo
+        f.seek(row)
+        line = f.readline()
+        if before(_row_timestamp(line)):
+            lo = f.tell()
+        else:
+            hi = row
+    return lo
+
+
+def _find_end_of_row(f, stamp: str) -> Optional[int]:
+    """Offset just past the line starting with ``stamp``, searching back from EOF."""
+    needle = f"\n{stamp},".encode()
+    position = f.seek(0, os.SEEK_END)
+    buffer = b""
+    while position > 0 and len(buffer) < APPEND_SCAN_LIMIT:
+        step = min(_SCAN_BLOCK_SIZE, position)
+        position -= step
+        f.seek(position)
+        buffer = f.read(step) + buffer
+        found = buffer.rfind(needle)
+        if found != -1:
+            line_end = buffer.find(b"\n", found + 1)
+            # A row without its newline was cut short and cannot be trusted
+            return None if line_end == -1 else position + line_end + 1
+    return None
@@ -1,16 +1,36 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Callable, List, Optional
 
 from vortex.models.instrument import Instrument
+from vortex.models.metadata import Metadata
 from vortex.models.period import Period
 from vortex.models.price_series import PriceSeries
 
+from .catalog import CatalogEntry
+
 
 class DataStorage(ABC):
+    # True when merge() upserts new rows without reading the stored series
+    merges_in_place = False
+
     def __init__(self, dry_run: bool):
         self.dry_run = dry_run
 
     @abstractmethod
-    def load(self, contract: Instrument, period: Period) -> PriceSeries:
+    def load(
+        self,
+        contract: Instrument,
+        period: Period,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> PriceSeries:
+        """Load a stored series, or part of it.
+
+        Only rows between ``start`` and ``end`` (inclusive) and only ``columns``
+        are read when given. The metadata always describes the whole series.
+        """
         pass
 
     @abstractmethod
@@ -18,3 +38,71 @@ class DataStorage(ABC):
         self, downloaded_data: PriceSeries, contract: Instrument, period: Period
     ):
         pass
+
+    def merge(
+        self, downloaded_data: PriceSeries, contract: Instrument, period: Period
+    ) -> Metadata:
+        """Merge new rows into the stored series and return its metadata.
+
+        Stores the same series as persisting ``downloaded_data.merge(stored)``.
+        This default loads, merges in memory and persists the result.
+        """
+        try:
+            existing = self.load(contract, period)
+        except FileNotFoundError:
+            existing = None
+        merged = downloaded_data.merge(existing)
+        self.persist(merged, contract, period)
+        return merged.metadata
+
+    def flush(self) -> None:
+        """Wait until every write accepted by persist() is stored.
+
+        Storages that write synchronously have nothing to do.
+        """
+
+    @property
+    def writes_behind(self) -> bool:
+        """Whether persist() returns before the series is stored."""
+        return False
+
+    def when_written(
+        self,
+        contract: Instrument,
+        period: Period,
+        callback: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        """Call ``callback(error)`` once the last series persisted is stored.
+
+        ``error`` is None when the write succeeded. Storages that write
+        synchronously call back right away.
+        """
+        callback(None)
+
+    def get_catalog_entry(
+        self, contract: Instrument, period: Period
+    ) -> Optional[CatalogEntry]:
+        """Describe the stored series without reading its data.
+
+        Returns None when the storage keeps no index or the series is unknown,
+        in which case callers fall back to load().
+        """
+        return None
+
+    def update_metadata(
+        self, metadata: Metadata, contract: Instrument, period: Period
+    ) -> None:
+        """Record new metadata for a stored series whose bars did not change.
+
+        Storages without an index keep metadata only with the data and have
+        nothing to do.
+        """
+
+    def get_sidecar_metadata(
+        self, contract: Instrument, period: Period
+    ) -> Optional[Metadata]:
+        """Metadata from a legacy per-file sidecar, for series not yet catalogued.
+
+        Returns None when the storage has no sidecars or none exists.
+        """
+        return None
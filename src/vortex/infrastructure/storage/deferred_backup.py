@@ -0,0 +1,142 @@
+"""
+Deferred backup storage.
+
+Instead of writing every series to the backup storage right after the
+primary storage, the series is only marked as pending in the primary storage's
+catalog. Pending series are copied from the primary to the backup storage in
+one parallel batch when the run ends (``flush``), or later with
+``vortex storage sync-backup``. The marks live in the catalog database, so a
+run that dies before its batch leaves them for the next run or sync.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from vortex.models.instrument import Instrument
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
+
+from .catalog import CatalogEntry
+from .data_storage import DataStorage
+from .file_storage import FileStorage
+
+DEFAULT_SYNC_WORKERS = min(8, os.cpu_count() or 1)
+
+
+@dataclass
+class BackupSyncResult:
+    """Series copied to the backup storage, and those that failed with why."""
+
+    synced: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+class DeferredBackupStorage(DataStorage):
+    """Backup storage that follows the primary storage in batches.
+
+    ``persist`` marks the series as pending; ``flush`` copies every pending
+    series from the primary storage. Reads are served by the backup storage
+    as of its last sync.
+    """
+
+    def __init__(
+        self,
+        primary: FileStorage,
+        backup: FileStorage,
+        workers: int = DEFAULT_SYNC_WORKERS,
+    ):
+        super().__init__(backup.dry_run)
+        self.primary = primary
+        self.backup = backup
+        self.workers = workers
+
+    def load(
+        self,
+        contract: Instrument,
+        period: Period,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> PriceSeries:
+        return self.backup.load(contract, period, start, end, columns)
+
+    def persist(
+        self, downloaded_data: PriceSeries, contract: Instrument, period: Period
+    ):
+        file_path = self.primary._make_file_path_for_instrument(contract, period)
+        self.primary.catalog.mark_backup_pending(file_path)
+
+    def flush(self) -> None:
+        sync_backup(self.primary, self.backup, self.workers)
+
+    def get_catalog_entry(
+        self, contract: Instrument, period: Period
+    ) -> Optional[CatalogEntry]:
+        return self.backup.get_catalog_entry(contract, period)
+
+    def update_metadata(
+        self, metadata: Metadata, contract: Instrument, period: Period
+    ) -> None:
+        self.backup.update_metadata(metadata, contract, period)
+
+    def get_sidecar_metadata(
+        self, contract: Instrument, period: Period
+    ) -> Optional[Metadata]:
+        return self.backup.get_sidecar_metadata(contract, period)
+
+
+def sync_backup(
+    primary: FileStorage,
+    backup: FileStorage,
+    workers: int = DEFAULT_SYNC_WORKERS,
+    file_paths: Optional[List[str]] = None,
+) -> BackupSyncResult:
+    """Copy the series pending backup from ``primary`` to ``backup`` in parallel.
+
+    ``file_paths`` of the primary storage are copied instead of the pending
+    ones when given. Pending marks are dropped as their series are copied.
+    """
+    primary.flush()
+    pending = primary.catalog.backup_pending()
+    if file_paths is None:
+        file_paths = list(pending)
+    result = BackupSyncResult()
+    if not file_paths:
+        return result
+
+    def copy(file_path: str) -> None:
+        series = primary.load_file(file_path)
+        backup._write_series(series, backup_path(primary, backup, file_path))
+        if file_path in pending:
+            primary.catalog.clear_backup_pending(file_path, pending[file_path])
+
+    config = LoggingConfiguration(
+        entry_msg=f"Syncing {len(file_paths)} series to {backup.storage_type} backup",
+        entry_level=logging.INFO,
+        success_msg=f"Synced {len(file_paths)} series to {backup.storage_type} backup",
+    )
+    with LoggingContext(config):
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                file_path: executor.submit(copy, file_path) for file_path in file_paths
+            }
+        for file_path, future in futures.items():
+            error = future.exception()
+            if error is None:
+                result.synced.append(file_path)
+            else:
+                logging.error(f"Failed to back up '{file_path}': {error}")
+                result.failed[file_path] = str(error)
+    return result
+
+
+def backup_path(primary: FileStorage, backup: FileStorage, file_path: str) -> str:
+    """Path in ``backup`` of the series stored at ``file_path`` in ``primary``."""
+    stem = os.path.splitext(os.path.relpath(file_path, primary.base_path))[0]
+    return os.path.join(backup.base_path, f"{stem}.{backup.storage_type}")
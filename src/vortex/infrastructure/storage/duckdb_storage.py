@@ -0,0 +1,393 @@
+"""
+DuckDB storage.
+
+Keeps every price series in one embedded DuckDB database instead of one file
+per series. Bars live in a single ``bars`` table keyed by
+``(symbol, period, Datetime)`` with one column per data column, and series
+metadata in a ``series`` table. New downloads are merged with an SQL upsert
+instead of a load/concat/rewrite cycle, and range and cross-symbol reads are
+plain queries.
+
+DuckDB is optional: install ``vortex[duckdb]`` to use this storage. A DuckDB
+file can be opened for writing by one process at a time.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+
+import pandas as pd
+from pandas import DataFrame
+
+from vortex.models.columns import DATETIME_INDEX_NAME
+from vortex.models.future import Future
+from vortex.models.instrument import Instrument
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
+
+from .catalog import CatalogEntry
+from .data_storage import DataStorage
+from .file_storage import align_timestamp
+
+# Optional dependency - the storage cannot be created without it
+try:
+    import duckdb
+
+    _duckdb_available = True
+except ImportError:
+    _duckdb_available = False
+
+DUCKDB_FILE_NAME = "vortex.duckdb"
+
+_SERIES_COLUMNS = (
+    "symbol",
+    "period",
+    "columns",
+    "timezone",
+    "start_date",
+    "end_date",
+    "first_row_date",
+    "last_row_date",
+    "data_provider",
+    "expiration_date",
+    "created_date",
+    "row_count",
+)
+
+
+class DuckDBStorage(DataStorage):
+    """All series in one DuckDB database file under ``base_path``.
+
+    Timestamps are stored as naive UTC and converted back to each series'
+    timezone on load. ``merge`` upserts new bars in place, so updating a long
+    intraday series costs the size of the download, not of the series.
+    """
+
+    merges_in_place = True
+
+    def __init__(self, base_path: str, dry_run: bool):
+        super().__init__(dry_run)
+        if not _duckdb_available:
+            raise ImportError(
+                "DuckDB storage requires the 'duckdb' package: pip install 'vortex[duckdb]'"
+            )
+        self.base_path = base_path
+        self.path = os.path.join(base_path, DUCKDB_FILE_NAME)
+        Path(base_path).mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = duckdb.connect(self.path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS series ("
+            " symbol VARCHAR NOT NULL,"
+            " period VARCHAR NOT NULL,"
+            " columns VARCHAR NOT NULL,"
+            " timezone VARCHAR,"
+            " start_date VARCHAR NOT NULL,"
+            " end_date VARCHAR NOT NULL,"
+            " first_row_date VARCHAR NOT NULL,"
+            " last_row_date VARCHAR NOT NULL,"
+            " data_provider VARCHAR,"
+            " expiration_date VARCHAR,"
+            " created_date VARCHAR,"
+            " row_count BIGINT NOT NULL,"
+            " PRIMARY KEY (symbol, period))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS bars ("
+            " symbol VARCHAR NOT NULL,"
+            " period VARCHAR NOT NULL,"
+            f" {_quote(DATETIME_INDEX_NAME)} TIMESTAMP NOT NULL,"
+            f" PRIMARY KEY (symbol, period, {_quote(DATETIME_INDEX_NAME)}))"
+        )
+
+    def load(
+        self,
+        instrument: Instrument,
+        period: Period,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> PriceSeries:
+        symbol = series_symbol(instrument)
+        with self._lock:
+            stored = self._get_series(symbol, period)
+            if stored is None:
+                raise FileNotFoundError(
+                    f"No {period.value} series for '{symbol}' in '{self.path}'"
+                )
+            entry, stored_columns, tz = stored
+            if columns is None:
+                columns = stored_columns
+            missing = [column for column in columns if column not in stored_columns]
+            if missing:
+                raise KeyError(f"Columns {missing} are not stored for '{symbol}'")
+
+            query = (
+                f"SELECT {', '.join(map(_quote, [DATETIME_INDEX_NAME, *columns]))} "
+                "FROM bars WHERE symbol = ? AND period = ?"
+            )
+            parameters: List[Any] = [symbol, period.value]
+            if start is not None:
+                query += f" AND {_quote(DATETIME_INDEX_NAME)} >= ?"
+                parameters.append(_to_stored_timestamp(start))
+            if end is not None:
+                query += f" AND {_quote(DATETIME_INDEX_NAME)} <= ?"
+                parameters.append(_to_stored_timestamp(end))
+            query += f" ORDER BY {_quote(DATETIME_INDEX_NAME)}"
+            df = self._connection.execute(query, parameters).df()
+
+        df = df.set_index(DATETIME_INDEX_NAME)
+        df.index = _from_stored_index(df.index, tz)
+        return PriceSeries(df, entry.metadata)
+
+    def persist(
+        self, downloaded_data: PriceSeries, instrument: Instrument, period: Period
+    ):
+        symbol = series_symbol(instrument)
+        df = downloaded_data.df
+        config = LoggingConfiguration(
+            entry_msg=f"Saving data {df.shape} to {symbol} in '{self.path}'",
+            success_msg=f"Saved data {df.shape} to {symbol} in '{self.path}'",
+            failure_msg=f"Failed to save data {df.shape} to {symbol} in '{self.path}'",
+        )
+        with LoggingContext(config), self._transaction():
+            self._replace_series(symbol, period, downloaded_data)
+
+    def merge(
+        self, downloaded_data: PriceSeries, instrument: Instrument, period: Period
+    ) -> Metadata:
+        symbol = series_symbol(instrument)
+        new = downloaded_data.metadata
+        config = LoggingConfiguration(
+            entry_msg=f"Merging data {downloaded_data.df.shape} into {symbol} in '{self.path}'",
+            success_msg=f"Merged data {downloaded_data.df.shape} into {symbol} in '{self.path}'",
+            failure_msg=f"Failed to merge data into {symbol} in '{self.path}'",
+        )
+        with LoggingContext(config), self._transaction():
+            stored = self._get_series(symbol, period)
+            # Same rules as PriceSeries.merge: disjoint downloads replace the series
+            if (
+                stored is None
+                or new.start_date > stored[0].metadata.end_date
+                or new.end_date < stored[0].metadata.start_date
+            ):
+                self._replace_series(symbol, period, downloaded_data)
+                return new
+
+            entry, stored_columns, _ = stored
+            self._upsert_rows(symbol, period, downloaded_data.df)
+            first_row, last_row, row_count = self._connection.execute(
+                f"SELECT min({_quote(DATETIME_INDEX_NAME)}), "
+                f"max({_quote(DATETIME_INDEX_NAME)}), count(*) "
+                "FROM bars WHERE symbol = ? AND period = ?",
+                [symbol, period.value],
+            ).fetchone()
+            tz = getattr(downloaded_data.df.index, "tz", None)
+            metadata = Metadata(
+                new.symbol,
+                new.period,
+                min(new.start_date, entry.metadata.start_date),
+                max(new.end_date, entry.metadata.end_date),
+                _from_stored_timestamp(first_row, tz),
+                _from_stored_timestamp(last_row, tz),
+                data_provider=new.data_provider,
+                expiration_date=new.expiration_date,
+            )
+            columns = stored_columns + [
+                column
+                for column in downloaded_data.df.columns
+                if column not in stored_columns
+            ]
+            self._put_series(symbol, period, metadata, columns, tz, row_count)
+            return metadata
+
+    def get_catalog_entry(
+        self, instrument: Instrument, period: Period
+    ) -> Optional[CatalogEntry]:
+        with self._lock:
+            stored = self._get_series(series_symbol(instrument), period)
+        return stored[0] if stored else None
+
+    def query(self, sql: str, parameters: Optional[Sequence[Any]] = None) -> DataFrame:
+        """Run a read query against the ``bars`` and ``series`` tables.
+
+        E.g. daily closes of several symbols in one pass::
+
+            storage.query(
+                'SELECT symbol, "Datetime", "Close" FROM bars '
+                "WHERE period = '1d' AND symbol IN ('AAPL', 'MSFT')"
+            )
+
+        Timestamps are naive UTC.
+        """
+        with self._lock:
+            return self._connection.execute(sql, parameters or []).df()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            self._connection.begin()
+            try:
+                yield
+            except BaseException:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
+
+    def _replace_series(
+        self, symbol: str, period: Period, downloaded_data: PriceSeries
+    ) -> None:
+        df = downloaded_data.df
+        self._connection.execute(
+            "DELETE FROM bars WHERE symbol = ? AND period = ?", [symbol, period.value]
+        )
+        self._upsert_rows(symbol, period, df)
+        self._put_series(
+            symbol,
+            period,
+            downloaded_data.metadata,
+            list(df.columns),
+            getattr(df.index, "tz", None),
+            len(df),
+        )
+
+    def _upsert_rows(self, symbol: str, period: Period, df: DataFrame) -> None:
+        """Insert the rows of ``df``, replacing stored bars with the same timestamp."""
+        if df.empty:
+            return
+        frame = df.reset_index(names=DATETIME_INDEX_NAME)
+        frame[DATETIME_INDEX_NAME] = _to_stored_index(df.index)
+        self._connection.register("new_rows", frame)
+        try:
+            self._add_columns()
+            names = ", ".join(map(_quote, frame.columns))
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO bars (symbol, period, {names}) "
+                f"SELECT ?, ?, {names} FROM new_rows",
+                [symbol, period.value],
+            )
+        finally:
+            self._connection.unregister("new_rows")
+
+    def _add_columns(self) -> None:
+        """Add data columns of the registered ``new_rows`` missing from ``bars``."""
+        existing = {
+            row[0].lower() for row in self._connection.execute("DESCRIBE bars").fetchall()
+        }
+        for name, column_type, *_ in self._connection.execute(
+            "DESCRIBE SELECT * FROM new_rows"
+        ).fetchall():
+            if name.lower() not in existing:
+                logging.debug(f"Adding column '{name}' ({column_type}) to '{self.path}'")
+                self._connection.execute(
+                    f"ALTER TABLE bars ADD COLUMN {_quote(name)} {column_type}"
+                )
+
+    def _get_series(self, symbol: str, period: Period):
+        """``(entry, columns, timezone)`` of a stored series, or None."""
+        row = self._connection.execute(
+            f"SELECT {', '.join(_SERIES_COLUMNS)} FROM series "
+            "WHERE symbol = ? AND period = ?",
+            [symbol, period.value],
+        ).fetchone()
+        if row is None:
+            return None
+        values = dict(zip(_SERIES_COLUMNS, row))
+        metadata = Metadata(
+            values["symbol"],
+            Period(values["period"]),
+            _from_text(values["start_date"]),
+            _from_text(values["end_date"]),
+            _from_text(values["first_row_date"]),
+            _from_text(values["last_row_date"]),
+            data_provider=values["data_provider"],
+            expiration_date=_from_text(values["expiration_date"]),
+        )
+        if values["created_date"]:
+            metadata.created_date = _from_text(values["created_date"])
+        entry = CatalogEntry(metadata, values["row_count"])
+        return entry, json.loads(values["columns"]), values["timezone"]
+
+    def _put_series(
+        self,
+        symbol: str,
+        period: Period,
+        metadata: Metadata,
+        columns: List[str],
+        tz,
+        row_count: int,
+    ) -> None:
+        row = (
+            symbol,
+            period.value,
+            json.dumps([str(column) for column in columns]),
+            str(tz) if tz is not None else None,
+            _to_text(metadata.start_date),
+            _to_text(metadata.end_date),
+            _to_text(metadata.first_row_date),
+            _to_text(metadata.last_row_date),
+            metadata.data_provider,
+            _to_text(metadata.expiration_date),
+            _to_text(metadata.created_date),
+            int(row_count),
+        )
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO series ({', '.join(_SERIES_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_SERIES_COLUMNS))})",
+            row,
+        )
+
+
+def series_symbol(instrument: Instrument) -> str:
+    """Key of an instrument's series, e.g. ``AAPL`` or ``GC_20240600`` for a future."""
+    if isinstance(instrument, Future):
+        return f"{instrument.id}_{instrument.year}{instrument.month:02d}00"
+    return instrument.id
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _to_stored_timestamp(value: datetime) -> datetime:
+    # Naive values are taken as UTC, as for file storages
+    return align_timestamp(value, None).to_pydatetime()
+
+
+def _to_stored_index(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index
+
+
+def _from_stored_index(index, tz: Optional[str]) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(index, name=DATETIME_INDEX_NAME).as_unit("ns")
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    return index
+
+
+def _from_stored_timestamp(value: datetime, tz) -> datetime:
+    timestamp = pd.Timestamp(value)
+    if tz is not None:
+        timestamp = timestamp.tz_localize("UTC").tz_convert(tz)
+    return timestamp.to_pydatetime()
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
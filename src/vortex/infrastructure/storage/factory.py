@@ -0,0 +1,71 @@
+"""
+Storage factory.
+
+Creates the storage for a configured format, so the primary and backup
+storages can each use any of them.
+"""
+
+from typing import Dict, Optional, Type
+
+from .arrow_storage import ArrowStorage
+from .csv_storage import CsvStorage
+from .data_storage import DataStorage
+from .duckdb_storage import DuckDBStorage
+from .parquet_storage import ParquetEncoding, ParquetStorage
+
+STORAGE_CLASSES: Dict[str, Type[DataStorage]] = {
+    "csv": CsvStorage,
+    "parquet": ParquetStorage,
+    "arrow": ArrowStorage,
+    "duckdb": DuckDBStorage,
+}
+
+
+def create_storage(
+    storage_format: str,
+    base_path: str,
+    dry_run: bool,
+    partitioning: Optional[str] = None,
+    max_pending_writes: int = 0,
+    arrow_compression: str = "uncompressed",
+    csv_engine: str = "pandas",
+    parquet_encoding: Optional[ParquetEncoding] = None,
+) -> DataStorage:
+    """Create the storage for ``storage_format`` (csv, parquet, arrow or duckdb).
+
+    Partitioning and write-behind apply to the file formats only.
+    """
+    try:
+        storage_class = STORAGE_CLASSES[storage_format]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage format '{storage_format}', expected one of "
+            f"{list(STORAGE_CLASSES)}"
+        )
+    if storage_class is DuckDBStorage:
+        return DuckDBStorage(base_path, dry_run)
+    if storage_class is ArrowStorage:
+        return ArrowStorage(
+            base_path,
+            dry_run,
+            partitioning,
+            max_pending_writes,
+            compression=arrow_compression,
+        )
+    if storage_class is ParquetStorage:
+        return ParquetStorage(
+            base_path,
+            dry_run,
+            partitioning,
+            max_pending_writes,
+            encoding=parquet_encoding,
+        )
+    if storage_class is CsvStorage:
+        return CsvStorage(
+            base_path,
+            dry_run,
+            partitioning,
+            max_pending_writes,
+            engine=csv_engine,
+        )
+    return storage_class(base_path, dry_run, partitioning, max_pending_writes)
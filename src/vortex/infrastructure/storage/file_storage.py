@@ -1,9 +1,15 @@
+import contextlib
 import logging
 import os
 from abc import abstractmethod
+from dataclasses import replace
+from datetime import datetime
 from functools import singledispatchmethod
+from typing import Callable, List, Optional
 
-from pandas import DataFrame
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, DatetimeIndex
 
 from vortex.models.forex import Forex
 from vortex.models.future import Future
@@ -14,35 +20,148 @@ from vortex.models.stock import Stock
 from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
 from vortex.utils.utils import create_full_path
 
+from .catalog import (
+    CatalogEntry,
+    StorageCatalog,
+    dataframe_checksum,
+    get_storage_catalog,
+)
 from .data_storage import DataStorage
 from .metadata import Metadata, MetadataHandler
+from .write_behind import WriteBehindQueue
 
 DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
 
+# strftime patterns naming the partition each row belongs to
+PARTITION_FORMATS = {"year": "%Y", "month": "%Y-%m"}
+
+
 class FileStorage(DataStorage):
-    def __init__(self, base_path: str, dry_run: bool):
+    def __init__(
+        self,
+        base_path: str,
+        dry_run: bool,
+        partitioning: Optional[str] = None,
+        max_pending_writes: int = 0,
+    ):
         super().__init__(dry_run)
         self.base_path = base_path
+        if partitioning in (None, "none"):
+            partitioning = None
+        elif partitioning not in PARTITION_FORMATS:
+            raise ValueError(
+                f"Unknown partitioning '{partitioning}', expected one of "
+                f"{['none', *PARTITION_FORMATS]}"
+            )
+        # With partitioning, the series for file_path is split into one file
+        # per period under a directory named after it, e.g. SPY/2024.csv
+        self.partitioning = partitioning
+        # Write-behind mode: persist() queues the write for a background thread
+        self._write_queue = (
+            WriteBehindQueue(self.storage_type, max_pending_writes)
+            if max_pending_writes > 0
+            else None
+        )
+
+    @property
+    def storage_type(self) -> str:
+        return type(self).__name__.replace("Storage", "").lower()
 
     def persist(
         self, downloaded_data: PriceSeries, instrument: Instrument, period: Period
     ):
-        df = downloaded_data.df
         file_path = self._make_file_path_for_instrument(instrument, period)
+        if self._write_queue is not None:
+            self._write_queue.submit(
+                file_path,
+                downloaded_data,
+                lambda: self._write_series(downloaded_data, file_path),
+            )
+            return
+        self._write_series(downloaded_data, file_path)
+
+    def flush(self) -> None:
+        if self._write_queue is not None:
+            self._write_queue.flush()
+
+    @property
+    def writes_behind(self) -> bool:
+        return self._write_queue is not None
+
+    def when_written(
+        self,
+        instrument: Instrument,
+        period: Period,
+        callback: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        if self._write_queue is None:
+            callback(None)
+            return
+        file_path = self._make_file_path_for_instrument(instrument, period)
+        self._write_queue.when_done(file_path, callback)
 
+    def _write_series(self, downloaded_data: PriceSeries, file_path: str) -> None:
+        df = downloaded_data.df
         config = LoggingConfiguration(
             entry_msg=f"Saving data {df.shape} to '{file_path}'",
             success_msg=f"Saved data {df.shape} to '{file_path}'",
             failure_msg=f"Failed to save data {df.shape} to '{file_path}'",
         )
         with LoggingContext(config):
-            create_full_path(file_path)
-            self._persist(df, file_path)
-            FileStorage.persist_metadata(file_path, downloaded_data.metadata)
+            if self.partitioning:
+                self._persist_partitions(df, file_path)
+            else:
+                partitions = self._partition_files(file_path)
+                create_full_path(file_path)
+                if not self._append_new_rows(df, file_path):
+                    self._persist(df, file_path)
+                # The file now holds the series; drop a partitioned copy of it,
+                # unless it has rows the written series does not reach
+                if partitions and self._spans_stored_rows(df, partitions):
+                    self._remove_partitions(file_path)
+                elif partitions:
+                    logging.warning(
+                        f"Kept partitions of '{file_path}': they hold rows "
+                        "outside the written series"
+                    )
+            # Indexed only once the data is written: a crash in between leaves
+            # the catalog describing the previous, smaller series, which at
+            # worst makes the next run fetch again
+            self.catalog.put(
+                file_path,
+                CatalogEntry(
+                    downloaded_data.metadata, len(df), dataframe_checksum(df)
+                ),
+            )
 
-    def load(self, instrument: Instrument, period: Period) -> PriceSeries:
+    def load(
+        self,
+        instrument: Instrument,
+        period: Period,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> PriceSeries:
         file_path = self._make_file_path_for_instrument(instrument, period)
+        return self.load_file(file_path, start, end, columns)
+
+    def load_file(
+        self,
+        file_path: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> PriceSeries:
+        """Load the series stored at ``file_path``, as ``load`` does for an instrument."""
+        ranged = start is not None or end is not None or columns is not None
+
+        pending = self._pending_series(file_path)
+        if pending is not None:
+            if ranged:
+                df = slice_frame(pending.df, start, end, columns)
+                return PriceSeries(df, pending.metadata)
+            return pending
 
         config = LoggingConfiguration(
             entry_msg=f"Loading data from '{file_path}'",
@@ -50,6 +169,17 @@ class FileStorage(DataStorage):
             success_level=logging.DEBUG,
         )
         with LoggingContext(config):
+            # Either layout is read whatever the partitioning setting, so a
+            # change of setting never hides stored history
+            partitions = self._partition_files(file_path)
+            if partitions and (self.partitioning or not os.path.isfile(file_path)):
+                if ranged:
+                    partitions = self._partitions_in_range(partitions, start, end)
+                return self._load_series(
+                    file_path,
+                    lambda: self._load_partitions(partitions, start, end, columns),
+                    complete=not ranged,
+                )
             if not os.path.exists(file_path):
                 raise FileNotFoundError(file_path)
             if not os.path.isfile(file_path):
@@ -57,16 +187,277 @@ class FileStorage(DataStorage):
                     f"Path '{file_path}' exists but it's not a file!"
                 )
 
-            metadata = FileStorage.load_metadata(file_path)
-            if not metadata:
-                raise FileNotFoundError(f"Metadata file not found for '{file_path}'")
-            df = self._load(file_path)
-            return PriceSeries(df, metadata)
+            if ranged:
+                return self._load_series(
+                    file_path,
+                    lambda: self._load_range(file_path, start, end, columns),
+                    complete=False,
+                )
+            return self._load_series(file_path, lambda: self._load(file_path))
+
+    def _load_series(
+        self, file_path: str, load_df: Callable[[], DataFrame], complete: bool = True
+    ) -> PriceSeries:
+        """Pair the loaded rows with the stored series' metadata.
+
+        The metadata always describes the whole stored series, also when
+        ``load_df`` reads only part of it (``complete`` False).
+        """
+        entry = self.catalog.get(file_path)
+        # Series written before the catalog existed still have a JSON sidecar
+        metadata = entry.metadata if entry else FileStorage.load_metadata(file_path)
+        if not metadata:
+            raise FileNotFoundError(f"Metadata file not found for '{file_path}'")
+        df = load_df()
+        if entry is None and complete:
+            self._index_legacy_series(file_path, metadata, df)
+        return PriceSeries(df, metadata)
+
+    def get_catalog_entry(
+        self, instrument: Instrument, period: Period
+    ) -> Optional[CatalogEntry]:
+        file_path = self._make_file_path_for_instrument(instrument, period)
+        pending = self._pending_series(file_path)
+        if pending is not None:
+            return CatalogEntry(pending.metadata, len(pending.df))
+        if not self._series_exists(file_path):
+            return None
+        return self.catalog.get(file_path)
+
+    def update_metadata(
+        self, metadata: Metadata, instrument: Instrument, period: Period
+    ) -> None:
+        file_path = self._make_file_path_for_instrument(instrument, period)
+        entry = self.catalog.get(file_path)
+        if entry is not None and entry.metadata != metadata:
+            self.catalog.put(file_path, replace(entry, metadata=metadata))
+
+    def get_sidecar_metadata(
+        self, instrument: Instrument, period: Period
+    ) -> Optional[Metadata]:
+        file_path = self._make_file_path_for_instrument(instrument, period)
+        if not os.path.isfile(file_path) or not os.path.isfile(f"{file_path}.json"):
+            return None
+        try:
+            return FileStorage.load_metadata(file_path)
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable metadata sidecar for '{file_path}': {e}")
+            return None
+
+    def _pending_series(self, file_path: str) -> Optional[PriceSeries]:
+        """Series queued for writing to ``file_path``, so reads see it early."""
+        if self._write_queue is None:
+            return None
+        return self._write_queue.pending(file_path)
+
+    @property
+    def catalog(self) -> StorageCatalog:
+        return get_storage_catalog(self.base_path)
+
+    def _index_legacy_series(
+        self, file_path: str, metadata: Metadata, df: DataFrame
+    ) -> None:
+        try:
+            self.catalog.put(
+                file_path, CatalogEntry(metadata, len(df), dataframe_checksum(df))
+            )
+        except Exception as e:
+            logging.warning(f"Failed to add '{file_path}' to storage catalog: {e}")
+
+    def _append_new_rows(self, df: DataFrame, file_path: str) -> bool:
+        """Write only the rows past the stored series, if nothing before changed.
+
+        Returns False when a full rewrite is needed: the file is not catalogued,
+        the stored rows differ from the head of ``df`` or the format cannot append.
+        """
+        if not os.path.isfile(file_path):
+            return False
+        entry = self.catalog.get(file_path)
+        new_rows = rows_after_stored_series(df, entry)
+        if new_rows is None:
+            return False
+        return self._append(new_rows, file_path, entry.metadata.last_row_date)
+
+    def _persist_partitions(self, df: DataFrame, file_path: str) -> None:
+        """Write ``df`` as one file per partition, touching only changed ones.
+
+        When the stored rows are unchanged, partitions before the stored last
+        row are left alone, the partition holding it is appended to and newer
+        partitions are created. Otherwise only partitions whose rows differ
+        from their catalogued checksum are rewritten.
+        """
+        labels = self._partition_labels(df.index)
+        parts = dict(tuple(df.groupby(labels, sort=True)))
+        checksums = {label: dataframe_checksum(part) for label, part in parts.items()}
+        stored_partitions = self._partition_files(file_path)
+        entry = self.catalog.get(file_path) if stored_partitions else None
+        new_rows = rows_after_stored_series(df, entry)
+
+        if new_rows is None:
+            stored_checksums = (
+                self.catalog.partition_checksums(file_path) if stored_partitions else {}
+            )
+            for label, part in parts.items():
+                partition_path = self._partition_path(file_path, label)
+                if stored_checksums.get(label) == checksums[label] and os.path.isfile(
+                    partition_path
+                ):
+                    continue
+                create_full_path(partition_path)
+                self._persist(part, partition_path)
+            stale = set(stored_partitions) - {
+                self._partition_path(file_path, label) for label in parts
+            }
+            for partition_path in stale:
+                os.remove(partition_path)
+        else:
+            last_row_date = entry.metadata.last_row_date
+            last_label = self._partition_labels(DatetimeIndex([last_row_date]))[0]
+            new_labels = self._partition_labels(new_rows.index)
+            for label in sorted(set(new_labels)):
+                partition_path = self._partition_path(file_path, label)
+                appended = (
+                    label == last_label
+                    and os.path.isfile(partition_path)
+                    and self._append(
+                        new_rows[new_labels == label], partition_path, last_row_date
+                    )
+                )
+                if not appended:
+                    create_full_path(partition_path)
+                    self._persist(parts[label], partition_path)
+        # Recorded only once the partitions are written, like the series entry
+        self.catalog.put_partition_checksums(file_path, checksums)
+
+        # The partitions now hold the series; drop a single-file copy of it,
+        # unless it has rows the written series does not reach
+        if os.path.isfile(file_path):
+            if self._spans_stored_rows(df, [file_path]):
+                os.remove(file_path)
+            else:
+                logging.warning(
+                    f"Kept '{file_path}': it holds rows outside the written series"
+                )
+
+    def _load_partitions(
+        self,
+        partitions: List[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[List[str]] = None,
+    ) -> DataFrame:
+        if start is None and end is None and columns is None:
+            frames = [self._load(partition_path) for partition_path in partitions]
+        else:
+            frames = [
+                self._load_range(partition_path, start, end, columns)
+                for partition_path in partitions
+            ]
+        if not frames:
+            return DataFrame(columns=columns)
+        return pd.concat(frames).sort_index()
+
+    def _partitions_in_range(
+        self,
+        partitions: List[str],
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> List[str]:
+        """Partitions that may hold rows between ``start`` and ``end``."""
+        # Labels are taken in the stored timezone; a day of slack covers any offset
+        pattern = PARTITION_FORMATS[self.partitioning]
+        slack = pd.Timedelta(days=1)
+        first = (pd.Timestamp(start) - slack).strftime(pattern) if start else None
+        last = (pd.Timestamp(end) + slack).strftime(pattern) if end else None
+        return [
+            partition_path
+            for partition_path in partitions
+            if (first is None or self._partition_label(partition_path) >= first)
+            and (last is None or self._partition_label(partition_path) <= last)
+        ]
+
+    def _remove_partitions(self, file_path: str) -> None:
+        """Drop partition files left from a partitioned copy of the series."""
+        partitions = self._partition_files(file_path)
+        if not partitions:
+            return
+        for partition_path in partitions:
+            os.remove(partition_path)
+        with contextlib.suppress(OSError):
+            os.rmdir(self._partition_dir(file_path))
+        self.catalog.put_partition_checksums(file_path, {})
+
+    def _series_exists(self, file_path: str) -> bool:
+        return os.path.isfile(file_path) or bool(self._partition_files(file_path))
+
+    def _spans_stored_rows(self, df: DataFrame, paths: List[str]) -> bool:
+        """Whether ``df`` reaches from the first to the last row stored in ``paths``.
+
+        ``paths`` are the files of one stored series, oldest first. A series
+        merged from the stored one always does; a fresh download over a
+        shorter lookback does not.
+        """
+        first, last = self._load(paths[0]).index, self._load(paths[-1]).index
+        if first.empty or last.empty:
+            return True
+        try:
+            return df.index.min() <= first[0] and df.index.max() >= last[-1]
+        except TypeError:
+            # Naive and tz-aware timestamps cannot be compared
+            return False
+
+    def _partition_labels(self, index: DatetimeIndex) -> np.ndarray:
+        return np.asarray(index.strftime(PARTITION_FORMATS[self.partitioning]))
+
+    @staticmethod
+    def _partition_dir(file_path: str) -> str:
+        return os.path.splitext(file_path)[0]
+
+    @staticmethod
+    def _partition_label(partition_path: str) -> str:
+        return os.path.splitext(os.path.basename(partition_path))[0]
+
+    def _partition_path(self, file_path: str, label: str) -> str:
+        extension = os.path.splitext(file_path)[1]
+        return os.path.join(self._partition_dir(file_path), f"{label}{extension}")
+
+    def _partition_files(self, file_path: str) -> List[str]:
+        """Partition files of the series stored at ``file_path``, oldest first."""
+        extension = os.path.splitext(file_path)[1]
+        partition_dir = self._partition_dir(file_path)
+        if not extension or not os.path.isdir(partition_dir):
+            return []
+        return sorted(
+            os.path.join(partition_dir, name)
+            for name in os.listdir(partition_dir)
+            if name.endswith(extension)
+        )
+
+    def _append(self, new_rows: DataFrame, file_path: str, last_row_date) -> bool:
+        """Append ``new_rows`` after the stored row dated ``last_row_date``.
+
+        Formats that can only be rewritten keep this default and return False.
+        """
+        return False
 
     @abstractmethod
     def _load(self, file_path) -> DataFrame:
         pass
 
+    def _load_range(
+        self,
+        file_path: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[List[str]],
+    ) -> DataFrame:
+        """Load the rows between ``start`` and ``end`` (inclusive) of ``columns``.
+
+        Formats that can read part of a file override this; the default loads
+        everything and slices it.
+        """
+        return slice_frame(self._load(file_path), start, end, columns)
+
     @abstractmethod
     def _persist(self, downloaded_data: DataFrame, file_path: str) -> None:
         pass
@@ -93,7 +484,53 @@ class FileStorage(DataStorage):
         retrieved_metadata = metadata_handler.get_metadata()
         return retrieved_metadata
 
-    @staticmethod
-    def persist_metadata(file_path: str, metadata: Metadata) -> None:
-        metadata_handler = MetadataHandler(file_path)
-        metadata_handler.set_metadata(metadata)
+
+def rows_after_stored_series(
+    df: DataFrame, entry: Optional[CatalogEntry]
+) -> Optional[DataFrame]:
+    """Rows of ``df`` newer than the catalogued series, if it is otherwise unchanged.
+
+    Returns None unless the rows of ``df`` up to the stored ``last_row_date``
+    match the catalog entry's row count and checksum exactly.
+    """
+    if entry is None or not entry.checksum:
+        return None
+    try:
+        stored = df.index <= entry.metadata.last_row_date
+    except TypeError:
+        # Naive and tz-aware timestamps cannot be compared
+        return None
+    head = df[stored]
+    if len(head) != entry.row_count or dataframe_checksum(head) != entry.checksum:
+        return None
+    return df[~stored]
+
+
+def align_timestamp(value: datetime, tz) -> pd.Timestamp:
+    """``value`` as a Timestamp comparable with an index in timezone ``tz``.
+
+    Naive values are taken as UTC against a tz-aware index.
+    """
+    timestamp = pd.Timestamp(value)
+    if tz is None:
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+        return timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return timestamp.tz_convert(tz)
+
+
+def slice_frame(
+    df: DataFrame,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[List[str]] = None,
+) -> DataFrame:
+    """Rows of a sorted ``df`` between ``start`` and ``end`` (inclusive)."""
+    tz = getattr(df.index, "tz", None)
+    if start is not None:
+        df = df[df.index >= align_timestamp(start, tz)]
+    if end is not None:
+        df = df[df.index <= align_timestamp(end, tz)]
+    return df[columns] if columns is not None else df
@@ -0,0 +1,272 @@
+"""
+Storage migration.
+
+Converts every series of a file storage tree (``futures/``, ``stocks/`` and
+``forex/`` under the storage root) from one format to another, or rewrites it
+in the same format with another layout or encoding. Series are converted in a
+process pool. Each one is written next to its final place, read back and
+compared with the source by row count and checksum, and only then moved into
+place, so an interrupted or failed migration leaves every series readable.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from vortex.models.metadata import Metadata
+from vortex.utils.utils import create_full_path
+
+from .catalog import CatalogEntry, dataframe_checksum, get_storage_catalog
+from .factory import STORAGE_CLASSES, create_storage
+from .file_storage import FileStorage
+from .parquet_storage import ParquetEncoding
+
+# Formats stored as one file (or partition directory) per series, named with
+# the format as extension
+MIGRATION_FORMATS = tuple(
+    name
+    for name, storage_class in STORAGE_CLASSES.items()
+    if issubclass(storage_class, FileStorage)
+)
+
+INSTRUMENT_DIRECTORIES = ("futures", "stocks", "forex")
+
+# Suffix of the copies a migration writes before moving them into place
+STAGING_SUFFIX = ".migrating"
+
+# Partition files are named after the year or month they hold
+_PARTITION_NAME = re.compile(r"^\d{4}(-\d{2})?$")
+
+
+@dataclass(frozen=True)
+class MigrationTask:
+    """One series to convert, with the options of the target storage."""
+
+    base_path: str
+    series_path: str
+    source_format: str
+    target_format: str
+    partitioning: Optional[str] = None
+    arrow_compression: str = "uncompressed"
+    parquet: Optional[Dict[str, Any]] = None
+
+    @property
+    def target_path(self) -> str:
+        return f"{os.path.splitext(self.series_path)[0]}.{self.target_format}"
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    """Outcome of one series; ``error`` is set when it was left unchanged."""
+
+    series_path: str
+    target_path: str
+    row_count: int = 0
+    checksum: Optional[str] = None
+    metadata: Optional[Metadata] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def find_series(base_path: str, storage_format: str) -> List[str]:
+    """Paths of the series stored in ``storage_format`` under ``base_path``.
+
+    A partitioned series is reported by the path it would have as a single
+    file, e.g. ``stocks/1d/SPY.csv`` for ``stocks/1d/SPY/2024.csv``.
+    """
+    extension = f".{storage_format}"
+    series = set()
+    for directory in INSTRUMENT_DIRECTORIES:
+        root = os.path.join(base_path, directory)
+        for dir_path, dir_names, file_names in os.walk(root):
+            # Skip copies left by an interrupted migration
+            dir_names[:] = [
+                name for name in dir_names if not name.endswith(STAGING_SUFFIX)
+            ]
+            for name in file_names:
+                stem, file_extension = os.path.splitext(name)
+                if file_extension != extension:
+                    continue
+                if _PARTITION_NAME.match(stem):
+                    series.add(f"{dir_path}{extension}")
+                else:
+                    series.add(os.path.join(dir_path, name))
+    return sorted(series)
+
+
+def migrate_series(task: MigrationTask) -> MigrationResult:
+    """Convert one series, verify the copy and move it into place.
+
+    Runs in a worker process. The catalog is left to the caller, so workers
+    never write to it concurrently.
+    """
+    target_path = task.target_path
+    try:
+        # Any partitioning lets the source find partition files, of any span
+        source = create_storage(
+            task.source_format, task.base_path, dry_run=False, partitioning="year"
+        )
+        target = create_storage(
+            task.target_format,
+            task.base_path,
+            dry_run=False,
+            partitioning=task.partitioning,
+            arrow_compression=task.arrow_compression,
+            parquet_encoding=ParquetEncoding(**task.parquet) if task.parquet else None,
+        )
+        series = source.load_file(task.series_path)
+        df = series.df.sort_index()
+        checksum = dataframe_checksum(df)
+
+        staged_path, written = _write_staged(target, df, target_path)
+        if len(written) != len(df) or dataframe_checksum(written) != checksum:
+            _remove_path(staged_path)
+            raise ValueError(
+                f"Copy differs from the source ({len(written)} of {len(df)} rows "
+                "read back or checksum mismatch)"
+            )
+        _switch(target, staged_path, target_path)
+        return MigrationResult(
+            task.series_path, target_path, len(df), checksum, series.metadata
+        )
+    except Exception as e:
+        return MigrationResult(task.series_path, target_path, error=str(e))
+
+
+def migrate_store(
+    base_path: str,
+    source_format: str,
+    target_format: str,
+    workers: int = 1,
+    keep_source: bool = False,
+    partitioning: Optional[str] = None,
+    arrow_compression: str = "uncompressed",
+    parquet: Optional[Dict[str, Any]] = None,
+    on_result: Optional[Callable[[MigrationResult], None]] = None,
+) -> List[MigrationResult]:
+    """Convert every ``source_format`` series under ``base_path`` to ``target_format``.
+
+    Each converted series is catalogued under its new path and, unless
+    ``keep_source`` is set, its source files, metadata sidecar and catalog
+    entry are removed. Migrating to the same format rewrites every series with
+    the given partitioning and encoding. ``on_result`` is called as each series
+    finishes.
+    """
+    for storage_format in (source_format, target_format):
+        if storage_format not in MIGRATION_FORMATS:
+            raise ValueError(
+                f"Cannot migrate '{storage_format}' storage, expected one of "
+                f"{list(MIGRATION_FORMATS)}"
+            )
+    tasks = [
+        MigrationTask(
+            base_path,
+            series_path,
+            source_format,
+            target_format,
+            partitioning=partitioning,
+            arrow_compression=arrow_compression,
+            parquet=parquet,
+        )
+        for series_path in find_series(base_path, source_format)
+    ]
+    catalog = get_storage_catalog(base_path)
+    source = create_storage(source_format, base_path, dry_run=False, partitioning="year")
+    results = []
+    for result in _run(tasks, workers):
+        if result.succeeded:
+            catalog.put(
+                result.target_path,
+                CatalogEntry(result.metadata, result.row_count, result.checksum),
+            )
+            if source_format != target_format and not keep_source:
+                _remove_series(source, result.series_path)
+        else:
+            logging.error(f"Failed to migrate '{result.series_path}': {result.error}")
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+def _run(tasks: List[MigrationTask], workers: int) -> Iterator[MigrationResult]:
+    if workers <= 1 or len(tasks) <= 1:
+        yield from map(migrate_series, tasks)
+        return
+    # Spawned workers open their own catalog connections instead of
+    # inheriting this process's SQLite handle
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [executor.submit(migrate_series, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _write_staged(target: FileStorage, df, target_path: str):
+    """Write ``df`` to the staging copy of ``target_path`` and read it back."""
+    if target.partitioning:
+        staged_path = f"{target._partition_dir(target_path)}{STAGING_SUFFIX}"
+        _remove_path(staged_path)
+        os.makedirs(staged_path)
+        extension = os.path.splitext(target_path)[1]
+        labels = target._partition_labels(df.index)
+        partitions = []
+        for label in sorted(set(labels)):
+            partition_path = os.path.join(staged_path, f"{label}{extension}")
+            target._persist(df[labels == label], partition_path)
+            partitions.append(partition_path)
+        return staged_path, target._load_partitions(partitions)
+
+    staged_path = f"{target_path}{STAGING_SUFFIX}"
+    create_full_path(target_path)
+    target._persist(df, staged_path)
+    return staged_path, target._load(staged_path)
+
+
+def _switch(target: FileStorage, staged_path: str, target_path: str) -> None:
+    """Move the verified copy into place and drop the series' other layout."""
+    if target.partitioning:
+        # The partition directory may also hold the source's partitions, so
+        # partitions are moved one by one instead of swapping directories
+        partition_dir = target._partition_dir(target_path)
+        os.makedirs(partition_dir, exist_ok=True)
+        names = set(os.listdir(staged_path))
+        for name in names:
+            os.replace(
+                os.path.join(staged_path, name), os.path.join(partition_dir, name)
+            )
+        os.rmdir(staged_path)
+        for partition_path in target._partition_files(target_path):
+            if os.path.basename(partition_path) not in names:
+                os.remove(partition_path)
+        if os.path.isfile(target_path):
+            os.remove(target_path)
+        # Checksums of the replaced partitions no longer describe the files
+        target.catalog.put_partition_checksums(target_path, {})
+    else:
+        os.replace(staged_path, target_path)
+        target._remove_partitions(target_path)
+
+
+def _remove_series(source: FileStorage, series_path: str) -> None:
+    source._remove_partitions(series_path)
+    for path in (series_path, f"{series_path}.json"):
+        if os.path.isfile(path):
+            os.remove(path)
+    source.catalog.remove(series_path)
+
+
+def _remove_path(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,123 @@
+"""
+Parquet encoding benchmark.
+
+Writes a stored series with each candidate encoding through ParquetStorage and
+measures file size, write and read throughput and the time of a range read,
+to choose the ``[general.parquet]`` settings for the data at hand.
+"""
+
+import itertools
+import os
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, List, Optional
+
+import pyarrow.parquet as pq
+from pandas import DataFrame
+
+from .factory import STORAGE_CLASSES
+from .file_storage import FileStorage
+from .parquet_storage import LEVELED_CODECS, ParquetEncoding, ParquetStorage
+
+# Range reads cover the newest tenth of the series, like an update would
+RANGE_READ_FRACTION = 0.1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements of one encoding; times are the best of the repeats."""
+
+    encoding: ParquetEncoding
+    data_bytes: int
+    file_bytes: int
+    row_groups: int
+    write_seconds: float
+    read_seconds: float
+    range_read_seconds: float
+
+    @property
+    def write_throughput(self) -> float:
+        """In-memory bytes written per second."""
+        return self.data_bytes / self.write_seconds if self.write_seconds else 0.0
+
+    @property
+    def read_throughput(self) -> float:
+        """In-memory bytes read per second."""
+        return self.data_bytes / self.read_seconds if self.read_seconds else 0.0
+
+
+def read_series_file(file_path: str) -> DataFrame:
+    """Load a stored series file (CSV, Parquet or Arrow) by its extension."""
+    extension = os.path.splitext(file_path)[1].lstrip(".").lower()
+    storage_class = STORAGE_CLASSES.get(extension)
+    if storage_class is None or not issubclass(storage_class, FileStorage):
+        raise ValueError(f"Unsupported series file '{file_path}'")
+    return storage_class(os.path.dirname(file_path), dry_run=True)._load(file_path)
+
+
+def candidate_encodings(
+    base: ParquetEncoding,
+    codecs: Iterable[str] = (),
+    levels: Iterable[Optional[int]] = (),
+    row_group_rows: Iterable[int] = (),
+    row_group_spans: Iterable[Optional[str]] = (),
+    dictionary: Iterable[bool] = (),
+) -> List[ParquetEncoding]:
+    """Every combination of the given settings; empty ones keep ``base``'s value.
+
+    Levels only combine with codecs that have them.
+    """
+    encodings = []
+    for codec, level, rows, span, use_dictionary in itertools.product(
+        list(codecs) or [base.codec],
+        list(levels) or [base.compression_level],
+        list(row_group_rows) or [base.row_group_rows],
+        list(row_group_spans) or [base.row_group_span],
+        list(dictionary) or [base.dictionary],
+    ):
+        encoding = replace(
+            base,
+            codec=codec,
+            compression_level=level if codec in LEVELED_CODECS else None,
+            row_group_rows=rows,
+            row_group_span=span,
+            dictionary=use_dictionary,
+        )
+        if encoding not in encodings:
+            encodings.append(encoding)
+    return encodings
+
+
+def benchmark_encoding(
+    df: DataFrame, encoding: ParquetEncoding, directory: str, repeat: int = 3
+) -> BenchmarkResult:
+    """Write and read ``df`` with ``encoding`` in ``directory``."""
+    storage = ParquetStorage(directory, dry_run=True, encoding=encoding)
+    file_path = os.path.join(directory, "benchmark.parquet")
+    start = df.index[int(len(df) * (1 - RANGE_READ_FRACTION))] if len(df) else None
+
+    write_seconds = _best_time(lambda: storage._persist(df, file_path), repeat)
+    read_seconds = _best_time(lambda: storage._load(file_path), repeat)
+    range_read_seconds = _best_time(
+        lambda: storage._load_range(file_path, start, None, None), repeat
+    )
+    result = BenchmarkResult(
+        encoding=encoding,
+        data_bytes=int(df.memory_usage(index=True, deep=True).sum()),
+        file_bytes=os.path.getsize(file_path),
+        row_groups=pq.ParquetFile(file_path).metadata.num_row_groups,
+        write_seconds=write_seconds,
+        read_seconds=read_seconds,
+        range_read_seconds=range_read_seconds,
+    )
+    os.remove(file_path)
+    return result
+
+
+def _best_time(action: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
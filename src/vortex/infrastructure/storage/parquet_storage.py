@@ -1,6 +1,12 @@
 import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pandas import DataFrame
 
 from vortex.models.columns import (
@@ -11,12 +17,81 @@ from vortex.models.columns import (
 from vortex.models.instrument import Instrument
 from vortex.models.period import Period
 
-from .file_storage import FileStorage
+from .file_storage import FileStorage, align_timestamp
+
+# Rows per row group; each group's min/max statistics let range reads skip it
+ROW_GROUP_SIZE = 64 * 1024
+
+PARQUET_CODECS = ("zstd", "lz4", "snappy", "gzip", "none")
+# Codecs that take a compression level
+LEVELED_CODECS = ("zstd", "lz4", "gzip")
+
+# Time spans a row group may be limited to, as pandas period frequencies
+ROW_GROUP_SPANS = {"day": "D", "week": "W", "month": "M", "year": "Y"}
+
+
+@dataclass(frozen=True)
+class ParquetEncoding:
+    """How Parquet files are encoded.
+
+    Row groups hold at most ``row_group_rows`` rows and, with
+    ``row_group_span``, never cross a day/week/month/year boundary, so a range
+    read decodes only the groups it overlaps. Statistics of the index are
+    always written since range reads depend on them.
+    """
+
+    codec: str = "snappy"
+    compression_level: Optional[int] = None
+    row_group_rows: int = ROW_GROUP_SIZE
+    row_group_span: Optional[str] = None
+    dictionary: bool = True
+    statistics: bool = True
+    # Record in the file footer that rows are sorted by the index
+    sorted_index: bool = True
+
+    def __post_init__(self):
+        if self.codec not in PARQUET_CODECS:
+            raise ValueError(
+                f"Unknown Parquet codec '{self.codec}', expected one of {list(PARQUET_CODECS)}"
+            )
+        if self.compression_level is not None and self.codec not in LEVELED_CODECS:
+            raise ValueError(
+                f"Parquet codec '{self.codec}' has no compression levels, "
+                f"only {list(LEVELED_CODECS)} do"
+            )
+        if self.row_group_rows < 1:
+            raise ValueError(
+                f"row_group_rows must be at least 1, got {self.row_group_rows}"
+            )
+        if self.row_group_span is not None and self.row_group_span not in ROW_GROUP_SPANS:
+            raise ValueError(
+                f"Unknown row group span '{self.row_group_span}', expected one of "
+                f"{list(ROW_GROUP_SPANS)}"
+            )
+
+    def __str__(self):
+        level = f"-{self.compression_level}" if self.compression_level is not None else ""
+        groups = f"{self.row_group_rows} rows"
+        if self.row_group_span:
+            groups += f"/{self.row_group_span}"
+        return (
+            f"{self.codec}{level}, {groups}, "
+            f"dictionary {'on' if self.dictionary else 'off'}, "
+            f"statistics {'on' if self.statistics else 'off'}"
+        )
 
 
 class ParquetStorage(FileStorage):
-    def __init__(self, base_path: str, dry_run: bool):
-        super().__init__(base_path, dry_run)
+    def __init__(
+        self,
+        base_path: str,
+        dry_run: bool,
+        partitioning: Optional[str] = None,
+        max_pending_writes: int = 0,
+        encoding: Optional[ParquetEncoding] = None,
+    ):
+        super().__init__(base_path, dry_run, partitioning, max_pending_writes)
+        self.encoding = encoding or ParquetEncoding()
 
     def _make_file_path_for_instrument(self, instrument: Instrument, period: Period):
         base_file_path = super()._make_file_path_for_instrument(instrument, period)
@@ -43,5 +118,63 @@ class ParquetStorage(FileStorage):
 
         return df.sort_index()
 
+    def _load_range(
+        self,
+        file_path: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[List[str]],
+    ) -> DataFrame:
+        # Filters on the index are checked against row-group statistics, so
+        # only the row groups overlapping the range are read
+        index_type = pq.read_schema(file_path).field(DATETIME_INDEX_NAME).type
+        tz = getattr(index_type, "tz", None)
+        filters = []
+        if start is not None:
+            filters.append((DATETIME_INDEX_NAME, ">=", align_timestamp(start, tz)))
+        if end is not None:
+            filters.append((DATETIME_INDEX_NAME, "<=", align_timestamp(end, tz)))
+        df = pd.read_parquet(file_path, columns=columns, filters=filters or None)
+        return df.sort_index()
+
     def _persist(self, df: DataFrame, file_path: str) -> None:
-        df.sort_index().to_parquet(file_path, index=True)
+        write_parquet(df.sort_index(), file_path, self.encoding)
+
+
+def write_parquet(df: DataFrame, file_path: str, encoding: ParquetEncoding) -> None:
+    """Write a sorted ``df`` with its index to ``file_path`` as ``encoding`` says."""
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    index_position = table.schema.get_field_index(DATETIME_INDEX_NAME)
+    statistics = encoding.statistics
+    if not statistics and index_position >= 0:
+        statistics = [DATETIME_INDEX_NAME]
+    sorting_columns = (
+        [pq.SortingColumn(index_position)]
+        if encoding.sorted_index and index_position >= 0
+        else None
+    )
+    with pq.ParquetWriter(
+        file_path,
+        table.schema,
+        compression=encoding.codec,
+        compression_level=encoding.compression_level,
+        use_dictionary=encoding.dictionary,
+        write_statistics=statistics,
+        sorting_columns=sorting_columns,
+    ) as writer:
+        for start, stop in _row_group_bounds(df.index, encoding):
+            writer.write_table(
+                table.slice(start, stop - start), row_group_size=encoding.row_group_rows
+            )
+
+
+def _row_group_bounds(index, encoding: ParquetEncoding):
+    """``(start, stop)`` row ranges written as separate row groups."""
+    if encoding.row_group_span is None or len(index) == 0:
+        return [(0, len(index))]
+    if getattr(index, "tz", None) is not None:
+        # Spans follow the series' local calendar
+        index = index.tz_localize(None)
+    periods = index.to_period(ROW_GROUP_SPANS[encoding.row_group_span]).asi8
+    starts = [0, *(np.flatnonzero(periods[1:] != periods[:-1]) + 1)]
+    return list(zip(starts, [*starts[1:], len(index)]))
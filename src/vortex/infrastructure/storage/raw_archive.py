@@ -0,0 +1,288 @@
+"""
+Rolling archive of raw provider responses.
+
+Instead of one gzip file and one metadata file per response, responses are
+appended to a few large segment files under ``{year}/{month}/archive/``:
+
+- ``{opened_at}.zst``: one zstd frame per response, back to back, so the
+  segment as a whole is also a valid zstd stream (``zstd -d`` reads it)
+- ``{opened_at}.idx``: one JSON line per response with its offset and length
+  in the segment, correlation ID, provider, symbol, instrument type, time and
+  request metadata
+
+A segment is closed and a new one started once it reaches the size limit,
+has been open for the time limit, or the month changes. Responses are
+compressed and appended by a write-behind thread, so saving one costs the
+caller a queue insertion. Queued responses are written on exit, Ctrl-C and
+SIGTERM; a hard kill loses them. A response is listed in the index only
+after its frame is written, so a crash never indexes a partial frame.
+"""
+
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
+
+import pyarrow as pa
+
+from .write_behind import DEFAULT_MAX_PENDING_WRITES, WriteBehindQueue
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRECTORY = "archive"
+SEGMENT_EXTENSION = ".zst"
+INDEX_EXTENSION = ".idx"
+
+DEFAULT_SEGMENT_MB = 64
+DEFAULT_SEGMENT_HOURS = 24
+DEFAULT_COMPRESSION_LEVEL = 3
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+    """Location and description of one archived response."""
+
+    segment: Path
+    offset: int
+    length: int
+    size: int
+    created_at: datetime
+    provider: str
+    symbol: str
+    instrument_type: str
+    correlation_id: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "offset": self.offset,
+                "length": self.length,
+                "size": self.size,
+                "created_at": self.created_at.isoformat(),
+                "provider": self.provider,
+                "symbol": self.symbol,
+                "type": self.instrument_type,
+                "correlation_id": self.correlation_id,
+                "metadata": self.metadata,
+            },
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, segment: Path, line: str) -> "ArchiveRecord":
+        fields = json.loads(line)
+        return cls(
+            segment=segment,
+            offset=fields["offset"],
+            length=fields["length"],
+            size=fields["size"],
+            created_at=datetime.fromisoformat(fields["created_at"]),
+            provider=fields["provider"],
+            symbol=fields["symbol"],
+            instrument_type=fields["type"],
+            correlation_id=fields.get("correlation_id"),
+            metadata=fields.get("metadata"),
+        )
+
+
+class _Segment:
+    """Segment being appended to, with its index; used by the writer thread only."""
+
+    def __init__(self, path: Path, opened_at: datetime):
+        self.path = path
+        self.opened_at = opened_at
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.data: BinaryIO = open(path, "ab")
+        self.index = open(path.with_suffix(INDEX_EXTENSION), "a", encoding="utf-8")
+        self.size = self.data.tell()
+
+    def append(self, frame: bytes) -> int:
+        offset = self.size
+        self.data.write(frame)
+        self.data.flush()
+        self.size += len(frame)
+        return offset
+
+    def close(self) -> None:
+        self.data.close()
+        self.index.close()
+
+
+class RawArchive:
+    """Append-only, zstd-compressed segments of raw responses with an index."""
+
+    def __init__(
+        self,
+        raw_dir: Path,
+        segment_mb: int = DEFAULT_SEGMENT_MB,
+        segment_hours: int = DEFAULT_SEGMENT_HOURS,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_pending: int = DEFAULT_MAX_PENDING_WRITES,
+        on_record: Optional[Callable[[ArchiveRecord], None]] = None,
+    ):
+        """``on_record`` is called on the writer thread with each written record."""
+        self.raw_dir = Path(raw_dir)
+        self.on_record = on_record
+        self.segment_bytes = segment_mb * 1024 * 1024
+        self.segment_seconds = segment_hours * 3600
+        self._codec = pa.Codec("zstd", compression_level=compression_level)
+        self._segment: Optional[_Segment] = None
+        # Each response gets its own key, so queued responses never coalesce
+        self._sequence = itertools.count()
+        self._queue = WriteBehindQueue("raw-archive", max_pending)
+
+    def append(
+        self,
+        raw_data: str,
+        created_at: datetime,
+        provider: str,
+        symbol: str,
+        instrument_type: str,
+        correlation_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Queue a response for the writer thread; blocks only while the queue is full."""
+
+        def write() -> None:
+            try:
+                self._write(
+                    raw_data,
+                    created_at,
+                    provider,
+                    symbol,
+                    instrument_type,
+                    correlation_id,
+                    metadata,
+                )
+            except Exception as e:
+                # Like per-file raw storage, a failed save never fails the download
+                logger.error(
+                    f"Failed to archive raw data for {provider}",
+                    extra={"correlation_id": correlation_id, "error": str(e)},
+                )
+
+        self._queue.submit(str(next(self._sequence)), None, write)
+
+    def flush(self) -> None:
+        """Wait until every queued response is written."""
+        self._queue.flush()
+
+    def close(self) -> None:
+        """Write queued responses and close the open segment."""
+        self._queue.close()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def is_open(self, segment: Path) -> bool:
+        """Whether ``segment`` is the one responses are appended to."""
+        return self._segment is not None and self._segment.path == Path(segment)
+
+    def appends_under(self, directory: Path) -> bool:
+        """Whether the segment responses are appended to lies under ``directory``."""
+        return self._segment is not None and Path(directory) in self._segment.path.parents
+
+    def records(
+        self,
+        symbol: Optional[str] = None,
+        instrument_type: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[ArchiveRecord]:
+        """Archived responses matching every given filter, oldest segment first.
+
+        Reads every segment index; ``RawIndex`` answers the same queries from
+        the matching rows only.
+        """
+        for record in read_archive_indexes(self.raw_dir):
+            if symbol and record.symbol != symbol:
+                continue
+            if instrument_type and record.instrument_type != instrument_type:
+                continue
+            if correlation_id and record.correlation_id != correlation_id:
+                continue
+            if start_date and record.created_at < start_date:
+                continue
+            if end_date and record.created_at > end_date:
+                continue
+            yield record
+
+    def read(self, record: ArchiveRecord) -> str:
+        """The response stored by ``record``, exactly as received."""
+        with open(record.segment, "rb") as f:
+            f.seek(record.offset)
+            frame = f.read(record.length)
+        return self._codec.decompress(
+            frame, decompressed_size=record.size, asbytes=True
+        ).decode("utf-8")
+
+    def _write(
+        self,
+        raw_data: str,
+        created_at: datetime,
+        provider: str,
+        symbol: str,
+        instrument_type: str,
+        correlation_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        data = raw_data.encode("utf-8")
+        frame = self._codec.compress(data, asbytes=True)
+        segment = self._segment_for(created_at)
+        offset = segment.append(frame)
+        record = ArchiveRecord(
+            segment.path,
+            offset,
+            len(frame),
+            len(data),
+            created_at,
+            provider,
+            symbol,
+            instrument_type,
+            correlation_id,
+            metadata,
+        )
+        segment.index.write(record.to_json() + "\n")
+        segment.index.flush()
+        if self.on_record is not None:
+            self.on_record(record)
+
+    def _segment_for(self, created_at: datetime) -> _Segment:
+        """Open segment for a response made at ``created_at``, rotating if due."""
+        segment = self._segment
+        if segment is not None and (
+            segment.size >= self.segment_bytes
+            or (created_at - segment.opened_at).total_seconds() >= self.segment_seconds
+            or (created_at.year, created_at.month)
+            != (segment.opened_at.year, segment.opened_at.month)
+        ):
+            segment.close()
+            segment = None
+        if segment is None:
+            path = (
+                self.raw_dir
+                / str(created_at.year)
+                / f"{created_at.month:02d}"
+                / ARCHIVE_DIRECTORY
+                / f"{created_at.strftime('%Y%m%d_%H%M%S_%f')[:-3]}{SEGMENT_EXTENSION}"
+            )
+            segment = _Segment(path, created_at)
+            self._segment = segment
+        return segment
+
+
+def read_archive_indexes(raw_dir: Path) -> Iterator[ArchiveRecord]:
+    """Every response listed in the segment indexes under ``raw_dir``."""
+    for index_path in sorted(
+        Path(raw_dir).glob(f"*/*/{ARCHIVE_DIRECTORY}/*{INDEX_EXTENSION}")
+    ):
+        segment = index_path.with_suffix(SEGMENT_EXTENSION)
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield ArchiveRecord.from_json(segment, line)
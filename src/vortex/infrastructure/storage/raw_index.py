@@ -0,0 +1,318 @@
+"""
+Raw data index.
+
+A SQLite database in the raw data directory with one row per saved provider
+response, whether stored as its own file or appended to an archive segment.
+Lookups by instrument, correlation ID or time, and retention, then read only
+the matching rows instead of listing the whole year/month tree.
+
+An index missing from an existing raw tree is rebuilt from the tree once,
+when it is first opened.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .raw_archive import ARCHIVE_DIRECTORY, ArchiveRecord, read_archive_indexes
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = ".vortex-raw-index.sqlite"
+
+# Time format of the index; fixed width, so text order is time order
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+# {symbol}_{YYYYmmdd_HHMMSS_mmm}.csv[.gz], as written by RawDataStorage
+_RAW_FILE_NAME = re.compile(r"^(?P<symbol>.+)_(?P<time>\d{8}_\d{6}_\d{3})\.csv(\.gz)?$")
+
+_COLUMNS = (
+    "path",
+    "offset",
+    "length",
+    "size",
+    "created_at",
+    "provider",
+    "symbol",
+    "instrument_type",
+    "correlation_id",
+    "metadata",
+)
+
+
+@dataclass(frozen=True)
+class RawIndexEntry:
+    """One indexed response; ``offset`` is None for a response stored as a file."""
+
+    path: Path
+    created_at: datetime
+    symbol: str
+    instrument_type: str
+    provider: Optional[str] = None
+    correlation_id: Optional[str] = None
+    offset: Optional[int] = None
+    length: Optional[int] = None
+    size: Optional[int] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def archived(self) -> bool:
+        return self.offset is not None
+
+    def to_archive_record(self) -> ArchiveRecord:
+        return ArchiveRecord(
+            self.path,
+            self.offset,
+            self.length,
+            self.size,
+            self.created_at,
+            self.provider,
+            self.symbol,
+            self.instrument_type,
+            self.correlation_id,
+            self.metadata,
+        )
+
+
+class RawIndex:
+    """SQLite-backed index of the responses held by a raw data directory.
+
+    Paths are stored relative to the raw directory, so year and month are the
+    first two path components.
+    """
+
+    def __init__(self, raw_dir: Path):
+        self.raw_dir = Path(raw_dir)
+        self.path = self.raw_dir / INDEX_FILE_NAME
+        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " path TEXT NOT NULL,"
+                " offset INTEGER,"
+                " length INTEGER,"
+                " size INTEGER,"
+                " created_at TEXT NOT NULL,"
+                " provider TEXT,"
+                " symbol TEXT NOT NULL,"
+                " instrument_type TEXT NOT NULL,"
+                " correlation_id TEXT,"
+                " metadata TEXT)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_instrument"
+                " ON responses (instrument_type, symbol, created_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_correlation"
+                " ON responses (correlation_id)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_created"
+                " ON responses (created_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_path ON responses (path)"
+            )
+        if is_new:
+            self.rebuild()
+
+    def add_file(
+        self,
+        file_path: Path,
+        provider: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> None:
+        """Index a response stored as its own file.
+
+        Symbol, time and instrument type are read from the file's name and
+        directory.
+        """
+        row = self._file_row(Path(file_path), provider, correlation_id)
+        if row is None:
+            raise ValueError(f"Not a raw data file name: {file_path}")
+        self._insert([row])
+
+    def add_archive_record(self, record: ArchiveRecord) -> None:
+        """Index a response appended to an archive segment."""
+        self._insert([self._archive_row(record)])
+
+    def find(
+        self,
+        symbol: Optional[str] = None,
+        instrument_type: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        archived: Optional[bool] = None,
+    ) -> List[RawIndexEntry]:
+        """Indexed responses matching every given filter, oldest first."""
+        conditions, params = [], []
+        for column, value in (
+            ("symbol", symbol),
+            ("instrument_type", instrument_type),
+            ("correlation_id", correlation_id),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if start_date is not None:
+            conditions.append("created_at >= ?")
+            params.append(_to_text(start_date))
+        if end_date is not None:
+            conditions.append("created_at <= ?")
+            params.append(_to_text(end_date))
+        if archived is not None:
+            conditions.append(f"offset IS {'NOT ' if archived else ''}NULL")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM responses{where}"
+                " ORDER BY created_at, path, offset",
+                params,
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def remove_paths(self, paths: List[Path]) -> None:
+        """Drop every response stored in ``paths`` (files or segments)."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM responses WHERE path = ?",
+                [(self._relative(path),) for path in paths],
+            )
+
+    def remove_month(self, year: str, month: str) -> int:
+        """Drop every response saved in a year/month directory; returns their count."""
+        # Range on the path index: "0" is the character after "/"
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE path >= ? AND path < ?",
+                (f"{year}/{month}/", f"{year}/{month}0"),
+            )
+        return cursor.rowcount
+
+    def expired_files(self, cutoff: datetime) -> List[RawIndexEntry]:
+        """Responses stored as files and saved before ``cutoff``."""
+        return self.find(end_date=cutoff, archived=False)
+
+    def expired_segments(self, cutoff: datetime) -> Dict[Path, int]:
+        """Segments whose every response was saved before ``cutoff``, with their counts."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT path, COUNT(*) FROM responses WHERE offset IS NOT NULL"
+                " AND path IN (SELECT path FROM responses"
+                "  WHERE offset IS NOT NULL AND created_at < ?)"
+                " GROUP BY path HAVING MAX(created_at) < ?",
+                (_to_text(cutoff), _to_text(cutoff)),
+            ).fetchall()
+        return {self.raw_dir / path: count for path, count in rows}
+
+    def rebuild(self) -> int:
+        """Re-index the whole raw tree; returns the number of responses found."""
+        rows = []
+        for file_path in self.raw_dir.glob("*/*/*/*.csv*"):
+            if file_path.parent.name == ARCHIVE_DIRECTORY:
+                continue
+            row = self._file_row(file_path)
+            if row is not None:
+                rows.append(row)
+        for record in read_archive_indexes(self.raw_dir):
+            rows.append(self._archive_row(record))
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+        self._insert(rows)
+        if rows:
+            logger.info(f"Indexed {len(rows)} raw responses in {self.raw_dir}")
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _insert(self, rows) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO responses ({', '.join(_COLUMNS)})"
+                f" VALUES ({', '.join('?' * len(_COLUMNS))})",
+                rows,
+            )
+
+    def _file_row(
+        self,
+        file_path: Path,
+        provider: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ):
+        match = _RAW_FILE_NAME.match(file_path.name)
+        if match is None:
+            return None
+        # Names carry the UTC time of the request, to the millisecond
+        created_at = datetime.strptime(match["time"], "%Y%m%d_%H%M%S_%f").replace(
+            tzinfo=timezone.utc
+        )
+        return (
+            self._relative(file_path),
+            None,
+            None,
+            None,
+            _to_text(created_at),
+            provider,
+            match["symbol"],
+            file_path.parent.name,
+            correlation_id,
+            None,
+        )
+
+    def _archive_row(self, record: ArchiveRecord):
+        return (
+            self._relative(record.segment),
+            record.offset,
+            record.length,
+            record.size,
+            _to_text(record.created_at),
+            record.provider,
+            record.symbol,
+            record.instrument_type,
+            record.correlation_id,
+            json.dumps(record.metadata, default=str)
+            if record.metadata is not None
+            else None,
+        )
+
+    def _relative(self, path: Path) -> str:
+        return Path(path).relative_to(self.raw_dir).as_posix()
+
+    def _row_to_entry(self, row) -> RawIndexEntry:
+        values = dict(zip(_COLUMNS, row))
+        return RawIndexEntry(
+            path=self.raw_dir / values["path"],
+            created_at=datetime.strptime(values["created_at"], _TIME_FORMAT).replace(
+                tzinfo=timezone.utc
+            ),
+            symbol=values["symbol"],
+            instrument_type=values["instrument_type"],
+            provider=values["provider"],
+            correlation_id=values["correlation_id"],
+            offset=values["offset"],
+            length=values["length"],
+            size=values["size"],
+            metadata=json.loads(values["metadata"]) if values["metadata"] else None,
+        )
+
+
+def _to_text(value: datetime) -> str:
+    """UTC text of ``value``; naive times are taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime(_TIME_FORMAT)
@@ -2,21 +2,33 @@
 Raw data storage for compliance and debugging.
 
 This module provides storage for untampered raw data exactly as received
-from providers, compressed as gzipped CSV files for raw data trail purposes.
+from providers, compressed as gzipped CSV files for raw data trail purposes,
+or appended to a rolling archive of zstd segments (see ``raw_archive``).
 """
 
 import gzip
 import json
 import logging
-from datetime import datetime, timezone
+import shutil
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from vortex import __version__ as VORTEX_VERSION
 from vortex.core.correlation import get_correlation_manager
 from vortex.core.security.sanitizer import SensitiveDataSanitizer
 from vortex.models.instrument import Instrument
 
+from .raw_archive import (
+    DEFAULT_SEGMENT_HOURS,
+    DEFAULT_SEGMENT_MB,
+    INDEX_EXTENSION,
+    ArchiveRecord,
+    RawArchive,
+)
+from .raw_index import RawIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +42,9 @@ class RawDataStorage:
         retention_days: Optional[int] = None,
         compress: bool = True,
         include_metadata: bool = True,
+        archive: bool = False,
+        archive_segment_mb: int = DEFAULT_SEGMENT_MB,
+        archive_segment_hours: int = DEFAULT_SEGMENT_HOURS,
     ):
         """Initialize raw data storage.
 
@@ -39,6 +54,10 @@ class RawDataStorage:
             retention_days: Number of days to retain raw data files (None for unlimited)
             compress: Whether to compress raw data files with gzip
             include_metadata: Whether to include request metadata with raw data files
+            archive: Append responses to rolling zstd segments instead of one
+                file per response (always compressed)
+            archive_segment_mb: Size at which an archive segment is closed
+            archive_segment_hours: Age at which an archive segment is closed
         """
         self.base_dir = Path(base_dir)
         self.enabled = enabled
@@ -50,9 +69,35 @@ class RawDataStorage:
         # Always define raw_dir property for consistent interface
         self.raw_dir = self.base_dir
 
+        self._index: Optional[RawIndex] = None
+        self._index_lock = threading.Lock()
+        self.archive: Optional[RawArchive] = None
         if self.enabled:
             # Create raw data directory structure only when enabled
             self.raw_dir.mkdir(parents=True, exist_ok=True)
+            if archive:
+                self.archive = RawArchive(
+                    self.raw_dir,
+                    archive_segment_mb,
+                    archive_segment_hours,
+                    on_record=lambda record: self.index.add_archive_record(record),
+                )
+                # Opened before the first append, so a first-time build of the
+                # index never sees, and indexes twice, a response being added
+                self._open_index()
+
+    @property
+    def index(self) -> Optional[RawIndex]:
+        """Index of the saved responses, opened on first use; None if disabled."""
+        if not self.enabled:
+            return None
+        return self._open_index()
+
+    def _open_index(self) -> RawIndex:
+        with self._index_lock:
+            if self._index is None:
+                self._index = RawIndex(self.raw_dir)
+            return self._index
 
     def save_raw_response(
         self,
@@ -72,14 +117,23 @@ class RawDataStorage:
             correlation_id: Optional correlation ID for tracking
 
         Returns:
-            Path to saved raw data file, or None if disabled
+            Path to saved raw data file, the archive segment directory it is
+            queued for in archive mode, or None if disabled
         """
         if not self.enabled:
             return None
 
         correlation_id = correlation_id or self.correlation_manager.get_current_id()
 
+        if self.archive is not None:
+            return self._archive_raw_response(
+                provider, instrument, raw_data, request_metadata, correlation_id
+            )
+
         try:
+            # Opened before the file is written, as in archive mode
+            index = self.index
+
             # Generate raw data file path
             raw_file_path = self._generate_raw_file_path(provider, instrument)
 
@@ -110,6 +164,8 @@ class RawDataStorage:
                 with open(metadata_path, "w") as f:
                     json.dump(metadata, f, indent=2, default=str)
 
+            index.add_file(raw_file_path, provider, correlation_id)
+
             logger.info(
                 f"Raw data saved for {provider}",
                 extra={
@@ -135,6 +191,68 @@ class RawDataStorage:
             # Don't fail the entire operation due to raw data storage issues
             return None
 
+    def _archive_raw_response(
+        self,
+        provider: str,
+        instrument: Instrument,
+        raw_data: str,
+        request_metadata: Optional[Dict[str, Any]],
+        correlation_id: Optional[str],
+    ) -> Optional[str]:
+        """Queue a response for the archive writer thread."""
+        try:
+            now = datetime.now(timezone.utc)
+            symbol = getattr(instrument, "symbol", str(instrument))
+            instrument_type = instrument.__class__.__name__.lower()
+            metadata = None
+            if self.include_metadata:
+                metadata = self._create_raw_metadata(
+                    provider, instrument, raw_data, request_metadata, correlation_id
+                )
+            self.archive.append(
+                raw_data,
+                now,
+                provider,
+                symbol,
+                instrument_type,
+                correlation_id,
+                metadata,
+            )
+            logger.debug(
+                f"Raw data queued for archive for {provider}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "provider": provider,
+                    "symbol": symbol,
+                    "raw_data_size": len(raw_data),
+                },
+            )
+            return str(self.raw_dir / str(now.year) / f"{now.month:02d}")
+        except Exception as e:
+            logger.error(
+                f"Failed to archive raw data for {provider}",
+                extra={
+                    "correlation_id": correlation_id,
+                    "provider": provider,
+                    "error": str(e),
+                },
+            )
+            return None
+
+    def flush(self) -> None:
+        """Wait until responses queued for the archive are written."""
+        if self.archive is not None:
+            self.archive.flush()
+
+    def close(self) -> None:
+        """Write queued responses and close the open archive segment and index."""
+        if self.archive is not None:
+            self.archive.close()
+        with self._index_lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
     def _generate_raw_file_path(self, provider: str, instrument: Instrument) -> Path:
         """Generate standardized raw data file path with security validation.
 
@@ -322,6 +440,9 @@ class RawDataStorage:
     ) -> list[Path]:
         """Get list of raw data files for a specific instrument.
 
+        Answered from the raw index; dates filter on the time each response
+        was saved.
+
         Args:
             provider: Provider name
             instrument: Instrument object
@@ -334,53 +455,87 @@ class RawDataStorage:
         if not self.enabled:
             return []
 
-        symbol = getattr(instrument, "symbol", str(instrument))
-        instrument_type = instrument.__class__.__name__.lower()
+        entries = self.index.find(
+            symbol=getattr(instrument, "symbol", str(instrument)),
+            instrument_type=instrument.__class__.__name__.lower(),
+            start_date=start_date,
+            end_date=end_date,
+            archived=False,
+        )
+        return [entry.path for entry in entries if entry.path.name.endswith(".csv.gz")]
 
-        # Search pattern (no provider directory since deployments are single-provider)
-        # Files are stored as: raw_dir/YEAR/MONTH/instrument_type/symbol_timestamp.csv.gz
-        pattern = f"*/*/{instrument_type}/{symbol}_*.csv.gz"
-        raw_files = list(self.raw_dir.glob(pattern))
-
-        # Filter by date if provided
-        if start_date or end_date:
-            filtered_files = []
-            for file_path in raw_files:
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc)
-                if start_date and file_time < start_date:
-                    continue
-                if end_date and file_time > end_date:
-                    continue
-                filtered_files.append(file_path)
-            return filtered_files
+    def get_archived_responses(
+        self,
+        provider: str,
+        instrument: Instrument,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[ArchiveRecord]:
+        """Get archived responses for a specific instrument.
 
-        return raw_files
+        Args:
+            provider: Provider name
+            instrument: Instrument object
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+
+        Returns:
+            Archive records; read a response with ``archive.read(record)``
+        """
+        if not self.enabled or self.archive is None:
+            return []
+
+        self.archive.flush()
+        entries = self.index.find(
+            symbol=getattr(instrument, "symbol", str(instrument)),
+            instrument_type=instrument.__class__.__name__.lower(),
+            start_date=start_date,
+            end_date=end_date,
+            archived=True,
+        )
+        return [entry.to_archive_record() for entry in entries]
 
     def cleanup_old_raw_files(self, retention_days: int = 90) -> int:
-        """Clean up raw data files older than retention period.
+        """Clean up raw data saved before the retention period.
+
+        Year/month directories entirely older than the cutoff are removed
+        whole. In the month the cutoff falls in, the expired files and archive
+        segments are found through the raw index, so the cost grows with what
+        is deleted rather than with the size of the tree.
 
         Args:
             retention_days: Number of days to retain raw data files
 
         Returns:
-            Number of files deleted
+            Number of raw responses deleted
         """
         if not self.enabled:
             return 0
 
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (retention_days * 24 * 3600)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
         deleted_count = 0
 
         try:
-            for raw_file in self.raw_dir.rglob("*.csv.gz"):
-                if raw_file.stat().st_mtime < cutoff_time:
-                    # Also remove metadata file if it exists
-                    meta_file = raw_file.with_suffix(".meta.json")
-                    if meta_file.exists():
-                        meta_file.unlink()
-
-                    raw_file.unlink()
-                    deleted_count += 1
+            deleted_count += self._remove_expired_months(cutoff)
+
+            expired_files = self.index.expired_files(cutoff)
+            for entry in expired_files:
+                # Also remove metadata file if it exists
+                entry.path.with_suffix(".meta.json").unlink(missing_ok=True)
+                entry.path.unlink(missing_ok=True)
+            self.index.remove_paths([entry.path for entry in expired_files])
+            deleted_count += len(expired_files)
+
+            expired_segments = {
+                segment: count
+                for segment, count in self.index.expired_segments(cutoff).items()
+                if self.archive is None or not self.archive.is_open(segment)
+            }
+            for segment in expired_segments:
+                segment.with_suffix(INDEX_EXTENSION).unlink(missing_ok=True)
+                segment.unlink(missing_ok=True)
+            self.index.remove_paths(list(expired_segments))
+            deleted_count += sum(expired_segments.values())
 
             logger.info(
                 f"Cleaned up {deleted_count} old raw data files (retention: {retention_days} days)"
@@ -390,3 +545,25 @@ class RawDataStorage:
         except Exception as e:
             logger.error(f"Failed to cleanup raw data files: {e}")
             return 0
+
+    def _remove_expired_months(self, cutoff: datetime) -> int:
+        """Remove year/month directories whose whole month is before ``cutoff``."""
+        deleted_count = 0
+        for year_dir in sorted(self.raw_dir.iterdir()):
+            if not (year_dir.is_dir() and year_dir.name.isdigit()):
+                continue
+            year = int(year_dir.name)
+            if year > cutoff.year:
+                break
+            for month_dir in sorted(year_dir.iterdir()):
+                if not (month_dir.is_dir() and month_dir.name.isdigit()):
+                    continue
+                if (year, int(month_dir.name)) >= (cutoff.year, cutoff.month):
+                    continue
+                if self.archive is not None and self.archive.appends_under(month_dir):
+                    continue
+                shutil.rmtree(month_dir)
+                deleted_count += self.index.remove_month(year_dir.name, month_dir.name)
+            if not any(year_dir.iterdir()):
+                year_dir.rmdir()
+        return deleted_count
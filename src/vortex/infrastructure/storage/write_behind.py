@@ -0,0 +1,252 @@
+"""
+Write-behind queue for series persistence.
+
+Storages in write-behind mode hand each write to a bounded queue drained by
+one background thread, so the next download can start while the previous
+series is still being written.
+
+Durability: a write is on disk (and in the catalog) only once the writer has
+run it. Queued writes are flushed when the downloader logs out, when the
+process exits normally, on Ctrl-C and on SIGTERM. A hard kill or power loss
+loses the queued writes; the catalog then still describes the previous
+series, so the next run fetches the missing bars again. Downloaders journal
+a job only from ``when_done`` callbacks, after its write ran, so a resumed
+run fetches jobs whose writes were lost.
+"""
+
+import atexit
+import logging
+import signal
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Optional metrics - graceful fallback if not available
+try:
+    from vortex.infrastructure.metrics import get_metrics
+
+    _metrics_available = True
+except ImportError:
+    _metrics_available = False
+
+DEFAULT_MAX_PENDING_WRITES = 32
+
+# Called with the error of a completed write, or None when it succeeded
+WriteCallback = Callable[[Optional[BaseException]], None]
+
+# Every open queue, flushed on interpreter exit
+_open_queues: "weakref.WeakSet[WriteBehindQueue]" = weakref.WeakSet()
+_signal_handler_installed = False
+
+
+class WriteBehindQueue:
+    """Bounded, coalescing queue of writes run by one background thread.
+
+    Writes are keyed by target path. A write submitted while an earlier one
+    for the same path is still queued replaces it, so repeated updates of a
+    series are written once. ``submit`` blocks while ``max_pending`` paths are
+    queued. The value of the newest queued or running write for a path stays
+    visible through ``pending`` so readers see their own writes.
+    """
+
+    def __init__(self, name: str, max_pending: int = DEFAULT_MAX_PENDING_WRITES):
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+        self.name = name
+        self.max_pending = max_pending
+        self._condition = threading.Condition()
+        # path -> (value, write, queued_at)
+        self._queued: "OrderedDict[str, Tuple[Any, Callable[[], None], float]]" = (
+            OrderedDict()
+        )
+        self._running: Dict[str, Any] = {}
+        # Callbacks waiting for the queued and the running write of a path
+        self._queued_callbacks: Dict[str, List[WriteCallback]] = {}
+        self._running_callbacks: Dict[str, List[WriteCallback]] = {}
+        # Paths whose latest completed write failed
+        self._failed: Dict[str, BaseException] = {}
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._coalesced = 0
+        self._written = 0
+        self._metrics = get_metrics() if _metrics_available else None
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"write-behind-{name}", daemon=True
+        )
+        self._thread.start()
+        _open_queues.add(self)
+        _install_signal_handler()
+
+    def submit(self, key: str, value: Any, write: Callable[[], None]) -> None:
+        """Queue ``write`` for ``key``, replacing a queued write for the same key.
+
+        Raises the error of a failed earlier write, which would otherwise only
+        surface at the next flush.
+        """
+        with self._condition:
+            self._raise_error()
+            if self._closed:
+                raise RuntimeError(f"Write-behind queue '{self.name}' is closed")
+            if key in self._queued:
+                queued_at = self._queued[key][2]
+                self._queued[key] = (value, write, queued_at)
+                self._coalesced += 1
+                return
+            while len(self._queued) >= self.max_pending:
+                self._condition.wait()
+                self._raise_error()
+            self._queued[key] = (value, write, time.monotonic())
+            self._condition.notify_all()
+            depth = len(self._queued)
+        self._record_depth(depth)
+
+    def pending(self, key: str) -> Optional[Any]:
+        """Value of the newest write for ``key`` not yet completed, if any."""
+        with self._condition:
+            if key in self._queued:
+                return self._queued[key][0]
+            return self._running.get(key)
+
+    def when_done(self, key: str, callback: WriteCallback) -> None:
+        """Call ``callback(error)`` once the newest write for ``key`` has run.
+
+        ``error`` is None when the write succeeded. Without a queued or
+        running write for ``key``, the callback gets the outcome of the last
+        one right away.
+        """
+        with self._condition:
+            if key in self._queued:
+                self._queued_callbacks.setdefault(key, []).append(callback)
+                return
+            if key in self._running:
+                self._running_callbacks.setdefault(key, []).append(callback)
+                return
+            error = self._failed.get(key)
+        _call_back(key, [callback], error)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued write has run; raise the first failure."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queued or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"Write-behind queue '{self.name}' still has "
+                        f"{len(self._queued) + len(self._running)} pending writes"
+                    )
+                self._condition.wait(remaining)
+            self._raise_error()
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+            _open_queues.discard(self)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "name": self.name,
+                "queued": len(self._queued),
+                "written": self._written,
+                "coalesced": self._coalesced,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queued and not self._closed:
+                    self._condition.wait()
+                if not self._queued:
+                    return
+                key, (value, write, queued_at) = self._queued.popitem(last=False)
+                self._running[key] = value
+                self._running_callbacks[key] = self._queued_callbacks.pop(key, [])
+                self._condition.notify_all()
+                depth = len(self._queued)
+            self._record_depth(depth)
+
+            error = None
+            try:
+                write()
+            except BaseException as e:
+                logging.error(f"Write-behind write of '{key}' failed: {e}")
+                error = e
+
+            with self._condition:
+                del self._running[key]
+                callbacks = self._running_callbacks.pop(key)
+                if error is None:
+                    self._written += 1
+                    self._failed.pop(key, None)
+                else:
+                    self._failed[key] = error
+                    if self._error is None:
+                        self._error = error
+                self._condition.notify_all()
+            _call_back(key, callbacks, error)
+            if error is None and self._metrics:
+                self._metrics.record_write_behind_flush(
+                    self.name, time.monotonic() - queued_at
+                )
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _record_depth(self, depth: int) -> None:
+        if self._metrics:
+            self._metrics.update_write_behind_queue_depth(self.name, depth)
+
+
+def _call_back(
+    key: str, callbacks: List[WriteCallback], error: Optional[BaseException]
+) -> None:
+    for callback in callbacks:
+        try:
+            callback(error)
+        except Exception as e:
+            logging.error(f"Write-behind callback for '{key}' failed: {e}")
+
+
+def flush_all_write_behind_queues() -> None:
+    """Flush every open queue, logging rather than raising failures."""
+    for queue in list(_open_queues):
+        try:
+            queue.flush()
+        except Exception as e:
+            logging.error(f"Failed to flush write-behind queue '{queue.name}': {e}")
+
+
+def _install_signal_handler() -> None:
+    """Turn SIGTERM into SystemExit so pending writes are flushed on the way out.
+
+    Only done from the main thread and when no other handler was installed.
+    """
+    global _signal_handler_installed
+    if _signal_handler_installed:
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+
+    def exit_on_sigterm(signum, frame):
+        raise SystemExit(128 + signum)
+
+    signal.signal(signal.SIGTERM, exit_on_sigterm)
+    _signal_handler_installed = True
+
+
+atexit.register(flush_all_write_behind_queues)
@@ -47,6 +47,64 @@ def _normalize_datetime_for_comparison(dt):
         return dt.astimezone(pytz.UTC)
 
 
+def is_coverage_acceptable(metadata: Metadata, row_count: int, start_date, end_date) -> bool:
+    """Decide from metadata and row count alone whether stored data covers a range."""
+    if row_count > 0:
+        logging.debug(
+            f"Current range: {metadata.start_date.strftime('%Y-%m-%d')} - "
+            f"{metadata.end_date.strftime('%Y-%m-%d')}"
+        )
+        logging.debug(
+            f"Desired range: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}"
+        )
+
+        # Normalize all datetimes for timezone-aware comparison
+        normalized_start_date = _normalize_datetime_for_comparison(start_date)
+        normalized_end_date = _normalize_datetime_for_comparison(end_date)
+        normalized_metadata_start = _normalize_datetime_for_comparison(
+            metadata.start_date
+        )
+        normalized_metadata_end = _normalize_datetime_for_comparison(
+            metadata.end_date
+        )
+        normalized_last_row_date = _normalize_datetime_for_comparison(
+            metadata.last_row_date
+        )
+
+        if (
+            normalized_metadata_end - normalized_last_row_date
+            > EXPIRATION_THRESHOLD
+        ):
+            logging.debug(
+                "Coverage is acceptable. Last search indicates no more data is available, "
+                f"since last bar is {EXPIRATION_THRESHOLD} behind the end of the "
+                "previous download request."
+            )
+            return True
+
+        # We pretend existing data is larger in order avoid too frequent updates.
+        trigger_threshold = metadata.period.get_bar_time_delta()
+        start_date_diff = (
+            normalized_metadata_start - trigger_threshold
+        ) - normalized_start_date
+        end_date_diff = normalized_end_date - (
+            normalized_metadata_end + trigger_threshold
+        )
+        # If either diff is positive then existing data is missing enough bars to cover requested range.
+        if end_date_diff.days < 0 and start_date_diff.days < 0:
+            logging.debug(
+                "Coverage is acceptable since range of existing data "
+                f"is within {trigger_threshold} tolerance when comparing with requested range."
+            )
+            return True
+
+    else:
+        logging.debug("Low data.")
+
+    logging.debug("Coverage NOT acceptable.")
+    return False
+
+
 @dataclass
 class PriceSeries(ABC):
     df: DataFrame
@@ -56,61 +114,7 @@ class PriceSeries(ABC):
         return f"{self.df.shape}, {self.metadata}"
 
     def is_data_coverage_acceptable(self, start_date, end_date) -> bool:
-        df = self.df
-        if len(df) > 0:
-            logging.debug(
-                f"Current range: {self.metadata.start_date.strftime('%Y-%m-%d')} - "
-                f"{self.metadata.end_date.strftime('%Y-%m-%d')}"
-            )
-            logging.debug(
-                f"Desired range: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}"
-            )
-
-            # Normalize all datetimes for timezone-aware comparison
-            normalized_start_date = _normalize_datetime_for_comparison(start_date)
-            normalized_end_date = _normalize_datetime_for_comparison(end_date)
-            normalized_metadata_start = _normalize_datetime_for_comparison(
-                self.metadata.start_date
-            )
-            normalized_metadata_end = _normalize_datetime_for_comparison(
-                self.metadata.end_date
-            )
-            normalized_last_row_date = _normalize_datetime_for_comparison(
-                self.metadata.last_row_date
-            )
-
-            if (
-                normalized_metadata_end - normalized_last_row_date
-                > EXPIRATION_THRESHOLD
-            ):
-                logging.debug(
-                    "Coverage is acceptable. Last search indicates no more data is available, "
-                    f"since last bar is {EXPIRATION_THRESHOLD} behind the end of the "
-                    "previous download request."
-                )
-                return True
-
-            # We pretend existing data is larger in order avoid too frequent updates.
-            trigger_threshold = self.metadata.period.get_bar_time_delta()
-            start_date_diff = (
-                normalized_metadata_start - trigger_threshold
-            ) - normalized_start_date
-            end_date_diff = normalized_end_date - (
-                normalized_metadata_end + trigger_threshold
-            )
-            # If either diff is positive then existing data is missing enough bars to cover requested range.
-            if end_date_diff.days < 0 and start_date_diff.days < 0:
-                logging.debug(
-                    "Coverage is acceptable since range of existing data "
-                    f"is within {trigger_threshold} tolerance when comparing with requested range."
-                )
-                return True
-
-        else:
-            logging.debug("Low data.")
-
-        logging.debug("Coverage NOT acceptable.")
-        return False
+        return is_coverage_acceptable(self.metadata, len(self.df), start_date, end_date)
 
     def merge(self, existing_download):
         if not existing_download:
@@ -5,16 +5,22 @@ Contains the business services that orchestrate the downloading of financial dat
 from various providers and coordinate with storage systems.
 """
 
+from .async_updating_downloader import AsyncUpdatingDownloader
 from .backfill_downloader import BackfillDownloader
 from .base_downloader import BaseDownloader
 from .download_job import DownloadJob
+from .download_pipeline import DownloadPipeline
+from .job_runner import JobRunner
 from .mock_downloader import MockDownloader
 from .updating_downloader import UpdatingDownloader
 
 __all__ = [
     "UpdatingDownloader",
+    "AsyncUpdatingDownloader",
     "BackfillDownloader",
     "MockDownloader",
     "DownloadJob",
     "BaseDownloader",
+    "JobRunner",
+    "DownloadPipeline",
 ]
@@ -0,0 +1,75 @@
+"""
+Download allowance budgeting.
+
+Providers such as Barchart cap the number of downloads per day. Rather than
+running jobs until the provider refuses one, the remaining allowance is read
+once before the run and the scheduled jobs are fitted into it in priority
+order. Jobs that do not fit are deferred and remembered, so that the next run
+serves them ahead of new work of the same priority.
+"""
+
+import logging
+from typing import Callable, List, NamedTuple, Optional
+
+from .download_job import DownloadJob
+
+
+class AllowancePlan(NamedTuple):
+    """Scheduled jobs split by whether they fit in the remaining allowance."""
+
+    selected: List[DownloadJob]
+    deferred: List[DownloadJob]
+
+
+def series_key(job: DownloadJob) -> str:
+    """Key of the series a job downloads; stable across runs unlike the job string."""
+    return f"{job.instrument}|{job.period}"
+
+
+def job_cost(job: DownloadJob) -> int:
+    """Provider downloads a job uses at most: one per date-range request."""
+    return len(job.get_fetch_ranges())
+
+
+def plan_allowance(
+    job_list: List[DownloadJob],
+    remaining: Optional[int],
+    cost: Callable[[DownloadJob], int] = job_cost,
+) -> AllowancePlan:
+    """Fit jobs, already ordered most valuable first, into the remaining allowance.
+
+    Jobs are taken in order while their cost fits; a job too expensive for
+    what is left is deferred, but cheaper jobs after it may still fit.
+
+    Args:
+        job_list: Scheduled jobs in execution order
+        remaining: Downloads left today, or None if the provider has no limit
+            or its usage is unknown
+        cost: Provider downloads a job will use; job_cost by default
+
+    Returns:
+        The jobs to run now and the jobs deferred to a later run
+    """
+    if remaining is None:
+        return AllowancePlan(list(job_list), [])
+
+    selected: List[DownloadJob] = []
+    deferred: List[DownloadJob] = []
+    budget = remaining
+    for job in job_list:
+        downloads = cost(job)
+        if downloads <= budget:
+            budget -= downloads
+            selected.append(job)
+        else:
+            deferred.append(job)
+
+    logging.info(
+        f"Download allowance: {remaining} remaining, "
+        f"{remaining - budget} planned for {len(selected)} jobs"
+    )
+    if deferred:
+        logging.warning(
+            f"Download allowance exhausted: deferring {len(deferred)} lower-priority jobs"
+        )
+    return AllowancePlan(selected, deferred)
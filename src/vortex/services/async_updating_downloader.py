@@ -0,0 +1,155 @@
+"""
+Asyncio-driven execution of updating download jobs.
+
+AsyncUpdatingDownloader runs every job of a download from one event loop,
+awaiting the provider's async fetch. It is a library entry point: the
+``vortex download`` command runs jobs through JobRunner or DownloadPipeline,
+and code already inside an event loop can await process_jobs_async() directly.
+
+Only the IBKR provider has a native async fetch. Other providers run each
+request in a worker thread on their shared session, so for them this
+downloader gives no more concurrency than JobRunner. Provider requests are
+capped at the provider's MAX_CONCURRENT_JOBS, as in JobRunner.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Dict, Hashable, List, Optional
+
+from vortex.infrastructure.providers.base import HistoricalDataResult
+
+from .base_downloader import JobProgress
+from .download_job import DownloadJob
+from .job_journal import JobJournal
+from .job_scheduler import JobScheduler
+from .job_runner import get_provider_max_concurrency, job_lock_key
+from .updating_downloader import PendingParse, UpdatingDownloader, parse_download
+
+DEFAULT_MAX_IN_FLIGHT = 32
+
+
+class AsyncUpdatingDownloader(UpdatingDownloader):
+    """UpdatingDownloader that drives all jobs from a single asyncio event loop.
+
+    Runs the load, parse and persist stages of UpdatingDownloader, but
+    awaits DataProvider.fetch_historical_data_async. Up to ``max_in_flight``
+    jobs run at once; their provider requests are further capped by the
+    provider's concurrency limit. The stages run in worker threads so
+    storage I/O and parsing never block the loop. Results are journaled and
+    counted as in BaseDownloader._process_jobs.
+    """
+
+    def __init__(
+        self,
+        data_storage,
+        data_provider,
+        backup_data_storage=None,
+        force_backup: bool = False,
+        dry_run: bool = False,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        job_journal: Optional[JobJournal] = None,
+        scheduler: Optional[JobScheduler] = None,
+    ) -> None:
+        super().__init__(
+            data_storage,
+            data_provider,
+            backup_data_storage,
+            force_backup,
+            dry_run,
+            job_journal=job_journal,
+            scheduler=scheduler,
+        )
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+        self.max_in_flight = max_in_flight
+        self._fetch_slots: Optional[asyncio.Semaphore] = None
+
+    def _process_jobs(self, job_list: List[DownloadJob]) -> None:
+        _run_coroutine(self.process_jobs_async(job_list))
+
+    async def process_jobs_async(self, job_list: List[DownloadJob]) -> None:
+        """Process jobs concurrently; await this directly from async code."""
+        job_list, journal_keys = self._plan_journaled_jobs(job_list)
+        self.expect_jobs(job_list)
+        progress = JobProgress(len(job_list))
+
+        logging.info(
+            f"--------------------------- processing {len(job_list)} jobs "
+            f"(async, {self.max_in_flight} in flight) ---------------------------"
+        )
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._fetch_slots = self._create_fetch_slots()
+        file_locks: Dict[Hashable, asyncio.Lock] = {}
+
+        async def run(job: DownloadJob):
+            lock = file_locks.setdefault(job_lock_key(job), asyncio.Lock())
+            async with lock, semaphore:
+                try:
+                    if not self.scheduler.start(job):
+                        return job, HistoricalDataResult.DEFERRED, None
+                    return job, await self._process_job_async(job), None
+                except Exception as e:
+                    return job, None, e
+
+        tasks = [asyncio.ensure_future(run(job)) for job in job_list]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                job, result, error = await next_done
+                self._record_job_outcome(
+                    progress, job, journal_keys[id(job)], result, error
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._log_job_summary(progress)
+
+    async def _process_job_async(self, job: DownloadJob) -> HistoricalDataResult:
+        """UpdatingDownloader's job stages, awaiting the provider requests."""
+        logging.info(f"Processing {job}")
+        journal_key = self._pop_journal_key(job)
+
+        loaded = await asyncio.to_thread(self._load_stage, job)
+        if isinstance(loaded, HistoricalDataResult):
+            return loaded
+
+        if self._fetch_slots is None:
+            self._fetch_slots = self._create_fetch_slots()
+        try:
+            async with self._fetch_slots:
+                responses = await job.fetch_responses_async()
+        except ValueError as e:
+            return self._handle_invalid_download(job, e)
+
+        pending = PendingParse(responses, job.series_description())
+        return await asyncio.to_thread(
+            self._finish_stage,
+            job,
+            partial(parse_download, pending),
+            loaded.existing_download,
+            journal_key,
+        )
+
+    def _create_fetch_slots(self) -> asyncio.Semaphore:
+        """Semaphore capping concurrent provider requests like JobRunner does."""
+        return asyncio.Semaphore(
+            get_provider_max_concurrency(self._get_provider_name())
+        )
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Reuses the thread's current event loop when one exists, since clients such
+    as ib_insync bind their connection to it at login time.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
@@ -1,13 +1,61 @@
 import logging
+import threading
+from functools import partial
+from typing import Dict, List
+
+import pandas as pd
 
 from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.metadata import Metadata
+from vortex.models.price_series import PriceSeries
 from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
 
+from .allowance_planner import series_key
 from .base_downloader import BaseDownloader
 from .download_job import DownloadJob
 
 
 class BackfillDownloader(BaseDownloader):
+    """Downloads history, writing each series once.
+
+    Chunks fetched by the jobs of one instrument/period announced through
+    expect_jobs() are kept in memory. When the last of those jobs has run they
+    are combined with the stored series in one sorted concatenation and
+    persisted. Jobs that were not announced are persisted as they finish.
+    Series whose jobs were deferred are written by flush_storage().
+
+    Announced jobs whose chunk is kept return PENDING. They are marked
+    completed in the job journal only once their series is persisted, and
+    all marked failed if that fails, so a resumed run fetches them again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._series_lock = threading.Lock()
+        self._series_of_job: Dict[int, str] = {}
+        self._jobs_left: Dict[str, int] = {}
+        self._chunks: Dict[str, List[PriceSeries]] = {}
+        self._chunk_journal_keys: Dict[str, List[str]] = {}
+        self._writer_job: Dict[str, DownloadJob] = {}
+
+    def expect_jobs(self, job_list: List[DownloadJob]) -> None:
+        super().expect_jobs(job_list)
+        with self._series_lock:
+            for job in job_list:
+                key = series_key(job)
+                self._series_of_job[id(job)] = key
+                self._jobs_left[key] = self._jobs_left.get(key, 0) + 1
+
+    def flush_storage(self) -> None:
+        self._write_series(list(self._jobs_left))
+        super().flush_storage()
+
+    def _process_jobs(self, job_list: List[DownloadJob]) -> None:
+        try:
+            super()._process_jobs(job_list)
+        finally:
+            self._write_series(list(self._jobs_left))
+
     def _process_job(self, job: DownloadJob):
         config = LoggingConfiguration(
             entry_msg=f"(Backfill) Processing {job}",
@@ -15,17 +63,97 @@ class BackfillDownloader(BaseDownloader):
             success_msg=f"(Backfill) Processed {job}",
             success_level=logging.DEBUG,
         )
-        with LoggingContext(config):
+        journal_key = self._pop_journal_key(job)
+        with self._series_lock:
+            key = self._series_of_job.pop(id(job), None)
+        try:
+            with LoggingContext(config):
+                try:
+                    new_download = job.fetch()
+                except ValueError as e:
+                    # Handle invalid data from provider
+                    logging.error(f"Provider returned invalid data: {str(e)}")
+                    return HistoricalDataResult.NONE
+
+                if not new_download:
+                    return HistoricalDataResult.NONE
+                logging.info(f"Fetched remote data: {new_download}")
+                if key is None:
+                    self._persist_series(job, [new_download])
+                else:
+                    with self._series_lock:
+                        self._chunks.setdefault(key, []).append(new_download)
+                        self._chunk_journal_keys.setdefault(key, []).append(
+                            journal_key
+                        )
+                        self._writer_job[key] = job
+                    return HistoricalDataResult.PENDING
+                return HistoricalDataResult.OK
+        finally:
+            if key is not None:
+                self._job_finished(key)
+
+    def _job_finished(self, key: str) -> None:
+        with self._series_lock:
+            self._jobs_left[key] -= 1
+            done = self._jobs_left[key] == 0
+        if done:
+            self._write_series([key])
+
+    def _write_series(self, keys: List[str]) -> None:
+        """Persist the kept chunks of each series and journal their jobs.
+
+        Every series is attempted; the first failure is raised afterwards.
+        """
+        first_error = None
+        for key in keys:
+            with self._series_lock:
+                self._jobs_left.pop(key, None)
+                chunks = self._chunks.pop(key, None)
+                journal_keys = self._chunk_journal_keys.pop(key, [])
+                job = self._writer_job.pop(key, None)
+            if not chunks:
+                continue
             try:
-                new_download = job.fetch()
-            except ValueError as e:
-                # Handle invalid data from provider
-                logging.error(f"Provider returned invalid data: {str(e)}")
-                return HistoricalDataResult.NONE
-
-            if not new_download:
-                return HistoricalDataResult.NONE
-            logging.info(f"Fetched remote data: {new_download}")
-            job.persist(new_download)
-            logging.info(f"Persisted data: {new_download}")
-            return HistoricalDataResult.OK
+                self._persist_series(job, chunks)
+            except Exception as e:
+                logging.error(
+                    f"Failed to persist {key}; its {len(journal_keys)} fetched "
+                    f"jobs will be fetched again: {e}"
+                )
+                self._journal_written(journal_keys, e)
+                first_error = first_error or e
+            else:
+                # In write-behind mode the jobs are journaled once the write ran
+                job.when_persisted(partial(self._journal_written, journal_keys))
+        if first_error is not None:
+            raise first_error
+
+    def _persist_series(self, job: DownloadJob, chunks: List[PriceSeries]) -> None:
+        try:
+            stored = job.load()
+        except FileNotFoundError:
+            stored = None
+        series = combine_price_series(([stored] if stored else []) + chunks)
+        job.persist(series)
+        logging.info(f"Persisted data: {series}")
+
+
+def combine_price_series(series: List[PriceSeries]) -> PriceSeries:
+    """Union of price series in one sorted concatenation; later rows win."""
+    if len(series) == 1:
+        return series[0]
+    df = pd.concat([s.df for s in series])
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    latest = series[-1].metadata
+    metadata = Metadata(
+        latest.symbol,
+        latest.period,
+        min(s.metadata.start_date for s in series),
+        max(s.metadata.end_date for s in series),
+        df.index[0].to_pydatetime(),
+        df.index[-1].to_pydatetime(),
+        data_provider=latest.data_provider,
+        expiration_date=latest.expiration_date,
+    )
+    return PriceSeries(df, metadata)
@@ -1,9 +1,9 @@
 import logging
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from itertools import cycle
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from vortex.core.instruments import InstrumentConfig, InstrumentType
 from vortex.exceptions.providers import AllowanceLimitExceededError, DataNotFoundError
@@ -24,7 +24,13 @@ from vortex.utils.utils import (
     total_elements_in_dict_of_lists,
 )
 
+from .allowance_planner import AllowancePlan, job_cost, plan_allowance, series_key
 from .download_job import DownloadJob
+from .job_journal import JobJournal
+from .job_runner import JobRunner
+from .job_scheduler import JobScheduler, PriorityScheduler
+from .preflight import PreflightPlan
+from .range_planner import coalesce_date_ranges
 
 
 @dataclass
@@ -59,6 +65,17 @@ class DownloadConfiguration:
             raise TypeError(f"Unsupported instruments type: {type(self.instruments)}")
 
 
+@dataclass
+class JobProgress:
+    """Result accounting of the jobs of one _process_jobs() call."""
+
+    total: int
+    processed: int = 0
+    downloaded: int = 0
+    deferred: int = 0
+    not_found: List[DownloadJob] = field(default_factory=list)
+
+
 class BaseDownloader(ABC):
     def __init__(
         self,
@@ -66,17 +83,67 @@ class BaseDownloader(ABC):
         data_provider: DataProvider,
         backup_data_storage: Optional[DataStorage] = None,
         force_backup: bool = False,
+        max_workers: int = 1,
+        job_journal: Optional[JobJournal] = None,
+        scheduler: Optional[JobScheduler] = None,
     ) -> None:
         self.data_storage: DataStorage = data_storage
         self.data_provider: DataProvider = data_provider
         self.backup_data_storage = backup_data_storage
         self.force_backup = force_backup
+        self.max_workers = max_workers
+        self.job_journal = job_journal
+        self.scheduler: JobScheduler = scheduler or PriorityScheduler(
+            carried_over=job_journal.deferred_keys() if job_journal else None
+        )
+        # Journal keys of announced jobs, for jobs journaled once written
+        self._journal_keys_lock = threading.Lock()
+        self._journal_key_of_job: Dict[int, str] = {}
 
     def login(self) -> None:
         self.data_provider.login()
 
     def logout(self) -> None:
-        self.data_provider.logout()
+        try:
+            self.flush_storage()
+        finally:
+            self.data_provider.logout()
+
+    def expect_jobs(self, job_list: List[DownloadJob]) -> None:
+        """Announce the jobs about to be processed, before the first one runs.
+
+        Lets downloaders that batch work per series know when a series is done.
+        Journal keys are captured here, before a job can narrow its range, for
+        jobs that are journaled only once their data is written.
+        """
+        with self._journal_keys_lock:
+            for job in job_list:
+                self._journal_key_of_job[id(job)] = str(job)
+
+    def _pop_journal_key(self, job: DownloadJob) -> Optional[str]:
+        """Journal key of an announced job; None for jobs not announced."""
+        with self._journal_keys_lock:
+            return self._journal_key_of_job.pop(id(job), None)
+
+    def _journal_written(
+        self, journal_keys: List[str], error: Optional[BaseException] = None
+    ) -> None:
+        """Journal jobs that returned PENDING, once their data write finished."""
+        if self.job_journal is None:
+            return
+        for journal_key in journal_keys:
+            if error is None:
+                self.job_journal.mark_completed(
+                    journal_key, HistoricalDataResult.OK.name
+                )
+            else:
+                self.job_journal.mark_failed(journal_key, str(error))
+
+    def flush_storage(self) -> None:
+        """Wait until storage writes queued in write-behind mode are stored."""
+        self.data_storage.flush()
+        if self.backup_data_storage:
+            self.backup_data_storage.flush()
 
     def download(self, config: DownloadConfiguration) -> None:
         """Download data using the provided configuration."""
@@ -86,7 +153,10 @@ class BaseDownloader(ABC):
             job_list = self._create_jobs(
                 contract_map, config.start_year, config.end_year
             )
-            self._process_jobs(job_list)
+            pending = self.preflight(job_list).pending
+            if pending:
+                pending = self._fit_allowance(pending)
+            self._process_jobs(pending)
         except AllowanceLimitExceededError as e:  # absorbing exception by design
             logging.error(f"{e}")
 
@@ -117,8 +187,9 @@ class BaseDownloader(ABC):
                 logging.debug(f"Skipping {instr} because it has been disabled.")
                 continue
 
-            jobs = self._create_instrument_jobs(instr, config, start, end)
-            jobs_per_instrument[instr] = jobs[::-1]
+            jobs_per_instrument[instr] = self._create_instrument_jobs(
+                instr, config, start, end
+            )
 
         return self._schedule_jobs(configs, jobs_per_instrument)
 
@@ -299,65 +370,72 @@ class BaseDownloader(ABC):
             start = max(start, provider_min_start) if provider_min_start else start
 
             timedelta_value: timedelta = self.data_provider.get_max_range(period)
+            ranges = list(date_range_generator(start, end, timedelta_value))
+            if not ranges:
+                continue
 
-            for step_start_date, step_end_date in date_range_generator(
-                start, end, timedelta_value
-            ):
-                job = DownloadJob(
-                    self.data_provider,
-                    self.data_storage,
-                    instrument,
-                    period,
-                    step_start_date,
-                    step_end_date,
-                    backup_data_storage=self.backup_data_storage,
-                )
-                logging.debug(f"Created: {job}")
-                jobs.append(job)
+            # One job per instrument/period: the series is loaded, merged and
+            # persisted once, with adjacent chunks fetched in as few requests
+            # as the provider's bar limit allows
+            ranges = coalesce_date_ranges(
+                ranges, period, self.data_provider.get_max_bars(period)
+            )
+            job = DownloadJob(
+                self.data_provider,
+                self.data_storage,
+                instrument,
+                period,
+                ranges[0][0],
+                ranges[-1][1],
+                backup_data_storage=self.backup_data_storage,
+                fetch_ranges=ranges if len(ranges) > 1 else None,
+            )
+            logging.debug(f"Created: {job} ({len(ranges)} requests)")
+            jobs.append(job)
 
         return jobs
 
     def _schedule_jobs(
         self, contract_map, jobs_per_instrument: Dict[str, List[DownloadJob]]
     ) -> List[DownloadJob]:
-        scheduled: List[DownloadJob] = []
         count = total_elements_in_dict_of_lists(jobs_per_instrument)
         logging.info(f"Total jobs to schedule: {count}")
+        return self.scheduler.schedule(contract_map, jobs_per_instrument)
 
-        pool = cycle(contract_map.keys())
-        while len(scheduled) < count:
-            try:
-                instr = next(pool)
-            except StopIteration:
-                continue
-            if instr not in jobs_per_instrument:
-                continue
-            instr_list = jobs_per_instrument[instr]
-            config_obj = contract_map[instr]
-            roll_cycle = config_obj.cycle
+    def preflight(self, job_list: List[DownloadJob]) -> PreflightPlan:
+        """Split jobs into those stored metadata proves satisfied and the rest.
 
-            if not roll_cycle:
-                max_count = 1
-            else:
-                if len(roll_cycle) > 10:
-                    max_count = 3
-                elif len(roll_cycle) > 7:
-                    max_count = 2
-                else:
-                    max_count = 1
+        Runs before any provider access, so a run with nothing pending never
+        needs to log in. By default every job is pending.
+        """
+        return PreflightPlan([], list(job_list))
+
+    def plan_allowance(self, job_list: List[DownloadJob]) -> AllowancePlan:
+        """Fit scheduled jobs into the provider's remaining download allowance.
 
-            for _ in range(0, max_count):
-                if len(instr_list) > 0:
-                    job = instr_list.pop()
-                    logging.info(f"Scheduled: {job}")
-                    scheduled.append(job)
+        Reads the provider's usage once; requires a logged-in provider.
+        """
+        return plan_allowance(
+            job_list, self.data_provider.get_remaining_allowance(), self._job_cost
+        )
+
+    def _job_cost(self, job: DownloadJob) -> int:
+        """Provider downloads the job will use; subclasses that narrow jobs override."""
+        return job_cost(job)
 
-        return scheduled
+    def _fit_allowance(self, job_list: List[DownloadJob]) -> List[DownloadJob]:
+        plan = self.plan_allowance(job_list)
+        if self.job_journal is not None:
+            self.job_journal.update_deferred(
+                [series_key(job) for job in plan.deferred],
+                [series_key(job) for job in plan.selected],
+            )
+        return plan.selected
 
     def _process_jobs(self, job_list: List[DownloadJob]) -> None:
-        not_found = []
-        jobs_processed = 0
-        jobs_downloaded = 0
+        job_list, journal_keys = self._plan_journaled_jobs(job_list)
+        self.expect_jobs(job_list)
+        progress = JobProgress(len(job_list))
 
         config = LoggingConfiguration(
             entry_msg=f"--------------------------- processing {len(job_list)} jobs ---------------------------",
@@ -365,27 +443,111 @@ class BaseDownloader(ABC):
             failure_msg="Failed to completely process scheduled downloads",
         )
         with LoggingContext(config):
-            for job in job_list:
-                try:
-                    result = self._process_job(job)
-                    jobs_downloaded += 1 if result == HistoricalDataResult.OK else 0
-                except DataNotFoundError:
-                    logging.warning(f"Instrument not found. Check starting date. {job}")
-                    not_found.append(job)
-                    continue
-                finally:
-                    jobs_processed += 1
-                    logging.info(
-                        "--------------------------- "
-                        f"{jobs_processed}/{len(job_list)} jobs processed ----  "
-                        f"{jobs_downloaded} downloads -----------------------"
-                    )
-
-            if not_found:
-                formatted_jobs = [f"({j})" for j in not_found]
-                logging.warning(
-                    f"Data not found for: {formatted_jobs}, maybe check config"
+            for job, result, error in self._run_jobs(job_list):
+                self._record_job_outcome(
+                    progress, job, journal_keys[id(job)], result, error
                 )
+            self._log_job_summary(progress)
+
+    def _record_job_outcome(
+        self,
+        progress: JobProgress,
+        job: DownloadJob,
+        journal_key: str,
+        result: Any,
+        error: Optional[Exception],
+    ) -> None:
+        """Journal and count a finished job.
+
+        Errors other than DataNotFoundError are raised once journaled.
+        """
+        progress.processed += 1
+        self._journal_job_outcome(journal_key, result, error)
+        if isinstance(error, DataNotFoundError):
+            logging.warning(f"Instrument not found. Check starting date. {job}")
+            progress.not_found.append(job)
+        elif result == HistoricalDataResult.DEFERRED:
+            progress.deferred += 1
+        elif error is None:
+            downloaded = (HistoricalDataResult.OK, HistoricalDataResult.PENDING)
+            progress.downloaded += 1 if result in downloaded else 0
+        logging.info(
+            "--------------------------- "
+            f"{progress.processed}/{progress.total} jobs processed ----  "
+            f"{progress.downloaded} downloads -----------------------"
+        )
+        if error is not None and not isinstance(error, DataNotFoundError):
+            raise error
+
+    def _log_job_summary(self, progress: JobProgress) -> None:
+        if progress.not_found:
+            formatted_jobs = [f"({j})" for j in progress.not_found]
+            logging.warning(
+                f"Data not found for: {formatted_jobs}, maybe check config"
+            )
+        if progress.deferred:
+            logging.warning(f"Deferred {progress.deferred} jobs to a later run")
+
+    def _plan_journaled_jobs(
+        self, job_list: List[DownloadJob]
+    ) -> Tuple[List[DownloadJob], Dict[int, str]]:
+        """Record jobs in the journal and drop those a previous run completed.
+
+        Journal keys are captured up front because processing a job may narrow
+        its date range, which changes its string form.
+        """
+        journal_keys = {id(job): str(job) for job in job_list}
+        if self.job_journal is None:
+            return job_list, journal_keys
+
+        self.job_journal.plan(journal_keys.values())
+        completed = self.job_journal.completed_keys()
+        remaining = [job for job in job_list if journal_keys[id(job)] not in completed]
+        if len(remaining) < len(job_list):
+            logging.info(
+                f"Skipping {len(job_list) - len(remaining)} jobs completed by a previous run"
+            )
+        return remaining, journal_keys
+
+    def _journal_job_outcome(
+        self, key: str, result: Any, error: Optional[Exception]
+    ) -> None:
+        if self.job_journal is None or result in (
+            HistoricalDataResult.DEFERRED,
+            HistoricalDataResult.PENDING,
+        ):
+            # Deferred jobs stay planned so that a resumed run picks them up;
+            # pending ones are journaled when their series is written
+            return
+        if error is None:
+            outcome = result.name if isinstance(result, HistoricalDataResult) else None
+            self.job_journal.mark_completed(key, outcome)
+        elif isinstance(error, DataNotFoundError):
+            self.job_journal.mark_completed(key, "NOT_FOUND")
+        else:
+            self.job_journal.mark_failed(key, str(error))
+
+    def _run_jobs(
+        self, job_list: List[DownloadJob]
+    ) -> Iterator[Tuple[DownloadJob, Any, Optional[Exception]]]:
+        runner = JobRunner(
+            max_workers=self.max_workers, provider_name=self._get_provider_name()
+        )
+        return runner.run(job_list, self._when_started(self._process_job))
+
+    def _when_started(self, process):
+        """Wrap a job stage so the scheduler can still defer the job as it starts."""
+
+        def run(job: DownloadJob):
+            if not self.scheduler.start(job):
+                return HistoricalDataResult.DEFERRED
+            return process(job)
+
+        return run
+
+    def _get_provider_name(self) -> Optional[str]:
+        name = self.data_provider.get_name()
+        return name.lower() if isinstance(name, str) else None
 
     @abstractmethod
     def _process_job(self, job: DownloadJob) -> HistoricalDataResult:
@@ -1,8 +1,15 @@
+import threading
 from abc import ABC
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable, List, Optional, Tuple, Union
 
-from vortex.infrastructure.providers.base import DataProvider
+import pandas as pd
+from pandas import DataFrame
+
+from vortex.exceptions.providers import DataNotFoundError
+from vortex.infrastructure.providers.base import DataProvider, RawResponse
+from vortex.infrastructure.storage.catalog import CatalogEntry, dataframe_checksum
 from vortex.infrastructure.storage.data_storage import DataStorage
 from vortex.models.instrument import Instrument
 from vortex.models.metadata import Metadata
@@ -10,6 +17,10 @@ from vortex.models.period import Period
 from vortex.models.price_series import PriceSeries
 
 
+# What a provider request for one range of a job produced
+Response = Union[DataFrame, RawResponse, DataNotFoundError, None]
+
+
 @dataclass
 class DownloadJob(ABC):
     data_provider: DataProvider
@@ -19,6 +30,8 @@ class DownloadJob(ABC):
     start_date: datetime
     end_date: datetime
     backup_data_storage: DataStorage = None
+    # Provider requests covering the job when one request cannot serve it all
+    fetch_ranges: Optional[List[Tuple[datetime, datetime]]] = None
 
     def __post_init__(self):
         if self.start_date > self.end_date:
@@ -41,6 +54,22 @@ class DownloadJob(ABC):
             else:
                 raise
 
+    def get_catalog_entry(self) -> Optional[CatalogEntry]:
+        entry = self.data_storage.get_catalog_entry(self.instrument, self.period)
+        if entry is None and self.backup_data_storage:
+            return self.backup_data_storage.get_catalog_entry(
+                self.instrument, self.period
+            )
+        return entry
+
+    def get_sidecar_metadata(self) -> Optional[Metadata]:
+        metadata = self.data_storage.get_sidecar_metadata(self.instrument, self.period)
+        if metadata is None and self.backup_data_storage:
+            return self.backup_data_storage.get_sidecar_metadata(
+                self.instrument, self.period
+            )
+        return metadata
+
     def persist(self, downloaded_data: PriceSeries, backup=True):
         self.data_storage.persist(downloaded_data, self.instrument, self.period)
 
@@ -49,25 +78,202 @@ class DownloadJob(ABC):
                 downloaded_data, self.instrument, self.period
             )
 
+    @property
+    def writes_behind(self) -> bool:
+        """Whether persist() may return before the series reaches a storage."""
+        return any(storage.writes_behind for storage in self._storages())
+
+    def when_persisted(
+        self, callback: Callable[[Optional[BaseException]], None]
+    ) -> None:
+        """Call ``callback(error)`` once every storage has stored the last persist.
+
+        ``error`` is the first failure among the storages, None when all
+        succeeded.
+        """
+        storages = self._storages()
+        lock = threading.Lock()
+        outcome = {"left": len(storages), "error": None}
+
+        def written(error: Optional[BaseException]) -> None:
+            with lock:
+                outcome["left"] -= 1
+                outcome["error"] = outcome["error"] or error
+                if outcome["left"]:
+                    return
+            callback(outcome["error"])
+
+        for storage in storages:
+            storage.when_written(self.instrument, self.period, written)
+
+    def is_stored(self, downloaded_data: PriceSeries) -> bool:
+        """Whether the primary and backup storages already hold exactly these bars.
+
+        Decided from the catalogued row count and checksum, without reading
+        any data; False when a storage does not record them.
+        """
+        df = downloaded_data.df
+        checksum = None
+        for storage in self._storages():
+            entry = storage.get_catalog_entry(self.instrument, self.period)
+            if entry is None or not entry.checksum or entry.row_count != len(df):
+                return False
+            checksum = checksum or dataframe_checksum(df)
+            if entry.checksum != checksum:
+                return False
+        return True
+
+    def update_metadata(self, metadata: Metadata) -> None:
+        for storage in self._storages():
+            storage.update_metadata(metadata, self.instrument, self.period)
+
+    def _storages(self) -> List[DataStorage]:
+        return [
+            storage
+            for storage in (self.data_storage, self.backup_data_storage)
+            if storage is not None
+        ]
+
+    @property
+    def merges_in_storage(self) -> bool:
+        """Whether new data is merged by the storage instead of in memory.
+
+        Only without a backup storage, which needs the whole merged series.
+        """
+        return self.data_storage.merges_in_place and self.backup_data_storage is None
+
+    def merge(self, downloaded_data: PriceSeries) -> Metadata:
+        return self.data_storage.merge(downloaded_data, self.instrument, self.period)
+
+    def get_fetch_ranges(self) -> List[Tuple[datetime, datetime]]:
+        """Provider requests needed for the job's current, possibly narrowed, range."""
+        if not self.fetch_ranges:
+            return [(self.start_date, self.end_date)]
+        clipped = [
+            (max(start, self.start_date), min(end, self.end_date))
+            for start, end in self.fetch_ranges
+        ]
+        ranges = [(start, end) for start, end in clipped if start < end] or [
+            (self.start_date, self.end_date)
+        ]
+        # A job widened to meet the stored series needs one more request
+        if ranges[-1][1] < self.end_date:
+            ranges.append((ranges[-1][1], self.end_date))
+        return ranges
+
     def fetch(self) -> PriceSeries:
-        df = self.data_provider.fetch_historical_data(
-            self.instrument, self.period, self.start_date, self.end_date
+        return self.create_price_series(self.fetch_responses())
+
+    def fetch_responses(self) -> List[Response]:
+        """Provider responses for the job's ranges, before they become a series.
+
+        Besides DataFrames these include DataNotFoundError values and, inside
+        deferred_parsing(), unparsed RawResponse payloads.
+        """
+        return [self._request(start, end) for start, end in self.get_fetch_ranges()]
+
+    async def fetch_responses_async(self) -> List[Response]:
+        """fetch_responses(), awaiting the provider's async fetch."""
+        return [
+            await self._request_async(start, end)
+            for start, end in self.get_fetch_ranges()
+        ]
+
+    def create_price_series(self, responses: List[Response]) -> PriceSeries:
+        return create_price_series(responses, *self.series_description())
+
+    def series_description(self) -> Tuple[str, str, Period, datetime, datetime]:
+        """Arguments of create_price_series() besides the responses."""
+        return (
+            self.data_provider.get_name(),
+            self.instrument.get_symbol(),
+            self.period,
+            self.start_date,
+            self.end_date,
         )
 
+    def _request(self, start: datetime, end: datetime):
         try:
-            metadata = Metadata.create_metadata(
-                df,
-                self.data_provider.get_name(),
-                self.instrument.get_symbol(),
-                self.period,
-                self.start_date,
-                self.end_date,
+            return self.data_provider.fetch_historical_data(
+                self.instrument, self.period, start, end
             )
-        except ValueError as e:
-            # Handle invalid data from provider
-            raise ValueError(
-                f"Provider {self.data_provider.get_name()} returned invalid data for "
-                f"{self.instrument.get_symbol()} {self.period}: {str(e)}"
+        except DataNotFoundError as e:
+            return e
+
+    async def _request_async(self, start: datetime, end: datetime):
+        try:
+            return await self.data_provider.fetch_historical_data_async(
+                self.instrument, self.period, start, end
             )
+        except DataNotFoundError as e:
+            return e
+
+
+def create_price_series(
+    responses: List[Response],
+    provider_name: str,
+    symbol: str,
+    period: Period,
+    start_date: datetime,
+    end_date: datetime,
+) -> PriceSeries:
+    """Build the fetched series from the provider responses of a job.
+
+    Module-level and free of provider state, so it can run in a worker process.
+    Unparsed responses are parsed here. Raises DataNotFoundError when no
+    request found data.
+    """
+    frames = _collect_responses([_parse_response(r) for r in responses])
+    df = frames[0] if len(frames) == 1 else _combine_frames(frames)
+    try:
+        metadata = Metadata.create_metadata(
+            df, provider_name, symbol, period, start_date, end_date
+        )
+    except ValueError as e:
+        # Handle invalid data from provider
+        raise ValueError(
+            f"Provider {provider_name} returned invalid data for "
+            f"{symbol} {period}: {str(e)}"
+        )
+
+    return PriceSeries(df, metadata)
+
+
+def _parse_response(response: Response):
+    if not isinstance(response, RawResponse):
+        return response
+    try:
+        return response.to_frame()
+    except DataNotFoundError as e:
+        return e
+
+
+def _collect_responses(responses) -> List[DataFrame]:
+    """Keep the frames of the responses; raise when the job found no data.
+
+    A single request's response is kept as returned. Ranges before an
+    instrument existed legitimately return nothing, so with several requests
+    DataNotFoundError only propagates when no request returned data.
+    """
+    not_found = [r for r in responses if isinstance(r, DataNotFoundError)]
+    if len(responses) == 1:
+        if not_found:
+            raise not_found[0]
+        return responses
+    frames = [
+        df
+        for df in responses
+        if not isinstance(df, DataNotFoundError) and df is not None and not df.empty
+    ]
+    if not frames and not_found:
+        raise not_found[-1]
+    return frames
+
 
-        return PriceSeries(df, metadata)
+def _combine_frames(frames: List[DataFrame]) -> DataFrame:
+    """Join the frames of a multi-request fetch into one series."""
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames)
+    # Adjacent requests share their boundary bar
+    return df[~df.index.duplicated(keep="last")].sort_index()
@@ -0,0 +1,224 @@
+"""
+Staged fetch → parse → persist execution of download jobs.
+
+A download job is split into three stages connected by bounded queues:
+
+- fetch: storage load, coverage check and the provider requests, on a pool of
+  threads since it is dominated by network wait;
+- parse: turning the provider responses into the fetched series, on a process
+  pool so that the pandas work does not contend for the GIL with the fetch
+  threads. Only the responses cross the process boundary: providers that
+  support deferred_parsing() (Barchart) send their raw CSV text, others their
+  parsed frames;
+- persist: merging the stored series into the fetched one and the storage
+  writes, on a single I/O thread.
+
+A full queue blocks the stage feeding it, so a slow disk or merge backs up the
+fetchers instead of buffering whole price series in memory. Jobs for the same
+instrument/period file hold a per-file lock from fetch until persist completes.
+Providers capped at one job, whose clients are bound to the thread they were
+created in, fetch in the calling thread; parsing and persisting still overlap
+with their next fetch.
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+from vortex.infrastructure.providers.base import HistoricalDataResult
+
+from .job_runner import get_provider_max_concurrency, get_provider_semaphore, job_lock_key
+
+DEFAULT_QUEUE_SIZE = 8
+
+_DONE = object()
+
+
+class DownloadPipeline:
+    """Runs download jobs through bounded fetch, parse and persist stages.
+
+    ``fetch(item)`` returns either a final HistoricalDataResult or the input of
+    ``parse``, a module-level function run in a worker process.
+    ``persist(item, parsed)`` then finishes the item, where calling
+    ``parsed()`` returns the parse result or raises its error.
+
+    Like JobRunner, results are yielded as ``(item, result, error)`` tuples in
+    completion order and errors are captured rather than raised.
+    """
+
+    def __init__(
+        self,
+        fetch_workers: int = 1,
+        cpu_workers: int = 1,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        provider_name: Optional[str] = None,
+        lock_key: Callable[[Any], Hashable] = job_lock_key,
+    ):
+        if fetch_workers < 1:
+            raise ValueError(f"fetch_workers must be at least 1, got {fetch_workers}")
+        if cpu_workers < 0:
+            raise ValueError(f"cpu_workers must not be negative, got {cpu_workers}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        # e.g. IBKR: its client needs the event loop of the calling thread
+        self.fetch_in_caller = get_provider_max_concurrency(provider_name) == 1
+
+        self.fetch_workers = fetch_workers
+        self.cpu_workers = cpu_workers
+        self.queue_size = queue_size
+        self.lock_key = lock_key
+
+        self._file_locks: Dict[Hashable, threading.Lock] = {}
+        self._file_locks_lock = threading.Lock()
+        self._provider_semaphore = (
+            get_provider_semaphore(provider_name)
+            if fetch_workers > 1
+            and not self.fetch_in_caller
+            and isinstance(provider_name, str)
+            else None
+        )
+
+    def run(
+        self,
+        items: Iterable[Any],
+        fetch: Callable[[Any], Any],
+        parse: Callable[[Any], Any],
+        persist: Callable[[Any, Callable[[], Any]], Any],
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Process items, yielding ``(item, result, error)`` as each one completes.
+
+        Closing the iterator early stops fetching new items, then waits for the
+        items already in flight to be persisted before returning.
+        """
+        items = list(items)
+        pending: "queue.Queue[Any]" = queue.Queue()
+        for item in items:
+            pending.put(item)
+        to_persist: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        results: "queue.Queue[Any]" = queue.Queue()
+        stop = threading.Event()
+
+        logging.info(
+            f"Running jobs through pipeline: "
+            f"{1 if self.fetch_in_caller else self.fetch_workers} fetch workers, "
+            f"{self.cpu_workers} parse processes, queue size {self.queue_size}"
+        )
+        pool = self._create_parse_pool()
+        stages = (fetch, parse, persist, pool)
+        fetchers = []
+        if not self.fetch_in_caller:
+            fetchers = [
+                threading.Thread(
+                    target=self._fetch_worker,
+                    args=(pending, to_persist, results, stop, stages),
+                    name=f"vortex-fetch-{i}",
+                    daemon=True,
+                )
+                for i in range(min(self.fetch_workers, len(items)))
+            ]
+        persister = threading.Thread(
+            target=self._persist_worker,
+            args=(to_persist, results, persist),
+            name="vortex-persist",
+            daemon=True,
+        )
+        for thread in fetchers:
+            thread.start()
+        persister.start()
+        try:
+            yielded = 0
+            if self.fetch_in_caller:
+                while not pending.empty():
+                    self._fetch_one(pending.get(), to_persist, results, stages)
+                    while not results.empty():
+                        yielded += 1
+                        yield results.get()
+            for _ in range(len(items) - yielded):
+                yield results.get()
+        finally:
+            stop.set()
+            for thread in fetchers:
+                thread.join()
+            to_persist.put(_DONE)
+            persister.join()
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _create_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.cpu_workers == 0:
+            return None
+        # spawn rather than fork: forking a process that already runs threads
+        # can copy locks in a held state into the child
+        return ProcessPoolExecutor(
+            max_workers=self.cpu_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _fetch_worker(self, pending, to_persist, results, stop, stages) -> None:
+        while not stop.is_set():
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                return
+            self._fetch_one(item, to_persist, results, stages)
+
+    def _fetch_one(self, item, to_persist, results, stages) -> None:
+        fetch, parse, _, pool = stages
+        lock = self._get_file_lock(self.lock_key(item))
+        lock.acquire()
+        try:
+            with self._provider_semaphore or nullcontext():
+                outcome = fetch(item)
+            if not isinstance(outcome, HistoricalDataResult):
+                parsed = self._submit_parse(pool, parse, outcome)
+        except Exception as e:
+            lock.release()
+            results.put((item, None, e))
+            return
+
+        if isinstance(outcome, HistoricalDataResult):
+            lock.release()
+            results.put((item, outcome, None))
+        else:
+            # The persist stage releases the file lock once the data is written
+            to_persist.put((item, parsed, lock))
+
+    def _persist_worker(self, to_persist, results, persist) -> None:
+        while True:
+            entry = to_persist.get()
+            if entry is _DONE:
+                return
+
+            item, parsed, lock = entry
+            try:
+                outcome = (item, persist(item, parsed.result), None)
+            except Exception as e:
+                outcome = (item, None, e)
+            finally:
+                lock.release()
+            results.put(outcome)
+
+    @staticmethod
+    def _submit_parse(
+        pool: Optional[ProcessPoolExecutor], parse: Callable[[Any], Any], argument
+    ) -> Future:
+        if pool is not None:
+            return pool.submit(parse, argument)
+
+        future: Future = Future()
+        try:
+            future.set_result(parse(argument))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _get_file_lock(self, key: Hashable) -> threading.Lock:
+        with self._file_locks_lock:
+            lock = self._file_locks.get(key)
+            if lock is None:
+                lock = self._file_locks[key] = threading.Lock()
+            return lock
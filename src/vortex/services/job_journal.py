@@ -0,0 +1,143 @@
+"""
+Crash-safe journal of planned and completed download jobs.
+
+The journal is a small SQLite database kept next to the downloaded data. Every
+planned job is recorded under its ``DownloadJob.__str__`` key before the run
+starts and marked completed as soon as it finishes, each in its own
+transaction, so a run that is killed part-way can be resumed by skipping the
+completed keys without re-loading any stored data.
+
+Series deferred because the provider's download allowance ran out are kept in
+a separate table that survives new runs, so later runs can serve them first.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Set, Union
+
+JOURNAL_FILE_NAME = ".vortex-journal.sqlite"
+
+STATUS_PLANNED = "planned"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+class JobJournal:
+    """Persistent record of download job progress, keyed by job string."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        # WAL keeps committed rows durable across a kill without fsyncing the
+        # whole database on every completed job
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " key TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " result TEXT,"
+                " updated_at TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS deferred ("
+                " key TEXT PRIMARY KEY,"
+                " deferred_at TEXT NOT NULL)"
+            )
+
+    @classmethod
+    def open(cls, directory: Union[str, Path], resume: bool = False) -> "JobJournal":
+        """Open the journal for a data directory.
+
+        Args:
+            directory: Download output directory holding the journal file
+            resume: Keep the progress of the previous run instead of starting over
+
+        Returns:
+            The opened journal
+        """
+        journal = cls(Path(directory) / JOURNAL_FILE_NAME)
+        if resume:
+            logging.info(
+                f"Resuming from job journal {journal.path}: "
+                f"{len(journal.completed_keys())} jobs already completed"
+            )
+        else:
+            journal.clear()
+        return journal
+
+    def plan(self, keys: Iterable[str]) -> None:
+        """Record jobs as planned, leaving already-known jobs untouched."""
+        now = _now()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO jobs (key, status, updated_at) VALUES (?, ?, ?)",
+                [(key, STATUS_PLANNED, now) for key in keys],
+            )
+
+    def mark_completed(self, key: str, result: Optional[str] = None) -> None:
+        self._set_status(key, STATUS_COMPLETED, result)
+
+    def mark_failed(self, key: str, error: Optional[str] = None) -> None:
+        self._set_status(key, STATUS_FAILED, error)
+
+    def is_completed(self, key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status FROM jobs WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and row[0] == STATUS_COMPLETED
+
+    def completed_keys(self) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key FROM jobs WHERE status = ?", (STATUS_COMPLETED,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def update_deferred(self, deferred: Iterable[str], scheduled: Iterable[str]) -> None:
+        """Remember deferred series and forget those scheduled to run now.
+
+        Series deferred again keep their original deferral time.
+        """
+        now = _now()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM deferred WHERE key = ?", [(key,) for key in scheduled]
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO deferred (key, deferred_at) VALUES (?, ?)",
+                [(key, now) for key in deferred],
+            )
+
+    def deferred_keys(self) -> Set[str]:
+        with self._lock:
+            rows = self._connection.execute("SELECT key FROM deferred").fetchall()
+        return {row[0] for row in rows}
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM jobs")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _set_status(self, key: str, status: str, result: Optional[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs (key, status, result, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET status = excluded.status, "
+                "result = excluded.result, updated_at = excluded.updated_at",
+                (key, status, result, _now()),
+            )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,152 @@
+"""
+Worker-pool execution of download jobs.
+
+Runs download jobs either serially (the historical behaviour) or on a thread
+pool. Jobs targeting the same instrument/period file are serialized with a
+per-file lock, and the number of jobs running concurrently against a single
+provider is capped by a semaphore shared across all runners. Providers capped
+at one job, whose clients are bound to the thread they were created in, always
+run jobs serially in the calling thread.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+from vortex.constants import get_provider_constants
+
+DEFAULT_MAX_CONCURRENT_JOBS = 4
+
+# Per-provider semaphores shared by every runner in the process
+_provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_provider_semaphores_lock = threading.Lock()
+
+
+def get_provider_max_concurrency(provider_name: Optional[str]) -> int:
+    """Get the maximum number of concurrent jobs allowed for a provider.
+
+    Args:
+        provider_name: Provider name (e.g., 'barchart', 'yahoo', 'ibkr')
+
+    Returns:
+        Concurrency cap from ProviderConstants, or DEFAULT_MAX_CONCURRENT_JOBS
+        for providers without a configured cap
+    """
+    if not isinstance(provider_name, str):
+        return DEFAULT_MAX_CONCURRENT_JOBS
+    try:
+        constants = get_provider_constants(provider_name)
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENT_JOBS
+    return constants.get("MAX_CONCURRENT_JOBS", DEFAULT_MAX_CONCURRENT_JOBS)
+
+
+def get_provider_semaphore(provider_name: str) -> threading.BoundedSemaphore:
+    """Get the process-wide semaphore capping concurrent jobs for a provider."""
+    key = provider_name.lower()
+    with _provider_semaphores_lock:
+        if key not in _provider_semaphores:
+            _provider_semaphores[key] = threading.BoundedSemaphore(
+                get_provider_max_concurrency(key)
+            )
+        return _provider_semaphores[key]
+
+
+def job_lock_key(job: Any) -> Hashable:
+    """Key identifying the storage file a job reads and writes."""
+    return str(job.instrument), str(job.period)
+
+
+class JobRunner:
+    """Runs download jobs serially or on a bounded worker pool.
+
+    Results are yielded as ``(item, result, error)`` tuples in completion order.
+    Exceptions raised while processing an item are captured and yielded rather
+    than raised, so callers keep full control over result accounting.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        provider_name: Optional[str] = None,
+        lock_key: Callable[[Any], Hashable] = job_lock_key,
+    ):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_workers > 1 and get_provider_max_concurrency(provider_name) == 1:
+            # e.g. IBKR: its client needs the event loop of the calling thread
+            logging.info(
+                f"Provider {provider_name} runs one job at a time; "
+                f"ignoring {max_workers} workers"
+            )
+            max_workers = 1
+
+        self.max_workers = max_workers
+        self.provider_name = provider_name
+        self.lock_key = lock_key
+
+        self._file_locks: Dict[Hashable, threading.Lock] = {}
+        self._file_locks_lock = threading.Lock()
+        self._provider_semaphore = (
+            get_provider_semaphore(provider_name)
+            if self.is_concurrent and isinstance(provider_name, str)
+            else None
+        )
+
+    @property
+    def is_concurrent(self) -> bool:
+        return self.max_workers > 1
+
+    def run(
+        self, items: Iterable[Any], process: Callable[[Any], Any]
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Process items, yielding ``(item, result, error)`` as each one completes.
+
+        Closing the iterator early (e.g. because the caller raised) cancels
+        every item that has not started yet and waits for running ones.
+        """
+        if not self.is_concurrent:
+            for item in items:
+                result, error = self._run_one(item, process)
+                yield item, result, error
+            return
+
+        logging.info(
+            f"Running jobs on {self.max_workers} workers "
+            f"(provider cap: {get_provider_max_concurrency(self.provider_name)})"
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="vortex-job"
+        )
+        try:
+            futures = {
+                executor.submit(self._run_locked, item, process): item
+                for item in items
+            }
+            for future in as_completed(futures):
+                result, error = future.result()
+                yield futures[future], result, error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run_locked(self, item: Any, process: Callable[[Any], Any]):
+        with self._get_file_lock(self.lock_key(item)):
+            if self._provider_semaphore is None:
+                return self._run_one(item, process)
+            with self._provider_semaphore:
+                return self._run_one(item, process)
+
+    @staticmethod
+    def _run_one(item: Any, process: Callable[[Any], Any]):
+        try:
+            return process(item), None
+        except Exception as e:
+            return None, e
+
+    def _get_file_lock(self, key: Hashable) -> threading.Lock:
+        with self._file_locks_lock:
+            lock = self._file_locks.get(key)
+            if lock is None:
+                lock = self._file_locks[key] = threading.Lock()
+            return lock
@@ -0,0 +1,269 @@
+"""
+Download job scheduling.
+
+Decides the order in which planned download jobs run. The default
+PriorityScheduler runs the most valuable jobs first (front-month futures, then
+stale series, then backfill), shares each priority tier fairly across
+instruments by weight, serves series deferred by an earlier run ahead of the
+rest of their tier, and can defer low-priority jobs once a run deadline has
+passed. Queue depth and wait times are exposed for monitoring.
+"""
+
+import enum
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from itertools import cycle
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from vortex.models.future import Future
+from vortex.models.price_series import LOW_DATA_THRESHOLD
+
+from .allowance_planner import series_key
+from .download_job import DownloadJob
+
+# Optional metrics - graceful fallback if not available
+try:
+    from vortex.infrastructure.metrics import get_metrics
+
+    _metrics_available = True
+except ImportError:
+    _metrics_available = False
+
+
+class JobPriority(enum.IntEnum):
+    """Priority tiers; lower values run first."""
+
+    FRONT_MONTH = 0
+    STALE = 1
+    BACKFILL = 2
+
+
+def _tier_label(tier: int) -> str:
+    """Metric label of a priority tier; custom tiers are labelled by number."""
+    if tier in JobPriority._value2member_map_:
+        return JobPriority(tier).name.lower()
+    return str(tier)
+
+
+def _config_value(config: Any, name: str) -> Any:
+    # Library callers pass InstrumentConfig objects, the CLI passes plain dicts
+    if isinstance(config, dict):
+        return config.get(name)
+    return getattr(config, name, None)
+
+
+def instrument_weight(config: Any) -> int:
+    """Fair-share weight of an instrument: long roll cycles get more turns."""
+    roll_cycle = _config_value(config, "cycle")
+    if not roll_cycle:
+        return 1
+    if len(roll_cycle) > 10:
+        return 3
+    if len(roll_cycle) > 7:
+        return 2
+    return 1
+
+
+def user_priority(config: Any) -> int:
+    """User-assigned instrument priority from the instrument config (higher first)."""
+    value = _config_value(config, "priority")
+    return value if isinstance(value, int) else 0
+
+
+def find_front_months(jobs: List[DownloadJob], now: datetime) -> set:
+    """ids of the jobs for the nearest unexpired contract among an instrument's jobs."""
+    months = [
+        (job.instrument.year, job.instrument.month)
+        for job in jobs
+        if isinstance(job.instrument, Future)
+        and (job.instrument.year, job.instrument.month) >= (now.year, now.month)
+    ]
+    if not months:
+        return set()
+    front = min(months)
+    return {
+        id(job)
+        for job in jobs
+        if isinstance(job.instrument, Future)
+        and (job.instrument.year, job.instrument.month) == front
+    }
+
+
+def is_stale(job: DownloadJob) -> bool:
+    """Whether the job extends a stored series that lags the requested end date.
+
+    The requested end is usually now, which no stored bar reaches; a series
+    is stale once its last bar is older than the latest bar expected by then:
+    one bar before the end, or LOW_DATA_THRESHOLD before it to allow for
+    weekends and holidays.
+    """
+    entry = job.get_catalog_entry()
+    metadata = entry.metadata if entry is not None else job.get_sidecar_metadata()
+    if metadata is None:
+        return False
+    last_row_date = metadata.last_row_date
+    end_date = job.end_date
+    if (last_row_date.tzinfo is None) != (end_date.tzinfo is None):
+        last_row_date = last_row_date.replace(tzinfo=None)
+        end_date = end_date.replace(tzinfo=None)
+    expected_lag = max(job.period.get_bar_time_delta(), LOW_DATA_THRESHOLD)
+    return last_row_date < end_date - expected_lag
+
+
+class JobScheduler(ABC):
+    """Orders planned jobs and decides, as each one starts, whether it still runs."""
+
+    @abstractmethod
+    def schedule(
+        self, contract_map: Dict[str, Any], jobs_per_instrument: Dict[str, List[DownloadJob]]
+    ) -> List[DownloadJob]:
+        """Return every job of ``jobs_per_instrument`` in execution order."""
+
+    def start(self, job: DownloadJob) -> bool:
+        """Called when a job is about to run; False defers the job to a later run."""
+        return True
+
+
+class RoundRobinScheduler(JobScheduler):
+    """Cycles through instruments, taking 1-3 jobs per turn by roll cycle length."""
+
+    def schedule(self, contract_map, jobs_per_instrument):
+        queues = {instr: list(jobs) for instr, jobs in jobs_per_instrument.items()}
+        count = sum(len(jobs) for jobs in queues.values())
+        scheduled: List[DownloadJob] = []
+
+        pool = cycle(contract_map.keys())
+        while len(scheduled) < count:
+            instr = next(pool)
+            if instr not in queues:
+                continue
+            queue = queues[instr]
+            for _ in range(instrument_weight(contract_map[instr])):
+                if queue:
+                    scheduled.append(queue.pop(0))
+
+        return scheduled
+
+
+class PriorityScheduler(JobScheduler):
+    """Weighted fair queue across instruments, ordered by priority tier.
+
+    Jobs are ranked by tier (see JobPriority, or a custom ``priority``
+    function), then ahead of the tier if the series is in ``carried_over``
+    (deferred by an earlier run), then by user priority from the instrument
+    config. Within a tier, each instrument's n-th job gets virtual finish time n / weight, so
+    instruments share the tier in proportion to their weights and none is
+    starved by another with many more jobs.
+
+    When ``deadline`` is set, jobs whose tier is ``defer_from`` or lower
+    priority are deferred if they start after the deadline.
+    """
+
+    def __init__(
+        self,
+        deadline: Optional[datetime] = None,
+        defer_from: JobPriority = JobPriority.BACKFILL,
+        priority: Optional[Callable[[DownloadJob, set], int]] = None,
+        carried_over: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.deadline = deadline
+        self.carried_over = set(carried_over or ())
+        self.defer_from = defer_from
+        self._priority = priority or self._default_priority
+        self._lock = threading.Lock()
+        self._queued: Dict[int, Tuple[float, int]] = {}
+        self._wait_seconds: List[float] = []
+        self._deferred = 0
+        self._metrics = get_metrics() if _metrics_available else None
+
+    @staticmethod
+    def _default_priority(job: DownloadJob, front_months: set) -> int:
+        if id(job) in front_months:
+            return JobPriority.FRONT_MONTH
+        if is_stale(job):
+            return JobPriority.STALE
+        return JobPriority.BACKFILL
+
+    def schedule(self, contract_map, jobs_per_instrument):
+        now = datetime.now(timezone.utc)
+        ranked = []
+        for order, (instr, jobs) in enumerate(jobs_per_instrument.items()):
+            config = contract_map.get(instr)
+            weight = instrument_weight(config)
+            boost = user_priority(config)
+            front_months = find_front_months(jobs, now)
+            served: Dict[int, int] = {}
+            for job in jobs:
+                tier = self._priority(job, front_months)
+                carried = series_key(job) in self.carried_over
+                served[tier] = served.get(tier, 0) + 1
+                ranked.append(
+                    ((tier, not carried, -boost, served[tier] / weight, order), job, tier)
+                )
+
+        ranked.sort(key=lambda item: item[0])
+        enqueued_at = time.monotonic()
+        with self._lock:
+            for _, job, tier in ranked:
+                self._queued[id(job)] = (enqueued_at, tier)
+            self._report_queue_depth()
+
+        scheduled = [job for _, job, _ in ranked]
+        for job in scheduled:
+            logging.info(f"Scheduled: {job}")
+        return scheduled
+
+    def start(self, job: DownloadJob) -> bool:
+        with self._lock:
+            enqueued_at, tier = self._queued.pop(id(job), (None, None))
+            self._report_queue_depth()
+            if enqueued_at is None:
+                return True
+
+            if self._is_past_deadline() and tier >= self.defer_from:
+                self._deferred += 1
+                logging.info(f"Run deadline passed; deferring {job}")
+                return False
+
+            wait = time.monotonic() - enqueued_at
+            self._wait_seconds.append(wait)
+        if self._metrics:
+            self._metrics.record_scheduler_wait(_tier_label(tier), wait)
+        return True
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of scheduled jobs that have not started yet."""
+        with self._lock:
+            return len(self._queued)
+
+    @property
+    def deferred_count(self) -> int:
+        with self._lock:
+            return self._deferred
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean time between scheduling and start over the jobs started so far."""
+        with self._lock:
+            if not self._wait_seconds:
+                return 0.0
+            return sum(self._wait_seconds) / len(self._wait_seconds)
+
+    @property
+    def max_wait_seconds(self) -> float:
+        with self._lock:
+            return max(self._wait_seconds, default=0.0)
+
+    def _is_past_deadline(self) -> bool:
+        if self.deadline is None:
+            return False
+        now = datetime.now(self.deadline.tzinfo)
+        return now >= self.deadline
+
+    def _report_queue_depth(self) -> None:
+        if self._metrics:
+            self._metrics.update_scheduler_queue_depth(len(self._queued))
@@ -0,0 +1,51 @@
+import logging
+from typing import List, NamedTuple
+
+from vortex.models.price_series import is_coverage_acceptable
+
+from .download_job import DownloadJob
+
+
+class PreflightPlan(NamedTuple):
+    """Jobs split by whether stored metadata already proves them satisfied."""
+
+    satisfied: List[DownloadJob]
+    pending: List[DownloadJob]
+
+
+def is_job_satisfied(job: DownloadJob) -> bool:
+    """Decide from stored metadata alone whether a job has nothing to fetch.
+
+    Uses the storage catalog when the series is indexed and the legacy JSON
+    sidecar otherwise; never reads the data file. Jobs without any stored
+    metadata are not provably satisfied.
+    """
+    entry = job.get_catalog_entry()
+    if entry is not None:
+        return is_coverage_acceptable(
+            entry.metadata, entry.row_count, job.start_date, job.end_date
+        )
+
+    metadata = job.get_sidecar_metadata()
+    if metadata is None:
+        return False
+    # Sidecars are only ever written for non-empty series
+    return is_coverage_acceptable(metadata, 1, job.start_date, job.end_date)
+
+
+def preflight_jobs(job_list: List[DownloadJob]) -> PreflightPlan:
+    """Split planned jobs into satisfied and pending without any provider access."""
+    satisfied: List[DownloadJob] = []
+    pending: List[DownloadJob] = []
+    for job in job_list:
+        if is_job_satisfied(job):
+            logging.debug(f"Preflight: stored data already covers {job}")
+            satisfied.append(job)
+        else:
+            pending.append(job)
+
+    if satisfied:
+        logging.info(
+            f"Preflight: {len(satisfied)}/{len(job_list)} jobs already satisfied by stored data"
+        )
+    return PreflightPlan(satisfied, pending)
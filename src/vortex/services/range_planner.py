@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from vortex.models.period import Period
+
+DateRange = Tuple[datetime, datetime]
+
+
+def estimate_bar_count(period: Period, start: datetime, end: datetime) -> float:
+    """Upper-bound estimate of the bars a provider returns for a date range.
+
+    Daily bars are counted on business days; other periods assume a bar for
+    every period step, which over-counts intraday sessions and so errs on the
+    side of keeping requests small.
+    """
+    if period == Period.Daily:
+        # busday_count excludes the end date; requests include it
+        return float(np.busday_count(start.date(), end.date() + timedelta(days=1)))
+    return (end - start) / period.get_bar_time_delta() + 1
+
+
+def coalesce_date_ranges(
+    ranges: List[DateRange], period: Period, max_bars: Optional[int]
+) -> List[DateRange]:
+    """Merge adjacent ranges while one provider request can still serve them.
+
+    Args:
+        ranges: Contiguous, ordered ranges as produced by date_range_generator
+        period: Bar period being requested
+        max_bars: Bar limit of a single request, or None if unknown
+
+    Returns:
+        The merged ranges; unchanged when the bar limit is unknown
+    """
+    if not max_bars or len(ranges) < 2:
+        return list(ranges)
+
+    merged: List[DateRange] = [ranges[0]]
+    for start, end in ranges[1:]:
+        current_start, current_end = merged[-1]
+        if current_end == start and estimate_bar_count(period, current_start, end) <= max_bars:
+            merged[-1] = (current_start, end)
+        else:
+            merged.append((start, end))
+    return merged
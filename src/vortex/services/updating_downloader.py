@@ -1,13 +1,38 @@
+import dataclasses
 import logging
-from typing import Optional
+from datetime import datetime
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from vortex.infrastructure.providers.base import HistoricalDataResult
-from vortex.models.price_series import LOW_DATA_THRESHOLD
+from vortex.infrastructure.providers.base import HistoricalDataResult, deferred_parsing
+from vortex.infrastructure.storage.catalog import CatalogEntry
+from vortex.models.period import Period
+from vortex.models.price_series import (
+    LOW_DATA_THRESHOLD,
+    PriceSeries,
+    is_coverage_acceptable,
+)
 from vortex.utils.logging_utils import LoggingConfiguration, LoggingContext
-from vortex.utils.utils import random_sleep
 
+from .allowance_planner import job_cost
 from .base_downloader import BaseDownloader
-from .download_job import DownloadJob
+from .download_job import DownloadJob, Response, create_price_series
+from .download_pipeline import DownloadPipeline
+from .job_journal import JobJournal
+from .job_runner import job_lock_key
+from .job_scheduler import JobScheduler
+from .preflight import PreflightPlan, preflight_jobs
 
 # Optional metrics - graceful fallback if not available
 try:
@@ -18,6 +43,36 @@ except ImportError:
     _metrics_available = False
 
 
+class PendingFetch(NamedTuple):
+    """Output of the load stage for a job that has data to fetch."""
+
+    existing_download: Optional[PriceSeries]
+
+
+class PendingParse(NamedTuple):
+    """Output of the fetch stage: provider responses still to become a series.
+
+    Holds only what parsing needs. The stored series stays with the persist
+    stage, so pipelines do not send it to their worker processes.
+    """
+
+    responses: List[Response]
+    # DownloadJob.series_description() of the job
+    description: Tuple[str, str, Period, datetime, datetime]
+
+
+LoadOutcome = Union[HistoricalDataResult, PendingFetch]
+FetchOutcome = Union[HistoricalDataResult, PendingParse]
+
+
+def parse_download(pending: PendingParse) -> PriceSeries:
+    """Parse stage body: build the fetched series from the provider responses.
+
+    Module-level so that pipeline worker processes can unpickle it.
+    """
+    return create_price_series(pending.responses, *pending.description)
+
+
 class UpdatingDownloader(BaseDownloader):
     def __init__(
         self,
@@ -25,18 +80,114 @@ class UpdatingDownloader(BaseDownloader):
         data_provider,
         backup_data_storage=None,
         force_backup: bool = False,
-        random_sleep_in_sec: Optional[float] = None,
         dry_run: bool = False,
+        max_workers: int = 1,
+        job_journal: Optional[JobJournal] = None,
+        scheduler: Optional[JobScheduler] = None,
+        cpu_workers: int = 0,
     ) -> None:
-        super().__init__(data_storage, data_provider, backup_data_storage, force_backup)
-        self.dry_run = dry_run
-        self.random_sleep_in_sec = (
-            random_sleep_in_sec
-            if random_sleep_in_sec is not None and random_sleep_in_sec > 0
-            else None
+        super().__init__(
+            data_storage,
+            data_provider,
+            backup_data_storage,
+            force_backup,
+            max_workers,
+            job_journal,
+            scheduler,
         )
+        if cpu_workers < 0:
+            raise ValueError(f"cpu_workers must not be negative, got {cpu_workers}")
+        self.dry_run = dry_run
+        # With parse processes, jobs run through a DownloadPipeline
+        self.cpu_workers = cpu_workers
         self._metrics = get_metrics() if _metrics_available else None
 
+    @property
+    def pipelined(self) -> bool:
+        return self.cpu_workers > 0
+
+    def preflight(self, job_list) -> PreflightPlan:
+        if self.force_backup and self.backup_data_storage:
+            # Forced backups rewrite existing data, so every job has work to do
+            return super().preflight(job_list)
+        return preflight_jobs(job_list)
+
+    def _job_cost(self, job: DownloadJob) -> int:
+        """Provider downloads left once the job is narrowed from the storage catalog.
+
+        Mirrors _apply_coverage_decision without changing the job: a series
+        that only lags the end date is costed from its last bar on, and a job
+        ending before the stored series is costed up to its first bar.
+        """
+        entry = job.get_catalog_entry()
+        if entry is None:
+            return job_cost(job)
+        metadata = entry.metadata
+        if is_coverage_acceptable(
+            metadata, entry.row_count, job.start_date, job.end_date
+        ):
+            return 0
+        start_date, end_date = job.start_date, job.end_date
+        if start_date >= metadata.start_date:
+            new_start = metadata.last_row_date - LOW_DATA_THRESHOLD
+            start_date = min(new_start, end_date)
+        if end_date < metadata.start_date:
+            end_date = metadata.start_date
+        return job_cost(
+            dataclasses.replace(job, start_date=start_date, end_date=end_date)
+        )
+
+    def _run_jobs(
+        self, job_list: List[DownloadJob]
+    ) -> Iterator[Tuple[DownloadJob, Any, Optional[Exception]]]:
+        if not self.pipelined:
+            return super()._run_jobs(job_list)
+        return self.run_pipeline(job_list)
+
+    def run_pipeline(
+        self,
+        items: Iterable[Any],
+        job_of: Callable[[Any], DownloadJob] = lambda item: item,
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Process the jobs of ``items`` through a DownloadPipeline.
+
+        Yields ``(item, result, error)`` as each job completes, as JobRunner
+        does. ``job_of`` maps an item to its job for callers that track jobs
+        in their own records.
+        """
+        pipeline = DownloadPipeline(
+            fetch_workers=self.max_workers,
+            cpu_workers=self.cpu_workers,
+            provider_name=self._get_provider_name(),
+            lock_key=lambda item: job_lock_key(job_of(item)),
+        )
+        # Journal key and stored series of each job waiting to be persisted
+        staged: Dict[int, Tuple[Optional[str], Optional[PriceSeries]]] = {}
+
+        def fetch(item) -> FetchOutcome:
+            job = job_of(item)
+            journal_key = self._pop_journal_key(job)
+            if not self.scheduler.start(job):
+                return HistoricalDataResult.DEFERRED
+            logging.info(f"Processing {job}")
+            loaded = self._load_stage(job)
+            if isinstance(loaded, HistoricalDataResult):
+                return loaded
+            # Providers that can leave their payloads for parse_download to parse
+            with deferred_parsing():
+                fetched = self._fetch_stage(job)
+            if isinstance(fetched, PendingParse):
+                staged[id(item)] = (journal_key, loaded.existing_download)
+            return fetched
+
+        def persist(item, parsed: Callable[[], PriceSeries]):
+            journal_key, existing_download = staged.pop(id(item))
+            return self._finish_stage(
+                job_of(item), parsed, existing_download, journal_key
+            )
+
+        return pipeline.run(items, fetch, parse_download, persist)
+
     def _process_job(self, job: DownloadJob) -> HistoricalDataResult:
         config = LoggingConfiguration(
             entry_msg=f"Processing {job}",
@@ -44,101 +195,184 @@ class UpdatingDownloader(BaseDownloader):
             success_msg=f"Processed {job}",
             success_level=logging.DEBUG,
         )
+        journal_key = self._pop_journal_key(job)
         with LoggingContext(config):
-            start_date = job.start_date
-            end_date = job.end_date
+            loaded = self._load_stage(job)
+            if isinstance(loaded, HistoricalDataResult):
+                return loaded
+
+            # Request pacing happens in the provider, around the actual HTTP call
+            return self._finish_stage(
+                job, job.fetch, loaded.existing_download, journal_key
+            )
 
-            # do we have this data already?
-            existing_download = None
-            try:
+    def _load_stage(self, job: DownloadJob) -> LoadOutcome:
+        """Decide from stored data whether the job still has data to fetch.
+
+        Returns a final HistoricalDataResult when it has not, narrowing the
+        job to the missing range otherwise.
+        """
+        # the storage catalog can usually answer without reading the data
+        catalog_entry = job.get_catalog_entry()
+        if catalog_entry is not None and self._is_catalogued_data_sufficient(
+            job, catalog_entry
+        ):
+            if self.force_backup and self.backup_data_storage:
+                job.persist(job.load())
+
+            return HistoricalDataResult.EXISTS
+
+        # do we have this data already? (not needed when the storage merges)
+        existing_download = None
+        try:
+            if not job.merges_in_storage:
                 existing_download = job.load()
                 logging.debug(f"Loaded existing data: {existing_download}")
-                if existing_download.is_data_coverage_acceptable(start_date, end_date):
-                    logging.info(
-                        f"Existing data {existing_download.df.shape} satisfies requested range. "
-                        "Skipping download."
-                    )
-
+                if catalog_entry is None and self._is_existing_data_sufficient(
+                    job, existing_download
+                ):
                     if self.force_backup and self.backup_data_storage:
                         job.persist(existing_download)
 
                     return HistoricalDataResult.EXISTS
-                logging.debug(
-                    f"Existing data {existing_download.df.shape} does NOT satisfy requested range. "
-                    "Getting more data."
-                )
-
-                # In order to avoid fetching data that we already have, and also to avoid creating holes,
-                # we use last row date as a magnet for new job start date, subtracting some days to avoid
-                # missing any data:
-                new_start = (
-                    existing_download.metadata.last_row_date - LOW_DATA_THRESHOLD
-                )
-                if job.start_date >= existing_download.metadata.start_date:
-                    job.start_date = new_start
-
-                # avoid holes:
-                if job.end_date < existing_download.metadata.start_date:
-                    job.end_date = existing_download.metadata.start_date
-
-            except FileNotFoundError:
-                logging.debug("Existing data was NOT found. Starting fresh download.")
-
-            self.pretend_not_a_bot()
-            try:
-                new_download = job.fetch()
-            except ValueError as e:
-                # Handle invalid data from provider
-                logging.error(f"Provider returned invalid data: {str(e)}")
-                if self._metrics:
-                    provider_name = (
-                        getattr(
-                            self.data_provider, "__class__", type(self.data_provider)
-                        )
-                        .__name__.lower()
-                        .replace("dataprovider", "")
-                    )
-                    self._metrics.record_download(
-                        provider_name, job.instrument.symbol, 0, False
-                    )
-                return HistoricalDataResult.NONE
-
-            if not new_download:
-                # Record failed download
-                if self._metrics:
-                    provider_name = (
-                        getattr(
-                            self.data_provider, "__class__", type(self.data_provider)
-                        )
-                        .__name__.lower()
-                        .replace("dataprovider", "")
-                    )
-                    self._metrics.record_download(
-                        provider_name, job.instrument.symbol, 0, False
-                    )
-                return HistoricalDataResult.NONE
-            logging.info(f"Fetched remote data: {new_download}")
-
-            # Record successful download metrics
-            if self._metrics and new_download.df is not None:
-                provider_name = (
-                    getattr(self.data_provider, "__class__", type(self.data_provider))
-                    .__name__.lower()
-                    .replace("dataprovider", "")
-                )
-                row_count = len(new_download.df)
-                self._metrics.record_download(
-                    provider_name, job.instrument.symbol, row_count, True
-                )
-
-            merged_download = new_download.merge(existing_download)
-            job.persist(merged_download)
-            logging.info(f"Persisted data: {merged_download}")
+        except FileNotFoundError:
+            logging.debug("Existing data was NOT found. Starting fresh download.")
+
+        return PendingFetch(existing_download)
+
+    def _fetch_stage(self, job: DownloadJob) -> FetchOutcome:
+        """Provider requests of a loaded job, leaving parsing to parse_download."""
+        try:
+            responses = job.fetch_responses()
+        except ValueError as e:
+            return self._handle_invalid_download(job, e)
+        return PendingParse(responses, job.series_description())
+
+    def _finish_stage(
+        self,
+        job: DownloadJob,
+        parse: Callable[[], Optional[PriceSeries]],
+        existing_download: Optional[PriceSeries],
+        journal_key: Optional[str] = None,
+    ) -> HistoricalDataResult:
+        """Take the parse stage's series, merge the stored one into it and store it."""
+        try:
+            new_download = parse()
+        except ValueError as e:
+            return self._handle_invalid_download(job, e)
+
+        if not self._accept_new_download(job, new_download):
+            return HistoricalDataResult.NONE
+        merged_download = new_download.merge(existing_download)
+        return self._persist_stage(job, merged_download, journal_key)
+
+    def _persist_stage(
+        self, job: DownloadJob, merged_download, journal_key: Optional[str] = None
+    ) -> HistoricalDataResult:
+        """Store the merged series.
+
+        Returns PENDING for an announced job whose write was queued in
+        write-behind mode; the job is journaled once the write has run.
+        """
+        if job.merges_in_storage:
+            # Only the new download reached here; the storage upserts it
+            logging.info(f"Merged data into storage: {job.merge(merged_download)}")
             return HistoricalDataResult.OK
+        if not self.force_backup and job.is_stored(merged_download):
+            # The fetch only repeated stored bars; keep the widened requested
+            # range so the next run does not ask for them again
+            job.update_metadata(merged_download.metadata)
+            logging.info(f"Stored data unchanged, skipped writing: {merged_download}")
+            return HistoricalDataResult.UNCHANGED
+        job.persist(merged_download)
+        logging.info(f"Persisted data: {merged_download}")
+        if journal_key is not None and job.writes_behind:
+            job.when_persisted(partial(self._journal_written, [journal_key]))
+            return HistoricalDataResult.PENDING
+        return HistoricalDataResult.OK
+
+    def _is_existing_data_sufficient(self, job: DownloadJob, existing_download) -> bool:
+        """Check stored coverage; when insufficient, narrow the job to the missing range."""
+        acceptable = existing_download.is_data_coverage_acceptable(
+            job.start_date, job.end_date
+        )
+        return self._apply_coverage_decision(
+            job,
+            existing_download.metadata,
+            acceptable,
+            f"Existing data {existing_download.df.shape}",
+        )
 
-    def pretend_not_a_bot(self) -> None:
-        if self.random_sleep_in_sec is not None:
-            # cursory attempt to not appear like a bot
-            random_sleep(self.random_sleep_in_sec)
-        else:
-            logging.warning("Random sleep is disabled. Enable to avoid bot detection.")
+    def _is_catalogued_data_sufficient(
+        self, job: DownloadJob, catalog_entry: CatalogEntry
+    ) -> bool:
+        """Same as _is_existing_data_sufficient, decided from the storage catalog."""
+        acceptable = is_coverage_acceptable(
+            catalog_entry.metadata, catalog_entry.row_count, job.start_date, job.end_date
+        )
+        return self._apply_coverage_decision(
+            job,
+            catalog_entry.metadata,
+            acceptable,
+            f"Catalogued data ({catalog_entry.row_count} rows)",
+        )
+
+    def _apply_coverage_decision(
+        self, job: DownloadJob, metadata, acceptable: bool, description: str
+    ) -> bool:
+        if acceptable:
+            logging.info(
+                f"{description} satisfies requested range. Skipping download."
+            )
+            return True
+        logging.debug(
+            f"{description} does NOT satisfy requested range. Getting more data."
+        )
+
+        # In order to avoid fetching data that we already have, and also to avoid creating holes,
+        # we use last row date as a magnet for new job start date, subtracting some days to avoid
+        # missing any data:
+        new_start = metadata.last_row_date - LOW_DATA_THRESHOLD
+        if job.start_date >= metadata.start_date:
+            job.start_date = new_start
+
+        # avoid holes:
+        if job.end_date < metadata.start_date:
+            job.end_date = metadata.start_date
+
+        return False
+
+    def _handle_invalid_download(
+        self, job: DownloadJob, error: ValueError
+    ) -> HistoricalDataResult:
+        # Handle invalid data from provider
+        logging.error(f"Provider returned invalid data: {str(error)}")
+        self._record_download_metrics(job, 0, False)
+        return HistoricalDataResult.NONE
+
+    def _accept_new_download(self, job: DownloadJob, new_download) -> bool:
+        """Record download metrics; False when the provider returned nothing."""
+        if not new_download:
+            # Record failed download
+            self._record_download_metrics(job, 0, False)
+            return False
+        logging.info(f"Fetched remote data: {new_download}")
+
+        # Record successful download metrics
+        if new_download.df is not None:
+            self._record_download_metrics(job, len(new_download.df), True)
+        return True
+
+    def _record_download_metrics(
+        self, job: DownloadJob, row_count: int, success: bool
+    ) -> None:
+        if not self._metrics:
+            return
+        provider_name = (
+            getattr(self.data_provider, "__class__", type(self.data_provider))
+            .__name__.lower()
+            .replace("dataprovider", "")
+        )
+        self._metrics.record_download(
+            provider_name, job.instrument.symbol, row_count, success
+        )
@@ -0,0 +1,65 @@
+"""
+CSV parsing with pyarrow.
+
+pyarrow's reader parses on several threads and converts typed columns,
+timestamps included, while reading, which makes it several times faster than
+pandas' parsers on price series. Callers keep a pandas fallback for input it
+rejects (``pyarrow.ArrowInvalid``), such as malformed timestamps.
+"""
+
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from pandas import DataFrame
+
+
+def read_csv_arrow(
+    data: bytes,
+    column_types: Optional[Dict[str, pa.DataType]] = None,
+    timestamp_formats: Optional[List[str]] = None,
+    include_columns: Optional[List[str]] = None,
+    skip_footer: int = 0,
+    quote_char: str = '"',
+) -> DataFrame:
+    """Parse CSV ``data`` into a DataFrame.
+
+    Args:
+        data: CSV text, header first
+        column_types: Types of the named columns; others are inferred
+        timestamp_formats: strptime formats tried for timestamp columns
+        include_columns: Only these columns are converted and returned
+        skip_footer: Number of trailing lines to drop before parsing
+        quote_char: Quote character
+
+    Raises:
+        pyarrow.ArrowInvalid: If a value does not match its column type
+    """
+    if skip_footer:
+        data = trim_footer(data, skip_footer)
+    table = pa_csv.read_csv(
+        pa.py_buffer(data),
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        parse_options=pa_csv.ParseOptions(quote_char=quote_char),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types or {},
+            timestamp_parsers=timestamp_formats,
+            include_columns=include_columns,
+        ),
+    )
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            # Empty columns become NaN floats, as pandas reads them
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas()
+
+
+def trim_footer(data: bytes, lines: int) -> bytes:
+    """``data`` without its last ``lines`` non-empty lines."""
+    data = data.rstrip(b"\r\n")
+    for _ in range(lines):
+        end = data.rfind(b"\n")
+        if end == -1:
+            return b""
+        data = data[:end].rstrip(b"\r\n")
+    return data + b"\n"
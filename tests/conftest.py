@@ -70,8 +70,7 @@ def sample_config_data():
                 "level": "DEBUG"
             },
             "backup_enabled": True,
-            "dry_run": False,
-            "random_sleep_max": 5
+            "dry_run": False
         },
         "providers": {
             "barchart": {
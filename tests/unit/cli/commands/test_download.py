@@ -66,6 +66,7 @@ class TestDownloadCommand:
             mock_dates.return_value = (datetime.now() - timedelta(days=30), datetime.now())
             mock_resolve.return_value = (['AAPL'], {'AAPL': {'asset_class': 'stock'}})
             mock_executor.return_value.execute_downloads.return_value = (1, 1)  # (successful_jobs, total_jobs)
+            mock_executor.return_value.deferred_jobs = 0
             
             yield {
                 'config': mock_config,
@@ -91,6 +92,17 @@ class TestDownloadCommand:
         assert result.exit_code == 0
         assert 'Download completed' in result.output
     
+    def test_download_all_jobs_deferred(self, runner, mock_dependencies):
+        """Test that a run whose jobs were all deferred is not reported as failed."""
+        mock_dependencies['executor'].return_value.execute_downloads.return_value = (0, 2)
+        mock_dependencies['executor'].return_value.deferred_jobs = 2
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = runner.invoke(download, ['--symbol', 'AAPL', '--output-dir', temp_dir, '--yes'], obj={})
+
+        assert result.exit_code == 0
+        assert 'Deferred: 2' in result.output
+        assert 'Failed: 0' in result.output
+
     def test_download_no_symbols_error(self, runner, mock_dependencies):
         """Test download fails when no symbols resolved."""
         # Configure mock to return empty symbols
@@ -21,22 +21,69 @@ from vortex.cli.commands.download_executor import (
 from vortex.infrastructure.providers.base import HistoricalDataResult
 from vortex.services.updating_downloader import UpdatingDownloader
 from vortex.services.backfill_downloader import BackfillDownloader
+from vortex.services.job_scheduler import JobPriority, PriorityScheduler
+from vortex.cli.commands.job_plan import JobPlan, PlannedJob
+from vortex.exceptions.providers import DataNotFoundError
+from vortex.services.allowance_planner import AllowancePlan
+from vortex.services.base_downloader import BaseDownloader
+from vortex.services.job_journal import JobJournal
+from vortex.services.preflight import PreflightPlan
+
+
+def make_downloader(job_journal=None, spec=None):
+    """Mock downloader whose preflight and allowance leave every job pending.
+
+    Journals jobs with the real BaseDownloader helpers.
+    """
+    downloader = Mock(spec=spec)
+    downloader.job_journal = job_journal
+    for helper in ("_plan_journaled_jobs", "_fit_allowance", "_journal_job_outcome"):
+        setattr(downloader, helper, getattr(BaseDownloader, helper).__get__(downloader))
+    downloader.preflight.side_effect = lambda jobs: PreflightPlan([], list(jobs))
+    downloader.plan_allowance.side_effect = lambda jobs: AllowancePlan(list(jobs), [])
+    downloader.scheduler = PriorityScheduler(priority=lambda job, front_months: JobPriority.BACKFILL)
+    return downloader
+
+
+def use_downloader(executor, downloader):
+    """Patch ``executor`` to create ``downloader``, sharing its job journal."""
+    def create():
+        downloader.job_journal = executor._job_journal
+        return downloader
+    return patch.object(executor, '_create_downloader', side_effect=create)
+
+
+def make_plan(count, symbol="AAPL"):
+    """Job plan of ``count`` mock jobs for one symbol."""
+    return JobPlan("yahoo", tuple(PlannedJob.from_job(Mock(), symbol) for _ in range(count)))
 
 
 @pytest.fixture
-def mock_config():
+def mock_config(tmp_path):
     """Mock download configuration."""
     config = Mock()
     config.provider = "yahoo"
-    config.output_dir = "/tmp/test"
+    config.output_dir = str(tmp_path)
     config.dry_run = False
     config.backup_enabled = True
     config.force_backup = False
-    config.random_sleep = 0
     config.mode = "updating"
     config.start_date = datetime(2024, 1, 1)
     config.end_date = datetime(2024, 1, 31)
     config.download_config = {}
+    config.workers = 1
+    config.cpu_workers = 0
+    config.resume = False
+    config.deadline = None
+    config.plan_out = None
+    config.partitioning = "none"
+    config.max_pending_writes = 0
+    config.storage_format = "csv"
+    config.backup_format = "parquet"
+    config.backup_deferred = False
+    config.arrow_compression = "uncompressed"
+    config.csv_engine = "pandas"
+    config.parquet = None
     return config
 
 
@@ -87,7 +134,8 @@ class TestDownloadExecutor:
     
     def test_execute_downloads_no_symbols(self, download_executor):
         """Test execute_downloads with empty symbols list."""
-        result = download_executor.execute_downloads([], {})
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
+            result = download_executor.execute_downloads([], {})
         
         assert result == (0, 0)
     
@@ -95,8 +143,9 @@ class TestDownloadExecutor:
         """Test execute_downloads when no jobs are created."""
         caplog.set_level(logging.WARNING)
         
-        with patch.object(download_executor, '_count_total_jobs', return_value=0):
-            result = download_executor.execute_downloads(["AAPL"], {})
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
+            with patch.object(download_executor, '_build_job_plan', return_value=make_plan(0)):
+                result = download_executor.execute_downloads(["AAPL"], {})
         
         assert result == (0, 0)
         assert "No download jobs to execute" in caplog.text
@@ -114,9 +163,9 @@ class TestDownloadExecutor:
         mock_create_jobs.return_value = mock_jobs
         
         # Mock downloader creation and job processing
-        mock_downloader = Mock()
+        mock_downloader = make_downloader()
         with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            with patch.object(download_executor, '_process_single_job', return_value=True):
+            with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
                 result = download_executor.execute_downloads(["AAPL"], sample_instrument_configs)
         
         assert result[0] == 2  # successful jobs
@@ -125,6 +174,148 @@ class TestDownloadExecutor:
         assert "Download execution completed" in caplog.text
 
 
+class TestResumeDownloads:
+    """Test job journal integration for resumable downloads."""
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_resume_skips_jobs_completed_by_previous_run(self, mock_get_periods, mock_create_jobs,
+                                                         download_executor):
+        """Test that --resume only runs jobs the previous run did not complete."""
+        mock_get_periods.return_value = ["1d"]
+        jobs = [Mock(__str__=Mock(return_value=f"AAPL|1d|2024-01-0{i}|2024-01-31"))
+                for i in range(1, 4)]
+        mock_create_jobs.return_value = jobs
+
+        with use_downloader(download_executor, make_downloader()):
+            with patch.object(download_executor, '_process_single_job',
+                              side_effect=[HistoricalDataResult.OK, RuntimeError("timeout"),
+                                           HistoricalDataResult.OK]):
+                download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+            download_executor.config.resume = True
+            with patch.object(download_executor, '_process_single_job',
+                              return_value=HistoricalDataResult.OK) as mock_process:
+                result = download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        assert [c.args[0].job for c in mock_process.call_args_list] == [jobs[1]]
+        assert result == (3, 3)
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_resume_skips_jobs_found_to_have_no_data(self, mock_get_periods, mock_create_jobs,
+                                                     download_executor):
+        """Test that not-found jobs are journaled completed, as the downloaders do."""
+        mock_get_periods.return_value = ["1d"]
+        mock_create_jobs.return_value = [Mock(__str__=Mock(return_value="AAPL|1d|2024-01-01|2024-01-31"))]
+        not_found = DataNotFoundError("yahoo", "AAPL", "1d", datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+        with use_downloader(download_executor, make_downloader()):
+            with patch.object(download_executor, '_process_single_job', side_effect=not_found):
+                assert download_executor.execute_downloads(["AAPL"], {"AAPL": {}}) == (0, 1)
+
+            download_executor.config.resume = True
+            with patch.object(download_executor, '_process_single_job') as mock_process:
+                download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        mock_process.assert_not_called()
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_pending_jobs_are_left_to_the_downloader(self, mock_get_periods, mock_create_jobs,
+                                                     download_executor):
+        """Test that jobs whose series is not written yet are not journaled completed."""
+        mock_get_periods.return_value = ["1d"]
+        mock_create_jobs.return_value = [Mock(__str__=Mock(return_value="AAPL|1d|2024-01-01|2024-01-31"))]
+
+        with use_downloader(download_executor, make_downloader()):
+            with patch.object(download_executor, '_process_single_job',
+                              return_value=HistoricalDataResult.PENDING):
+                download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        journal = JobJournal.open(download_executor.config.output_dir, resume=True)
+        assert journal.completed_keys() == set()
+        journal.close()
+
+    def test_dry_run_does_not_open_journal(self, download_executor):
+        """Test that dry runs leave no journal behind."""
+        download_executor.config.dry_run = True
+
+        assert download_executor._open_job_journal() is None
+
+
+class TestPreflightDownloads:
+    """Test that satisfied jobs are skipped before the provider logs in."""
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_nothing_pending_skips_login(self, mock_get_periods, mock_create_jobs,
+                                         download_executor):
+        """Test that a run whose jobs are all satisfied never logs in."""
+        mock_get_periods.return_value = ["1d"]
+        jobs = [Mock(), Mock()]
+        mock_create_jobs.return_value = jobs
+        downloader = make_downloader()
+        downloader.preflight.side_effect = None
+        downloader.preflight.return_value = PreflightPlan(jobs, [])
+
+        with patch.object(download_executor, '_create_downloader', return_value=downloader):
+            with patch.object(download_executor, '_process_single_job') as mock_process:
+                result = download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        downloader.login.assert_not_called()
+        mock_process.assert_not_called()
+        assert result == (2, 2)
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_pending_jobs_log_in_once(self, mock_get_periods, mock_create_jobs,
+                                      download_executor):
+        """Test that only pending jobs run, after a single login."""
+        mock_get_periods.return_value = ["1d"]
+        jobs = [Mock(), Mock()]
+        mock_create_jobs.return_value = jobs
+        downloader = make_downloader()
+        downloader.preflight.side_effect = None
+        downloader.preflight.return_value = PreflightPlan([jobs[0]], [jobs[1]])
+
+        with patch.object(download_executor, '_create_downloader', return_value=downloader):
+            with patch.object(download_executor, '_process_single_job',
+                              return_value=HistoricalDataResult.OK) as mock_process:
+                result = download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        downloader.login.assert_called_once()
+        assert [c.args[0].job for c in mock_process.call_args_list] == [jobs[1]]
+        assert result == (2, 2)
+
+
+class TestAllowanceDownloads:
+    """Test that jobs beyond the download allowance are deferred and remembered."""
+
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_jobs_beyond_allowance_are_deferred(self, mock_get_periods, mock_create_jobs,
+                                                download_executor, tmp_path):
+        """Test that only the jobs that fit run and the rest are journaled as deferred."""
+        mock_get_periods.return_value = ["1d"]
+        jobs = [Mock(instrument=f"AAPL_{i}", period="1d") for i in range(3)]
+        mock_create_jobs.return_value = jobs
+        downloader = make_downloader()
+        downloader.plan_allowance.side_effect = None
+        downloader.plan_allowance.return_value = AllowancePlan(jobs[:2], jobs[2:])
+
+        with use_downloader(download_executor, downloader):
+            with patch.object(download_executor, '_process_single_job',
+                              return_value=HistoricalDataResult.OK) as mock_process:
+                result = download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+
+        assert [c.args[0].job for c in mock_process.call_args_list] == jobs[:2]
+        assert result == (2, 3)
+        journal = JobJournal.open(tmp_path, resume=True)
+        assert journal.deferred_keys() == {"AAPL_2|1d"}
+        journal.close()
+
+
 class TestEnsureInstrumentConfigs:
     """Test _ensure_instrument_configs method."""
     
@@ -171,108 +362,182 @@ class TestEnsureInstrumentConfigs:
         assert "TSLA" in result
 
 
-class TestCountTotalJobs:
-    """Test _count_total_jobs method."""
+class TestBuildJobPlan:
+    """Test _build_job_plan method."""
     
     @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
     @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
-    def test_count_total_jobs_successful(self, mock_get_periods, mock_create_jobs, download_executor):
-        """Test successful job counting."""
-        # Mock periods and jobs
+    def test_build_job_plan_successful(self, mock_get_periods, mock_create_jobs, download_executor):
+        """Test that every symbol's jobs are planned once."""
         mock_get_periods.return_value = ["1d", "1h"]
-        mock_create_jobs.side_effect = [
-            [Mock(), Mock()],  # 2 jobs for first symbol
-            [Mock()]           # 1 job for second symbol
-        ]
+        aapl_jobs, tsla_jobs = [Mock(), Mock()], [Mock()]
+        mock_create_jobs.side_effect = [aapl_jobs, tsla_jobs]
         
-        mock_downloader = Mock()
-        with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            total = download_executor._count_total_jobs(
-                ["AAPL", "TSLA"], 
-                {"AAPL": {}, "TSLA": {}}
-            )
+        plan = download_executor._build_job_plan(
+            make_downloader(), ["AAPL", "TSLA"], {"AAPL": {}, "TSLA": {}}
+        )
         
-        assert total == 3
+        assert plan.total_jobs == 3
+        assert [p.job for p in plan.jobs] == aapl_jobs + tsla_jobs
+        assert [p.symbol for p in plan.jobs] == ["AAPL", "AAPL", "TSLA"]
         assert mock_create_jobs.call_count == 2
     
     @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
     @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
-    def test_count_total_jobs_with_exception_fallback(self, mock_get_periods, mock_create_jobs, 
+    def test_build_job_plan_with_job_creation_failure(self, mock_get_periods, mock_create_jobs, 
                                                      download_executor, caplog):
-        """Test job counting with exception fallback."""
-        caplog.set_level(logging.WARNING)
+        """Test that symbols whose jobs cannot be created count one job per period."""
+        caplog.set_level(logging.ERROR)
         
-        # Mock periods and job creation failure
         mock_get_periods.return_value = ["1d", "1h"]
         mock_create_jobs.side_effect = Exception("Job creation failed")
         
-        mock_downloader = Mock()
-        with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            total = download_executor._count_total_jobs(["AAPL"], {"AAPL": {}})
+        plan = download_executor._build_job_plan(make_downloader(), ["AAPL"], {"AAPL": {}})
+        
+        assert plan.jobs == ()
+        assert plan.failed_symbols == ("AAPL",)
+        assert plan.total_jobs == 2  # len(periods)
+        assert "Failed to create jobs for symbol AAPL" in caplog.text
+    
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_downloader_and_jobs_are_created_once(self, mock_get_periods, mock_create_jobs,
+                                                  download_executor):
+        """Test that one plan drives both counting and execution."""
+        mock_get_periods.return_value = ["1d"]
+        mock_create_jobs.return_value = [Mock(), Mock()]
+        
+        with patch.object(download_executor, '_create_downloader',
+                          return_value=make_downloader()) as mock_create_downloader:
+            with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
+                result = download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+        
+        assert result == (2, 2)
+        mock_create_downloader.assert_called_once()
+        mock_create_jobs.assert_called_once()
+    
+    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
+    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
+    def test_plan_out_writes_json(self, mock_get_periods, mock_create_jobs, download_executor,
+                                  tmp_path):
+        """Test that --plan-out exports the planned jobs."""
+        import json
         
-        # Should fallback to period count
-        assert total == 2  # len(periods)
-        assert "Failed to count jobs for symbol AAPL" in caplog.text
+        mock_get_periods.return_value = ["1d"]
+        job = Mock(instrument="AAPL", period="1d", start_date=datetime(2024, 1, 1),
+                   end_date=datetime(2024, 1, 31), fetch_ranges=None)
+        job.__str__ = Mock(return_value="AAPL|1d|2024-01-01|2024-01-31")
+        mock_create_jobs.return_value = [job]
+        download_executor.config.plan_out = tmp_path / "plan.json"
+        
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
+            with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
+                download_executor.execute_downloads(["AAPL"], {"AAPL": {}})
+        
+        exported = json.loads((tmp_path / "plan.json").read_text())
+        assert exported["provider"] == "yahoo"
+        assert exported["total_jobs"] == 1
+        assert exported["jobs"] == [{
+            "key": "AAPL|1d|2024-01-01|2024-01-31",
+            "symbol": "AAPL",
+            "instrument": "AAPL",
+            "period": "1d",
+            "start_date": "2024-01-01T00:00:00",
+            "end_date": "2024-01-31T00:00:00",
+            "requests": 1,
+        }]
 
 
 class TestProcessAllDownloads:
     """Test _process_all_downloads method."""
     
-    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
-    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
-    def test_process_all_downloads_successful(self, mock_get_periods, mock_create_jobs, 
-                                            download_executor, caplog):
+    def test_process_all_downloads_successful(self, download_executor, caplog):
         """Test successful processing of all downloads."""
         caplog.set_level(logging.INFO)
         
-        # Mock job creation
-        mock_get_periods.return_value = ["1d"]
-        mock_jobs = [Mock(), Mock()]
-        mock_create_jobs.return_value = mock_jobs
-        
-        mock_downloader = Mock()
-        with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            with patch.object(download_executor, '_process_single_job', return_value=True):
-                result = download_executor._process_all_downloads(["AAPL"], {"AAPL": {}}, 2)
+        with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
+            result = download_executor._process_all_downloads(
+                make_plan(2), {"AAPL": {}}, make_downloader()
+            )
         
         assert result == 2  # all successful
         assert "Progress: 1/2" in caplog.text
         assert "Progress: 2/2" in caplog.text
     
-    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
-    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
-    def test_process_all_downloads_mixed_results(self, mock_get_periods, mock_create_jobs, 
-                                               download_executor):
+    def test_process_all_downloads_mixed_results(self, download_executor):
         """Test processing with mixed success/failure results."""
-        # Mock job creation
-        mock_get_periods.return_value = ["1d"]
-        mock_jobs = [Mock(), Mock()]
-        mock_create_jobs.return_value = mock_jobs
-        
-        mock_downloader = Mock()
-        with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            with patch.object(download_executor, '_process_single_job', side_effect=[True, False]):
-                result = download_executor._process_all_downloads(["AAPL"], {"AAPL": {}}, 2)
+        with patch.object(download_executor, '_process_single_job',
+                          side_effect=[HistoricalDataResult.OK, HistoricalDataResult.NONE]):
+            result = download_executor._process_all_downloads(
+                make_plan(2), {"AAPL": {}}, make_downloader()
+            )
         
         assert result == 1  # only 1 successful
-    
-    @patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic')
-    @patch('vortex.cli.commands.download_executor.get_periods_for_symbol')
-    def test_process_all_downloads_job_creation_failure(self, mock_get_periods, mock_create_jobs, 
-                                                      download_executor, caplog):
-        """Test processing when job creation fails for a symbol."""
+
+    def test_process_all_downloads_failed_job_continues(self, download_executor, caplog):
+        """Test that a failing job is reported and the remaining jobs still run."""
         caplog.set_level(logging.ERROR)
+
+        with patch.object(download_executor, '_process_single_job',
+                          side_effect=[Exception("Download failed"), HistoricalDataResult.OK]):
+            result = download_executor._process_all_downloads(
+                make_plan(2), {"AAPL": {}}, make_downloader()
+            )
+
+        assert result == 1
+        assert "Job 1 failed: Download failed" in caplog.text
+
+    def test_process_all_downloads_deferred_jobs(self, download_executor, tmp_path):
+        """Test that jobs deferred by the deadline are neither successful nor failed."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+
+        def process(context, downloader):
+            if context.job_number == 1:
+                return HistoricalDataResult.OK
+            return HistoricalDataResult.DEFERRED
+
+        with patch.object(download_executor, '_process_single_job', side_effect=process), \
+                patch.object(journal, 'mark_failed') as mock_mark_failed:
+            result = download_executor._process_all_downloads(
+                make_plan(2), {"AAPL": {}}, make_downloader(journal)
+            )
+
+        assert result == 1
+        assert download_executor.deferred_jobs == 1
+        assert len(journal.completed_keys()) == 1
+        mock_mark_failed.assert_not_called()
+        journal.close()
+
+    def test_process_all_downloads_through_pipeline(self, download_executor):
+        """Test that a pipelined downloader runs the jobs instead of the worker pool."""
+        downloader = make_downloader(spec=UpdatingDownloader)
+        downloader.pipelined = True
+        outcomes = [
+            (HistoricalDataResult.OK, None),
+            (HistoricalDataResult.NONE, None),
+            (None, RuntimeError("disk full")),
+        ]
+        downloader.run_pipeline.side_effect = lambda contexts, job_of: (
+            (context, result, error) for context, (result, error) in zip(contexts, outcomes)
+        )
+
+        with patch.object(download_executor, '_process_single_job') as mock_process:
+            result = download_executor._process_all_downloads(
+                make_plan(3), {"AAPL": {}}, downloader
+            )
+
+        assert result == 1
+        mock_process.assert_not_called()
+
+    def test_process_all_downloads_unplanned_jobs(self, download_executor):
+        """Test processing when job creation failed for every symbol."""
+        plan = JobPlan("yahoo", failed_symbols=("AAPL",), unplanned_jobs=1)
         
-        # Mock job creation failure
-        mock_get_periods.return_value = ["1d"]
-        mock_create_jobs.side_effect = Exception("Job creation failed")
-        
-        mock_downloader = Mock()
-        with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            result = download_executor._process_all_downloads(["AAPL"], {"AAPL": {}}, 0)
+        with patch.object(download_executor, '_process_single_job') as mock_process:
+            result = download_executor._process_all_downloads(plan, {"AAPL": {}}, make_downloader())
         
         assert result == 0
-        assert "Failed to create jobs for symbol AAPL" in caplog.text
+        mock_process.assert_not_called()
 
 
 class TestProcessSingleJob:
@@ -291,11 +556,33 @@ class TestProcessSingleJob:
         
         result = download_executor._process_single_job(context, mock_downloader)
         
-        assert result is True
+        assert result == HistoricalDataResult.OK
         # LoggingContext logs success message at DEBUG level and also logs the entry message
         assert "Processing job 1/5: AAPL" in caplog.text
         assert "Completed job 1/5: AAPL" in caplog.text
     
+    def test_process_single_job_deferred_after_deadline(self, download_executor, caplog):
+        """Test that a job the scheduler defers is not processed."""
+        job = Mock()
+        context = JobExecutionContext(job, 1, 5, "AAPL")
+        mock_downloader = make_downloader()
+        mock_downloader.scheduler.deadline = datetime(2000, 1, 1)
+        mock_downloader.scheduler.schedule({}, {"AAPL": [job]})
+
+        result = download_executor._process_single_job(context, mock_downloader)
+
+        assert result == HistoricalDataResult.DEFERRED
+        mock_downloader._process_job.assert_not_called()
+        assert "deferred" in caplog.text
+
+    def test_process_single_job_pending(self, download_executor):
+        """Test that a job whose chunk is kept for its series counts as fetched."""
+        context = JobExecutionContext(Mock(), 1, 5, "AAPL")
+        mock_downloader = Mock()
+        mock_downloader._process_job.return_value = HistoricalDataResult.PENDING
+
+        assert download_executor._process_single_job(context, mock_downloader) == HistoricalDataResult.PENDING
+
     def test_process_single_job_success_exists(self, download_executor, caplog):
         """Test processing single job with EXISTS result."""
         # Set up logging for both the executor and LoggingContext loggers
@@ -309,7 +596,7 @@ class TestProcessSingleJob:
         
         result = download_executor._process_single_job(context, mock_downloader)
         
-        assert result is True
+        assert result == HistoricalDataResult.EXISTS
         # LoggingContext logs success message and internal logger logs exists message
         assert "Processing job 2/5: TSLA" in caplog.text
         assert "Completed job 2/5: TSLA" in caplog.text
@@ -327,7 +614,7 @@ class TestProcessSingleJob:
         
         result = download_executor._process_single_job(context, mock_downloader)
         
-        assert result is False
+        assert result == HistoricalDataResult.NONE
         # LoggingContext logs both entry and success messages
         assert "Processing job 3/5: INVALID" in caplog.text
         assert "Completed job 3/5: INVALID" in caplog.text
@@ -346,19 +633,15 @@ class TestProcessSingleJob:
         
         assert "Download interrupted by user" in caplog.text
     
-    def test_process_single_job_exception(self, download_executor, caplog):
-        """Test processing single job with exception."""
-        caplog.set_level(logging.ERROR)
-        
+    def test_process_single_job_exception(self, download_executor):
+        """Test that job errors are raised for the worker pool to report."""
         job = Mock()
         context = JobExecutionContext(job, 4, 5, "ERROR_SYMBOL")
         mock_downloader = Mock()
         mock_downloader._process_job.side_effect = Exception("Download failed")
         
-        result = download_executor._process_single_job(context, mock_downloader)
-        
-        assert result is False
-        assert "Job 4 failed: Download failed" in caplog.text
+        with pytest.raises(Exception, match="Download failed"):
+            download_executor._process_single_job(context, mock_downloader)
     
     @patch('vortex.cli.commands.download_executor.LoggingContext')
     def test_process_single_job_logging_context(self, mock_logging_context, download_executor):
@@ -375,7 +658,7 @@ class TestProcessSingleJob:
         
         result = download_executor._process_single_job(context, mock_downloader)
         
-        assert result is True
+        assert result == HistoricalDataResult.OK
         mock_logging_context.assert_called_once()
         
         # Verify LoggingConfiguration was created with correct parameters
@@ -402,6 +685,56 @@ class TestCreateDownloader:
         assert mock_updating.called
         assert result is mock_downloader_instance
     
+    @patch('vortex.cli.commands.download_executor.UpdatingDownloader')
+    def test_create_downloader_with_configured_formats(self, mock_updating, download_executor):
+        """Test that primary and backup storages use the configured formats."""
+        from vortex.infrastructure.storage.arrow_storage import ArrowStorage
+        from vortex.infrastructure.storage.csv_storage import CsvStorage
+
+        download_executor.config.storage_format = "arrow"
+        download_executor.config.backup_format = "csv"
+
+        download_executor._create_downloader()
+
+        kwargs = mock_updating.call_args.kwargs
+        assert isinstance(kwargs['data_storage'], ArrowStorage)
+        assert isinstance(kwargs['backup_data_storage'], CsvStorage)
+
+    @patch('vortex.cli.commands.download_executor.UpdatingDownloader')
+    def test_create_downloader_applies_parquet_encoding(self, mock_updating, download_executor):
+        """Test that the configured Parquet encoding reaches the Parquet storage."""
+        download_executor.config.parquet = {'codec': 'zstd', 'compression_level': 3}
+
+        download_executor._create_downloader()
+
+        encoding = mock_updating.call_args.kwargs['backup_data_storage'].encoding
+        assert (encoding.codec, encoding.compression_level) == ('zstd', 3)
+
+    @patch('vortex.cli.commands.download_executor.UpdatingDownloader')
+    def test_create_downloader_deferred_backup(self, mock_updating, download_executor):
+        """Test that a deferred backup follows the primary storage."""
+        from vortex.infrastructure.storage.deferred_backup import DeferredBackupStorage
+        from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+
+        download_executor.config.backup_deferred = True
+
+        download_executor._create_downloader()
+
+        kwargs = mock_updating.call_args.kwargs
+        backup = kwargs['backup_data_storage']
+        assert isinstance(backup, DeferredBackupStorage)
+        assert backup.primary is kwargs['data_storage']
+        assert isinstance(backup.backup, ParquetStorage)
+
+    @patch('vortex.cli.commands.download_executor.UpdatingDownloader')
+    def test_create_downloader_skips_backup_in_primary_format(self, mock_updating, download_executor):
+        """Test that a backup in the primary format is not created."""
+        download_executor.config.backup_format = "csv"
+
+        download_executor._create_downloader()
+
+        assert mock_updating.call_args.kwargs['backup_data_storage'] is None
+
     @patch('vortex.cli.commands.download_executor.BackfillDownloader')
     def test_create_downloader_backfill_mode_no_backup(self, mock_backfill, download_executor):
         """Test creating BackfillDownloader with backup disabled."""
@@ -526,7 +859,7 @@ class TestDownloadExecutorIntegration:
         mock_jobs = [Mock(), Mock()]
         mock_create_jobs.return_value = mock_jobs
         
-        mock_downloader = Mock()
+        mock_downloader = make_downloader()
         mock_downloader._process_job.side_effect = [
             HistoricalDataResult.OK,
             HistoricalDataResult.EXISTS
@@ -552,11 +885,12 @@ class TestDownloadExecutorIntegration:
             "MSFT": {"asset_class": "stock", "periods": ["1d"]}
         }
         
-        with patch.object(download_executor, '_count_total_jobs', return_value=3):
-            with patch.object(download_executor, '_process_all_downloads', return_value=2):
-                success_count, total_jobs = download_executor.execute_downloads(
-                    ["AAPL", "TSLA", "MSFT"], instrument_configs
-                )
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
+            with patch.object(download_executor, '_build_job_plan', return_value=make_plan(3)):
+                with patch.object(download_executor, '_process_all_downloads', return_value=2):
+                    success_count, total_jobs = download_executor.execute_downloads(
+                        ["AAPL", "TSLA", "MSFT"], instrument_configs
+                    )
         
         assert success_count == 2
         assert total_jobs == 3
@@ -571,22 +905,23 @@ class TestDownloadExecutorEdgeCases:
         symbols = ["AAPL", "TSLA"]
         
         # Mock job counting and processing
-        with patch.object(download_executor, '_count_total_jobs', return_value=2):
-            with patch.object(download_executor, '_process_all_downloads', return_value=2):
-                success_count, total_jobs = download_executor.execute_downloads(symbols, {})
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
+            with patch.object(download_executor, '_build_job_plan', return_value=make_plan(2)):
+                with patch.object(download_executor, '_process_all_downloads', return_value=2):
+                    success_count, total_jobs = download_executor.execute_downloads(symbols, {})
         
         assert success_count == 2
         assert total_jobs == 2
     
-    def test_count_total_jobs_empty_symbols(self, download_executor):
-        """Test counting jobs with empty symbols list."""
-        result = download_executor._count_total_jobs([], {})
+    def test_build_job_plan_empty_symbols(self, download_executor):
+        """Test planning jobs with empty symbols list."""
+        result = download_executor._build_job_plan(make_downloader(), [], {})
         
-        assert result == 0
+        assert result.total_jobs == 0
     
-    def test_process_all_downloads_empty_symbols(self, download_executor):
-        """Test processing downloads with empty symbols list."""
-        result = download_executor._process_all_downloads([], {}, 0)
+    def test_process_all_downloads_empty_plan(self, download_executor):
+        """Test processing downloads with an empty plan."""
+        result = download_executor._process_all_downloads(JobPlan("yahoo"), {}, make_downloader())
         
         assert result == 0
     
@@ -631,15 +966,17 @@ class TestDownloadExecutorPerformance:
         symbols = ["AAPL"]
         configs = {"AAPL": {"periods": ["1d"]}}
         
-        with patch.object(download_executor, '_create_downloader'):
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
             with patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic') as mock_create:
                 with patch('vortex.cli.commands.download_executor.get_periods_for_symbol', return_value=["1d"]):
-                    with patch.object(download_executor, '_process_single_job', return_value=True):
+                    with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
                         
                         mock_jobs = [Mock()]
                         mock_create.return_value = mock_jobs
                         
-                        download_executor._process_all_downloads(symbols, configs, 1)
+                        downloader = download_executor._create_downloader()
+                        plan = download_executor._build_job_plan(downloader, symbols, configs)
+                        download_executor._process_all_downloads(plan, configs, downloader)
         
         # Check that elapsed time is logged
         assert "Elapsed:" in caplog.text
@@ -651,16 +988,18 @@ class TestDownloadExecutorPerformance:
         symbols = ["AAPL"]
         configs = {"AAPL": {"periods": ["1d"]}}
         
-        with patch.object(download_executor, '_create_downloader'):
+        with patch.object(download_executor, '_create_downloader', return_value=make_downloader()):
             with patch('vortex.cli.commands.download_executor.create_jobs_using_downloader_logic') as mock_create:
                 with patch('vortex.cli.commands.download_executor.get_periods_for_symbol', return_value=["1d"]):
-                    with patch.object(download_executor, '_process_single_job', return_value=True):
+                    with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
                         
                         # Create 4 jobs to test progress calculation
                         mock_jobs = [Mock(), Mock(), Mock(), Mock()]
                         mock_create.return_value = mock_jobs
                         
-                        download_executor._process_all_downloads(symbols, configs, 4)
+                        downloader = download_executor._create_downloader()
+                        plan = download_executor._build_job_plan(downloader, symbols, configs)
+                        download_executor._process_all_downloads(plan, configs, downloader)
         
         # Should see progress: 1/4 (25.0%), 2/4 (50.0%), 3/4 (75.0%), 4/4 (100.0%)
         log_text = caplog.text
@@ -691,10 +1030,12 @@ class TestDownloadExecutorErrorRecovery:
         symbols = ["INVALID", "AAPL"]
         configs = {"AAPL": {"periods": ["1d"]}}
         
-        mock_downloader = Mock()
+        mock_downloader = make_downloader()
         with patch.object(download_executor, '_create_downloader', return_value=mock_downloader):
-            with patch.object(download_executor, '_process_single_job', return_value=True):
-                result = download_executor._process_all_downloads(symbols, configs, 1)
+            with patch.object(download_executor, '_process_single_job', return_value=HistoricalDataResult.OK):
+                downloader = download_executor._create_downloader()
+                plan = download_executor._build_job_plan(downloader, symbols, configs)
+                result = download_executor._process_all_downloads(plan, configs, downloader)
         
         # Should process the successful symbol despite the first failure
         assert result == 1
@@ -702,21 +1043,16 @@ class TestDownloadExecutorErrorRecovery:
     
     def test_job_processing_resilience(self, download_executor):
         """Test that individual job failures don't crash the executor."""
-        context1 = JobExecutionContext(Mock(), 1, 2, "AAPL")
-        context2 = JobExecutionContext(Mock(), 2, 2, "TSLA")
-        
-        mock_downloader = Mock()
+        mock_downloader = make_downloader()
         mock_downloader._process_job.side_effect = [
             Exception("Job 1 failed"),
             HistoricalDataResult.OK
         ]
         
         # First job should fail, second should succeed
-        result1 = download_executor._process_single_job(context1, mock_downloader)
-        result2 = download_executor._process_single_job(context2, mock_downloader)
+        result = download_executor._process_all_downloads(make_plan(2), {"AAPL": {}}, mock_downloader)
         
-        assert result1 is False
-        assert result2 is True
+        assert result == 1
 
 
 class TestDownloadExecutorConfigurationHandling:
@@ -726,7 +1062,6 @@ class TestDownloadExecutorConfigurationHandling:
     def test_config_parameter_propagation(self, mock_updating, download_executor):
         """Test that config parameters are properly propagated to downloader."""
         download_executor.config.force_backup = True
-        download_executor.config.random_sleep = 5
         download_executor.config.dry_run = True
         download_executor.config.mode = "updating"
         
@@ -736,7 +1071,6 @@ class TestDownloadExecutorConfigurationHandling:
         assert mock_updating.called
         call_kwargs = mock_updating.call_args[1]
         assert call_kwargs['force_backup'] is True
-        assert call_kwargs['random_sleep_in_sec'] == 5
         assert call_kwargs['dry_run'] is True
     
     @patch('vortex.cli.commands.download_executor.UpdatingDownloader')
@@ -0,0 +1,176 @@
+"""
+Tests for storage command module.
+"""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+from vortex.cli.commands.storage import storage
+from vortex.core.config import ParquetConfig
+from vortex.core.config.models import StorageFormat, StoragePartitioning
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+
+@pytest.fixture
+def mock_config_manager():
+    manager = Mock()
+    manager.load_config.return_value.general.parquet = ParquetConfig()
+    return manager
+
+
+@pytest.fixture
+def series_file(tmp_path):
+    dates = pd.date_range('2024-01-01', periods=50, freq='D', tz='UTC', name='Datetime')
+    df = pd.DataFrame({'Close': [float(i) for i in range(50)]}, index=dates)
+    file_path = tmp_path / 'AAPL.parquet'
+    df.to_parquet(file_path)
+    return file_path
+
+
+class TestStorageBenchmark:
+    """Test the storage benchmark command."""
+
+    def test_benchmark_reports_each_encoding(self, mock_config_manager, series_file):
+        """Test that one row is printed per encoding tried."""
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console') as mock_console:
+            result = runner.invoke(
+                storage, ['benchmark', str(series_file), '--codec', 'zstd', '--codec', 'snappy', '--repeat', '1']
+            )
+
+        assert result.exit_code == 0, result.output
+        table = mock_console.print.call_args.args[0]
+        assert table.row_count == 2
+        assert 'AAPL.parquet: 50 rows' in table.title
+
+    def test_benchmark_skips_unreadable_files(self, mock_config_manager, tmp_path):
+        """Test that files of unknown formats are reported and skipped."""
+        other_file = tmp_path / 'notes.txt'
+        other_file.write_text('not a series')
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console') as mock_console:
+            result = runner.invoke(storage, ['benchmark', str(other_file)])
+
+        assert result.exit_code == 0
+        assert 'Cannot read' in mock_console.print.call_args.args[0]
+
+
+class TestStorageMigrate:
+    """Test the storage migrate command."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path, mock_config_manager):
+        series_dir = tmp_path / 'stocks' / '1d'
+        series_dir.mkdir(parents=True)
+        dates = pd.date_range('2024-01-01', periods=5, freq='D', tz='UTC', name='Datetime')
+        df = pd.DataFrame({'Close': [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+        df.to_csv(series_dir / 'AAPL.csv', date_format='%Y-%m-%dT%H:%M:%S%z')
+        (series_dir / 'AAPL.csv.json').write_text(
+            '{"symbol": "AAPL", "period": "1d", "start_date": "2024-01-01T00:00:00+00:00",'
+            ' "end_date": "2024-01-05T00:00:00+00:00", "first_row_date": "2024-01-01T00:00:00+00:00",'
+            ' "last_row_date": "2024-01-05T00:00:00+00:00"}'
+        )
+        general = mock_config_manager.load_config.return_value.general
+        general.output_directory = tmp_path
+        general.partitioning.value = 'none'
+        general.arrow_compression = 'uncompressed'
+        return tmp_path
+
+    def test_dry_run_lists_series(self, mock_config_manager, data_dir):
+        """Test that a dry run lists the series and converts nothing."""
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console') as mock_console:
+            result = runner.invoke(storage, ['migrate', '--from', 'csv', '--to', 'parquet', '--dry-run'])
+
+        assert result.exit_code == 0, result.output
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert printed[0] == 'stocks/1d/AAPL.csv'
+        assert '1 csv series would be converted to parquet' in printed[-1]
+        assert (data_dir / 'stocks' / '1d' / 'AAPL.csv').exists()
+
+    def test_migrate_converts_series(self, mock_config_manager, data_dir):
+        """Test that series are converted with the configured settings."""
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console') as mock_console:
+            result = runner.invoke(storage, ['migrate', '--from', 'csv', '--to', 'parquet', '--workers', '1'])
+
+        assert result.exit_code == 0, result.output
+        assert (data_dir / 'stocks' / '1d' / 'AAPL.parquet').exists()
+        assert not (data_dir / 'stocks' / '1d' / 'AAPL.csv').exists()
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert 'Converted 1 of 1 series from csv to parquet' in printed
+
+    def test_failures_exit_with_error(self, mock_config_manager, data_dir):
+        """Test that series that could not be converted fail the command."""
+        (data_dir / 'stocks' / '1d' / 'AAPL.csv.json').unlink()
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console'):
+            result = runner.invoke(storage, ['migrate', '--from', 'csv', '--to', 'parquet', '--workers', '1'])
+
+        assert result.exit_code == 1
+        assert '1 series could not be converted' in result.output
+        assert (data_dir / 'stocks' / '1d' / 'AAPL.csv').exists()
+
+
+class TestStorageSyncBackup:
+    """Test the storage sync-backup command."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path, mock_config_manager):
+        general = mock_config_manager.load_config.return_value.general
+        general.output_directory = tmp_path
+        general.storage_format = StorageFormat.CSV
+        general.backup_format = StorageFormat.PARQUET
+        general.partitioning = StoragePartitioning.NONE
+        general.arrow_compression = 'uncompressed'
+        general.csv_engine = 'pandas'
+        return tmp_path
+
+    @staticmethod
+    def persist_csv(data_dir, mark_pending):
+        dates = pd.date_range('2024-01-01', periods=5, freq='D', tz='UTC', name='Datetime')
+        df = pd.DataFrame({'Close': [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+        metadata = Metadata.create_metadata(
+            df, 'test', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        csv_storage = CsvStorage(str(data_dir), dry_run=False)
+        csv_storage.persist(PriceSeries(df, metadata), Stock(id='AAPL', symbol='AAPL'), Period.Daily)
+        if mark_pending:
+            csv_storage.catalog.mark_backup_pending(str(data_dir / 'stocks' / '1d' / 'AAPL.csv'))
+
+    def test_copies_pending_series(self, mock_config_manager, data_dir):
+        """Test that marked series are copied to the backup format."""
+        self.persist_csv(data_dir, mark_pending=True)
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console') as mock_console:
+            result = runner.invoke(storage, ['sync-backup', '--workers', '1'])
+
+        assert result.exit_code == 0, result.output
+        assert (data_dir / 'stocks' / '1d' / 'AAPL.parquet').exists()
+        assert 'Copied 1 series to the parquet backup' in mock_console.print.call_args.args[0]
+
+    def test_all_copies_unmarked_series(self, mock_config_manager, data_dir):
+        """Test that --all copies series that were never marked."""
+        self.persist_csv(data_dir, mark_pending=False)
+        runner = CliRunner()
+        with patch('vortex.cli.commands.storage.get_config_manager', return_value=mock_config_manager), \
+                patch('vortex.cli.commands.storage.console'):
+            result = runner.invoke(storage, ['sync-backup'])
+            assert not (data_dir / 'stocks' / '1d' / 'AAPL.parquet').exists()
+            result = runner.invoke(storage, ['sync-backup', '--all'])
+
+        assert result.exit_code == 0, result.output
+        assert (data_dir / 'stocks' / '1d' / 'AAPL.parquet').exists()
@@ -180,6 +180,19 @@ class TestDataNotFoundError:
         expected_message = "No data found for AAPL (1d) from 2024-01-01 to 2024-01-31"
         assert expected_message in str(error)
 
+    def test_data_not_found_error_survives_pickling(self):
+        """Test that errors raised in worker processes reach the parent intact."""
+        import pickle
+
+        error = DataNotFoundError("barchart", "GC", "1d", datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is DataNotFoundError
+        assert restored.symbol == "GC"
+        assert restored.provider == "barchart"
+        assert str(restored) == str(error)
+
     def test_data_not_found_error_with_http_code(self):
         """Test DataNotFoundError with HTTP code."""
         mock_period = Mock()
@@ -292,6 +292,31 @@ class TestVortexMetrics:
 
         metrics.active_correlations.set.assert_called_once_with(5)
 
+    def test_scheduler_metrics_initialized(self, metrics):
+        """Test scheduler queue depth and wait time recording when initialized."""
+        metrics._initialized = True
+        mock_histogram = Mock()
+        metrics.scheduler_wait_seconds.labels.return_value = mock_histogram
+
+        metrics.update_scheduler_queue_depth(7)
+        metrics.record_scheduler_wait("stale", 12.5)
+
+        metrics.scheduler_queue_depth.set.assert_called_once_with(7)
+        metrics.scheduler_wait_seconds.labels.assert_called_with(priority="stale")
+        mock_histogram.observe.assert_called_once_with(12.5)
+
+    def test_write_behind_metrics_initialized(self, metrics):
+        """Test write-behind queue depth and flush latency recording when initialized."""
+        metrics._initialized = True
+
+        metrics.update_write_behind_queue_depth("csv", 3)
+        metrics.record_write_behind_flush("csv", 0.25)
+
+        metrics.write_behind_queue_depth.labels.assert_called_with(storage_type="csv")
+        metrics.write_behind_queue_depth.labels.return_value.set.assert_called_once_with(3)
+        metrics.write_behind_flush_seconds.labels.assert_called_with(storage_type="csv")
+        metrics.write_behind_flush_seconds.labels.return_value.observe.assert_called_once_with(0.25)
+
     def test_is_server_running(self, metrics):
         """Test is_server_running."""
         assert metrics.is_server_running() is False
@@ -0,0 +1,40 @@
+"""
+Tests for Barchart usage checking and download allowance.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vortex.exceptions.providers import AllowanceLimitExceededError
+from vortex.infrastructure.providers.barchart.usage_checker import BarchartUsageChecker
+
+
+@pytest.fixture
+def checker():
+    return BarchartUsageChecker(Mock(), Mock(), daily_limit=150)
+
+
+class TestRemainingAllowance:
+    """Test the remaining allowance computed from the server usage count."""
+
+    def test_remaining_allowance(self, checker):
+        """Test that remaining downloads are the daily limit minus server usage."""
+        with patch.object(checker, 'check_server_usage', return_value=40):
+            assert checker.get_remaining_allowance() == 110
+
+    def test_remaining_allowance_never_negative(self, checker):
+        """Test that usage above the configured limit leaves no allowance."""
+        with patch.object(checker, 'check_server_usage', return_value=200):
+            assert checker.get_remaining_allowance() == 0
+
+    def test_unknown_usage(self, checker):
+        """Test that an unavailable usage count leaves the allowance unknown."""
+        with patch.object(checker, 'check_server_usage', return_value=None):
+            assert checker.get_remaining_allowance() is None
+
+    def test_validate_daily_limit_exceeded(self, checker):
+        """Test that reaching the limit still raises for per-download validation."""
+        with patch.object(checker, 'check_server_usage', return_value=150):
+            with pytest.raises(AllowanceLimitExceededError):
+                checker.validate_daily_limit()
@@ -16,10 +16,10 @@ from vortex.models.period import Period
 from vortex.models.columns import CLOSE_COLUMN, DATETIME_COLUMN_NAME
 
 
-@pytest.fixture
-def parser():
-    """Create a BarchartParser instance for testing."""
-    return BarchartParser()
+@pytest.fixture(params=['python', 'pyarrow'])
+def parser(request):
+    """Create a BarchartParser instance for testing, once per CSV engine."""
+    return BarchartParser(csv_engine=request.param)
 
 
 @pytest.mark.unit
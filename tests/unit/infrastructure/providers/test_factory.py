@@ -101,6 +101,20 @@ class TestProviderFactory:
         assert "Missing required configuration" in str(exc_info.value)
         assert "username, password" in str(exc_info.value)
     
+    @patch('vortex.infrastructure.providers.barchart.auth.BarchartAuth')
+    def test_create_barchart_provider_deferred_login(self, mock_auth_class, factory):
+        """Test that login=False leaves the session closed until login() is called."""
+        mock_auth_class.return_value = Mock(session=Mock())
+
+        with patch('vortex.infrastructure.providers.barchart.provider.BarchartDataProvider.login') as mock_login:
+            provider = factory.create_provider('barchart', login=False)
+            mock_login.assert_not_called()
+
+            factory.create_provider('barchart')
+            mock_login.assert_called_once()
+
+        assert provider.get_name() == 'Barchart'
+
     def test_register_provider(self, factory):
         """Test registering a new provider."""
         mock_provider_class = Mock()
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import time
 import threading
@@ -223,6 +224,29 @@ class TestCircuitBreaker:
         with pytest.raises(CircuitOpenException):
             circuit_breaker.call(test_function)
 
+    def test_call_async_success(self, circuit_breaker):
+        """Test awaiting a coroutine function through the breaker."""
+        async def successful_coroutine(value):
+            return value
+
+        result = asyncio.run(circuit_breaker.call_async(successful_coroutine, "success"))
+
+        assert result == "success"
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    def test_call_async_failures_open_circuit(self, circuit_breaker):
+        """Test async failures count towards the threshold and open the circuit."""
+        async def failing_coroutine():
+            raise VortexConnectionError("Network error")
+
+        for _ in range(circuit_breaker.config.failure_threshold):
+            with pytest.raises(VortexConnectionError):
+                asyncio.run(circuit_breaker.call_async(failing_coroutine))
+
+        assert circuit_breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenException):
+            asyncio.run(circuit_breaker.call_async(failing_coroutine))
+
     def test_function_with_arguments(self, circuit_breaker):
         """Test circuit breaker with function arguments."""
         def add_numbers(a, b, multiplier=1):
@@ -328,6 +352,45 @@ class TestCircuitBreaker:
         assert len(results) == 5
         assert len(errors) == 0
 
+    def test_half_open_allows_one_probe_at_a_time(self, circuit_breaker):
+        """Test that callers are rejected while the half-open probe runs."""
+        circuit_breaker.force_open()
+        circuit_breaker._last_failure_time = datetime.now() - timedelta(seconds=2)
+        probing = threading.Event()
+        release = threading.Event()
+
+        def probe():
+            probing.set()
+            release.wait(5)
+            return "probed"
+
+        thread = threading.Thread(target=circuit_breaker.call, args=(probe,))
+        thread.start()
+        probing.wait(5)
+
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenException):
+            circuit_breaker.call(lambda: "concurrent")
+
+        release.set()
+        thread.join()
+
+        assert circuit_breaker.call(lambda: "next probe") == "next probe"
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    def test_cancelled_probe_frees_half_open_circuit(self, circuit_breaker):
+        """Test that a probe ended by a non-Exception lets the next caller probe."""
+        circuit_breaker.force_open()
+        circuit_breaker._last_failure_time = datetime.now() - timedelta(seconds=2)
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(circuit_breaker.call_async(cancelled))
+
+        assert circuit_breaker.call(lambda: "probe") == "probe"
+
 
 class TestCircuitBreakerRegistry:
     def test_circuit_breaker_registry_singleton(self):
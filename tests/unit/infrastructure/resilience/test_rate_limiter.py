@@ -0,0 +1,222 @@
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vortex.exceptions import RateLimitError, VortexConnectionError
+from vortex.infrastructure.resilience.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimiterRegistry,
+    parse_retry_after,
+    throttle_hint,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, **overrides):
+    config = RateLimitConfig(**{"requests_per_second": 2.0, "burst": 2, **overrides})
+    return RateLimiter("test", config, clock=clock)
+
+
+class TestRateLimitConfig:
+    def test_defaults_are_valid(self):
+        assert RateLimitConfig().validate()
+
+    def test_invalid_values(self):
+        assert not RateLimitConfig(burst=0).validate()
+        assert not RateLimitConfig(requests_per_second=-1).validate()
+        assert not RateLimitConfig(decrease_factor=1.0).validate()
+
+    def test_from_dict_keeps_defaults_for_unset_keys(self):
+        defaults = RateLimitConfig(requests_per_second=0.2, jitter=2.0)
+
+        config = RateLimitConfig.from_dict(
+            {"requests_per_second": 1.5, "burst": None, "unknown": 1}, defaults
+        )
+
+        assert config.requests_per_second == 1.5
+        assert config.jitter == 2.0
+        assert config.burst == defaults.burst
+
+
+class TestRateLimiter:
+    def test_burst_is_not_delayed(self, clock):
+        limiter = make_limiter(clock)
+
+        assert limiter._reserve() == 0
+        assert limiter._reserve() == 0
+
+    def test_drained_bucket_spaces_requests(self, clock):
+        limiter = make_limiter(clock)
+        limiter._reserve()
+        limiter._reserve()
+
+        # Reservations queue up: 0.5s, then 1.0s at 2 req/s
+        assert limiter._reserve() == pytest.approx(0.5)
+        assert limiter._reserve() == pytest.approx(1.0)
+
+    def test_bucket_refills_over_time(self, clock):
+        limiter = make_limiter(clock)
+        limiter._reserve()
+        limiter._reserve()
+
+        clock.now += 1.0
+
+        assert limiter._reserve() == 0
+
+    def test_jitter_only_applies_to_paced_requests(self, clock):
+        limiter = make_limiter(clock, burst=1, jitter=3.0)
+
+        with patch("vortex.infrastructure.resilience.rate_limiter.random.uniform",
+                   return_value=1.25) as mock_uniform:
+            assert limiter._reserve() == 0
+            assert limiter._reserve() == pytest.approx(0.5 + 1.25)
+
+        mock_uniform.assert_called_once_with(0, 3.0)
+
+    def test_disabled_limiter_never_waits(self, clock):
+        limiter = make_limiter(clock, requests_per_second=0)
+
+        assert all(limiter._reserve() == 0 for _ in range(10))
+
+    def test_throttle_halves_rate_down_to_floor(self, clock):
+        limiter = make_limiter(clock, min_requests_per_second=0.75)
+
+        limiter.record_throttle()
+        assert limiter.current_rate == pytest.approx(1.0)
+        limiter.record_throttle()
+        assert limiter.current_rate == pytest.approx(0.75)
+
+    def test_success_recovers_rate_additively_up_to_ceiling(self, clock):
+        limiter = make_limiter(clock, additive_increase=0.25)
+        limiter.record_throttle()
+
+        limiter.record_success()
+        assert limiter.current_rate == pytest.approx(1.5)
+        limiter.record_success()
+        limiter.record_success()
+        assert limiter.current_rate == pytest.approx(2.0)
+
+    def test_retry_after_pauses_all_requests(self, clock):
+        limiter = make_limiter(clock)
+
+        limiter.record_throttle(retry_after=30)
+
+        assert limiter._reserve() == pytest.approx(30)
+        clock.now += 30
+        assert limiter._reserve() == 0
+
+    def test_retry_after_is_capped(self, clock):
+        limiter = make_limiter(clock, max_retry_after=60)
+
+        limiter.record_throttle(retry_after=3600)
+
+        assert limiter._reserve() == pytest.approx(60)
+
+    def test_record_outcome_ignores_non_throttling_errors(self, clock):
+        limiter = make_limiter(clock)
+
+        limiter.record_outcome(VortexConnectionError("test", "reset"))
+
+        assert limiter.current_rate == 2.0
+        assert limiter.stats["total_throttles"] == 0
+
+    def test_record_outcome_backs_off_on_rate_limit_error(self, clock):
+        limiter = make_limiter(clock)
+
+        limiter.record_outcome(RateLimitError("test", wait_time=10))
+
+        assert limiter.current_rate == pytest.approx(1.0)
+        assert limiter._reserve() == pytest.approx(10)
+
+    @patch("vortex.infrastructure.resilience.rate_limiter.time.sleep")
+    def test_acquire_sleeps_for_reserved_delay(self, mock_sleep, clock):
+        limiter = make_limiter(clock, burst=1)
+        limiter.acquire()
+        limiter.acquire()
+
+        mock_sleep.assert_called_once_with(pytest.approx(0.5))
+
+    def test_acquire_async(self, clock):
+        limiter = make_limiter(clock, burst=1, requests_per_second=100.0)
+        limiter._reserve()
+
+        assert asyncio.run(limiter.acquire_async()) == pytest.approx(0.01)
+
+    def test_concurrent_reservations_are_spaced(self, clock):
+        limiter = make_limiter(clock, burst=1, requests_per_second=10.0)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = limiter._reserve()
+            with lock:
+                delays.append(delay)
+
+        threads = [threading.Thread(target=reserve) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(delays) == pytest.approx([0, 0.1, 0.2, 0.3, 0.4])
+
+
+class TestThrottleHint:
+    def test_rate_limit_error(self):
+        assert throttle_hint(RateLimitError("test", wait_time=42)) == (True, 42)
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_throttling_http_status(self, status):
+        error = Exception("http")
+        error.response = Mock(status_code=status, headers={"Retry-After": "7"})
+
+        assert throttle_hint(error) == (True, 7.0)
+
+    def test_client_error_is_not_throttling(self):
+        error = Exception("http")
+        error.response = Mock(status_code=404, headers={})
+
+        assert throttle_hint(error) == (False, None)
+
+    def test_plain_exception(self):
+        assert throttle_hint(ValueError("bad")) == (False, None)
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date_in_the_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRateLimiterRegistry:
+    def test_same_name_shares_limiter(self):
+        registry = RateLimiterRegistry()
+
+        first = registry.get_limiter("provider_test", RateLimitConfig(requests_per_second=1))
+        second = registry.get_limiter("provider_test")
+
+        assert first is second
+        assert set(registry.get_stats()) == {"provider_test"}
@@ -255,10 +255,21 @@ class TestRetryManager:
         delay = retry_manager._calculate_delay(1)
         assert delay == 2.0
 
+    def test_calculate_delay_rate_limit_uses_wait_time(self, retry_manager):
+        """Test _calculate_delay honours the wait_time of a RateLimitError."""
+        rate_limit_error = RateLimitError("test", wait_time=30)
+        
+        retry_manager.policy.strategy = RetryStrategy.FIXED_DELAY
+        retry_manager.policy.base_delay = 2.0
+        
+        delay = retry_manager._calculate_delay(1, rate_limit_error)
+        
+        # wait_time scaled by rate_limit_backoff_multiplier
+        assert delay == 45.0
+
     def test_calculate_delay_rate_limit_fallback_to_strategy(self, retry_manager):
         """Test _calculate_delay falls back to strategy for RateLimitError without wait_time."""
-        # Create RateLimitError (doesn't expose wait_time attribute)
-        rate_limit_error = RateLimitError("test", wait_time=30)
+        rate_limit_error = RateLimitError("test")
         
         # Configure policy 
         retry_manager.policy.strategy = RetryStrategy.FIXED_DELAY
@@ -266,7 +277,6 @@ class TestRetryManager:
         
         delay = retry_manager._calculate_delay(1, rate_limit_error)
         
-        # Should fall back to strategy since wait_time isn't accessible
         assert delay == 2.0
 
     @patch('time.sleep')
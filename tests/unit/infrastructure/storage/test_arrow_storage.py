@@ -0,0 +1,98 @@
+"""
+Unit tests for ArrowStorage class.
+
+Tests Arrow IPC file round trips, memory-mapped range reads and the storage factory.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from vortex.infrastructure.storage.arrow_storage import ArrowStorage
+from vortex.infrastructure.storage.factory import create_storage
+from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+from vortex.models.stock import Stock
+from vortex.models.period import Period
+
+
+@pytest.fixture
+def sample_df():
+    dates = pd.date_range('2024-01-01', periods=10, freq='D', tz='UTC', name='Datetime')
+    return pd.DataFrame(
+        {'Open': [float(i) for i in range(10)], 'Close': [i + 0.5 for i in range(10)], 'Volume': range(10)},
+        index=dates,
+    )
+
+
+class TestArrowStorage:
+    """Test cases for ArrowStorage class."""
+
+    def test_file_extension(self, tmp_path):
+        """Test that series are stored as .arrow files."""
+        storage = ArrowStorage(str(tmp_path), dry_run=False)
+
+        path = storage._make_file_path_for_instrument(Stock(id='AAPL', symbol='AAPL'), Period.Daily)
+
+        assert path == f"{tmp_path}/stocks/1d/AAPL.arrow"
+
+    @pytest.mark.parametrize('compression', ['uncompressed', 'lz4'])
+    def test_roundtrip(self, tmp_path, sample_df, compression):
+        """Test that a persisted frame loads back unchanged."""
+        storage = ArrowStorage(str(tmp_path), dry_run=False, compression=compression)
+        file_path = str(tmp_path / 'series.arrow')
+
+        storage._persist(sample_df, file_path)
+
+        pd.testing.assert_frame_equal(storage._load(file_path), sample_df, check_freq=False)
+        with pa.memory_map(file_path) as source:
+            assert pa.ipc.open_file(source).schema.names[-1] == 'Datetime'
+
+    def test_persist_replaces_file_atomically(self, tmp_path, sample_df):
+        """Test that rewrites go through a temporary file and leave none behind."""
+        storage = ArrowStorage(str(tmp_path), dry_run=False)
+        file_path = str(tmp_path / 'series.arrow')
+        storage._persist(sample_df, file_path)
+        mapped = storage._load(file_path)
+
+        storage._persist(sample_df.iloc[:3], file_path)
+
+        assert len(storage._load(file_path)) == 3
+        assert len(mapped) == 10
+        assert list(tmp_path.iterdir()) == [tmp_path / 'series.arrow']
+
+    def test_load_range(self, tmp_path, sample_df):
+        """Test that a range read slices the mapped table by date and column."""
+        storage = ArrowStorage(str(tmp_path), dry_run=False)
+        file_path = str(tmp_path / 'series.arrow')
+        storage._persist(sample_df, file_path)
+
+        result = storage._load_range(file_path, datetime(2024, 1, 3), datetime(2024, 1, 5), ['Close'])
+
+        pd.testing.assert_frame_equal(
+            result, sample_df.loc['2024-01-03':'2024-01-05', ['Close']], check_freq=False
+        )
+
+    def test_invalid_compression(self, tmp_path):
+        """Test that unsupported compressions are rejected."""
+        with pytest.raises(ValueError, match="Unknown Arrow compression"):
+            ArrowStorage(str(tmp_path), dry_run=False, compression='gzip')
+
+
+class TestCreateStorage:
+    """Test cases for the storage factory."""
+
+    def test_creates_configured_format(self, tmp_path):
+        """Test that each format maps to its storage class with shared options."""
+        storage = create_storage('arrow', str(tmp_path), False, partitioning='year', arrow_compression='lz4')
+
+        assert isinstance(storage, ArrowStorage)
+        assert storage.partitioning == 'year'
+        assert storage.compression == 'lz4'
+        assert isinstance(create_storage('parquet', str(tmp_path), False), ParquetStorage)
+
+    def test_unknown_format(self, tmp_path):
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError, match="Unknown storage format"):
+            create_storage('xlsx', str(tmp_path), False)
@@ -0,0 +1,194 @@
+"""
+Unit tests for the storage catalog index.
+"""
+
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.catalog import (
+    CATALOG_FILE_NAME,
+    CatalogEntry,
+    StorageCatalog,
+    dataframe_checksum,
+    get_storage_catalog,
+)
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.infrastructure.storage.metadata import MetadataHandler
+from vortex.models.columns import DATETIME_INDEX_NAME
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+
+def make_series(days=(1, 2, 3)):
+    index = pd.DatetimeIndex(
+        [datetime(2024, 1, d, tzinfo=timezone.utc) for d in days], name=DATETIME_INDEX_NAME
+    )
+    df = pd.DataFrame({
+        'Open': [1.0] * len(days), 'High': [2.0] * len(days), 'Low': [0.5] * len(days),
+        'Close': [1.5] * len(days), 'Volume': [100] * len(days),
+    }, index=index)
+    metadata = Metadata.create_metadata(
+        df, 'yahoo', 'AAPL', Period.Daily,
+        datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 3, tzinfo=timezone.utc)
+    )
+    return PriceSeries(df, metadata)
+
+
+class TestStorageCatalog:
+    def test_put_and_get_round_trip(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+        series = make_series()
+        file_path = os.path.join(str(tmp_path), "stocks", "1d", "AAPL.csv")
+
+        catalog.put(file_path, CatalogEntry(series.metadata, 3, "abc"))
+        entry = catalog.get(file_path)
+
+        assert entry.metadata == series.metadata
+        assert entry.metadata.period == Period.Daily
+        assert entry.row_count == 3
+        assert entry.checksum == "abc"
+        assert list(catalog.entries())[0][0] == "stocks/1d/AAPL.csv"
+
+    def test_get_unknown_file(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+
+        assert catalog.get(os.path.join(str(tmp_path), "missing.csv")) is None
+
+    def test_remove(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+        file_path = os.path.join(str(tmp_path), "AAPL.csv")
+        catalog.put(file_path, CatalogEntry(make_series().metadata, 3))
+
+        catalog.remove(file_path)
+
+        assert catalog.get(file_path) is None
+
+    def test_partition_checksums_replaced_and_removed(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+        file_path = os.path.join(str(tmp_path), "SPY.csv")
+
+        catalog.put_partition_checksums(file_path, {"2023": "a", "2024": "b"})
+        catalog.put_partition_checksums(file_path, {"2024": "c"})
+        assert catalog.partition_checksums(file_path) == {"2024": "c"}
+
+        catalog.remove(file_path)
+        assert catalog.partition_checksums(file_path) == {}
+
+    def test_backup_pending_marks(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+        file_path = os.path.join(str(tmp_path), "AAPL.csv")
+
+        catalog.mark_backup_pending(file_path)
+        pending = catalog.backup_pending()
+
+        assert list(pending) == [file_path]
+        catalog.clear_backup_pending(file_path, pending[file_path])
+        assert catalog.backup_pending() == {}
+
+    def test_backup_pending_mark_renewed_since_sync_is_kept(self, tmp_path):
+        catalog = StorageCatalog(str(tmp_path))
+        file_path = os.path.join(str(tmp_path), "AAPL.csv")
+        catalog.mark_backup_pending(file_path)
+        marked_at = catalog.backup_pending()[file_path]
+
+        with patch('vortex.infrastructure.storage.catalog.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2100, 1, 1, tzinfo=timezone.utc)
+            catalog.mark_backup_pending(file_path)
+        catalog.clear_backup_pending(file_path, marked_at)
+
+        assert list(catalog.backup_pending()) == [file_path]
+
+    def test_shared_catalog_per_root(self, tmp_path):
+        assert get_storage_catalog(str(tmp_path)) is get_storage_catalog(str(tmp_path))
+        assert os.path.exists(os.path.join(str(tmp_path), CATALOG_FILE_NAME))
+
+    def test_checksum_tracks_content(self):
+        series = make_series()
+        changed = series.df.copy()
+        changed.iloc[0, 0] = 99.0
+
+        assert dataframe_checksum(series.df) == dataframe_checksum(series.df.copy())
+        assert dataframe_checksum(series.df) != dataframe_checksum(changed)
+
+
+class TestFileStorageCatalog:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return CsvStorage(str(tmp_path), dry_run=False)
+
+    def test_persist_indexes_series_without_sidecar(self, storage):
+        stock = Stock(id='AAPL', symbol='AAPL')
+        storage.persist(make_series(), stock, Period.Daily)
+
+        file_path = storage._make_file_path_for_instrument(stock, Period.Daily)
+        assert not os.path.exists(f"{file_path}.json")
+        entry = storage.get_catalog_entry(stock, Period.Daily)
+        assert entry.row_count == 3
+        assert entry.metadata.symbol == 'AAPL'
+
+    def test_catalog_entry_decides_without_reading_data(self, storage):
+        stock = Stock(id='AAPL', symbol='AAPL')
+        storage.persist(make_series(), stock, Period.Daily)
+
+        with patch.object(storage, '_load') as mock_load:
+            entry = storage.get_catalog_entry(stock, Period.Daily)
+
+        mock_load.assert_not_called()
+        assert entry.metadata.last_row_date.day == 3
+
+    def test_catalog_entry_for_missing_file(self, storage):
+        assert storage.get_catalog_entry(Stock(id='MSFT', symbol='MSFT'), Period.Daily) is None
+
+    def test_load_uses_catalog_metadata(self, storage):
+        stock = Stock(id='AAPL', symbol='AAPL')
+        series = make_series()
+        storage.persist(series, stock, Period.Daily)
+
+        loaded = storage.load(stock, Period.Daily)
+
+        assert loaded.metadata == series.metadata
+        assert len(loaded.df) == 3
+
+    def test_legacy_sidecar_is_imported(self, storage):
+        stock = Stock(id='AAPL', symbol='AAPL')
+        series = make_series()
+        file_path = storage._make_file_path_for_instrument(stock, Period.Daily)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        storage._persist(series.df, file_path)
+        MetadataHandler(file_path).set_metadata(series.metadata)
+
+        loaded = storage.load(stock, Period.Daily)
+
+        assert len(loaded.df) == 3
+        assert storage.get_catalog_entry(stock, Period.Daily).row_count == 3
+
+    def test_update_metadata_keeps_row_count_and_checksum(self, storage):
+        stock = Stock(id='AAPL', symbol='AAPL')
+        series = make_series()
+        storage.persist(series, stock, Period.Daily)
+        stored = storage.get_catalog_entry(stock, Period.Daily)
+        widened = Metadata.create_metadata(
+            series.df, 'yahoo', 'AAPL', Period.Daily,
+            datetime(2023, 12, 1, tzinfo=timezone.utc), datetime(2024, 1, 3, tzinfo=timezone.utc)
+        )
+
+        with patch.object(storage, '_persist') as mock_persist:
+            storage.update_metadata(widened, stock, Period.Daily)
+
+        mock_persist.assert_not_called()
+        entry = storage.get_catalog_entry(stock, Period.Daily)
+        assert entry.metadata.start_date == datetime(2023, 12, 1, tzinfo=timezone.utc)
+        assert (entry.row_count, entry.checksum) == (stored.row_count, stored.checksum)
+
+    def test_update_metadata_ignores_unknown_series(self, storage):
+        stock = Stock(id='MSFT', symbol='MSFT')
+
+        storage.update_metadata(make_series().metadata, stock, Period.Daily)
+
+        assert storage.get_catalog_entry(stock, Period.Daily) is None
@@ -0,0 +1,123 @@
+"""
+Unit tests for deferred backup storage.
+
+Tests that series are only marked while downloading and copied to the backup
+storage in one batch, and that failed copies stay pending.
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.infrastructure.storage.deferred_backup import (
+    DeferredBackupStorage,
+    sync_backup,
+)
+from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+from vortex.models.future import Future
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+STOCK = Stock(id='AAPL', symbol='AAPL')
+FUTURE = Future(id='GC', futures_code='GC', year=2024, month_code='M', tick_date=datetime(2024, 1, 15), days_count=90)
+
+
+def make_series(symbol, periods=30):
+    dates = pd.date_range('2024-01-01', periods=periods, freq='D', tz='UTC', name='Datetime')
+    df = pd.DataFrame({'Close': [float(i) for i in range(periods)], 'Volume': range(periods)}, index=dates)
+    metadata = Metadata.create_metadata(
+        df, 'test', symbol, Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+    )
+    return PriceSeries(df, metadata)
+
+
+@pytest.fixture
+def storages(tmp_path):
+    primary = CsvStorage(str(tmp_path), dry_run=False)
+    backup = ParquetStorage(str(tmp_path), dry_run=False)
+    return primary, backup, DeferredBackupStorage(primary, backup, workers=2)
+
+
+def store(primary, deferred, series, instrument):
+    primary.persist(series, instrument, Period.Daily)
+    deferred.persist(series, instrument, Period.Daily)
+
+
+class TestDeferredBackupStorage:
+    """Marking and batch copying of changed series."""
+
+    def test_persist_only_marks_series(self, storages, tmp_path):
+        """Test that nothing is written to the backup before the flush."""
+        primary, backup, deferred = storages
+
+        store(primary, deferred, make_series('AAPL'), STOCK)
+
+        assert not os.path.exists(tmp_path / 'stocks' / '1d' / 'AAPL.parquet')
+        assert list(primary.catalog.backup_pending()) == [str(tmp_path / 'stocks' / '1d' / 'AAPL.csv')]
+
+    def test_flush_copies_pending_series(self, storages):
+        """Test that the flush copies every marked series and clears the marks."""
+        primary, backup, deferred = storages
+        store(primary, deferred, make_series('AAPL'), STOCK)
+        store(primary, deferred, make_series('GC'), FUTURE)
+
+        deferred.flush()
+
+        pd.testing.assert_frame_equal(
+            backup.load(STOCK, Period.Daily).df, make_series('AAPL').df, check_freq=False
+        )
+        assert len(backup.load(FUTURE, Period.Daily).df) == 30
+        assert backup.get_catalog_entry(STOCK, Period.Daily).row_count == 30
+        assert primary.catalog.backup_pending() == {}
+
+    def test_reads_come_from_backup(self, storages):
+        """Test that the deferred storage reads the backup as of its last sync."""
+        primary, backup, deferred = storages
+        store(primary, deferred, make_series('AAPL'), STOCK)
+
+        assert deferred.get_catalog_entry(STOCK, Period.Daily) is None
+        deferred.flush()
+        assert deferred.get_catalog_entry(STOCK, Period.Daily).row_count == 30
+
+    def test_failed_copy_stays_pending(self, storages):
+        """Test that a series that could not be copied is left for the next sync."""
+        primary, backup, deferred = storages
+        store(primary, deferred, make_series('AAPL'), STOCK)
+
+        with patch.object(backup, '_write_series', side_effect=OSError('disk full')):
+            result = sync_backup(primary, backup)
+
+        assert result.synced == []
+        assert list(result.failed.values()) == ['disk full']
+        assert len(primary.catalog.backup_pending()) == 1
+
+
+class TestSyncBackup:
+    """Copying chosen series."""
+
+    def test_given_series_are_copied_without_marks(self, tmp_path):
+        """Test that explicitly listed series are copied even when not marked."""
+        primary = CsvStorage(str(tmp_path), dry_run=False)
+        backup = ParquetStorage(str(tmp_path), dry_run=False)
+        primary.persist(make_series('AAPL'), STOCK, Period.Daily)
+        file_path = str(tmp_path / 'stocks' / '1d' / 'AAPL.csv')
+
+        result = sync_backup(primary, backup, file_paths=[file_path])
+
+        assert result.synced == [file_path]
+        assert len(backup.load(STOCK, Period.Daily).df) == 30
+
+    def test_nothing_pending(self, tmp_path):
+        """Test that an empty sync does nothing."""
+        primary = CsvStorage(str(tmp_path), dry_run=False)
+        backup = ParquetStorage(str(tmp_path), dry_run=False)
+
+        result = sync_backup(primary, backup)
+
+        assert (result.synced, result.failed) == ([], {})
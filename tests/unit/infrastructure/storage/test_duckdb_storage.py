@@ -0,0 +1,151 @@
+"""
+Unit tests for DuckDBStorage class.
+
+Tests series round trips, in-database merges and range reads. Skipped when the
+optional duckdb package is not installed.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from vortex.infrastructure.storage.duckdb_storage import DuckDBStorage, series_symbol
+from vortex.infrastructure.storage.factory import create_storage
+from vortex.models.future import Future
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+
+def make_series(start, periods, base=0.0, tz='America/New_York'):
+    dates = pd.date_range(start, periods=periods, freq='D', tz=tz, name='Datetime')
+    df = pd.DataFrame(
+        {
+            'Open': [base + i for i in range(periods)],
+            'Close': [base + i + 0.5 for i in range(periods)],
+            'Volume': list(range(periods)),
+        },
+        index=dates,
+    )
+    metadata = Metadata.create_metadata(
+        df, 'yahoo', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+    )
+    return PriceSeries(df, metadata)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = DuckDBStorage(str(tmp_path), dry_run=False)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def stock():
+    return Stock(id='AAPL', symbol='AAPL')
+
+
+class TestDuckDBStorage:
+    """Test cases for DuckDBStorage class."""
+
+    def test_roundtrip(self, storage, stock):
+        """Test that a persisted series loads back with its timezone and metadata."""
+        series = make_series('2024-01-01', 10)
+
+        storage.persist(series, stock, Period.Daily)
+        loaded = storage.load(stock, Period.Daily)
+
+        pd.testing.assert_frame_equal(loaded.df, series.df, check_freq=False)
+        assert loaded.metadata.last_row_date == series.metadata.last_row_date
+        assert storage.get_catalog_entry(stock, Period.Daily).row_count == 10
+
+    def test_persist_replaces_series(self, storage, stock):
+        """Test that persist stores exactly the given series."""
+        storage.persist(make_series('2024-01-01', 10), stock, Period.Daily)
+
+        storage.persist(make_series('2024-01-01', 3), stock, Period.Daily)
+
+        assert len(storage.load(stock, Period.Daily).df) == 3
+
+    def test_merge_upserts_like_price_series_merge(self, storage, stock):
+        """Test that an in-database merge stores what an in-memory merge produces."""
+        existing = make_series('2024-01-01', 10)
+        new = make_series('2024-01-08', 10, base=100.0)
+        storage.persist(existing, stock, Period.Daily)
+
+        metadata = storage.merge(new, stock, Period.Daily)
+
+        expected = new.merge(existing)
+        pd.testing.assert_frame_equal(
+            storage.load(stock, Period.Daily).df, expected.df, check_freq=False
+        )
+        assert metadata.start_date == expected.metadata.start_date
+        assert metadata.first_row_date == expected.metadata.first_row_date
+        assert metadata.last_row_date == expected.metadata.last_row_date
+        assert storage.get_catalog_entry(stock, Period.Daily).row_count == 17
+
+    def test_merge_into_missing_series(self, storage, stock):
+        """Test that merging into an unknown series stores the download."""
+        series = make_series('2024-01-01', 5)
+
+        storage.merge(series, stock, Period.Daily)
+
+        pd.testing.assert_frame_equal(
+            storage.load(stock, Period.Daily).df, series.df, check_freq=False
+        )
+
+    def test_load_range(self, storage, stock):
+        """Test that start, end and columns are applied in the query."""
+        series = make_series('2024-01-01', 10, tz='UTC')
+        storage.persist(series, stock, Period.Daily)
+
+        loaded = storage.load(
+            stock, Period.Daily, start=datetime(2024, 1, 3), end=datetime(2024, 1, 5), columns=['Close']
+        )
+
+        pd.testing.assert_frame_equal(
+            loaded.df, series.df.loc['2024-01-03':'2024-01-05', ['Close']], check_freq=False
+        )
+        assert loaded.metadata.last_row_date == series.metadata.last_row_date
+
+    def test_missing_series(self, storage, stock):
+        """Test that unknown series behave like missing files."""
+        with pytest.raises(FileNotFoundError):
+            storage.load(stock, Period.Daily)
+        assert storage.get_catalog_entry(stock, Period.Daily) is None
+
+    def test_query_across_symbols(self, storage, stock):
+        """Test that series of several symbols share one table."""
+        storage.persist(make_series('2024-01-01', 4), stock, Period.Daily)
+        storage.persist(make_series('2024-01-01', 6), Stock(id='MSFT', symbol='MSFT'), Period.Daily)
+
+        counts = storage.query(
+            'SELECT symbol, count(*) AS n FROM bars GROUP BY symbol ORDER BY symbol'
+        )
+
+        assert counts.to_dict('list') == {'symbol': ['AAPL', 'MSFT'], 'n': [4, 6]}
+
+    def test_series_symbol_of_future(self):
+        """Test that futures contracts get distinct keys."""
+        future = Future(
+            id='GC',
+            futures_code='GC',
+            year=2024,
+            month_code='M',
+            tick_date=datetime(2008, 5, 4),
+            days_count=360
+        )
+
+        assert series_symbol(future) == 'GC_20240600'
+
+    def test_created_by_factory(self, tmp_path):
+        """Test that the factory creates the storage for the duckdb format."""
+        storage = create_storage('duckdb', str(tmp_path), False, partitioning='year')
+
+        assert isinstance(storage, DuckDBStorage)
+        assert storage.merges_in_place
+        storage.close()
@@ -89,7 +89,11 @@ class TestFileStorage:
             'price': [100, 101, 102],
             'volume': [1000, 1100, 1200]
         })
-        metadata = Mock(spec=Metadata)
+        metadata = Metadata(
+            'AAPL', Period.Daily,
+            datetime(2024, 1, 1), datetime(2024, 1, 3),
+            datetime(2024, 1, 1), datetime(2024, 1, 3),
+        )
         return PriceSeries(df, metadata)
 
     def test_init_basic(self, temp_dir):
@@ -140,8 +144,7 @@ class TestFileStorage:
         assert result == expected_path
 
     @patch('vortex.infrastructure.storage.file_storage.create_full_path')
-    @patch.object(FileStorage, 'persist_metadata')
-    def test_persist_success(self, mock_persist_metadata, mock_create_path, 
+    def test_persist_success(self, mock_create_path,
                            file_storage, sample_price_series, mock_stock, mock_period):
         """Test successful data persistence."""
         with patch.object(file_storage, '_persist') as mock_persist:
@@ -155,12 +158,14 @@ class TestFileStorage:
             # Verify _persist was called with DataFrame and path
             mock_persist.assert_called_once_with(sample_price_series.df, expected_path)
             
-            # Verify metadata persistence
-            mock_persist_metadata.assert_called_once_with(expected_path, sample_price_series.metadata)
+            # Verify the series was indexed in the storage catalog
+            entry = file_storage.catalog.get(expected_path)
+            assert entry.metadata == sample_price_series.metadata
+            assert entry.row_count == 3
+            assert entry.checksum
 
     @patch('vortex.infrastructure.storage.file_storage.create_full_path')
-    @patch.object(FileStorage, 'persist_metadata')
-    def test_persist_with_logging_context(self, mock_persist_metadata, mock_create_path,
+    def test_persist_with_logging_context(self, mock_create_path,
                                         file_storage, sample_price_series, mock_future, mock_period):
         """Test that persist uses LoggingContext correctly."""
         with patch.object(file_storage, '_persist') as mock_persist, \
@@ -302,20 +307,3 @@ class TestFileStorage:
         
         # Verify result
         assert result is mock_metadata
-
-    @patch('vortex.infrastructure.storage.file_storage.MetadataHandler')
-    def test_persist_metadata_static_method(self, mock_metadata_handler_class):
-        """Test static persist_metadata method."""
-        # Setup mock
-        mock_handler = Mock()
-        mock_metadata_handler_class.return_value = mock_handler
-        mock_metadata = Mock(spec=Metadata)
-        
-        file_path = "/test/path/file.csv"
-        FileStorage.persist_metadata(file_path, mock_metadata)
-        
-        # Verify MetadataHandler was created with correct path
-        mock_metadata_handler_class.assert_called_once_with(file_path)
-        
-        # Verify set_metadata was called
-        mock_handler.set_metadata.assert_called_once_with(mock_metadata)
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""
+Unit tests for storage migration.
+
+Tests series discovery, conversion between formats and layouts, verification
+and the handling of source files and catalog entries.
+"""
+
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.arrow_storage import ArrowStorage
+from vortex.infrastructure.storage.catalog import get_storage_catalog
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.infrastructure.storage.migration import find_series, migrate_store
+from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+from vortex.models.future import Future
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+STOCK = Stock(id='AAPL', symbol='AAPL')
+FUTURE = Future(id='GC', futures_code='GC', year=2024, month_code='M', tick_date=datetime(2024, 1, 15), days_count=90)
+
+
+def make_series(symbol, periods=400):
+    dates = pd.date_range('2023-11-01', periods=periods, freq='D', tz='UTC', name='Datetime')
+    # Random prices need all 17 digits to round trip through CSV
+    df = pd.DataFrame({'Close': np.random.default_rng(0).random(periods) * 100, 'Volume': range(periods)}, index=dates)
+    metadata = Metadata.create_metadata(
+        df, 'test', symbol, Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+    )
+    return PriceSeries(df, metadata)
+
+
+@pytest.fixture
+def csv_tree(tmp_path):
+    storage = CsvStorage(str(tmp_path), dry_run=False)
+    storage.persist(make_series('AAPL'), STOCK, Period.Daily)
+    storage.persist(make_series('GC'), FUTURE, Period.Daily)
+    return tmp_path
+
+
+class TestFindSeries:
+    """Discovery of stored series."""
+
+    def test_finds_single_file_and_partitioned_series(self, tmp_path):
+        """Test that partitioned series are reported once, by their single-file path."""
+        CsvStorage(str(tmp_path), dry_run=False).persist(make_series('AAPL'), STOCK, Period.Daily)
+        CsvStorage(str(tmp_path), dry_run=False, partitioning='year').persist(make_series('GC'), FUTURE, Period.Daily)
+
+        series = find_series(str(tmp_path), 'csv')
+
+        assert [os.path.relpath(path, tmp_path) for path in series] == [
+            'futures/1d/GC/GC_20240600.csv',
+            'stocks/1d/AAPL.csv',
+        ]
+
+    def test_ignores_other_formats_and_staging_copies(self, csv_tree):
+        """Test that only files of the requested format are found."""
+        (csv_tree / 'stocks' / '1d' / 'MSFT.csv.migrating').write_text('')
+        os.makedirs(csv_tree / 'stocks' / '1d' / 'SPY.migrating')
+        (csv_tree / 'stocks' / '1d' / 'SPY.migrating' / '2024.csv').write_text('')
+
+        assert len(find_series(str(csv_tree), 'csv')) == 2
+        assert find_series(str(csv_tree), 'parquet') == []
+
+
+class TestMigrateStore:
+    """Conversion of a storage tree."""
+
+    def test_csv_to_parquet(self, csv_tree):
+        """Test that every series is converted, catalogued and its source removed."""
+        catalog = get_storage_catalog(str(csv_tree))
+        source_entry = catalog.get(str(csv_tree / 'stocks' / '1d' / 'AAPL.csv'))
+
+        results = migrate_store(str(csv_tree), 'csv', 'parquet')
+
+        assert [result.error for result in results] == [None, None]
+        assert find_series(str(csv_tree), 'csv') == []
+        loaded = ParquetStorage(str(csv_tree), dry_run=False).load(STOCK, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, make_series('AAPL').df, check_freq=False)
+        assert catalog.get(str(csv_tree / 'stocks' / '1d' / 'AAPL.csv')) is None
+        entry = catalog.get(str(csv_tree / 'stocks' / '1d' / 'AAPL.parquet'))
+        assert entry.row_count == 400
+        assert entry.metadata == source_entry.metadata
+
+    def test_migrated_csv_matches_checksum_of_normal_loads(self, tmp_path):
+        """Test that a converted CSV series is appended to by later runs."""
+        ParquetStorage(str(tmp_path), dry_run=False).persist(make_series('AAPL'), STOCK, Period.Daily)
+        migrate_store(str(tmp_path), 'parquet', 'csv')
+        storage = CsvStorage(str(tmp_path), dry_run=False)
+        stored = storage.load(STOCK, Period.Daily).df
+        grown = make_series('AAPL', periods=401)
+        updated = PriceSeries(pd.concat([stored, grown.df.iloc[-1:]]), grown.metadata)
+
+        with patch.object(storage, '_persist') as mock_persist:
+            storage.persist(updated, STOCK, Period.Daily)
+
+        mock_persist.assert_not_called()
+
+    def test_keep_source(self, csv_tree):
+        """Test that the source files stay when asked to."""
+        migrate_store(str(csv_tree), 'csv', 'arrow', keep_source=True)
+
+        assert len(find_series(str(csv_tree), 'csv')) == 2
+        assert len(find_series(str(csv_tree), 'arrow')) == 2
+
+    def test_same_format_repartitions(self, csv_tree):
+        """Test that migrating to the same format rewrites the layout."""
+        migrate_store(str(csv_tree), 'csv', 'csv', partitioning='year')
+
+        assert not os.path.exists(csv_tree / 'stocks' / '1d' / 'AAPL.csv')
+        assert sorted(os.listdir(csv_tree / 'stocks' / '1d' / 'AAPL')) == ['2023.csv', '2024.csv']
+        storage = CsvStorage(str(csv_tree), dry_run=False, partitioning='year')
+        pd.testing.assert_frame_equal(
+            storage.load(STOCK, Period.Daily).df, make_series('AAPL').df, check_freq=False
+        )
+
+    def test_partitions_of_both_formats_share_directory(self, tmp_path):
+        """Test that partitions of another format sharing the directory are replaced."""
+        CsvStorage(str(tmp_path), dry_run=False, partitioning='year').persist(make_series('AAPL'), STOCK, Period.Daily)
+
+        migrate_store(str(tmp_path), 'csv', 'arrow', partitioning='year')
+
+        assert sorted(os.listdir(tmp_path / 'stocks' / '1d' / 'AAPL')) == ['2023.arrow', '2024.arrow']
+        storage = ArrowStorage(str(tmp_path), dry_run=False, partitioning='year')
+        assert len(storage.load(STOCK, Period.Daily).df) == 400
+
+    def test_mismatching_copy_leaves_series_unchanged(self, csv_tree):
+        """Test that a copy failing verification is discarded and the source kept."""
+        with patch('vortex.infrastructure.storage.migration.dataframe_checksum', side_effect=['a', 'b'] * 2):
+            results = migrate_store(str(csv_tree), 'csv', 'parquet')
+
+        assert all('differs from the source' in result.error for result in results)
+        assert len(find_series(str(csv_tree), 'csv')) == 2
+        assert find_series(str(csv_tree), 'parquet') == []
+        assert not any(name.endswith('.migrating') for name in os.listdir(csv_tree / 'stocks' / '1d'))
+
+    def test_parallel_workers(self, csv_tree):
+        """Test that series converted in worker processes are catalogued here."""
+        results = migrate_store(str(csv_tree), 'csv', 'parquet', workers=2)
+
+        assert sorted(result.row_count for result in results if result.succeeded) == [400, 400]
+        assert len(find_series(str(csv_tree), 'parquet')) == 2
+
+    def test_rejects_database_formats(self, tmp_path):
+        """Test that only file formats can be migrated."""
+        with pytest.raises(ValueError, match="Cannot migrate 'duckdb'"):
+            migrate_store(str(tmp_path), 'csv', 'duckdb')
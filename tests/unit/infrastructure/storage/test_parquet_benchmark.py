@@ -0,0 +1,65 @@
+"""
+Unit tests for the Parquet encoding benchmark.
+"""
+
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.parquet_benchmark import (
+    benchmark_encoding,
+    candidate_encodings,
+    read_series_file,
+)
+from vortex.infrastructure.storage.parquet_storage import ParquetEncoding
+
+
+@pytest.fixture
+def sample_df():
+    dates = pd.date_range('2024-01-01', periods=100, freq='D', tz='UTC', name='Datetime')
+    return pd.DataFrame({'Close': [float(i) for i in range(100)], 'Volume': range(100)}, index=dates)
+
+
+class TestCandidateEncodings:
+    """Test cases for candidate_encodings."""
+
+    def test_combines_given_settings_over_base(self):
+        """Test that every combination is built and unset settings keep the base."""
+        base = ParquetEncoding(row_group_rows=1000)
+
+        encodings = candidate_encodings(base, codecs=['zstd', 'snappy'], levels=[1, 9], row_group_spans=[None, 'month'])
+
+        assert len(encodings) == 6
+        assert {e.row_group_rows for e in encodings} == {1000}
+        # Levels only apply to codecs that have them
+        assert {e.compression_level for e in encodings if e.codec == 'snappy'} == {None}
+        assert {e.compression_level for e in encodings if e.codec == 'zstd'} == {1, 9}
+
+    def test_defaults_to_base(self):
+        """Test that without settings only the base encoding is tried."""
+        base = ParquetEncoding(codec='lz4')
+
+        assert candidate_encodings(base) == [base]
+
+
+class TestBenchmarkEncoding:
+    """Test cases for benchmark_encoding."""
+
+    def test_measures_encoding(self, tmp_path, sample_df):
+        """Test that size, row groups and timings are reported and the file is removed."""
+        encoding = ParquetEncoding(codec='zstd', row_group_span='month')
+
+        result = benchmark_encoding(sample_df, encoding, str(tmp_path), repeat=1)
+
+        assert result.encoding == encoding
+        assert result.file_bytes > 0
+        assert result.row_groups == 4
+        assert result.write_throughput > 0 and result.read_throughput > 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_read_series_file(self, tmp_path, sample_df):
+        """Test that stored series files are read by extension."""
+        sample_df.to_parquet(tmp_path / 'series.parquet')
+
+        pd.testing.assert_frame_equal(read_series_file(str(tmp_path / 'series.parquet')), sample_df, check_freq=False)
+        with pytest.raises(ValueError):
+            read_series_file(str(tmp_path / 'series.txt'))
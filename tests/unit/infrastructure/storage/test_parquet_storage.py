@@ -5,11 +5,18 @@ Tests parquet file operations, path generation, and data handling.
 """
 
 import tempfile
+from datetime import datetime
 from unittest.mock import Mock, patch
 import pandas as pd
 import pytest
 
-from vortex.infrastructure.storage.parquet_storage import ParquetStorage
+import pyarrow.parquet as pq
+
+from vortex.infrastructure.storage.parquet_storage import (
+    ROW_GROUP_SIZE,
+    ParquetEncoding,
+    ParquetStorage,
+)
 from vortex.models.future import Future
 from vortex.models.period import Period
 
@@ -85,18 +92,65 @@ class TestParquetStorage:
         # Verify result
         assert result is mock_df
 
-    def test_persist(self, parquet_storage):
-        """Test persisting data to parquet file."""
-        # Create mock DataFrame with sort_index and to_parquet methods
-        mock_df = Mock()
-        mock_sorted_df = Mock()
-        mock_df.sort_index.return_value = mock_sorted_df
-        
-        file_path = "/test/path/file.parquet"
-        parquet_storage._persist(mock_df, file_path)
-        
-        # Verify sort_index was called
-        mock_df.sort_index.assert_called_once()
-        
-        # Verify to_parquet was called on sorted DataFrame
-        mock_sorted_df.to_parquet.assert_called_once_with(file_path, index=True)
\ No newline at end of file
+    def test_persist(self, parquet_storage, temp_dir):
+        """Test persisting data to parquet file with the default encoding."""
+        dates = pd.date_range('2024-01-01', periods=10, freq='D', tz='UTC', name='Datetime')
+        df = pd.DataFrame({'Open': range(10), 'Close': range(10, 20)}, index=dates)
+        file_path = f"{temp_dir}/file.parquet"
+
+        parquet_storage._persist(df.iloc[::-1], file_path)
+
+        metadata = pq.ParquetFile(file_path).metadata
+        assert metadata.row_group(0).column(0).compression == 'SNAPPY'
+        assert metadata.row_group(0).sorting_columns[0].column_index == 2
+        assert parquet_storage.encoding.row_group_rows == ROW_GROUP_SIZE
+        pd.testing.assert_frame_equal(parquet_storage._load(file_path), df, check_freq=False)
+
+    def test_persist_with_encoding(self, temp_dir):
+        """Test that codec, row group size and span follow the configured encoding."""
+        storage = ParquetStorage(
+            base_path=temp_dir,
+            dry_run=False,
+            encoding=ParquetEncoding(
+                codec='zstd', compression_level=5, row_group_rows=20, row_group_span='month', statistics=False
+            ),
+        )
+        dates = pd.date_range('2024-01-01', periods=60, freq='D', tz='UTC', name='Datetime')
+        df = pd.DataFrame({'Close': [float(i) for i in range(60)]}, index=dates)
+        file_path = f"{temp_dir}/file.parquet"
+
+        storage._persist(df, file_path)
+
+        metadata = pq.ParquetFile(file_path).metadata
+        # Each month starts a new group and is split at 20 rows
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [20, 11, 20, 9]
+        assert metadata.row_group(0).column(0).compression == 'ZSTD'
+        assert metadata.row_group(0).column(0).statistics is None
+        assert metadata.row_group(0).column(1).statistics is not None
+        pd.testing.assert_frame_equal(storage._load(file_path), df, check_freq=False)
+
+    @pytest.mark.parametrize('settings', [
+        {'codec': 'brotli'},
+        {'codec': 'snappy', 'compression_level': 3},
+        {'row_group_rows': 0},
+        {'row_group_span': 'hour'},
+    ])
+    def test_invalid_encoding(self, settings):
+        """Test that unsupported encodings are rejected."""
+        with pytest.raises(ValueError):
+            ParquetEncoding(**settings)
+
+    def test_load_range_reads_only_requested_rows_and_columns(self, parquet_storage, temp_dir):
+        """Test that a date range and column subset are pushed down to the reader."""
+        dates = pd.date_range('2024-01-01', periods=10, freq='D', tz='UTC', name='Datetime')
+        df = pd.DataFrame({'Open': range(10), 'Close': range(10, 20)}, index=dates)
+        file_path = f"{temp_dir}/file.parquet"
+        parquet_storage._persist(df, file_path)
+
+        with patch('pandas.read_parquet', wraps=pd.read_parquet) as mock_read_parquet:
+            result = parquet_storage._load_range(
+                file_path, datetime(2024, 1, 3), datetime(2024, 1, 5), ['Close']
+            )
+
+        assert mock_read_parquet.call_args.kwargs['columns'] == ['Close']
+        pd.testing.assert_frame_equal(result, df.loc['2024-01-03':'2024-01-05', ['Close']], check_freq=False)
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Unit tests for the rolling raw-data archive.
+
+Tests appending, reading back by offset, the index, segment rotation and
+archive mode of RawDataStorage.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from vortex.infrastructure.storage.raw_archive import RawArchive
+from vortex.infrastructure.storage.raw_storage import RawDataStorage
+from vortex.models.future import Future
+from vortex.models.stock import Stock
+
+NOW = datetime(2024, 8, 16, 12, 0, tzinfo=timezone.utc)
+RESPONSE = "Date,Open,High,Low,Close,Volume\n2024-08-16,150.0,152.0,149.0,151.0,1000000\n"
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = RawArchive(tmp_path)
+    yield archive
+    archive.close()
+
+
+def segments(tmp_path):
+    return sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob('*.zst'))
+
+
+class TestRawArchive:
+    """Appending to and reading from archive segments."""
+
+    def test_responses_read_back_by_offset(self, archive):
+        """Test that every response reads back exactly as appended."""
+        archive.append(RESPONSE, NOW, 'yahoo', 'AAPL', 'stock', 'c1', {'interval': '1d'})
+        archive.append('other', NOW + timedelta(seconds=1), 'yahoo', 'MSFT', 'stock', 'c2')
+        archive.flush()
+
+        records = list(archive.records())
+
+        assert [record.symbol for record in records] == ['AAPL', 'MSFT']
+        assert [archive.read(record) for record in records] == [RESPONSE, 'other']
+        assert records[0].metadata == {'interval': '1d'}
+        assert records[1].offset == records[0].length
+
+    def test_segment_is_a_zstd_stream(self, archive, tmp_path):
+        """Test that a whole segment decompresses to the responses in order."""
+        archive.append('first,', NOW, 'yahoo', 'AAPL', 'stock')
+        archive.append('second', NOW, 'yahoo', 'AAPL', 'stock')
+        archive.flush()
+        segment = next(tmp_path.rglob('*.zst'))
+
+        with pa.CompressedInputStream(str(segment), 'zstd') as stream:
+            assert stream.read() == b'first,second'
+
+    def test_records_filters(self, archive):
+        """Test filtering by symbol, type, correlation ID and time."""
+        archive.append('a', NOW, 'yahoo', 'AAPL', 'stock', 'c1')
+        archive.append('b', NOW + timedelta(hours=1), 'yahoo', 'AAPL', 'stock', 'c2')
+        archive.append('c', NOW, 'barchart', 'GC', 'future', 'c3')
+        archive.flush()
+
+        def symbols(**filters):
+            return [archive.read(record) for record in archive.records(**filters)]
+
+        assert symbols(symbol='AAPL') == ['a', 'b']
+        assert symbols(instrument_type='future') == ['c']
+        assert symbols(correlation_id='c2') == ['b']
+        assert symbols(symbol='AAPL', start_date=NOW + timedelta(minutes=30)) == ['b']
+        assert symbols(symbol='AAPL', end_date=NOW) == ['a']
+
+    def test_rotation_by_size(self, tmp_path):
+        """Test that a full segment is closed and a new one started."""
+        archive = RawArchive(tmp_path, segment_mb=1)
+        archive.segment_bytes = 10
+        archive.append(RESPONSE, NOW, 'yahoo', 'AAPL', 'stock')
+        archive.append(RESPONSE, NOW + timedelta(milliseconds=1), 'yahoo', 'AAPL', 'stock')
+        archive.close()
+
+        assert segments(tmp_path) == [
+            '2024/08/archive/20240816_120000_000.zst',
+            '2024/08/archive/20240816_120000_001.zst',
+        ]
+        assert len(list(archive.records())) == 2
+
+    def test_rotation_by_age_and_month(self, tmp_path):
+        """Test that segments are closed after their time limit and at month ends."""
+        archive = RawArchive(tmp_path, segment_hours=1)
+        archive.append('a', NOW, 'yahoo', 'AAPL', 'stock')
+        archive.append('b', NOW + timedelta(minutes=59), 'yahoo', 'AAPL', 'stock')
+        archive.append('c', NOW + timedelta(hours=1), 'yahoo', 'AAPL', 'stock')
+        archive.append('d', datetime(2024, 9, 1, 0, 0, tzinfo=timezone.utc), 'yahoo', 'AAPL', 'stock')
+        archive.close()
+
+        assert segments(tmp_path) == [
+            '2024/08/archive/20240816_120000_000.zst',
+            '2024/08/archive/20240816_130000_000.zst',
+            '2024/09/archive/20240901_000000_000.zst',
+        ]
+
+    def test_failed_write_is_logged_not_raised(self, archive):
+        """Test that a failing write neither raises nor blocks later responses."""
+        with patch.object(archive, '_write', side_effect=[OSError('disk full'), None]) as mock_write, \
+                patch('vortex.infrastructure.storage.raw_archive.logger') as mock_logger:
+            archive.append('a', NOW, 'yahoo', 'AAPL', 'stock')
+            archive.append('b', NOW, 'yahoo', 'AAPL', 'stock')
+            archive.flush()
+
+        assert mock_write.call_count == 2
+        mock_logger.error.assert_called_once()
+
+
+class TestRawDataStorageArchiveMode:
+    """RawDataStorage writing to the archive."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        storage = RawDataStorage(str(tmp_path), archive=True)
+        yield storage
+        storage.close()
+
+    def test_save_appends_to_archive(self, storage, tmp_path):
+        """Test that responses go to segments instead of one file each."""
+        stock = Stock(id='AAPL', symbol='AAPL')
+
+        result = storage.save_raw_response('yahoo', stock, RESPONSE, {'interval': '1d'}, 'corr-1')
+        storage.save_raw_response('yahoo', stock, RESPONSE, correlation_id='corr-2')
+        storage.flush()
+
+        assert result is not None
+        assert list(tmp_path.rglob('*.csv.gz')) == []
+        assert len(segments(tmp_path)) == 1
+        records = storage.get_archived_responses('yahoo', stock)
+        assert [record.correlation_id for record in records] == ['corr-1', 'corr-2']
+        assert records[0].metadata['request_info'] == {'interval': '1d'}
+        assert storage.archive.read(records[0]) == RESPONSE
+
+    def test_lookup_by_instrument(self, storage):
+        """Test that archived responses are found per instrument."""
+        future = Future(id='GC_Z24', futures_code='GC', year=2024, month_code='Z',
+                        tick_date=datetime(2024, 8, 1), days_count=90)
+        storage.save_raw_response('barchart', future, RESPONSE)
+        storage.save_raw_response('yahoo', Stock(id='AAPL', symbol='AAPL'), RESPONSE)
+
+        records = storage.get_archived_responses('barchart', future)
+
+        assert [(record.instrument_type, record.provider) for record in records] == [('future', 'barchart')]
+
+    def test_without_metadata(self, tmp_path):
+        """Test that request metadata is left out when disabled."""
+        storage = RawDataStorage(str(tmp_path), archive=True, include_metadata=False)
+        stock = Stock(id='AAPL', symbol='AAPL')
+        storage.save_raw_response('yahoo', stock, RESPONSE)
+
+        assert storage.get_archived_responses('yahoo', stock)[0].metadata is None
+        storage.close()
+
+    def test_file_mode_has_no_archive(self, tmp_path):
+        """Test that the per-file layout stays the default."""
+        storage = RawDataStorage(str(tmp_path))
+
+        assert storage.archive is None
+        assert storage.get_archived_responses('yahoo', Stock(id='AAPL', symbol='AAPL')) == []
@@ -0,0 +1,166 @@
+"""
+Unit tests for the raw data index.
+
+Tests indexing of per-file and archived responses, lookups, rebuilding the
+index of an existing tree and index-driven retention.
+"""
+
+import gzip
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from vortex.infrastructure.storage.raw_archive import ArchiveRecord
+from vortex.infrastructure.storage.raw_index import INDEX_FILE_NAME, RawIndex
+from vortex.infrastructure.storage.raw_storage import RawDataStorage
+from vortex.models.stock import Stock
+
+STOCK = Stock(id='AAPL', symbol='AAPL')
+RESPONSE = "Date,Close\n2024-08-16,151.0\n"
+NOW = datetime(2024, 8, 20, 12, 0, tzinfo=timezone.utc)
+
+
+def write_raw_file(raw_dir, relative_path):
+    path = raw_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, 'wt') as f:
+        f.write(RESPONSE)
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = RawIndex(tmp_path)
+    yield index
+    index.close()
+
+
+class TestRawIndex:
+    """Indexing and lookups."""
+
+    def test_file_is_indexed_from_its_name(self, index, tmp_path):
+        """Test that symbol, type and time are read from the file's path."""
+        path = write_raw_file(tmp_path, '2024/08/stock/AAPL_20240816_143045_123.csv.gz')
+
+        index.add_file(path, 'yahoo', 'c1')
+
+        [entry] = index.find(symbol='AAPL')
+        assert (entry.path, entry.instrument_type, entry.provider, entry.correlation_id) == (path, 'stock', 'yahoo', 'c1')
+        assert entry.created_at == datetime(2024, 8, 16, 14, 30, 45, 123000, tzinfo=timezone.utc)
+        assert not entry.archived
+
+    def test_archive_record_round_trip(self, index, tmp_path):
+        """Test that archived responses come back as the records written."""
+        record = ArchiveRecord(tmp_path / '2024/08/archive/s.zst', 10, 20, 30, NOW, 'yahoo', 'AAPL', 'stock',
+                               'c1', {'interval': '1d'})
+
+        index.add_archive_record(record)
+
+        assert index.find(correlation_id='c1')[0].to_archive_record() == record
+
+    def test_find_filters(self, index, tmp_path):
+        """Test filtering by instrument, time and storage kind."""
+        for name in ('AAPL_20240801_000000_000', 'AAPL_20240810_000000_000', 'MSFT_20240805_000000_000'):
+            index.add_file(write_raw_file(tmp_path, f'2024/08/stock/{name}.csv.gz'))
+        index.add_archive_record(ArchiveRecord(tmp_path / '2024/08/archive/s.zst', 0, 1, 1, NOW, 'yahoo',
+                                               'AAPL', 'stock'))
+
+        def names(**filters):
+            return [entry.path.name for entry in index.find(**filters)]
+
+        assert names(symbol='AAPL', archived=False) == ['AAPL_20240801_000000_000.csv.gz',
+                                                        'AAPL_20240810_000000_000.csv.gz']
+        assert names(symbol='AAPL', start_date=datetime(2024, 8, 5, tzinfo=timezone.utc)) == [
+            'AAPL_20240810_000000_000.csv.gz', 's.zst']
+        assert names(end_date=datetime(2024, 8, 5)) == ['AAPL_20240801_000000_000.csv.gz',
+                                                        'MSFT_20240805_000000_000.csv.gz']
+        assert names(archived=True) == ['s.zst']
+
+    def test_existing_tree_is_indexed_on_first_open(self, tmp_path):
+        """Test that a raw tree written before the index is indexed once."""
+        write_raw_file(tmp_path, '2024/07/stock/AAPL_20240716_000000_000.csv.gz')
+        write_raw_file(tmp_path, '2024/08/future/GC_20240801_000000_000.csv.gz')
+        (tmp_path / '2024/08/future/notes.txt').write_text('')
+
+        index = RawIndex(tmp_path)
+
+        assert [entry.symbol for entry in index.find()] == ['AAPL', 'GC']
+        assert (tmp_path / INDEX_FILE_NAME).exists()
+        index.close()
+
+    def test_remove_month(self, index, tmp_path):
+        """Test that only responses of the given month are dropped."""
+        index.add_file(write_raw_file(tmp_path, '2024/07/stock/AAPL_20240716_000000_000.csv.gz'))
+        index.add_file(write_raw_file(tmp_path, '2024/08/stock/AAPL_20240801_000000_000.csv.gz'))
+
+        assert index.remove_month('2024', '07') == 1
+        assert [entry.created_at.month for entry in index.find()] == [8]
+
+
+class TestRawDataStorageIndex:
+    """Lookups and retention of RawDataStorage through the index."""
+
+    def save_at(self, storage, when, symbol='AAPL'):
+        with patch('vortex.infrastructure.storage.raw_storage.datetime') as mock_datetime:
+            mock_datetime.now.return_value = when
+            return storage.save_raw_response('yahoo', Stock(id=symbol, symbol=symbol), RESPONSE)
+
+    def test_get_raw_files_for_instrument(self, tmp_path):
+        """Test that saved files are found per instrument and by time."""
+        storage = RawDataStorage(str(tmp_path))
+        first = self.save_at(storage, datetime(2024, 7, 16, tzinfo=timezone.utc))
+        second = self.save_at(storage, datetime(2024, 8, 16, tzinfo=timezone.utc))
+        self.save_at(storage, datetime(2024, 8, 16, tzinfo=timezone.utc), symbol='MSFT')
+
+        assert [str(path) for path in storage.get_raw_files_for_instrument('yahoo', STOCK)] == [first, second]
+        assert [str(path) for path in storage.get_raw_files_for_instrument(
+            'yahoo', STOCK, start_date=datetime(2024, 8, 1, tzinfo=timezone.utc))] == [second]
+
+    def test_cleanup_drops_expired_months_and_files(self, tmp_path):
+        """Test that old months go whole and expired files of the cutoff month one by one."""
+        storage = RawDataStorage(str(tmp_path))
+        self.save_at(storage, datetime(2023, 12, 1, tzinfo=timezone.utc))
+        self.save_at(storage, datetime(2024, 7, 16, tzinfo=timezone.utc))
+        self.save_at(storage, datetime(2024, 8, 5, tzinfo=timezone.utc))
+        kept = self.save_at(storage, datetime(2024, 8, 15, tzinfo=timezone.utc))
+
+        with patch('vortex.infrastructure.storage.raw_storage.datetime') as mock_datetime:
+            mock_datetime.now.return_value = NOW
+            assert storage.cleanup_old_raw_files(retention_days=10) == 3
+
+        assert sorted(path.name for path in tmp_path.iterdir() if path.is_dir()) == ['2024']
+        assert sorted(path.name for path in (tmp_path / '2024').iterdir()) == ['08']
+        assert sorted(path.name for path in (tmp_path / '2024' / '08' / 'stock').iterdir()) == [
+            'AAPL_20240815_000000_000.csv.gz', 'AAPL_20240815_000000_000.csv.meta.json']
+        assert [str(path) for path in storage.get_raw_files_for_instrument('yahoo', STOCK)] == [kept]
+
+    def test_cleanup_drops_expired_archive_segments(self, tmp_path):
+        """Test that segments whose responses all expired go, the others stay."""
+        storage = RawDataStorage(str(tmp_path), archive=True, archive_segment_hours=1)
+        for when in (datetime(2024, 7, 1, tzinfo=timezone.utc), datetime(2024, 8, 5, tzinfo=timezone.utc),
+                     datetime(2024, 8, 15, tzinfo=timezone.utc), datetime(2024, 8, 19, tzinfo=timezone.utc)):
+            storage.archive.append(RESPONSE, when, 'yahoo', 'AAPL', 'stock')
+        storage.flush()
+
+        with patch('vortex.infrastructure.storage.raw_storage.datetime') as mock_datetime:
+            mock_datetime.now.return_value = NOW
+            assert storage.cleanup_old_raw_files(retention_days=10) == 2
+
+        assert sorted(path.name for path in tmp_path.rglob('*.zst')) == [
+            '20240815_000000_000.zst', '20240819_000000_000.zst']
+        assert [record.created_at.day for record in storage.get_archived_responses('yahoo', STOCK)] == [15, 19]
+        storage.close()
+
+    def test_cleanup_keeps_open_segment(self, tmp_path):
+        """Test that the segment being appended to is never removed."""
+        storage = RawDataStorage(str(tmp_path), archive=True)
+        storage.archive.append(RESPONSE, datetime(2024, 6, 1, tzinfo=timezone.utc), 'yahoo', 'AAPL', 'stock')
+        storage.flush()
+
+        with patch('vortex.infrastructure.storage.raw_storage.datetime') as mock_datetime:
+            mock_datetime.now.return_value = NOW
+            assert storage.cleanup_old_raw_files(retention_days=10) == 0
+
+        assert len(list(tmp_path.rglob('*.zst'))) == 1
+        storage.close()
@@ -0,0 +1,167 @@
+"""
+Unit tests for the write-behind queue and FileStorage's write-behind mode.
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.infrastructure.storage.write_behind import WriteBehindQueue
+from vortex.models.columns import DATETIME_COLUMN_NAME
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+
+
+@pytest.fixture
+def queue():
+    queue = WriteBehindQueue("test", max_pending=2)
+    yield queue
+    queue.close()
+
+
+class TestWriteBehindQueue:
+    """Test cases for WriteBehindQueue."""
+
+    def test_writes_run_in_background_and_flush_waits(self, queue):
+        """Test that flush returns only after queued writes ran."""
+        written = []
+
+        queue.submit("a", 1, lambda: written.append("a"))
+        queue.submit("b", 2, lambda: written.append("b"))
+        queue.flush()
+
+        assert written == ["a", "b"]
+        assert queue.stats["written"] == 2
+
+    def test_repeated_writes_to_same_key_are_coalesced(self, queue):
+        """Test that only the newest queued write for a key runs."""
+        release = threading.Event()
+        written = []
+        queue.submit("blocker", None, release.wait)
+
+        queue.submit("a", 1, lambda: written.append(1))
+        queue.submit("a", 2, lambda: written.append(2))
+        assert queue.pending("a") == 2
+        release.set()
+        queue.flush()
+
+        assert written == [2]
+        assert queue.stats["coalesced"] == 1
+        assert queue.pending("a") is None
+
+    def test_submit_blocks_when_queue_is_full(self, queue):
+        """Test that a full queue applies backpressure to submitters."""
+        release = threading.Event()
+        queue.submit("blocker", None, release.wait)
+        queue.submit("a", None, lambda: None)
+        queue.submit("b", None, lambda: None)
+
+        submitted = threading.Event()
+        submitter = threading.Thread(
+            target=lambda: (queue.submit("c", None, lambda: None), submitted.set())
+        )
+        submitter.start()
+
+        assert not submitted.wait(0.1)
+        release.set()
+        assert submitted.wait(5)
+        submitter.join()
+
+    def test_failed_write_is_raised_on_flush(self, queue):
+        """Test that a background failure surfaces at the next flush."""
+
+        def fail():
+            raise OSError("disk full")
+
+        queue.submit("a", None, fail)
+
+        with pytest.raises(OSError, match="disk full"):
+            queue.flush()
+        queue.flush()
+
+    def test_when_done_waits_for_newest_write(self, queue):
+        """Test that callbacks run after the coalesced write for their key."""
+        release = threading.Event()
+        written, done = [], []
+        queue.submit("blocker", None, release.wait)
+        queue.submit("a", 1, lambda: written.append(1))
+        queue.when_done("a", lambda error: done.append((list(written), error)))
+        queue.submit("a", 2, lambda: written.append(2))
+        queue.when_done("a", lambda error: done.append((list(written), error)))
+
+        assert done == []
+        release.set()
+        queue.flush()
+
+        assert done == [([2], None), ([2], None)]
+
+    def test_when_done_reports_failed_write(self, queue):
+        """Test that callbacks get the error of a failed write, also when late."""
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            release.wait()
+            raise OSError("disk full")
+
+        queue.submit("a", None, fail)
+        queue.when_done("a", errors.append)
+        release.set()
+        with pytest.raises(OSError):
+            queue.flush()
+        queue.when_done("a", errors.append)
+
+        assert [str(error) for error in errors] == ["disk full", "disk full"]
+
+    def test_when_done_without_pending_write_calls_back_at_once(self, queue):
+        """Test that a key with nothing queued reports success right away."""
+        errors = []
+
+        queue.when_done("a", errors.append)
+
+        assert errors == [None]
+
+    def test_invalid_size(self):
+        """Test that a queue must hold at least one write."""
+        with pytest.raises(ValueError):
+            WriteBehindQueue("test", max_pending=0)
+
+
+class TestFileStorageWriteBehind:
+    """Test cases for FileStorage in write-behind mode."""
+
+    @pytest.fixture
+    def stock(self):
+        return Stock(id="AAPL", symbol="AAPL")
+
+    @pytest.fixture
+    def series(self):
+        dates = pd.date_range("2024-01-01", periods=3, freq="D", tz="UTC")
+        df = pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        metadata = Metadata.create_metadata(
+            df, "test", "AAPL", Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    def test_queued_series_is_readable_before_it_is_written(self, tmp_path, stock, series):
+        """Test that loads and catalog lookups see a series still in the queue."""
+        storage = CsvStorage(str(tmp_path), dry_run=False, max_pending_writes=4)
+        release = threading.Event()
+        storage._write_queue.submit("blocker", None, release.wait)
+
+        storage.persist(series, stock, Period.Daily)
+
+        assert storage.load(stock, Period.Daily) is series
+        assert storage.get_catalog_entry(stock, Period.Daily).row_count == 3
+        release.set()
+        storage.flush()
+        file_path = storage._make_file_path_for_instrument(stock, Period.Daily)
+        assert storage.catalog.get(file_path).checksum
+        pd.testing.assert_frame_equal(
+            storage.load(stock, Period.Daily).df, series.df, check_names=False, check_freq=False
+        )
@@ -1,5 +1,6 @@
 import pytest
 import pandas as pd
+import pyarrow as pa
 import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -10,6 +11,8 @@ from vortex.models.columns import DATETIME_COLUMN_NAME
 from vortex.models.period import Period
 from vortex.models.future import Future
 from vortex.models.stock import Stock
+from vortex.models.metadata import Metadata
+from vortex.models.price_series import PriceSeries
 
 
 class TestCsvStorage:
@@ -286,7 +289,7 @@ class TestCsvStorage:
         with pytest.raises(pd.errors.EmptyDataError):
             csv_storage._load('test_file.csv')
         
-        mock_read_csv.assert_called_once_with('test_file.csv')
+        mock_read_csv.assert_called_once_with('test_file.csv', float_precision='round_trip')
 
     @patch('pandas.DataFrame.to_csv')
     def test_persist_with_pandas_error_handling(self, mock_to_csv, csv_storage, sample_dataframe):
@@ -304,4 +307,304 @@ class TestCsvStorage:
             file_path = csv_storage._make_file_path_for_instrument(sample_stock, period)
             assert file_path.endswith('.csv'), f"File path {file_path} should end with .csv"
             # Should only have one .csv extension
-            assert file_path.count('.csv') == 1, f"File path {file_path} should have exactly one .csv extension"
\ No newline at end of file
+            assert file_path.count('.csv') == 1, f"File path {file_path} should have exactly one .csv extension"
+
+class TestCsvStorageAppend:
+    """Appending new bars instead of rewriting the whole file."""
+
+    @pytest.fixture
+    def csv_storage(self, tmp_path):
+        return CsvStorage(base_path=str(tmp_path), dry_run=False)
+
+    @pytest.fixture
+    def stock(self):
+        return Stock(id='AAPL', symbol='AAPL')
+
+    @staticmethod
+    def make_series(closes):
+        dates = pd.date_range('2024-01-01', periods=len(closes), freq='D', tz='UTC')
+        df = pd.DataFrame({'Close': closes, 'Volume': range(len(closes))}, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        metadata = Metadata.create_metadata(
+            df, 'test', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    def test_new_rows_are_appended(self, csv_storage, stock):
+        """Test that rows past the stored series are appended without a rewrite."""
+        csv_storage.persist(self.make_series([1.0, 2.0, 3.0]), stock, Period.Daily)
+        updated = self.make_series([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        with patch.object(csv_storage, '_persist') as mock_persist:
+            csv_storage.persist(updated, stock, Period.Daily)
+
+        mock_persist.assert_not_called()
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, updated.df, check_names=False, check_freq=False)
+        assert csv_storage.get_catalog_entry(stock, Period.Daily).row_count == 5
+
+    def test_reloaded_float_prices_are_appended(self, csv_storage, stock):
+        """Test that a series reloaded from the file still matches its checksum."""
+        closes = [100.0 + i * 0.37 + i / 7 for i in range(200)]
+        csv_storage.persist(self.make_series(closes), stock, Period.Daily)
+        stored = csv_storage.load(stock, Period.Daily).df
+        updated = self.make_series(list(stored['Close']) + [200.123456789])
+
+        with patch.object(csv_storage, '_persist') as mock_persist:
+            csv_storage.persist(updated, stock, Period.Daily)
+
+        mock_persist.assert_not_called()
+        assert csv_storage.get_catalog_entry(stock, Period.Daily).row_count == 201
+
+    def test_changed_stored_rows_force_rewrite(self, csv_storage, stock):
+        """Test that a revision of an already stored bar rewrites the file."""
+        csv_storage.persist(self.make_series([1.0, 2.0, 3.0]), stock, Period.Daily)
+        revised = self.make_series([1.0, 2.5, 3.0, 4.0])
+
+        with patch.object(csv_storage, '_append') as mock_append:
+            csv_storage.persist(revised, stock, Period.Daily)
+
+        mock_append.assert_not_called()
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, revised.df, check_names=False, check_freq=False)
+
+    def test_append_drops_rows_left_by_interrupted_append(self, csv_storage, stock):
+        """Test that rows after the catalogued last row are replaced, not duplicated."""
+        csv_storage.persist(self.make_series([1.0, 2.0, 3.0]), stock, Period.Daily)
+        file_path = csv_storage._make_file_path_for_instrument(stock, Period.Daily)
+        with open(file_path, 'a') as f:
+            f.write('2024-01-04T00:00:00+0000,4.0,3\n2024-01-05T00:0')
+        updated = self.make_series([1.0, 2.0, 3.0, 4.0, 5.0])
+
+        csv_storage.persist(updated, stock, Period.Daily)
+
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, updated.df, check_names=False, check_freq=False)
+
+
+class TestCsvStoragePartitioning:
+    """Yearly partitioned layout."""
+
+    @pytest.fixture
+    def csv_storage(self, tmp_path):
+        return CsvStorage(base_path=str(tmp_path), dry_run=False, partitioning='year')
+
+    @pytest.fixture
+    def stock(self):
+        return Stock(id='SPY', symbol='SPY')
+
+    @staticmethod
+    def make_series(start, closes):
+        dates = pd.date_range(start, periods=len(closes), freq='D', tz='UTC')
+        df = pd.DataFrame({'Close': closes, 'Volume': range(len(closes))}, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        metadata = Metadata.create_metadata(
+            df, 'test', 'SPY', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    def partition_names(self, csv_storage, stock):
+        file_path = csv_storage._make_file_path_for_instrument(stock, Period.Daily)
+        return [os.path.basename(p) for p in csv_storage._partition_files(file_path)]
+
+    def test_unknown_partitioning_rejected(self, tmp_path):
+        """Test that an unsupported partitioning scheme fails fast."""
+        with pytest.raises(ValueError, match="Unknown partitioning"):
+            CsvStorage(base_path=str(tmp_path), dry_run=False, partitioning='week')
+
+    def test_series_split_by_year_and_stitched_on_load(self, csv_storage, stock):
+        """Test that rows land in per-year files and load back as one series."""
+        series = self.make_series('2023-12-30', [1.0, 2.0, 3.0, 4.0])
+
+        csv_storage.persist(series, stock, Period.Daily)
+
+        assert self.partition_names(csv_storage, stock) == ['2023.csv', '2024.csv']
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, series.df, check_names=False, check_freq=False)
+        assert csv_storage.get_catalog_entry(stock, Period.Daily).row_count == 4
+
+    def test_update_leaves_older_partitions_untouched(self, csv_storage, stock):
+        """Test that new bars only touch the partitions they fall in."""
+        csv_storage.persist(self.make_series('2023-12-30', [1.0, 2.0, 3.0]), stock, Period.Daily)
+        updated = self.make_series('2023-12-30', [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        with patch.object(csv_storage, '_persist') as mock_persist:
+            csv_storage.persist(updated, stock, Period.Daily)
+
+        mock_persist.assert_not_called()
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, updated.df, check_names=False, check_freq=False)
+
+    def test_new_partition_written_without_rewriting_old_ones(self, csv_storage, stock):
+        """Test that bars in a new year create a partition and skip older ones."""
+        csv_storage.persist(self.make_series('2023-12-29', [1.0, 2.0]), stock, Period.Daily)
+        updated = self.make_series('2023-12-29', [1.0, 2.0, 3.0, 4.0])
+
+        with patch.object(csv_storage, '_persist', wraps=csv_storage._persist) as mock_persist:
+            csv_storage.persist(updated, stock, Period.Daily)
+
+        assert [os.path.basename(c.args[1]) for c in mock_persist.call_args_list] == ['2024.csv']
+        assert self.partition_names(csv_storage, stock) == ['2023.csv', '2024.csv']
+
+    def test_revised_bar_rewrites_only_its_partition(self, csv_storage, stock):
+        """Test that a change to stored rows rewrites just the partitions holding them."""
+        csv_storage.persist(self.make_series('2022-12-30', [1.0] * 400), stock, Period.Daily)
+        revised = self.make_series('2022-12-30', [1.0] * 399 + [2.0])
+
+        with patch.object(csv_storage, '_persist', wraps=csv_storage._persist) as mock_persist:
+            csv_storage.persist(revised, stock, Period.Daily)
+
+        assert [os.path.basename(c.args[1]) for c in mock_persist.call_args_list] == ['2024.csv']
+        loaded = csv_storage.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, revised.df, check_names=False, check_freq=False)
+
+    def test_single_file_series_migrated_to_partitions(self, csv_storage, stock, tmp_path):
+        """Test that a series stored as one file is read and then rewritten as partitions."""
+        series = self.make_series('2023-12-30', [1.0, 2.0, 3.0])
+        CsvStorage(base_path=str(tmp_path), dry_run=False).persist(series, stock, Period.Daily)
+        file_path = csv_storage._make_file_path_for_instrument(stock, Period.Daily)
+
+        loaded = csv_storage.load(stock, Period.Daily)
+        csv_storage.persist(loaded, stock, Period.Daily)
+
+        assert not os.path.exists(file_path)
+        assert self.partition_names(csv_storage, stock) == ['2023.csv', '2024.csv']
+
+    def test_partitions_read_with_partitioning_off(self, csv_storage, stock, tmp_path):
+        """Test that a partitioned series is still found after partitioning is turned off."""
+        series = self.make_series('2023-12-30', [1.0, 2.0, 3.0])
+        csv_storage.persist(series, stock, Period.Daily)
+        unpartitioned = CsvStorage(base_path=str(tmp_path), dry_run=False)
+
+        loaded = unpartitioned.load(stock, Period.Daily)
+
+        pd.testing.assert_frame_equal(loaded.df, series.df, check_names=False, check_freq=False)
+        assert unpartitioned.get_catalog_entry(stock, Period.Daily).row_count == 3
+
+    def test_merged_series_replaces_partitions_with_one_file(self, csv_storage, stock, tmp_path):
+        """Test that partitions are dropped once a series grown from them is written."""
+        csv_storage.persist(self.make_series('2023-12-30', [1.0, 2.0, 3.0]), stock, Period.Daily)
+        unpartitioned = CsvStorage(base_path=str(tmp_path), dry_run=False)
+        updated = self.make_series('2023-12-30', [1.0, 2.0, 3.0, 4.0])
+
+        unpartitioned.persist(updated, stock, Period.Daily)
+
+        assert self.partition_names(csv_storage, stock) == []
+        loaded = unpartitioned.load(stock, Period.Daily)
+        pd.testing.assert_frame_equal(loaded.df, updated.df, check_names=False, check_freq=False)
+
+    def test_shorter_series_keeps_partitions(self, csv_storage, stock, tmp_path):
+        """Test that a write not reaching back to the partitioned rows keeps them."""
+        csv_storage.persist(self.make_series('2023-12-30', [1.0, 2.0, 3.0]), stock, Period.Daily)
+        unpartitioned = CsvStorage(base_path=str(tmp_path), dry_run=False)
+
+        unpartitioned.persist(self.make_series('2024-01-01', [3.0, 4.0]), stock, Period.Daily)
+
+        assert self.partition_names(csv_storage, stock) == ['2023.csv', '2024.csv']
+
+
+class TestCsvStorageRangeLoad:
+    """Loading part of a stored series."""
+
+    @pytest.fixture(params=['pandas', 'pyarrow'])
+    def csv_storage(self, tmp_path, request):
+        return CsvStorage(base_path=str(tmp_path), dry_run=False, engine=request.param)
+
+    @pytest.fixture
+    def stock(self):
+        return Stock(id='AAPL', symbol='AAPL')
+
+    @pytest.fixture
+    def series(self):
+        dates = pd.date_range('2023-12-25', periods=20, freq='D', tz='UTC')
+        df = pd.DataFrame({'Close': [float(i) for i in range(20)], 'Volume': range(20)}, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        metadata = Metadata.create_metadata(
+            df, 'test', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    @pytest.mark.parametrize('start, end', [
+        (datetime(2024, 1, 3), datetime(2024, 1, 6)),
+        (datetime(2024, 1, 3, 12), None),
+        (None, datetime(2023, 12, 27)),
+        (datetime(2020, 1, 1), datetime(2030, 1, 1)),
+        (datetime(2030, 1, 1), None),
+    ])
+    def test_load_range_matches_slice_of_full_load(self, csv_storage, stock, series, start, end):
+        """Test that the bisected byte range holds exactly the rows in range."""
+        csv_storage.persist(series, stock, Period.Daily)
+
+        loaded = csv_storage.load(stock, Period.Daily, start=start, end=end)
+
+        expected = series.df.loc[
+            pd.Timestamp(start, tz='UTC') if start else None:pd.Timestamp(end, tz='UTC') if end else None
+        ]
+        # CSV cannot tell column types without rows, so an empty result is compared loosely
+        pd.testing.assert_frame_equal(
+            loaded.df, expected, check_names=False, check_freq=False,
+            check_dtype=not expected.empty, check_index_type=not expected.empty
+        )
+        assert loaded.metadata == series.metadata
+
+    def test_load_columns(self, csv_storage, stock, series):
+        """Test that only the requested columns are returned."""
+        csv_storage.persist(series, stock, Period.Daily)
+
+        loaded = csv_storage.load(stock, Period.Daily, columns=['Volume'])
+
+        assert list(loaded.df.columns) == ['Volume']
+        assert len(loaded.df) == 20
+
+    def test_partitioned_range_skips_other_partitions(self, tmp_path, stock, series):
+        """Test that partitions outside the range are not read."""
+        storage = CsvStorage(base_path=str(tmp_path), dry_run=False, partitioning='year')
+        storage.persist(series, stock, Period.Daily)
+
+        with patch.object(storage, '_load_range', wraps=storage._load_range) as mock_load_range:
+            loaded = storage.load(stock, Period.Daily, start=datetime(2024, 1, 5))
+
+        assert [os.path.basename(c.args[0]) for c in mock_load_range.call_args_list] == ['2024.csv']
+        assert loaded.df.index[0] == pd.Timestamp('2024-01-05', tz='UTC')
+
+
+class TestCsvStoragePyarrowEngine:
+    """Parsing stored files with pyarrow's reader."""
+
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        dates = pd.date_range('2024-01-08 09:30', periods=50, freq='min', tz='America/Chicago')
+        df = pd.DataFrame({
+            'Open': [float(i) for i in range(50)],
+            'High': 1.5,
+            'Low': 0.5,
+            'Close': [i + 0.25 for i in range(50)],
+            'Volume': range(50),
+            'Open Interest': float('nan'),
+        }, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        file_path = str(tmp_path / 'series.csv')
+        CsvStorage(base_path=str(tmp_path), dry_run=False)._persist(df, file_path)
+        return file_path
+
+    def test_unknown_engine_rejected(self, tmp_path):
+        """Test that an unsupported engine is rejected."""
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            CsvStorage(base_path=str(tmp_path), dry_run=False, engine='c')
+
+    def test_load_matches_pandas_engine(self, tmp_path, file_path):
+        """Test that both engines load the same frame, timezone offset included."""
+        pandas_df = CsvStorage(str(tmp_path), False)._load(file_path)
+        arrow_df = CsvStorage(str(tmp_path), False, engine='pyarrow')._load(file_path)
+
+        pd.testing.assert_frame_equal(arrow_df, pandas_df)
+
+    def test_unparseable_file_falls_back_to_pandas(self, tmp_path, file_path):
+        """Test that files pyarrow rejects are still loaded by pandas."""
+        storage = CsvStorage(str(tmp_path), False, engine='pyarrow')
+
+        with patch('vortex.infrastructure.storage.csv_storage.read_csv_arrow',
+                   side_effect=pa.ArrowInvalid('bad value')):
+            df = storage._load(file_path)
+
+        pd.testing.assert_frame_equal(df, CsvStorage(str(tmp_path), False)._load(file_path))
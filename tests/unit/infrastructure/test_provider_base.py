@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import pandas as pd
 from datetime import datetime, timedelta
@@ -6,6 +7,9 @@ from unittest.mock import Mock, patch, MagicMock
 from vortex.infrastructure.providers.base import (
     DataProvider, 
     HistoricalDataResult, 
+    RawResponse,
+    deferred_parsing,
+    parsing_deferred,
     should_retry
 )
 from vortex.models.period import Period, FrequencyAttributes
@@ -21,6 +25,10 @@ class ConnectionError(Exception): pass
 class RateLimitError(Exception): pass
 
 
+def frame_from_rows(rows):
+    return pd.DataFrame(rows)
+
+
 class TestHistoricalDataResult:
     def test_historical_data_result_enum_values(self):
         """Test HistoricalDataResult enum values."""
@@ -213,6 +221,17 @@ class TestDataProvider:
         result = provider.get_max_range(Period.Weekly)
         assert result is None
 
+    def test_get_max_bars(self, provider):
+        """Test get_max_bars reads the declared per-request bar limit."""
+        provider.set_frequency_attributes([
+            FrequencyAttributes(frequency=Period.Daily, properties={"max_bars": 10000}),
+            FrequencyAttributes(frequency=Period.Hourly),
+        ])
+
+        assert provider.get_max_bars(Period.Daily) == 10000
+        assert provider.get_max_bars(Period.Hourly) is None
+        assert provider.get_max_bars(Period.Weekly) is None
+
     def test_get_min_start(self, provider):
         """Test get_min_start method."""
         # Create frequency attribute with timedelta min_start
@@ -288,6 +307,36 @@ class TestDataProvider:
         
         assert result is sample_df
 
+    def test_deferred_response_is_validated_when_parsed(self, provider, sample_instrument):
+        """Test a raw response passes through the fetch and is validated once parsed."""
+        provider.set_frequency_attributes([FrequencyAttributes(frequency=Period.Daily)])
+        rows = {'Open': [99], 'High': [101], 'Low': [98], 'Close': [100], 'Volume': [1000]}
+        provider.set_fetch_response(RawResponse(frame_from_rows, (rows,)))
+
+        assert not parsing_deferred()
+        with deferred_parsing():
+            assert parsing_deferred()
+            result = provider.fetch_historical_data(
+                sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+            )
+        assert not parsing_deferred()
+
+        assert isinstance(result, RawResponse)
+        assert list(result.to_frame()['Close']) == [100]
+
+    def test_deferred_response_missing_columns_fails_when_parsed(self, provider, sample_instrument):
+        """Test validation errors of a raw response surface when it is parsed."""
+        provider.set_frequency_attributes([FrequencyAttributes(frequency=Period.Daily)])
+        provider.set_fetch_response(RawResponse(frame_from_rows, ({'Close': [100]},)))
+
+        with deferred_parsing():
+            result = provider.fetch_historical_data(
+                sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+            )
+
+        with pytest.raises(DataProviderError):
+            result.to_frame()
+
     def test_fetch_historical_data_calls_private_method(self, provider, sample_instrument):
         """Test that fetch_historical_data calls _fetch_historical_data with correct parameters."""
         freq_attr = FrequencyAttributes(frequency=Period.Daily)
@@ -314,6 +363,19 @@ class TestDataProvider:
                 end_date
             )
 
+    def test_fetch_historical_data_paces_through_rate_limiter(self, provider, sample_instrument):
+        """Test the provider fetch acquires a rate limit token and reports the outcome."""
+        provider.set_frequency_attributes([FrequencyAttributes(frequency=Period.Daily)])
+        provider.set_fetch_response(pd.DataFrame())
+        provider._rate_limiter = Mock()
+
+        provider.fetch_historical_data(
+            sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+        )
+
+        provider._rate_limiter.acquire.assert_called_once()
+        provider._rate_limiter.record_outcome.assert_called_once_with(None)
+
     @patch('vortex.infrastructure.providers.base.retry')
     def test_fetch_historical_data_has_retry_decorator(self, mock_retry, provider, sample_instrument):
         """Test that fetch_historical_data has retry decorator applied."""
@@ -367,6 +429,45 @@ class TestDataProvider:
                 datetime(2024, 1, 3)
             )
 
+    def test_fetch_historical_data_async_defaults_to_sync_fetch(self, provider, sample_instrument):
+        """Test the async fetch offloads the sync provider implementation."""
+        provider.set_frequency_attributes([FrequencyAttributes(frequency=Period.Daily)])
+        sample_df = pd.DataFrame({
+            'Open': [99], 'High': [101], 'Low': [98], 'Close': [100], 'Volume': [1000]
+        })
+        provider.set_fetch_response(sample_df)
+
+        result = asyncio.run(provider.fetch_historical_data_async(
+            sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+        ))
+
+        assert result is sample_df
+
+    def test_fetch_historical_data_async_nonexistent_period(self, provider, sample_instrument):
+        """Test the async fetch rejects unsupported periods like the sync path."""
+        provider.set_frequency_attributes([])
+
+        with pytest.raises(Exception, match="Period .* is not supported by provider"):
+            asyncio.run(provider.fetch_historical_data_async(
+                sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+            ))
+
+    def test_fetch_historical_data_async_does_not_retry_data_not_found(self, provider, sample_instrument):
+        """Test non-retryable errors propagate from the async fetch immediately."""
+        provider.set_frequency_attributes([FrequencyAttributes(frequency=Period.Daily)])
+        provider.set_fetch_exception(DataNotFoundError(
+            provider="test", symbol="AAPL", period=Period.Daily,
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 3)
+        ))
+
+        with patch('vortex.infrastructure.providers.base.asyncio.sleep') as mock_sleep:
+            with pytest.raises(DataNotFoundError):
+                asyncio.run(provider.fetch_historical_data_async(
+                    sample_instrument, Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 3)
+                ))
+
+        mock_sleep.assert_not_called()
+
     def test_abstract_methods_must_be_implemented(self):
         """Test that abstract methods must be implemented in concrete classes."""
         # This test verifies that DataProvider cannot be instantiated directly
@@ -0,0 +1,155 @@
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.infrastructure.storage.catalog import CatalogEntry
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.allowance_planner import job_cost, plan_allowance, series_key
+from vortex.services.base_downloader import BaseDownloader
+from vortex.services.download_job import DownloadJob
+from vortex.services.job_journal import JobJournal
+from vortex.services.job_scheduler import PriorityScheduler
+from vortex.services.updating_downloader import UpdatingDownloader
+
+
+def make_job(symbol, requests=1):
+    fetch_ranges = [(datetime(2024, 1, 1 + i), datetime(2024, 1, 2 + i)) for i in range(requests)]
+    return DownloadJob(
+        Mock(), Mock(), Stock(id=symbol, symbol=symbol), Period.Daily,
+        datetime(2024, 1, 1), datetime(2024, 1, 1 + requests),
+        fetch_ranges=fetch_ranges if requests > 1 else None,
+    )
+
+
+class TestPlanAllowance:
+    def test_unknown_allowance_selects_every_job(self):
+        jobs = [make_job("AAPL"), make_job("MSFT")]
+
+        plan = plan_allowance(jobs, None)
+
+        assert plan.selected == jobs
+        assert plan.deferred == []
+
+    def test_jobs_are_taken_in_order_while_they_fit(self):
+        first, second, third = make_job("AAPL"), make_job("MSFT"), make_job("GOOG")
+
+        plan = plan_allowance([first, second, third], 2)
+
+        assert plan.selected == [first, second]
+        assert plan.deferred == [third]
+
+    def test_cheaper_jobs_fill_what_an_expensive_one_leaves(self):
+        cheap, expensive, later = make_job("AAPL"), make_job("MSFT", requests=3), make_job("GOOG")
+
+        plan = plan_allowance([cheap, expensive, later], 2)
+
+        assert job_cost(expensive) == 3
+        assert plan.selected == [cheap, later]
+        assert plan.deferred == [expensive]
+
+    def test_exhausted_allowance_defers_everything(self):
+        jobs = [make_job("AAPL")]
+
+        assert plan_allowance(jobs, 0).deferred == jobs
+
+    def test_series_key_ignores_dates(self):
+        assert series_key(make_job("AAPL")) == series_key(make_job("AAPL", requests=2))
+
+
+class CountingDownloader(BaseDownloader):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed = []
+
+    def _process_job(self, job):
+        self.processed.append(job.instrument.symbol)
+        return HistoricalDataResult.OK
+
+
+class TestDownloaderAllowance:
+    def test_download_defers_jobs_beyond_allowance(self, tmp_path):
+        provider = Mock()
+        provider.get_remaining_allowance.return_value = 1
+        journal = JobJournal.open(tmp_path)
+        downloader = CountingDownloader(Mock(), provider, job_journal=journal)
+        jobs = [make_job("AAPL"), make_job("MSFT")]
+
+        with patch.object(downloader, '_create_jobs', return_value=jobs):
+            downloader.download_legacy({}, 2024, 2024)
+
+        provider.get_remaining_allowance.assert_called_once()
+        assert downloader.processed == ["AAPL"]
+        assert journal.deferred_keys() == {series_key(jobs[1])}
+        journal.close()
+
+    def test_deferred_series_are_carried_into_the_next_run(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        journal.update_deferred([series_key(make_job("MSFT"))], [])
+
+        downloader = CountingDownloader(Mock(), Mock(), job_journal=journal)
+
+        assert isinstance(downloader.scheduler, PriorityScheduler)
+        assert downloader.scheduler.carried_over == {series_key(make_job("MSFT"))}
+        journal.close()
+
+
+class TestUpdatingDownloaderAllowance:
+    def make_lagging_job(self, storage):
+        fetch_ranges = [
+            (datetime(2023, 1, 1), datetime(2023, 7, 1)),
+            (datetime(2023, 7, 1), datetime(2024, 1, 1)),
+            (datetime(2024, 1, 1), datetime(2024, 3, 31)),
+        ]
+        return DownloadJob(
+            Mock(), storage, Stock(id="AAPL", symbol="AAPL"), Period.Daily,
+            datetime(2023, 1, 1), datetime(2024, 3, 31), fetch_ranges=fetch_ranges,
+        )
+
+    def test_series_lagging_the_end_date_costs_its_last_request(self):
+        storage = Mock()
+        metadata = Metadata(
+            "AAPL", Period.Daily,
+            datetime(2023, 1, 1), datetime(2024, 3, 20),
+            datetime(2023, 1, 3), datetime(2024, 3, 19),
+        )
+        storage.get_catalog_entry.return_value = CatalogEntry(metadata, 300)
+        provider = Mock()
+        provider.get_remaining_allowance.return_value = 1
+        downloader = UpdatingDownloader(storage, provider)
+        job = self.make_lagging_job(storage)
+
+        plan = downloader.plan_allowance([job])
+
+        assert job_cost(job) == 3
+        assert plan.selected == [job]
+        assert job.start_date == datetime(2023, 1, 1)
+
+    def test_uncatalogued_series_costs_every_request(self):
+        storage = Mock()
+        storage.get_catalog_entry.return_value = None
+        provider = Mock()
+        provider.get_remaining_allowance.return_value = 2
+        downloader = UpdatingDownloader(storage, provider)
+        job = self.make_lagging_job(storage)
+
+        assert downloader.plan_allowance([job]).deferred == [job]
+
+    def test_series_before_stored_data_costs_the_gap_to_it(self):
+        storage = Mock()
+        metadata = Metadata(
+            "AAPL", Period.Daily,
+            datetime(2024, 6, 1), datetime(2024, 12, 31),
+            datetime(2024, 6, 3), datetime(2024, 12, 30),
+        )
+        entry = CatalogEntry(metadata, 150)
+        storage.get_catalog_entry.return_value = entry
+        downloader = UpdatingDownloader(storage, Mock())
+        job = self.make_lagging_job(storage)
+
+        cost = downloader._job_cost(job)
+        downloader._is_catalogued_data_sufficient(job, entry)
+
+        assert job.end_date == datetime(2024, 6, 1)
+        assert cost == job_cost(job) == 4
@@ -0,0 +1,180 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from vortex.exceptions import DataNotFoundError
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.async_updating_downloader import AsyncUpdatingDownloader
+from vortex.services.download_job import DownloadJob
+from vortex.services.job_journal import JobJournal
+from vortex.services.updating_downloader import PendingFetch
+
+
+def make_job(symbol, period=Period.Daily):
+    storage = Mock()
+    storage.merges_in_place = False
+    storage.get_catalog_entry.return_value = None
+    return DownloadJob(
+        Mock(), storage, Stock(id=symbol, symbol=symbol), period,
+        datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+
+class TestAsyncUpdatingDownloader:
+    @pytest.fixture
+    def downloader(self):
+        return AsyncUpdatingDownloader(Mock(), Mock(), max_in_flight=4)
+
+    def test_invalid_max_in_flight(self):
+        with pytest.raises(ValueError):
+            AsyncUpdatingDownloader(Mock(), Mock(), max_in_flight=0)
+
+    def test_existing_data_sufficient_skips_fetch(self, downloader):
+        job = make_job("AAPL")
+        job.load = Mock(return_value=Mock())
+        job.fetch_responses_async = AsyncMock()
+
+        with patch.object(downloader, "_is_existing_data_sufficient", return_value=True):
+            result = asyncio.run(downloader._process_job_async(job))
+
+        assert result == HistoricalDataResult.EXISTS
+        job.fetch_responses_async.assert_not_called()
+
+    def test_fresh_download_is_parsed_merged_and_persisted(self, downloader):
+        job = make_job("AAPL")
+        new_download = MagicMock()
+        job.load = Mock(side_effect=FileNotFoundError)
+        job.fetch_responses_async = AsyncMock(return_value=["response"])
+        job.persist = Mock()
+
+        with patch("vortex.services.async_updating_downloader.parse_download",
+                   return_value=new_download) as mock_parse:
+            result = asyncio.run(downloader._process_job_async(job))
+
+        assert result == HistoricalDataResult.OK
+        assert mock_parse.call_args.args[0].responses == ["response"]
+        new_download.merge.assert_called_once_with(None)
+        job.persist.assert_called_once_with(new_download.merge.return_value)
+
+    def test_empty_download_returns_none(self, downloader):
+        job = make_job("AAPL")
+        job.load = Mock(side_effect=FileNotFoundError)
+        job.fetch_responses_async = AsyncMock(return_value=[])
+        job.persist = Mock()
+
+        with patch("vortex.services.async_updating_downloader.parse_download",
+                   return_value=None):
+            result = asyncio.run(downloader._process_job_async(job))
+
+        assert result == HistoricalDataResult.NONE
+        job.persist.assert_not_called()
+
+    def test_invalid_download_returns_none(self, downloader):
+        job = make_job("AAPL")
+        job.load = Mock(side_effect=FileNotFoundError)
+        job.fetch_responses_async = AsyncMock(side_effect=ValueError("bad data"))
+
+        result = asyncio.run(downloader._process_job_async(job))
+
+        assert result == HistoricalDataResult.NONE
+
+    def test_process_jobs_accounts_not_found(self, downloader):
+        jobs = [make_job("AAPL"), make_job("MISSING"), make_job("MSFT")]
+
+        async def process(job):
+            if job.instrument.symbol == "MISSING":
+                raise DataNotFoundError(
+                    provider="test", symbol="MISSING", period=Period.Daily,
+                    start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+                )
+            return HistoricalDataResult.OK
+
+        with patch.object(downloader, "_process_job_async", side_effect=process), \
+                patch("vortex.services.base_downloader.logging") as mock_logging:
+            downloader._process_jobs(jobs)
+
+        warnings = " ".join(str(c) for c in mock_logging.warning.call_args_list)
+        assert "MISSING" in warnings
+        progress = [str(c) for c in mock_logging.info.call_args_list if "jobs processed" in str(c)]
+        assert any("3/3 jobs processed" in p and "2 downloads" in p for p in progress)
+
+    def test_jobs_for_same_file_never_overlap(self, downloader):
+        jobs = [make_job("AAPL") for _ in range(4)]
+        active = []
+        overlaps = []
+
+        async def process(job):
+            active.append(job)
+            if len(active) > 1:
+                overlaps.append(job)
+            await asyncio.sleep(0.01)
+            active.remove(job)
+            return HistoricalDataResult.OK
+
+        with patch.object(downloader, "_process_job_async", side_effect=process):
+            asyncio.run(downloader.process_jobs_async(jobs))
+
+        assert overlaps == []
+
+    def test_unexpected_errors_propagate(self, downloader):
+        with patch.object(downloader, "_process_job_async",
+                          AsyncMock(side_effect=RuntimeError("unexpected"))):
+            with pytest.raises(RuntimeError, match="unexpected"):
+                asyncio.run(downloader.process_jobs_async([make_job("AAPL")]))
+
+    def test_jobs_are_announced_before_they_run(self, downloader):
+        jobs = [make_job("AAPL"), make_job("MSFT")]
+        announced = []
+
+        async def process(job):
+            announced.append(downloader._pop_journal_key(job))
+            return HistoricalDataResult.OK
+
+        with patch.object(downloader, "_process_job_async", side_effect=process):
+            asyncio.run(downloader.process_jobs_async(jobs))
+
+        assert sorted(announced) == sorted(str(job) for job in jobs)
+
+    def test_unexpected_errors_are_journaled_as_failed(self, tmp_path):
+        journal = JobJournal(tmp_path / "journal.sqlite")
+        downloader = AsyncUpdatingDownloader(Mock(), Mock(), job_journal=journal)
+        job = make_job("AAPL")
+        key = str(job)
+
+        with patch.object(downloader, "_process_job_async",
+                          AsyncMock(side_effect=OSError("disk full"))), \
+                patch.object(journal, "mark_failed") as mock_mark_failed:
+            with pytest.raises(OSError):
+                asyncio.run(downloader.process_jobs_async([job]))
+
+        mock_mark_failed.assert_called_once_with(key, "disk full")
+        assert journal.completed_keys() == set()
+        journal.close()
+
+    def test_provider_requests_are_capped_at_provider_concurrency(self):
+        provider = Mock()
+        provider.get_name.return_value = "barchart"
+        downloader = AsyncUpdatingDownloader(Mock(), provider, max_in_flight=8)
+        jobs = [make_job(f"S{i}") for i in range(6)]
+        running = []
+        peak = []
+
+        async def fetch_responses():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return []
+
+        for job in jobs:
+            job.fetch_responses_async = fetch_responses
+        with patch.object(downloader, "_load_stage", return_value=PendingFetch(None)), \
+                patch.object(downloader, "_finish_stage", return_value=HistoricalDataResult.OK):
+            asyncio.run(downloader.process_jobs_async(jobs))
+
+        assert len(peak) == 6
+        assert max(peak) <= 2
@@ -2,11 +2,18 @@
 
 import pytest
 from datetime import datetime
+from datetime import timezone
 from unittest.mock import Mock
 
+import pandas as pd
+
 from vortex.services.backfill_downloader import BackfillDownloader
 from vortex.services.download_job import DownloadJob
+from vortex.services.job_journal import JobJournal
 from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
 
 
 class TestBackfillDownloader:
@@ -79,6 +86,8 @@ class TestBackfillDownloader:
         mock_data.df.shape = (100, 5)
         mock_job.fetch.return_value = mock_data
         mock_job.persist = Mock()
+        # Nothing stored yet, so the fetched series is persisted as is
+        mock_job.load.side_effect = FileNotFoundError
         
         # Process the job
         result = downloader._process_job(mock_job)
@@ -194,6 +203,7 @@ class TestBackfillDownloaderIntegration:
             mock_data.df.shape = (50 + i * 10, 5)
             mock_job.fetch.return_value = mock_data
             mock_job.persist = Mock()
+            mock_job.load.side_effect = FileNotFoundError
             
             jobs.append(mock_job)
         
@@ -232,6 +242,7 @@ class TestBackfillDownloaderIntegration:
             mock_job.__str__ = Mock(return_value=job_name)
             mock_job.fetch.return_value = return_value
             mock_job.persist = Mock()
+            mock_job.load.side_effect = FileNotFoundError
             
             result = downloader._process_job(mock_job)
             results.append(result)
@@ -245,4 +256,119 @@ class TestBackfillDownloaderIntegration:
             HistoricalDataResult.OK,    # Success Job 2
         ]
         
-        assert results == expected_results
\ No newline at end of file
+        assert results == expected_results
+
+class TestBackfillSeriesAccumulation:
+    """Chunks of one series are combined and written once."""
+
+    @staticmethod
+    def make_series(start, periods, value):
+        dates = pd.date_range(start, periods=periods, freq='D', tz='UTC')
+        df = pd.DataFrame({'Close': [value] * periods}, index=dates)
+        df.index.name = 'Datetime'
+        metadata = Metadata.create_metadata(
+            df, 'test', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    @staticmethod
+    def make_job(chunk, instrument='AAPL'):
+        job = Mock(spec=DownloadJob)
+        job.instrument = instrument
+        job.period = Period.Daily
+        job.fetch.return_value = chunk
+        job.load.side_effect = FileNotFoundError
+        # Written synchronously unless a test holds the callback back
+        job.when_persisted.side_effect = lambda callback: callback(None)
+        return job
+
+    def test_series_written_once_after_its_last_job(self):
+        """Test that announced jobs of one series are persisted together."""
+        downloader = BackfillDownloader(Mock(), Mock())
+        first = self.make_job(self.make_series('2024-01-01', 3, 1.0))
+        second = self.make_job(self.make_series('2024-01-03', 3, 2.0))
+        downloader.expect_jobs([first, second])
+
+        downloader._process_job(first)
+        first.persist.assert_not_called()
+        downloader._process_job(second)
+
+        first.persist.assert_not_called()
+        second.persist.assert_called_once()
+        written = second.persist.call_args.args[0]
+        assert len(written.df) == 5
+        # The later chunk wins where chunks overlap
+        assert written.df['Close'].tolist() == [1.0, 1.0, 2.0, 2.0, 2.0]
+
+    def test_stored_series_is_kept(self):
+        """Test that backfilled chunks are merged into the stored series."""
+        downloader = BackfillDownloader(Mock(), Mock())
+        job = self.make_job(self.make_series('2023-12-01', 2, 1.0))
+        job.load.side_effect = None
+        job.load.return_value = self.make_series('2024-01-01', 3, 5.0)
+        downloader.expect_jobs([job])
+
+        downloader._process_job(job)
+
+        written = job.persist.call_args.args[0]
+        assert len(written.df) == 5
+        assert written.metadata.start_date == datetime(2023, 12, 1, tzinfo=timezone.utc)
+
+    def test_series_with_unfinished_jobs_written_on_flush(self):
+        """Test that a series whose jobs did not all run is written by flush_storage."""
+        downloader = BackfillDownloader(Mock(), Mock())
+        ran = self.make_job(self.make_series('2024-01-01', 3, 1.0))
+        deferred = self.make_job(self.make_series('2024-01-05', 3, 1.0))
+        downloader.expect_jobs([ran, deferred])
+
+        downloader._process_job(ran)
+        ran.persist.assert_not_called()
+        downloader.flush_storage()
+
+        ran.persist.assert_called_once()
+        downloader.data_storage.flush.assert_called_once()
+
+    def test_jobs_journaled_once_their_series_is_written(self, tmp_path):
+        """Test that kept chunks are journaled completed only after the persist."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+        downloader = BackfillDownloader(Mock(), Mock(), job_journal=journal)
+        first = self.make_job(self.make_series('2024-01-01', 3, 1.0))
+        second = self.make_job(self.make_series('2024-01-04', 3, 1.0))
+        downloader.expect_jobs([first, second])
+
+        assert downloader._process_job(first) == HistoricalDataResult.PENDING
+        assert journal.completed_keys() == set()
+        downloader._process_job(second)
+
+        assert journal.completed_keys() == {str(first), str(second)}
+
+    def test_write_behind_jobs_journaled_once_written(self, tmp_path):
+        """Test that a series queued for writing is journaled by the write callback."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+        downloader = BackfillDownloader(Mock(), Mock(), job_journal=journal)
+        job = self.make_job(self.make_series('2024-01-01', 3, 1.0))
+        job.when_persisted.side_effect = None
+        downloader.expect_jobs([job])
+
+        assert downloader._process_job(job) == HistoricalDataResult.PENDING
+        job.persist.assert_called_once()
+        assert journal.completed_keys() == set()
+        job.when_persisted.call_args.args[0](None)
+
+        assert journal.completed_keys() == {str(job)}
+
+    def test_failed_persist_fails_every_job_of_the_series(self, tmp_path):
+        """Test that a series that could not be written is fetched again on resume."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+        downloader = BackfillDownloader(Mock(), Mock(), job_journal=journal)
+        first = self.make_job(self.make_series('2024-01-01', 3, 1.0))
+        second = self.make_job(self.make_series('2024-01-04', 3, 1.0))
+        second.persist.side_effect = OSError('disk full')
+        downloader.expect_jobs([first, second])
+
+        downloader._process_job(first)
+        with pytest.raises(OSError):
+            downloader._process_job(second)
+
+        assert journal.completed_keys() == set()
+        first.persist.assert_not_called()
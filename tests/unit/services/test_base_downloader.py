@@ -16,6 +16,12 @@ from vortex.models.stock import Stock
 from vortex.models.period import Period
 
 
+
+def make_mock_job():
+    """Mock job with no stored series, as seen by the scheduler."""
+    return Mock(**{"get_catalog_entry.return_value": None,
+                   "get_sidecar_metadata.return_value": None})
+
 class ConcreteDownloader(BaseDownloader):
     """Concrete implementation for testing."""
     
@@ -55,6 +61,8 @@ class TestBaseDownloader:
         provider.logout = Mock()
         provider.get_min_start = Mock(return_value=datetime(2020, 1, 1, tzinfo=timezone.utc))
         provider.get_max_range = Mock(return_value=timedelta(days=30))
+        provider.get_max_bars = Mock(return_value=None)
+        provider.get_remaining_allowance = Mock(return_value=None)
         provider.get_supported_timeframes = Mock(return_value=[Period.Daily, Period.Minute_1])
         return provider
 
@@ -105,6 +113,16 @@ class TestBaseDownloader:
         downloader.logout()
         downloader.data_provider.logout.assert_called_once()
 
+    def test_logout_flushes_storage_first(self, downloader):
+        """Test logout waits for queued storage writes even if flushing fails."""
+        downloader.data_storage.flush = Mock(side_effect=OSError("disk full"))
+
+        with pytest.raises(OSError):
+            downloader.logout()
+
+        downloader.data_storage.flush.assert_called_once()
+        downloader.data_provider.logout.assert_called_once()
+
     @patch('vortex.services.base_downloader.is_list_of_strings')
     @patch('vortex.services.base_downloader.merge_dicts')
     @patch.object(InstrumentConfig, 'load_from_json')
@@ -209,8 +227,8 @@ class TestBaseDownloader:
             'GOOGL': Mock(cycle='HM')    # Short cycle  
         }
         
-        job1 = Mock()
-        job2 = Mock()
+        job1 = make_mock_job()
+        job2 = make_mock_job()
         jobs_per_instrument = {
             'AAPL': [job1],
             'GOOGL': [job2]
@@ -233,9 +251,9 @@ class TestBaseDownloader:
         
         # Create enough jobs for each instrument
         jobs_per_instrument = {
-            'SHORT': [Mock() for _ in range(3)],
-            'MEDIUM': [Mock() for _ in range(3)],
-            'LONG': [Mock() for _ in range(3)]
+            'SHORT': [make_mock_job() for _ in range(3)],
+            'MEDIUM': [make_mock_job() for _ in range(3)],
+            'LONG': [make_mock_job() for _ in range(3)]
         }
         
         total_jobs = sum(len(jobs) for jobs in jobs_per_instrument.values())
@@ -254,7 +272,7 @@ class TestBaseDownloader:
         }
         
         jobs_per_instrument = {
-            'NOCYCLE': [Mock(), Mock()]
+            'NOCYCLE': [make_mock_job(), make_mock_job()]
         }
         
         with patch('vortex.services.base_downloader.total_elements_in_dict_of_lists', return_value=2):
@@ -272,7 +290,7 @@ class TestBaseDownloader:
         }
         
         jobs_per_instrument = {
-            'PRESENT': [Mock()]  # MISSING is not in jobs dict
+            'PRESENT': [make_mock_job()]  # MISSING is not in jobs dict
         }
         
         with patch('vortex.services.base_downloader.total_elements_in_dict_of_lists', return_value=1):
@@ -791,6 +809,31 @@ class TestBaseDownloader:
         assert jobs[0].instrument == instrument
         assert jobs[0].period == Period.Daily
 
+    def test_create_jobs_for_undated_instrument_groups_chunks(self, downloader):
+        """Test that chunks become one job, coalesced within the provider bar limit."""
+        instrument = Stock('AAPL', 'AAPL')
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        downloader.data_provider.get_supported_timeframes.return_value = [Period.Daily]
+        downloader.data_provider.get_min_start.return_value = None
+        downloader.data_provider.get_max_range.return_value = timedelta(days=365)
+        downloader.data_provider.get_max_bars.return_value = 600
+
+        jobs = downloader.create_jobs_for_undated_instrument(
+            instrument, start, end, [Period.Daily], None
+        )
+
+        assert len(jobs) == 1
+        assert (jobs[0].start_date, jobs[0].end_date) == (start, end)
+        assert len(jobs[0].fetch_ranges) == 2
+
+        downloader.data_provider.get_max_bars.return_value = 10000
+        jobs = downloader.create_jobs_for_undated_instrument(
+            instrument, start, end, [Period.Daily], None
+        )
+        assert jobs[0].fetch_ranges is None
+
     def test_create_jobs_for_undated_instrument_with_provider_min_start(self, downloader):
         """Test job creation when provider has minimum start date."""
         instrument = Stock('AAPL', 'AAPL')
@@ -10,12 +10,17 @@ from unittest.mock import MagicMock, Mock, patch
 import pandas as pd
 import pytest
 
+from vortex.exceptions import DataNotFoundError
 from vortex.services.download_job import DownloadJob
 from vortex.models.instrument import Instrument
 from vortex.models.period import Period
 from vortex.models.price_series import PriceSeries
+from vortex.models.columns import DATETIME_COLUMN_NAME
 from vortex.models.metadata import Metadata
+from vortex.models.stock import Stock
 from vortex.infrastructure.providers.base import DataProvider
+from vortex.infrastructure.storage.catalog import CatalogEntry, dataframe_checksum
+from vortex.infrastructure.storage.csv_storage import CsvStorage
 from vortex.infrastructure.storage.data_storage import DataStorage
 
 
@@ -290,6 +295,68 @@ class TestDownloadJob:
         mock_storage.persist.assert_called_once_with(mock_price_series, mock_instrument, mock_period)
         mock_backup_storage.persist.assert_not_called()
 
+    @pytest.fixture
+    def stored_series(self):
+        dates = pd.date_range('2024-01-01', periods=5, freq='D', tz='UTC')
+        df = pd.DataFrame({'Close': [1.0, 2.0, 3.0, 4.0, 5.0]}, index=dates)
+        return PriceSeries(df, Mock(spec=Metadata))
+
+    def test_is_stored_matches_catalogued_checksum(self, download_job, mock_storage, stored_series):
+        """Test that a series is stored when row count and checksum match."""
+        mock_storage.get_catalog_entry.return_value = CatalogEntry(
+            Mock(), 5, dataframe_checksum(stored_series.df)
+        )
+
+        assert download_job.is_stored(stored_series)
+
+    @pytest.mark.parametrize('row_count, checksum', [(5, 'other'), (4, None), (5, None)])
+    def test_is_stored_false_when_entry_differs(self, download_job, mock_storage, stored_series,
+                                                row_count, checksum):
+        """Test that changed or unverifiable series are not taken as stored."""
+        mock_storage.get_catalog_entry.return_value = CatalogEntry(Mock(), row_count, checksum)
+
+        assert not download_job.is_stored(stored_series)
+
+    def test_is_stored_requires_backup_copy(self, mock_provider, mock_storage, mock_backup_storage,
+                                            mock_instrument, mock_period, sample_dates, stored_series):
+        """Test that a series missing from the backup storage must still be written."""
+        job = DownloadJob(mock_provider, mock_storage, mock_instrument, mock_period, *sample_dates,
+                          backup_data_storage=mock_backup_storage)
+        mock_storage.get_catalog_entry.return_value = CatalogEntry(
+            Mock(), 5, dataframe_checksum(stored_series.df)
+        )
+        mock_backup_storage.get_catalog_entry.return_value = None
+
+        assert not job.is_stored(stored_series)
+
+    def test_update_metadata_reaches_every_storage(self, mock_provider, mock_storage, mock_backup_storage,
+                                                   mock_instrument, mock_period, sample_dates):
+        """Test that metadata updates go to the primary and backup storages."""
+        job = DownloadJob(mock_provider, mock_storage, mock_instrument, mock_period, *sample_dates,
+                          backup_data_storage=mock_backup_storage)
+        metadata = Mock(spec=Metadata)
+
+        job.update_metadata(metadata)
+
+        mock_storage.update_metadata.assert_called_once_with(metadata, mock_instrument, mock_period)
+        mock_backup_storage.update_metadata.assert_called_once_with(metadata, mock_instrument, mock_period)
+
+    def test_when_persisted_waits_for_every_storage(self, mock_provider, mock_storage,
+                                                    mock_backup_storage, mock_instrument,
+                                                    mock_period, sample_dates):
+        """Test that the callback runs once, after the primary and backup writes."""
+        job = DownloadJob(mock_provider, mock_storage, mock_instrument, mock_period, *sample_dates,
+                          backup_data_storage=mock_backup_storage)
+        callback = Mock()
+
+        job.when_persisted(callback)
+        mock_storage.when_written.call_args.args[2](None)
+        callback.assert_not_called()
+        error = OSError("disk full")
+        mock_backup_storage.when_written.call_args.args[2](error)
+
+        callback.assert_called_once_with(error)
+
     @patch('vortex.services.download_job.Metadata')
     def test_fetch_success(self, mock_metadata_class, download_job, mock_provider, mock_instrument):
         """Test successful data fetching."""
@@ -331,4 +398,91 @@ class TestDownloadJob:
         mock_provider.fetch_historical_data.side_effect = Exception("Provider failed")
         
         with pytest.raises(Exception, match="Provider failed"):
-            download_job.fetch()
\ No newline at end of file
+            download_job.fetch()
+
+    def test_fetch_ranges_are_clipped_to_narrowed_job(self, download_job):
+        """Test that a narrowed job only requests the ranges it still needs."""
+        download_job.fetch_ranges = [
+            (datetime(2024, 1, 1), datetime(2024, 1, 11)),
+            (datetime(2024, 1, 11), datetime(2024, 1, 21)),
+            (datetime(2024, 1, 21), datetime(2024, 1, 31)),
+        ]
+        download_job.start_date = datetime(2024, 1, 15)
+
+        assert download_job.get_fetch_ranges() == [
+            (datetime(2024, 1, 15), datetime(2024, 1, 21)),
+            (datetime(2024, 1, 21), datetime(2024, 1, 31)),
+        ]
+
+    def test_fetch_ranges_cover_job_widened_to_stored_series(self, download_job):
+        """Test a job widened past its ranges requests the extra span too."""
+        download_job.fetch_ranges = [
+            (datetime(2024, 1, 1), datetime(2024, 1, 16)),
+            (datetime(2024, 1, 16), datetime(2024, 1, 31)),
+        ]
+        download_job.end_date = datetime(2024, 3, 1)
+
+        assert download_job.get_fetch_ranges()[-1] == (datetime(2024, 1, 31), datetime(2024, 3, 1))
+
+    @patch('vortex.services.download_job.Metadata')
+    def test_fetch_multiple_ranges_combines_frames(self, mock_metadata_class, download_job,
+                                                   mock_provider, mock_period):
+        """Test that each range is requested and the frames joined once."""
+        download_job.fetch_ranges = [
+            (datetime(2024, 1, 1), datetime(2024, 1, 16)),
+            (datetime(2024, 1, 16), datetime(2024, 1, 31)),
+        ]
+        first = pd.DataFrame({'price': [1, 2]}, index=pd.to_datetime(['2024-01-02', '2024-01-16']))
+        second = pd.DataFrame({'price': [3, 4]}, index=pd.to_datetime(['2024-01-16', '2024-01-30']))
+        not_found = DataNotFoundError(
+            provider="test", symbol="AAPL", period=Period.Daily,
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 16)
+        )
+        mock_provider.fetch_historical_data.side_effect = [first, second]
+
+        result = download_job.fetch()
+
+        assert mock_provider.fetch_historical_data.call_count == 2
+        assert list(result.df['price']) == [1, 3, 4]
+
+        mock_provider.fetch_historical_data.side_effect = [not_found, second]
+        assert list(download_job.fetch().df['price']) == [3, 4]
+
+        mock_provider.fetch_historical_data.side_effect = [not_found, not_found]
+        with pytest.raises(DataNotFoundError):
+            download_job.fetch()
+
+
+class TestDownloadJobCsvStorage:
+    """Unchanged-data detection against a real CSV primary storage."""
+
+    @staticmethod
+    def make_series(dates, closes):
+        df = pd.DataFrame({
+            'Open': [close - 0.13 for close in closes],
+            'High': [close + 0.37 for close in closes],
+            'Low': [close - 0.41 for close in closes],
+            'Close': closes,
+            'Volume': [int(close * 1000) for close in closes],
+        }, index=dates)
+        df.index.name = DATETIME_COLUMN_NAME
+        metadata = Metadata.create_metadata(
+            df, 'test', 'AAPL', Period.Daily, dates[0].to_pydatetime(), dates[-1].to_pydatetime()
+        )
+        return PriceSeries(df, metadata)
+
+    def test_refetched_float_prices_are_stored(self, tmp_path):
+        """Test that refetching stored bars of a reloaded CSV series is detected as unchanged."""
+        storage = CsvStorage(str(tmp_path), dry_run=False)
+        stock = Stock(id='AAPL', symbol='AAPL')
+        dates = pd.date_range('2024-01-01', periods=250, freq='D', tz='UTC')
+        closes = [187.15 + i * 0.0731 + (i % 7) / 3 for i in range(250)]
+        job = DownloadJob(Mock(spec=DataProvider), storage, stock, Period.Daily,
+                          datetime(2024, 1, 1), datetime(2024, 9, 6))
+        job.persist(self.make_series(dates, closes))
+
+        existing = job.load()
+        fetched = self.make_series(dates[-10:], closes[-10:])
+        merged = fetched.merge(existing)
+
+        assert job.is_stored(merged)
@@ -0,0 +1,140 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.download_job import DownloadJob
+from vortex.services.download_pipeline import DownloadPipeline
+from vortex.services.job_runner import job_lock_key
+
+
+def make_job(symbol, period=Period.Daily):
+    return DownloadJob(
+        Mock(), Mock(), Stock(id=symbol, symbol=symbol), period,
+        datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+
+def symbol_of(job):
+    return job.instrument.symbol
+
+
+def parse_symbol(symbol):
+    return symbol.lower()
+
+
+class TestDownloadPipeline:
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            DownloadPipeline(fetch_workers=0)
+        with pytest.raises(ValueError):
+            DownloadPipeline(cpu_workers=-1)
+        with pytest.raises(ValueError):
+            DownloadPipeline(queue_size=0)
+
+    def test_fetched_items_are_parsed_and_persisted(self):
+        jobs = [make_job(s) for s in ["AAPL", "MSFT", "GOOGL"]]
+        pipeline = DownloadPipeline(fetch_workers=2, cpu_workers=0)
+
+        results = list(pipeline.run(
+            jobs, symbol_of, parse_symbol, lambda job, parsed: parsed()
+        ))
+
+        assert {r[0].instrument.symbol: r[1] for r in results} == {
+            "AAPL": "aapl", "MSFT": "msft", "GOOGL": "googl"
+        }
+        assert all(r[2] is None for r in results)
+
+    def test_parse_runs_in_worker_process(self):
+        jobs = [make_job(s) for s in ["AAPL", "MSFT"]]
+        pipeline = DownloadPipeline(fetch_workers=2, cpu_workers=1)
+
+        results = list(pipeline.run(
+            jobs, symbol_of, parse_symbol, lambda job, parsed: parsed()
+        ))
+
+        assert sorted(r[1] for r in results) == ["aapl", "msft"]
+
+    def test_final_fetch_results_skip_parse_and_persist(self):
+        parse = Mock()
+        persist = Mock()
+        pipeline = DownloadPipeline(cpu_workers=0)
+
+        results = list(pipeline.run(
+            [make_job("AAPL")], lambda job: HistoricalDataResult.EXISTS, parse, persist
+        ))
+
+        assert results[0][1] == HistoricalDataResult.EXISTS
+        parse.assert_not_called()
+        persist.assert_not_called()
+
+    def test_errors_are_yielded_not_raised(self):
+        error = ValueError("bad bars")
+
+        def parse(symbol):
+            raise error
+
+        def persist(job, parsed):
+            return parsed()
+
+        pipeline = DownloadPipeline(cpu_workers=0)
+        results = list(pipeline.run([make_job("AAPL")], symbol_of, parse, persist))
+
+        assert results[0][1] is None
+        assert results[0][2] is error
+
+    def test_jobs_for_same_file_never_overlap(self):
+        jobs = [make_job("AAPL") for _ in range(6)]
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def fetch(job):
+            with lock:
+                active.append(job_lock_key(job))
+                if active.count(job_lock_key(job)) > 1:
+                    overlaps.append(job)
+            return job
+
+        def persist(job, parsed):
+            time.sleep(0.01)
+            with lock:
+                active.remove(job_lock_key(job))
+
+        list(DownloadPipeline(fetch_workers=4, cpu_workers=0).run(
+            jobs, fetch, lambda job: job, persist
+        ))
+
+        assert overlaps == []
+
+    def test_single_job_provider_fetches_in_calling_thread(self):
+        jobs = [make_job(f"S{i}") for i in range(3)]
+        fetch_threads = []
+
+        def fetch(job):
+            fetch_threads.append(threading.current_thread())
+            return job
+
+        pipeline = DownloadPipeline(fetch_workers=6, cpu_workers=0, provider_name="ibkr")
+        results = list(pipeline.run(jobs, fetch, lambda job: job, lambda job, parsed: "done"))
+
+        assert pipeline.fetch_in_caller
+        assert fetch_threads == [threading.current_thread()] * 3
+        assert [r[1] for r in results] == ["done"] * 3
+
+    def test_persist_runs_off_the_fetch_threads(self):
+        persist_threads = []
+
+        def persist(job, parsed):
+            persist_threads.append(threading.current_thread().name)
+
+        list(DownloadPipeline(cpu_workers=0).run(
+            [make_job("AAPL")], lambda job: job, lambda job: job, persist
+        ))
+
+        assert persist_threads == ["vortex-persist"]
@@ -39,7 +39,6 @@ def create_barchart_downloader(config: VortexConfig, download_dir: str, mock_log
         data_provider, 
         backup_data_storage,
         force_backup=config.general.force_backup, 
-        random_sleep_in_sec=config.general.random_sleep_max,
         dry_run=config.general.dry_run
     )
 
@@ -180,7 +179,6 @@ class TestUpdatingDownloader:
             data_provider=mock_data_provider,
             backup_data_storage=None,
             force_backup=False,
-            random_sleep_in_sec=1,
             dry_run=True
         )
         
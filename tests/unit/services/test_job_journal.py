@@ -0,0 +1,121 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from vortex.exceptions import DataNotFoundError
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.base_downloader import BaseDownloader
+from vortex.services.download_job import DownloadJob
+from vortex.services.job_journal import JOURNAL_FILE_NAME, JobJournal
+
+
+def make_job(symbol):
+    return DownloadJob(
+        Mock(), Mock(), Stock(id=symbol, symbol=symbol), Period.Daily,
+        datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+
+class TestJobJournal:
+    def test_open_creates_journal_in_directory(self, tmp_path):
+        journal = JobJournal.open(tmp_path / "data")
+
+        assert journal.path == tmp_path / "data" / JOURNAL_FILE_NAME
+        assert journal.path.exists()
+        journal.close()
+
+    def test_completed_jobs_survive_reopen_with_resume(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        journal.plan(["a", "b", "c"])
+        journal.mark_completed("a", "OK")
+        journal.mark_failed("b", "boom")
+        journal.close()
+
+        resumed = JobJournal.open(tmp_path, resume=True)
+
+        assert resumed.completed_keys() == {"a"}
+        assert resumed.is_completed("a")
+        assert not resumed.is_completed("b")
+        assert not resumed.is_completed("c")
+        resumed.close()
+
+    def test_open_without_resume_starts_over(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        journal.plan(["a"])
+        journal.mark_completed("a")
+        journal.close()
+
+        fresh = JobJournal.open(tmp_path)
+
+        assert fresh.completed_keys() == set()
+        fresh.close()
+
+    def test_plan_keeps_existing_status(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        journal.plan(["a"])
+        journal.mark_completed("a")
+
+        journal.plan(["a", "b"])
+
+        assert journal.completed_keys() == {"a"}
+        journal.close()
+
+    def test_deferred_series_survive_new_runs(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        journal.update_deferred(["AAPL|1d", "MSFT|1d"], [])
+        journal.close()
+
+        fresh = JobJournal.open(tmp_path)
+        fresh.update_deferred(["MSFT|1d"], ["AAPL|1d"])
+
+        assert fresh.deferred_keys() == {"MSFT|1d"}
+        fresh.close()
+
+
+class JournaledDownloader(BaseDownloader):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed = []
+
+    def _process_job(self, job):
+        self.processed.append(job.instrument.symbol)
+        # Jobs narrow their own date range while running
+        job.start_date = datetime(2024, 1, 15)
+        if job.instrument.symbol == "MISSING":
+            raise DataNotFoundError(
+                provider="test", symbol="MISSING", period=Period.Daily,
+                start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+            )
+        if job.instrument.symbol == "CRASH":
+            raise RuntimeError("killed")
+        return HistoricalDataResult.OK
+
+
+class TestResumableProcessJobs:
+    def test_resume_skips_completed_jobs(self, tmp_path):
+        symbols = ["AAPL", "MISSING", "CRASH", "MSFT"]
+        journal = JobJournal.open(tmp_path)
+        first = JournaledDownloader(Mock(), Mock(), job_journal=journal)
+
+        with pytest.raises(RuntimeError):
+            first._process_jobs([make_job(s) for s in symbols])
+        journal.close()
+
+        resumed_journal = JobJournal.open(tmp_path, resume=True)
+        resumed = JournaledDownloader(Mock(), Mock(), job_journal=resumed_journal)
+        with pytest.raises(RuntimeError):
+            resumed._process_jobs([make_job(s) for s in symbols])
+
+        assert first.processed == ["AAPL", "MISSING", "CRASH"]
+        assert resumed.processed == ["CRASH"]
+        resumed_journal.close()
+
+    def test_without_journal_all_jobs_run(self):
+        downloader = JournaledDownloader(Mock(), Mock())
+
+        downloader._process_jobs([make_job("AAPL"), make_job("MSFT")])
+
+        assert downloader.processed == ["AAPL", "MSFT"]
@@ -0,0 +1,152 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vortex.exceptions import DataNotFoundError
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.base_downloader import BaseDownloader
+from vortex.services.download_job import DownloadJob
+from vortex.services.job_runner import (
+    DEFAULT_MAX_CONCURRENT_JOBS,
+    JobRunner,
+    get_provider_max_concurrency,
+    job_lock_key,
+)
+
+
+def make_job(symbol, period=Period.Daily):
+    return DownloadJob(
+        Mock(), Mock(), Stock(id=symbol, symbol=symbol), period,
+        datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+
+class TestJobRunner:
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            JobRunner(max_workers=0)
+
+    def test_serial_run_preserves_order(self):
+        jobs = [make_job(s) for s in ["AAPL", "MSFT", "GOOGL"]]
+        runner = JobRunner(max_workers=1)
+
+        results = list(runner.run(jobs, lambda job: job.instrument.symbol))
+
+        assert [r[0] for r in results] == jobs
+        assert [r[1] for r in results] == ["AAPL", "MSFT", "GOOGL"]
+        assert all(r[2] is None for r in results)
+
+    def test_errors_are_yielded_not_raised(self):
+        error = RuntimeError("boom")
+
+        def process(job):
+            raise error
+
+        runner = JobRunner(max_workers=2)
+        results = list(runner.run([make_job("AAPL")], process))
+
+        assert results[0][1] is None
+        assert results[0][2] is error
+
+    def test_concurrent_run_processes_all_jobs(self):
+        jobs = [make_job(f"S{i}") for i in range(20)]
+        runner = JobRunner(max_workers=4)
+
+        results = list(runner.run(jobs, lambda job: HistoricalDataResult.OK))
+
+        assert len(results) == 20
+        assert {id(r[0]) for r in results} == {id(j) for j in jobs}
+
+    def test_jobs_for_same_file_never_overlap(self):
+        jobs = [make_job("AAPL") for _ in range(6)]
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def process(job):
+            with lock:
+                active.append(job_lock_key(job))
+                if active.count(job_lock_key(job)) > 1:
+                    overlaps.append(job)
+            time.sleep(0.01)
+            with lock:
+                active.remove(job_lock_key(job))
+
+        list(JobRunner(max_workers=4).run(jobs, process))
+
+        assert overlaps == []
+
+    def test_provider_cap_limits_concurrency(self):
+        jobs = [make_job(f"S{i}") for i in range(6)]
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def process(job):
+            with lock:
+                running.append(job)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(job)
+
+        list(JobRunner(max_workers=6, provider_name="barchart").run(jobs, process))
+
+        assert max(peak) <= 2
+
+    def test_single_job_provider_runs_in_calling_thread(self):
+        jobs = [make_job(f"S{i}") for i in range(3)]
+        runner = JobRunner(max_workers=6, provider_name="ibkr")
+
+        results = list(runner.run(jobs, lambda job: threading.current_thread()))
+
+        assert not runner.is_concurrent
+        assert [r[1] for r in results] == [threading.current_thread()] * 3
+
+    def test_provider_max_concurrency_lookup(self):
+        assert get_provider_max_concurrency("barchart") == 2
+        assert get_provider_max_concurrency("IBKR") == 1
+        assert get_provider_max_concurrency("unknown") == DEFAULT_MAX_CONCURRENT_JOBS
+        assert get_provider_max_concurrency(None) == DEFAULT_MAX_CONCURRENT_JOBS
+
+
+class PooledDownloader(BaseDownloader):
+    def _process_job(self, job):
+        if job.instrument.symbol == "MISSING":
+            raise DataNotFoundError(
+                provider="test", symbol="MISSING", period=Period.Daily,
+                start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+            )
+        return HistoricalDataResult.OK
+
+
+class TestPooledProcessJobs:
+    def test_pooled_process_jobs_accounts_not_found(self):
+        provider = Mock()
+        provider.get_name.return_value = "yahoo"
+        downloader = PooledDownloader(Mock(), provider, max_workers=4)
+        jobs = [make_job("AAPL"), make_job("MISSING"), make_job("MSFT")]
+
+        with patch("vortex.services.base_downloader.logging") as mock_logging:
+            mock_logging.INFO = 20
+            downloader._process_jobs(jobs)
+
+        warnings = " ".join(str(c) for c in mock_logging.warning.call_args_list)
+        assert "MISSING" in warnings
+        progress = [str(c) for c in mock_logging.info.call_args_list if "jobs processed" in str(c)]
+        assert any("3/3 jobs processed" in p and "2 downloads" in p for p in progress)
+
+    def test_pooled_process_jobs_reraises_unexpected_errors(self):
+        class FailingDownloader(BaseDownloader):
+            def _process_job(self, job):
+                raise RuntimeError("unexpected")
+
+        downloader = FailingDownloader(Mock(), Mock(), max_workers=2)
+
+        with pytest.raises(RuntimeError, match="unexpected"):
+            downloader._process_jobs([make_job("AAPL")])
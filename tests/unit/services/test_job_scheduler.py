@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.infrastructure.storage.catalog import CatalogEntry
+from vortex.models.future import Future
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.stock import Stock
+from vortex.services.download_job import DownloadJob
+from vortex.services.job_journal import JobJournal
+from vortex.services.job_scheduler import (
+    JobPriority,
+    PriorityScheduler,
+    RoundRobinScheduler,
+    instrument_weight,
+    is_stale,
+)
+from vortex.services.mock_downloader import MockDownloader
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_job(instrument, last_row_date=None):
+    storage = Mock()
+    storage.get_sidecar_metadata.return_value = None
+    storage.get_catalog_entry.return_value = None
+    if last_row_date is not None:
+        metadata = Metadata(instrument.get_symbol(), Period.Daily, last_row_date - timedelta(days=30),
+                            last_row_date, last_row_date - timedelta(days=30), last_row_date)
+        storage.get_catalog_entry.return_value = CatalogEntry(metadata, 30)
+    return DownloadJob(Mock(), storage, instrument, Period.Daily, NOW - timedelta(days=60), NOW)
+
+
+def make_future(year, month_code):
+    return Future("GC", "GC", year, month_code, None, 360)
+
+
+class TestPriorityScheduler:
+    def test_front_month_then_stale_then_backfill(self):
+        next_year = NOW.year + 1
+        deferred_contract = make_job(make_future(next_year, "Z"))
+        front_contract = make_job(make_future(next_year, "G"))
+        backfill = make_job(Stock("AAPL", "AAPL"))
+        stale = make_job(Stock("MSFT", "MSFT"), last_row_date=NOW - timedelta(days=10))
+
+        scheduled = PriorityScheduler().schedule(
+            {"GC": {"cycle": "GZ"}, "AAPL": {}, "MSFT": {}},
+            {"GC": [front_contract, deferred_contract], "AAPL": [backfill], "MSFT": [stale]},
+        )
+
+        assert scheduled[0] is front_contract
+        assert scheduled[1] is stale
+
+    def test_up_to_date_series_is_not_stale(self):
+        current = make_job(Stock("AAPL", "AAPL"), last_row_date=NOW - timedelta(days=1))
+        stale = make_job(Stock("MSFT", "MSFT"), last_row_date=NOW - timedelta(days=10))
+
+        assert not is_stale(current)
+        assert is_stale(stale)
+        scheduled = PriorityScheduler().schedule({"AAPL": {}, "MSFT": {}}, {"AAPL": [current], "MSFT": [stale]})
+        assert scheduled == [stale, current]
+
+    def test_instruments_share_a_tier_by_weight(self):
+        heavy = [make_job(Stock("HEAVY", "HEAVY")) for _ in range(6)]
+        light = [make_job(Stock("LIGHT", "LIGHT")) for _ in range(2)]
+
+        scheduled = PriorityScheduler().schedule(
+            {"HEAVY": {"cycle": "FGHJKMNQUVXZ"}, "LIGHT": {"cycle": "H"}},
+            {"HEAVY": heavy, "LIGHT": light},
+        )
+
+        assert [j.instrument.symbol for j in scheduled[:4]] == ["HEAVY"] * 3 + ["LIGHT"]
+        assert [j.instrument.symbol for j in scheduled[4:]] == ["HEAVY"] * 3 + ["LIGHT"]
+
+    def test_user_priority_breaks_ties(self):
+        low, high = make_job(Stock("LOW", "LOW")), make_job(Stock("HIGH", "HIGH"))
+
+        scheduled = PriorityScheduler().schedule(
+            {"LOW": {}, "HIGH": {"priority": 5}}, {"LOW": [low], "HIGH": [high]}
+        )
+
+        assert scheduled == [high, low]
+
+    def test_carried_over_series_lead_their_tier(self):
+        fresh, carried = make_job(Stock("NEW", "NEW")), make_job(Stock("OLD", "OLD"))
+        stale = make_job(Stock("MSFT", "MSFT"), last_row_date=NOW - timedelta(days=10))
+
+        scheduled = PriorityScheduler(carried_over={f"{carried.instrument}|{carried.period}"}).schedule(
+            {"NEW": {"priority": 5}, "OLD": {}, "MSFT": {}},
+            {"NEW": [fresh], "OLD": [carried], "MSFT": [stale]},
+        )
+
+        assert scheduled == [stale, carried, fresh]
+
+    def test_deadline_defers_low_priority_jobs(self):
+        scheduler = PriorityScheduler(deadline=datetime.now() - timedelta(minutes=1))
+        backfill = make_job(Stock("AAPL", "AAPL"))
+        stale = make_job(Stock("MSFT", "MSFT"), last_row_date=NOW - timedelta(days=10))
+        scheduler.schedule({}, {"AAPL": [backfill], "MSFT": [stale]})
+
+        assert scheduler.queue_depth == 2
+        assert scheduler.start(stale) is True
+        assert scheduler.start(backfill) is False
+        assert scheduler.queue_depth == 0
+        assert scheduler.deferred_count == 1
+
+    def test_wait_times_are_tracked(self):
+        scheduler = PriorityScheduler()
+        job = make_job(Stock("AAPL", "AAPL"))
+        scheduler.schedule({}, {"AAPL": [job]})
+
+        assert scheduler.start(job) is True
+        assert 0 <= scheduler.max_wait_seconds
+        assert scheduler.mean_wait_seconds == scheduler.max_wait_seconds
+
+    def test_custom_priority_tiers_are_reported_by_number(self):
+        metrics = Mock()
+        with patch("vortex.services.job_scheduler.get_metrics", return_value=metrics, create=True), \
+                patch("vortex.services.job_scheduler._metrics_available", True):
+            scheduler = PriorityScheduler(priority=lambda job, front_months: 5)
+        job = make_job(Stock("AAPL", "AAPL"))
+        scheduler.schedule({}, {"AAPL": [job]})
+
+        assert scheduler.start(job) is True
+        assert metrics.record_scheduler_wait.call_args.args[0] == "5"
+
+
+class TestRoundRobinScheduler:
+    def test_turns_follow_roll_cycle_length(self):
+        long_jobs = [make_job(Stock("LONG", "LONG")) for _ in range(4)]
+        short_jobs = [make_job(Stock("SHORT", "SHORT")) for _ in range(2)]
+
+        scheduled = RoundRobinScheduler().schedule(
+            {"LONG": {"cycle": "FGHJKMNQUVXZ"}, "SHORT": {"cycle": "HM"}},
+            {"LONG": long_jobs, "SHORT": short_jobs},
+        )
+
+        assert scheduled == long_jobs[:3] + short_jobs[:1] + long_jobs[3:] + short_jobs[1:]
+
+    def test_instrument_weight(self):
+        assert instrument_weight({"cycle": None}) == 1
+        assert instrument_weight({"cycle": "FGHJKMNQ"}) == 2
+        assert instrument_weight(Mock(cycle="FGHJKMNQUVXZ")) == 3
+
+
+class TestDeferredJobs:
+    def test_deferred_jobs_are_not_processed_or_journaled(self, tmp_path):
+        journal = JobJournal.open(tmp_path)
+        scheduler = PriorityScheduler(deadline=datetime.now() - timedelta(minutes=1))
+        downloader = MockDownloader(Mock(), Mock(), job_journal=journal, scheduler=scheduler)
+        job = make_job(Stock("AAPL", "AAPL"))
+        scheduler.schedule({}, {"AAPL": [job]})
+
+        with patch.object(downloader, "_process_job") as mock_process:
+            downloader._process_jobs([job])
+
+        mock_process.assert_not_called()
+        assert journal.completed_keys() == set()
+        journal.close()
+
+    def test_unscheduled_jobs_always_start(self):
+        scheduler = PriorityScheduler(deadline=datetime.now() - timedelta(minutes=1))
+        downloader = MockDownloader(Mock(), Mock(), scheduler=scheduler)
+
+        results = [result for _, result, _ in downloader._run_jobs([make_job(Stock("A", "A"))])]
+
+        assert results == [HistoricalDataResult.OK]
@@ -0,0 +1,110 @@
+import os
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from vortex.infrastructure.storage.csv_storage import CsvStorage
+from vortex.infrastructure.storage.metadata import MetadataHandler
+from vortex.models.columns import DATETIME_INDEX_NAME
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.models.price_series import PriceSeries
+from vortex.models.stock import Stock
+from vortex.services.download_job import DownloadJob
+from vortex.services.preflight import is_job_satisfied, preflight_jobs
+from vortex.services.updating_downloader import UpdatingDownloader
+
+
+def make_series():
+    index = pd.DatetimeIndex(
+        [datetime(2024, 1, d, tzinfo=timezone.utc) for d in (1, 2, 3)],
+        name=DATETIME_INDEX_NAME,
+    )
+    df = pd.DataFrame({
+        'Open': [1.0] * 3, 'High': [2.0] * 3, 'Low': [0.5] * 3,
+        'Close': [1.5] * 3, 'Volume': [100] * 3,
+    }, index=index)
+    metadata = Metadata.create_metadata(
+        df, 'yahoo', 'AAPL', Period.Daily,
+        datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 3, tzinfo=timezone.utc)
+    )
+    return PriceSeries(df, metadata)
+
+
+def make_job(storage, symbol='AAPL', end=datetime(2024, 1, 3, tzinfo=timezone.utc), backup=None):
+    return DownloadJob(
+        Mock(), storage, Stock(id=symbol, symbol=symbol), Period.Daily,
+        datetime(2024, 1, 1, tzinfo=timezone.utc), end, backup
+    )
+
+
+class TestPreflight:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return CsvStorage(str(tmp_path), dry_run=False)
+
+    def test_catalogued_series_is_satisfied_without_loading(self, storage):
+        job = make_job(storage)
+        storage.persist(make_series(), job.instrument, job.period)
+
+        with patch.object(storage, '_load') as mock_load:
+            plan = preflight_jobs([job])
+
+        mock_load.assert_not_called()
+        assert plan.satisfied == [job]
+        assert plan.pending == []
+
+    def test_legacy_sidecar_is_used_when_not_catalogued(self, storage):
+        job = make_job(storage)
+        series = make_series()
+        file_path = storage._make_file_path_for_instrument(job.instrument, job.period)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        storage._persist(series.df, file_path)
+        MetadataHandler(file_path).set_metadata(series.metadata)
+
+        assert storage.get_catalog_entry(job.instrument, job.period) is None
+        assert is_job_satisfied(job)
+
+    def test_missing_and_stale_series_are_pending(self, storage):
+        stored = make_job(storage, end=datetime(2024, 3, 31, tzinfo=timezone.utc))
+        storage.persist(make_series(), stored.instrument, stored.period)
+        missing = make_job(storage, symbol='MSFT')
+
+        plan = preflight_jobs([stored, missing])
+
+        assert plan.satisfied == []
+        assert plan.pending == [stored, missing]
+
+    def test_backup_storage_is_consulted(self, storage, tmp_path):
+        backup = CsvStorage(str(tmp_path / "backup"), dry_run=False)
+        job = make_job(storage, backup=backup)
+        backup.persist(make_series(), job.instrument, job.period)
+
+        assert is_job_satisfied(job)
+
+
+class TestUpdatingDownloaderPreflight:
+    def test_download_skips_satisfied_jobs(self, tmp_path):
+        storage = CsvStorage(str(tmp_path), dry_run=False)
+        downloader = UpdatingDownloader(storage, Mock(get_remaining_allowance=Mock(return_value=None)))
+        satisfied, pending = make_job(storage), make_job(storage, symbol='MSFT')
+        storage.persist(make_series(), satisfied.instrument, satisfied.period)
+
+        with patch.object(downloader, '_create_jobs', return_value=[satisfied, pending]), \
+                patch.object(downloader, '_process_jobs') as mock_process:
+            downloader.download_legacy({}, 2024, 2024)
+
+        mock_process.assert_called_once_with([pending])
+
+    def test_force_backup_keeps_every_job(self, tmp_path):
+        storage = CsvStorage(str(tmp_path), dry_run=False)
+        downloader = UpdatingDownloader(storage, Mock(), backup_data_storage=Mock(),
+                                        force_backup=True)
+        job = make_job(storage)
+        storage.persist(make_series(), job.instrument, job.period)
+
+        plan = downloader.preflight([job])
+
+        assert plan.pending == [job]
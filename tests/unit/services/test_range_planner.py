@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from vortex.models.period import Period
+from vortex.services.range_planner import coalesce_date_ranges, estimate_bar_count
+from vortex.utils.utils import date_range_generator
+
+
+def yearly_ranges(start_year, end_year):
+    return list(date_range_generator(
+        datetime(start_year, 1, 1), datetime(end_year, 1, 1), timedelta(days=365)
+    ))
+
+
+class TestEstimateBarCount:
+    def test_daily_counts_business_days(self):
+        # Monday to Sunday
+        assert estimate_bar_count(Period.Daily, datetime(2024, 1, 1), datetime(2024, 1, 7)) == 5
+
+    def test_intraday_counts_every_step(self):
+        count = estimate_bar_count(Period.Hourly, datetime(2024, 1, 1), datetime(2024, 1, 2))
+        assert count == 25
+
+
+class TestCoalesceDateRanges:
+    def test_merges_adjacent_ranges_within_bar_limit(self):
+        ranges = yearly_ranges(2020, 2024)
+
+        merged = coalesce_date_ranges(ranges, Period.Daily, 10000)
+
+        assert merged == [(ranges[0][0], ranges[-1][1])]
+
+    def test_splits_when_bar_limit_is_exceeded(self):
+        ranges = yearly_ranges(2020, 2024)
+
+        merged = coalesce_date_ranges(ranges, Period.Daily, 600)
+
+        assert len(merged) == 2
+        assert merged[0] == (ranges[0][0], ranges[1][1])
+        assert merged[-1][1] == ranges[-1][1]
+
+    def test_unknown_bar_limit_keeps_ranges(self):
+        ranges = yearly_ranges(2020, 2024)
+
+        assert coalesce_date_ranges(ranges, Period.Daily, None) == ranges
@@ -4,10 +4,15 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
-from vortex.services.updating_downloader import UpdatingDownloader
+from vortex.services.download_pipeline import DownloadPipeline
+from vortex.services.updating_downloader import PendingParse, UpdatingDownloader
 from vortex.services.download_job import DownloadJob
-from vortex.infrastructure.providers.base import HistoricalDataResult
+from vortex.infrastructure.providers.base import HistoricalDataResult, parsing_deferred
 from vortex.models.price_series import PriceSeries
+from vortex.models.metadata import Metadata
+from vortex.models.period import Period
+from vortex.infrastructure.storage.catalog import CatalogEntry
+from vortex.services.job_journal import JobJournal
 
 
 class TestUpdatingDownloader:
@@ -55,7 +60,6 @@ class TestUpdatingDownloader:
         assert downloader.backup_data_storage is None
         assert downloader.force_backup is False
         assert downloader.dry_run is False
-        assert downloader.random_sleep_in_sec is None
     
     def test_downloader_initialization_with_options(self, mock_storage, mock_provider, mock_backup_storage):
         """Test UpdatingDownloader initialization with all options."""
@@ -64,7 +68,6 @@ class TestUpdatingDownloader:
             data_provider=mock_provider,
             backup_data_storage=mock_backup_storage,
             force_backup=True,
-            random_sleep_in_sec=5,
             dry_run=True
         )
         
@@ -73,32 +76,14 @@ class TestUpdatingDownloader:
         assert downloader.backup_data_storage == mock_backup_storage
         assert downloader.force_backup is True
         assert downloader.dry_run is True
-        assert downloader.random_sleep_in_sec == 5
-    
-    def test_downloader_initialization_zero_sleep(self, mock_storage, mock_provider):
-        """Test that zero sleep value gets set to None."""
-        downloader = UpdatingDownloader(
-            data_storage=mock_storage,
-            data_provider=mock_provider,
-            random_sleep_in_sec=0
-        )
-        
-        assert downloader.random_sleep_in_sec is None
-    
-    def test_downloader_initialization_negative_sleep(self, mock_storage, mock_provider):
-        """Test that negative sleep value gets set to None."""
-        downloader = UpdatingDownloader(
-            data_storage=mock_storage,
-            data_provider=mock_provider,
-            random_sleep_in_sec=-5
-        )
-        
-        assert downloader.random_sleep_in_sec is None
     
     def test_process_job_existing_data_acceptable(self, downloader):
         """Test processing job when existing data is acceptable."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2023, 1, 1)
         mock_job.end_date = datetime(2023, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -119,26 +104,13 @@ class TestUpdatingDownloader:
             datetime(2023, 1, 1), datetime(2023, 12, 31)
         )
     
-    @patch('vortex.services.updating_downloader.random_sleep')
-    def test_pretend_not_a_bot_with_sleep(self, mock_sleep, downloader):
-        """Test pretend_not_a_bot with random sleep enabled."""
-        downloader.random_sleep_in_sec = 10
-        
-        downloader.pretend_not_a_bot()
-        
-        mock_sleep.assert_called_once_with(10)
-    
-    def test_pretend_not_a_bot_without_sleep(self, downloader):
-        """Test pretend_not_a_bot without random sleep."""
-        downloader.random_sleep_in_sec = None
-        
-        # Should not raise an exception
-        downloader.pretend_not_a_bot()
-    
     def test_process_job_existing_data_force_backup(self, downloader_with_backup):
         """Test processing job with existing data and force backup."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2023, 1, 1)
         mock_job.end_date = datetime(2023, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -170,6 +142,9 @@ class TestUpdatingDownloader:
         """Test processing job when no existing data is found."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2023, 1, 1)
         mock_job.end_date = datetime(2023, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -189,9 +164,7 @@ class TestUpdatingDownloader:
         mock_job.fetch.return_value = mock_new_data
         mock_job.persist = Mock()
         
-        # Mock pretend_not_a_bot
-        with patch.object(downloader, 'pretend_not_a_bot'):
-            result = downloader._process_job(mock_job)
+        result = downloader._process_job(mock_job)
         
         # Verify new data was fetched and persisted
         mock_job.fetch.assert_called_once()
@@ -230,27 +203,13 @@ class TestUpdatingDownloaderEdgeCases:
             data_provider=mock_provider
         )
     
-    def test_random_sleep_configuration_edge_cases(self):
-        """Test various edge cases for random sleep configuration."""
-        mock_storage = Mock()
-        mock_provider = Mock()
-        
-        # Test None value
-        downloader = UpdatingDownloader(mock_storage, mock_provider, random_sleep_in_sec=None)
-        assert downloader.random_sleep_in_sec is None
-        
-        # Test valid positive value
-        downloader = UpdatingDownloader(mock_storage, mock_provider, random_sleep_in_sec=15)
-        assert downloader.random_sleep_in_sec == 15
-        
-        # Test that zero becomes None
-        downloader = UpdatingDownloader(mock_storage, mock_provider, random_sleep_in_sec=0)
-        assert downloader.random_sleep_in_sec is None
-    
     def test_process_job_existing_data_needs_more_coverage(self, downloader):
         """Test processing job when existing data needs more coverage."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2023, 1, 1)
         mock_job.end_date = datetime(2023, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -275,9 +234,7 @@ class TestUpdatingDownloaderEdgeCases:
         mock_job.fetch.return_value = mock_new_data
         mock_job.persist = Mock()
         
-        # Mock pretend_not_a_bot
-        with patch.object(downloader, 'pretend_not_a_bot'):
-            result = downloader._process_job(mock_job)
+        result = downloader._process_job(mock_job)
         
         # Verify that job dates were adjusted (lines 43-55)
         # Should adjust start date based on existing data
@@ -291,6 +248,9 @@ class TestUpdatingDownloaderEdgeCases:
         """Test processing job when there's a gap before existing data start."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2022, 1, 1)
         mock_job.end_date = datetime(2022, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -315,9 +275,7 @@ class TestUpdatingDownloaderEdgeCases:
         mock_job.fetch.return_value = mock_new_data
         mock_job.persist = Mock()
         
-        # Mock pretend_not_a_bot
-        with patch.object(downloader, 'pretend_not_a_bot'):
-            result = downloader._process_job(mock_job)
+        result = downloader._process_job(mock_job)
         
         # Should adjust end date to avoid holes (line 54-55)
         mock_job.fetch.assert_called_once()
@@ -328,6 +286,9 @@ class TestUpdatingDownloaderEdgeCases:
         """Test processing job when fetch returns None."""
         # Create mock download job
         mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = None
         mock_job.start_date = datetime(2023, 1, 1) 
         mock_job.end_date = datetime(2023, 12, 31)
         mock_job.__str__ = Mock(return_value="Test Job")
@@ -340,12 +301,211 @@ class TestUpdatingDownloaderEdgeCases:
         # Mock fetch to return None (line 63-64)
         mock_job.fetch.return_value = None
         
-        # Mock pretend_not_a_bot
-        with patch.object(downloader, 'pretend_not_a_bot'):
-            result = downloader._process_job(mock_job)
+        result = downloader._process_job(mock_job)
         
         # Should return NONE when fetch returns None
         assert result == HistoricalDataResult.NONE
         mock_job.fetch.assert_called_once()
         # Should not call persist when no data
-        mock_job.persist.assert_not_called() if hasattr(mock_job, 'persist') else None
\ No newline at end of file
+        mock_job.persist.assert_not_called() if hasattr(mock_job, 'persist') else None
+
+class TestUpdatingDownloaderCatalog:
+    """Test coverage decisions made from the storage catalog."""
+
+    @pytest.fixture
+    def downloader(self):
+        return UpdatingDownloader(data_storage=Mock(), data_provider=Mock())
+
+    @pytest.fixture
+    def catalog_entry(self):
+        metadata = Metadata(
+            "TEST", Period.Daily,
+            datetime(2023, 1, 1), datetime(2023, 12, 31),
+            datetime(2023, 1, 3), datetime(2023, 12, 29),
+        )
+        return CatalogEntry(metadata, 250)
+
+    def test_covered_series_skips_load(self, downloader, catalog_entry):
+        """Test EXISTS is decided from the catalog without loading data."""
+        mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = catalog_entry
+        mock_job.start_date = datetime(2023, 1, 1)
+        mock_job.end_date = datetime(2023, 12, 31)
+
+        result = downloader._process_job(mock_job)
+
+        assert result == HistoricalDataResult.EXISTS
+        mock_job.load.assert_not_called()
+        mock_job.fetch.assert_not_called()
+
+    def test_uncovered_series_narrows_job_and_fetches(self, downloader, catalog_entry):
+        """Test an insufficient catalog entry narrows the job and downloads the rest."""
+        mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = False
+        mock_job.get_catalog_entry.return_value = catalog_entry
+        mock_job.start_date = datetime(2023, 6, 1)
+        mock_job.end_date = datetime(2024, 3, 31)
+        mock_job.instrument = Mock(symbol="TEST")
+        existing = Mock()
+        mock_job.load.return_value = existing
+        new_data = Mock()
+        new_data.df = Mock(__len__=Mock(return_value=60))
+        mock_job.fetch.return_value = new_data
+
+        result = downloader._process_job(mock_job)
+
+        assert result == HistoricalDataResult.OK
+        assert mock_job.start_date == datetime(2023, 12, 26)
+        existing.is_data_coverage_acceptable.assert_not_called()
+        new_data.merge.assert_called_once_with(existing)
+
+    def test_storage_merge_skips_load(self, downloader, catalog_entry):
+        """Test a storage that merges in place gets only the new download."""
+        mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = True
+        mock_job.get_catalog_entry.return_value = catalog_entry
+        mock_job.start_date = datetime(2023, 6, 1)
+        mock_job.end_date = datetime(2024, 3, 31)
+        mock_job.instrument = Mock(symbol="TEST")
+        new_data = Mock()
+        new_data.df = Mock(__len__=Mock(return_value=60))
+        new_data.merge.side_effect = lambda existing: new_data if existing is None else Mock()
+        mock_job.fetch.return_value = new_data
+
+        result = downloader._process_job(mock_job)
+
+        assert result == HistoricalDataResult.OK
+        mock_job.load.assert_not_called()
+        mock_job.merge.assert_called_once_with(new_data)
+        mock_job.persist.assert_not_called()
+
+    def test_unchanged_series_is_not_written(self, downloader, catalog_entry):
+        """Test that a fetch repeating stored bars only refreshes the metadata."""
+        mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = True
+        mock_job.get_catalog_entry.return_value = catalog_entry
+        mock_job.start_date = datetime(2023, 6, 1)
+        mock_job.end_date = datetime(2024, 3, 31)
+        mock_job.instrument = Mock(symbol="TEST")
+        merged = Mock()
+        new_data = Mock()
+        new_data.df = Mock(__len__=Mock(return_value=5))
+        new_data.merge.return_value = merged
+        mock_job.fetch.return_value = new_data
+
+        result = downloader._process_job(mock_job)
+
+        assert result == HistoricalDataResult.UNCHANGED
+        mock_job.is_stored.assert_called_once_with(merged)
+        mock_job.persist.assert_not_called()
+        mock_job.update_metadata.assert_called_once_with(merged.metadata)
+
+    def test_forced_backup_writes_unchanged_series(self, catalog_entry):
+        """Test that force_backup still rewrites a series whose bars did not change."""
+        downloader = UpdatingDownloader(Mock(), Mock(), backup_data_storage=Mock(), force_backup=True)
+        mock_job = Mock(spec=DownloadJob)
+        mock_job.merges_in_storage = False
+        mock_job.is_stored.return_value = True
+        merged = Mock()
+
+        result = downloader._persist_stage(mock_job, merged)
+
+        assert result == HistoricalDataResult.OK
+        mock_job.persist.assert_called_once_with(merged)
+
+
+class TestUpdatingDownloaderWriteBehind:
+    """Test journaling of jobs whose series is written in the background."""
+
+    @staticmethod
+    def make_job():
+        job = Mock(spec=DownloadJob)
+        job.merges_in_storage = False
+        job.is_stored.return_value = False
+        job.writes_behind = True
+        job.__str__ = Mock(return_value="AAPL|1d|2024-01-01|2024-01-31")
+        return job
+
+    def test_announced_job_is_journaled_once_written(self, tmp_path):
+        """Test that a queued write leaves the job PENDING until the write ran."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+        downloader = UpdatingDownloader(Mock(), Mock(), job_journal=journal)
+        job = self.make_job()
+        downloader.expect_jobs([job])
+
+        result = downloader._persist_stage(job, Mock(), downloader._pop_journal_key(job))
+
+        assert result == HistoricalDataResult.PENDING
+        assert journal.completed_keys() == set()
+        job.when_persisted.call_args.args[0](None)
+        assert journal.completed_keys() == {"AAPL|1d|2024-01-01|2024-01-31"}
+        journal.close()
+
+    def test_failed_write_fails_the_job(self, tmp_path):
+        """Test that a job whose queued write failed is fetched again on resume."""
+        journal = JobJournal(tmp_path / 'journal.sqlite')
+        downloader = UpdatingDownloader(Mock(), Mock(), job_journal=journal)
+        job = self.make_job()
+        downloader.expect_jobs([job])
+
+        downloader._persist_stage(job, Mock(), downloader._pop_journal_key(job))
+        job.when_persisted.call_args.args[0](OSError("disk full"))
+
+        assert journal.completed_keys() == set()
+        journal.close()
+
+    def test_synchronous_write_is_ok(self):
+        """Test that jobs written synchronously complete as before."""
+        downloader = UpdatingDownloader(Mock(), Mock())
+        job = self.make_job()
+        job.writes_behind = False
+
+        assert downloader._persist_stage(job, Mock(), "key") == HistoricalDataResult.OK
+        job.when_persisted.assert_not_called()
+
+
+class TestUpdatingDownloaderPipeline:
+    """Test running jobs through the fetch → parse → persist pipeline."""
+
+    def test_cpu_workers_must_not_be_negative(self):
+        with pytest.raises(ValueError):
+            UpdatingDownloader(Mock(), Mock(), cpu_workers=-1)
+
+    def test_pipelined_jobs_are_fetched_parsed_and_persisted(self):
+        """Test that parsing gets only the responses and the persist stage merges."""
+        provider = Mock()
+        provider.get_name.return_value = "yahoo"
+        downloader = UpdatingDownloader(Mock(), provider, cpu_workers=2)
+        stored = Mock()
+        job = Mock(spec=DownloadJob)
+        job.merges_in_storage = False
+        job.is_stored.return_value = False
+        job.writes_behind = False
+        job.get_catalog_entry.return_value = None
+        job.load.return_value = stored
+        job.fetch_responses.side_effect = lambda: [parsing_deferred()]
+        job.series_description.return_value = ("yahoo", "AAPL")
+        job.__str__ = Mock(return_value="AAPL|1d")
+        job.instrument = Mock(symbol="AAPL")
+        job.period = Period.Daily
+        new_download = Mock()
+        new_download.df.__len__ = Mock(return_value=10)
+        parse = Mock(return_value=new_download)
+
+        # Parse inline: a Mock cannot be sent to a worker process
+        with patch("vortex.services.updating_downloader.parse_download", parse), \
+                patch("vortex.services.updating_downloader.DownloadPipeline",
+                      lambda **kwargs: DownloadPipeline(**{**kwargs, "cpu_workers": 0})), \
+                patch.object(downloader, "_is_existing_data_sufficient", return_value=False):
+            assert downloader.pipelined
+            downloader._process_jobs([job])
+
+        pending = parse.call_args.args[0]
+        assert pending == PendingParse([True], ("yahoo", "AAPL"))
+        new_download.merge.assert_called_once_with(stored)
+        job.fetch.assert_not_called()
+        job.persist.assert_called_once_with(new_download.merge.return_value)